@@ -32,16 +32,177 @@
 ###############################################################################
 
 import inspect
+import collections.abc
 
 
 from ..utility.log_report import Log
-from .generator_utility import MatchResult, is_impl_list, ImplemList
+from .generator_utility import MatchResult, is_impl_list, ImplemList, is_dispatch_static
 from .code_constant import C_Code
 
 LOG_BACKEND_INIT = Log.Info.gen_sub_level("backend_init")
 
 TARGET_INSTANCE_MAP = {}
 
+# marker for selection predicates which have not been evaluated yet
+NOT_EVALUATED = object()
+
+class DispatchResult:
+    """ result of instruction selection in a single table: the first strong
+        match (if any) and the list of weak matches found before it """
+    def __init__(self, match, implementation, weak_list, static):
+        self.match = match
+        self.implementation = implementation
+        self.weak_list = weak_list
+        # True if this result does not depend on the node it was selected for
+        self.static = static
+
+    def is_supported(self):
+        return not self.match is None or len(self.weak_list) > 0
+
+def evaluate_interface_condition(interface_condition, op_class, interface, optree):
+    try:
+        return interface_condition(*interface, optree=optree)
+    except TypeError as e:
+        Log.report(Log.Error, "Type Error for interface_condition on {}, {}",  op_class, (str(ifce) for ifce in interface), error=e)
+
+class DispatchEntry:
+    """ memoized instruction selection for the (op class, interface formats,
+        codegen key) bucket of a table.
+
+        Conditions and interface conditions declared dispatch-static (see
+        generator_utility.dispatch_static) are evaluated once, the others
+        are evaluated for each node. If the selection did not depend on
+        any other predicate its result is memoized and returned directly
+        for the next nodes """
+    def __init__(self, bucket, op_class, interface):
+        self.op_class = op_class
+        self.interface = interface
+        self.static_result = None
+        # list of [condition, node (or state) dependency, value, interface
+        # condition list] with interface condition list items
+        # [interface_condition, node (or state) dependency, match, implementation],
+        # only dispatch-static predicates are known not to depend on the
+        # node or on any state
+        self.entries = []
+        for condition in bucket:
+            self.entries.append([
+                condition, not is_dispatch_static(condition), NOT_EVALUATED,
+                [[interface_condition, not is_dispatch_static(interface_condition), NOT_EVALUATED, implementation]
+                 for interface_condition, implementation in bucket[condition].items()]
+            ])
+
+    def resolve(self, optree):
+        """ return the DispatchResult of selection for optree """
+        if not self.static_result is None:
+            return self.static_result
+        static = True
+        weak_list = ImplemList()
+        for entry in self.entries:
+            condition, cond_dependency, valid, ic_list = entry
+            if cond_dependency:
+                static = False
+                valid = condition(optree)
+            elif valid is NOT_EVALUATED:
+                valid = entry[2] = condition(None)
+            if not valid:
+                continue
+            for ic_entry in ic_list:
+                interface_condition, ic_dependency, match, implementation = ic_entry
+                if ic_dependency:
+                    static = False
+                    match = evaluate_interface_condition(interface_condition, self.op_class, self.interface, optree)
+                elif match is NOT_EVALUATED:
+                    match = ic_entry[2] = evaluate_interface_condition(interface_condition, self.op_class, self.interface, None)
+                if not match:
+                    continue
+                if isinstance(match, MatchResult) and match.weak:
+                    weak_list.append((match, implementation))
+                else:
+                    result = DispatchResult(match, implementation, weak_list, static)
+                    if static:
+                        self.static_result = result
+                    return result
+        result = DispatchResult(None, None, weak_list, static)
+        if static:
+            self.static_result = result
+        return result
+
+# entry of the tables which do not support a bucket
+UNSUPPORTED_DISPATCH_ENTRY = DispatchEntry({}, None, ())
+
+def default_table_getter(backend):
+    """ default accessor to the action selection table of a backend """
+    return backend.action_selection_table
+
+def default_key_getter(backend, optree):
+    """ default accessor to the selection keys of optree """
+    return backend.get_operation_keys(optree)
+
+class SupportedOpMap(collections.abc.Mapping):
+    """ flattened map of the operations supported by a list of language
+        tables: op_class -> specifier -> condition -> interface condition
+        -> ML_FullySupported (tables are merged in order, as
+        GenericBackend.generate_local_op_map does).
+
+        The map is built lazily: the entry of an operation class is only
+        merged from the source tables when it is first accessed, so
+        creating the map of a backend does not walk its whole processor
+        hierarchy tables. """
+    def __init__(self, local_map_list):
+        # list of the language tables (op_class -> specifier -> ...)
+        self.local_map_list = local_map_list
+        self.reset()
+
+    def reset(self):
+        """ discard every merged entry (must be called if a source table
+            is modified after the map creation) """
+        # ordered list of operation classes (None if not computed yet)
+        self.op_class_list = None
+        # map op_class -> merged specifier map
+        self.merged_map = {}
+
+    def merge_op_class(self, op_class):
+        """ merge the entries of op_class from every source table, return
+            None if op_class is not supported by any table """
+        specifier_map = None
+        for local_map in self.local_map_list:
+            if not op_class in local_map:
+                continue
+            if specifier_map is None:
+                specifier_map = {}
+            local_specifier_map = local_map[op_class]
+            for specifier in local_specifier_map:
+                condition_map = specifier_map.setdefault(specifier, {})
+                for condition in local_specifier_map[specifier]:
+                    interface_map = condition_map.setdefault(condition, {})
+                    for interface_format in local_specifier_map[specifier][condition]:
+                        interface_map[interface_format] = ML_FullySupported
+        return specifier_map
+
+    def __getitem__(self, op_class):
+        try:
+            return self.merged_map[op_class]
+        except KeyError:
+            pass
+        specifier_map = self.merge_op_class(op_class)
+        if specifier_map is None:
+            raise KeyError(op_class)
+        self.merged_map[op_class] = specifier_map
+        return specifier_map
+
+    def __contains__(self, op_class):
+        return op_class in self.merged_map or any(op_class in local_map for local_map in self.local_map_list)
+
+    def __iter__(self):
+        if self.op_class_list is None:
+            self.op_class_list = list(dict.fromkeys(
+                op_class for local_map in self.local_map_list for op_class in local_map))
+        return iter(self.op_class_list)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
 class GenericBackend:
     """ base class for generic backend implementation (for codegen and more) """
     target_name = "generic_backend"
@@ -59,6 +220,53 @@ class GenericBackend:
         self.simplified_rec_op_map = {}
         self.simplified_rec_op_map[self.DEFAULT_LANGUAGE] = self.generate_supported_op_map(language=self.DEFAULT_LANGUAGE)
 
+    def reset_dispatch_cache(self):
+        """ discard the instruction selections memoized by this backend
+            (must be called if one of its action selection tables, or one of
+            its parents', is modified after instruction selection started) """
+        # map id(language table) -> (language table, map key -> DispatchEntry)
+        self.dispatch_cache = {}
+        # map selection key -> implementation selected through the whole
+        # processor hierarchy (default table and key getters only)
+        self.recursive_dispatch_cache = {}
+
+    def get_dispatch_entry(self, op_map, language, op_class, interface, codegen_key):
+        """ return the (memoized) DispatchEntry for the bucket
+            op_map[language][op_class][codegen_key] and interface """
+        if not hasattr(self, "dispatch_cache"):
+            self.reset_dispatch_cache()
+        if not language in op_map:
+            return UNSUPPORTED_DISPATCH_ENTRY
+        language_map = op_map[language]
+        # language tables are referenced by the cache so their id can not be
+        # re-used while the cache entry exists
+        table_cache = self.dispatch_cache.get(id(language_map))
+        if table_cache is None or not table_cache[0] is language_map:
+            table_cache = (language_map, {})
+            self.dispatch_cache[id(language_map)] = table_cache
+        key = (op_class, interface, codegen_key)
+        try:
+            return table_cache[1][key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable format, selection is not memoized
+            return self.build_dispatch_entry(language_map, op_class, interface, codegen_key)
+        dispatch_entry = self.build_dispatch_entry(language_map, op_class, interface, codegen_key)
+        table_cache[1][key] = dispatch_entry
+        return dispatch_entry
+
+    @staticmethod
+    def build_dispatch_entry(language_map, op_class, interface, codegen_key):
+        if not op_class in language_map or not codegen_key in language_map[op_class]:
+            return UNSUPPORTED_DISPATCH_ENTRY
+        return DispatchEntry(language_map[op_class][codegen_key], op_class, interface)
+
+    def get_dispatch_result(self, op_map, optree, language, key_getter=default_key_getter):
+        """ return the DispatchResult of the selection of optree in op_map """
+        op_class, interface, codegen_key = key_getter(self, optree)
+        return self.get_dispatch_entry(op_map, language, op_class, interface, codegen_key).resolve(optree)
+
     @classmethod
     def get_target_instance(TargetClass, *args, **kw):
         if TargetClass in TARGET_INSTANCE_MAP:
@@ -77,16 +285,22 @@ class GenericBackend:
 
     def generate_supported_op_map(self, language, table_getter = lambda self: self.action_selection_table):
         """ generate a map of every operations supported by the processor hierarchy,
-            to be used in OptimizationEngine step """
-        op_map = {}
+            to be used in OptimizationEngine step.
+            The map is a SupportedOpMap whose entries are only merged
+            when first accessed """
+        local_map_list = []
         for parent_proc in self.parent_architecture:
-            parent_proc.generate_local_op_map(language, op_map, table_getter = table_getter)
+            table = table_getter(parent_proc)
+            if language in table:
+                local_map_list.append(table[language])
         # add locally supported operation last to patch
         # any previously registered support mapping
-        self.generate_local_op_map(language, op_map)
-        return op_map
+        table = default_table_getter(self)
+        if language in table:
+            local_map_list.append(table[language])
+        return SupportedOpMap(local_map_list)
 
-    def generate_local_op_map(self, language, op_map=None, table_getter=lambda self: self.action_selection_table):
+    def generate_local_op_map(self, language, op_map=None, table_getter=default_table_getter):
         """ generate simplified map of locally supported operations """
         op_map = {} if op_map is None else op_map
         table = table_getter(self)
@@ -107,62 +321,70 @@ class GenericBackend:
                           op_map[operation][specifier][condition][interface_format] = ML_FullySupported
           return op_map
 
-    def get_implementation(self, optree, language, table_getter = lambda self: self.action_selection_table, key_getter = lambda self, optree: self.get_operation_keys(optree)):
+    def get_implementation(self, optree, language, table_getter=default_table_getter, key_getter=default_key_getter):
         """ return <self> implementation of operation performed by <optree> """
-        #key_getter = AbstractBackend.get_operation_keys if key_getter is None else key_getter
-        table = table_getter(self)
-        op_class, interface, codegen_key = key_getter(self, optree)
-        possible_impl = ImplemList()
-        for condition in table[language][op_class][codegen_key]:
-            if condition(optree):
-                for interface_condition in table[language][op_class][codegen_key][condition]:
-                    possible_match = interface_condition(*interface, optree=optree)
-                    if possible_match:
-                        implementation = table[language][op_class][codegen_key][condition][interface_condition]
-                        sourceinfo = implementation.get_source_info()
-                        Log.report(
-                            Log.Verbose,
-                            "optree {} matched to implementation @ {}",
-                            optree,
-                            str(sourceinfo)
-                        )
-                        if possible_match is True:
-                            return implementation
-                        elif isinstance(possible_match, MatchResult):
-                            if possible_match.weak:
-                                Log.report(Log.Verbose, "found weak match")
-                                possible_impl.append((possible_match, implementation))
-                            else:
-                                return implementation
-                        else:
-                            Log.report(Log.Error, "unsupported match result: {} for optree {}", possible_match, optree)
-        return possible_impl
+        dispatch_result = self.get_dispatch_result(table_getter(self), optree, language, key_getter=key_getter)
+        return self.get_result_implementation(optree, dispatch_result)
+
+    @staticmethod
+    def get_result_implementation(optree, dispatch_result):
+        """ return the implementation selected by dispatch_result, or the
+            list of weak implementations if no strong match was found """
+        for possible_match, implementation in dispatch_result.weak_list:
+            Log.report(Log.Verbose, "found weak match for optree {} @ {}", optree, str(implementation.get_source_info()))
+        if dispatch_result.match is None:
+            return ImplemList(dispatch_result.weak_list)
+        implementation = dispatch_result.implementation
+        Log.report(
+            Log.Verbose,
+            "optree {} matched to implementation @ {}",
+            optree,
+            str(implementation.get_source_info())
+        )
+        if not (dispatch_result.match is True or isinstance(dispatch_result.match, MatchResult)):
+            Log.report(Log.Error, "unsupported match result: {} for optree {}", dispatch_result.match, optree)
+        return implementation
 
     def get_recursive_implementation(self, optree, language=None,
-                                     table_getter=lambda self: self.action_selection_table,
-                                     key_getter=lambda self, optree: self.get_operation_keys(optree),
+                                     table_getter=default_table_getter,
+                                     key_getter=default_key_getter,
                                      allowed_to_fail=False):
         """ recursively search for an implementation of optree in the processor
             class hierarchy """
+        recursive_key = None
+        if table_getter is default_table_getter and key_getter is default_key_getter:
+            op_class, interface, codegen_key = key_getter(self, optree)
+            if not hasattr(self, "recursive_dispatch_cache"):
+                self.reset_dispatch_cache()
+            recursive_key = (language, op_class, interface, codegen_key)
+            try:
+                return self.recursive_dispatch_cache[recursive_key]
+            except KeyError:
+                pass
+            except TypeError:
+                # unhashable format, selection is not memoized
+                recursive_key = None
+        static = True
         impl_list = ImplemList()
-        if self.is_local_supported_operation(optree, language, table_getter = table_getter, key_getter = key_getter):
-            local_implementation = self.get_implementation(optree, language, table_getter = table_getter, key_getter = key_getter)
+        for proc in [self] + self.parent_architecture:
+            dispatch_result = proc.get_dispatch_result(table_getter(proc), optree, language, key_getter=key_getter)
+            static = static and dispatch_result.static
+            if not dispatch_result.is_supported():
+                continue
+            implementation = proc.get_result_implementation(optree, dispatch_result)
             # check if local_implementation is a list of weak implementation
             # or a single "string implementation
-            if is_impl_list(local_implementation):
-                impl_list += local_implementation
+            if is_impl_list(implementation):
+                impl_list += implementation
             else:
-                return local_implementation
-        for parent_proc in self.parent_architecture:
-            if parent_proc.is_local_supported_operation(optree, language, table_getter = table_getter, key_getter = key_getter):
-                parent_implementation = parent_proc.get_implementation(optree, language, table_getter = table_getter, key_getter = key_getter)
-                if is_impl_list(parent_implementation):
-                    impl_list += parent_implementation
-                else:
-                    return parent_implementation
+                if static and not recursive_key is None:
+                    self.recursive_dispatch_cache[recursive_key] = implementation
+                return implementation
         if len(impl_list):
             # select the first weak implementation match
             match, implementation = impl_list[0]
+            if static and not recursive_key is None:
+                self.recursive_dispatch_cache[recursive_key] = implementation
             return implementation
 
         # no implementation were found
@@ -180,8 +402,10 @@ class GenericBackend:
 
     def is_map_supported_operation(self, op_map, optree, language,
                                    debug=False,
-                                   key_getter=lambda self, optree: self.get_operation_keys(optree)):
+                                   key_getter=default_key_getter):
         """ return wheter or not the operation performed by optree has a local implementation """
+        if not debug:
+            return self.get_dispatch_result(op_map, optree, language, key_getter=key_getter).is_supported()
         op_class, interface, codegen_key = key_getter(self, optree)
 
         if not language in op_map:
@@ -223,9 +447,9 @@ class GenericBackend:
                     return False
 
     def is_local_supported_operation(self, optree, language,
-                                     table_getter=lambda self: self.action_selection_table,
+                                     table_getter=default_table_getter,
                                      debug=False,
-                                     key_getter=lambda self, optree: self.get_operation_keys(optree)):
+                                     key_getter=default_key_getter):
         """ return whether or not the operation performed by optree
             has a local implementation, that is an implementation
             by self class directly and not its ancestors """
@@ -235,7 +459,7 @@ class GenericBackend:
                                                key_getter=key_getter)
 
     def is_supported_operation(self, optree, language, debug=False,
-                               key_getter = lambda self, optree: self.get_operation_keys(optree)):
+                               key_getter=default_key_getter):
         """ return whether or not the operation performed by optree is
             supported by any level of the processor hierarchy """
         return self.is_map_supported_operation(self.simplified_rec_op_map,
@@ -65,7 +65,7 @@ class CodeEntity(object):
   def instanciate_dyn_attributes(self):
     # attribute to contain thestage where the pipelined
     # signal was originally created
-    self.init_stage_attribute = AttributeCtor("init_stage", default_value = self.current_stage)
+    self.init_stage_attribute = AttributeCtor("init_stage", default_value = self.current_stage, snapshot = True)
     # attribute to contain the original operation for the pipelined signals
     self.init_op_attribute    = AttributeCtor("init_op", default_value = None) 
     Attributes.add_dyn_attribute(self.init_stage_attribute)
@@ -46,6 +46,7 @@ class CodeFunction(object):
     arg_list_precision = [arg.get_precision() for arg in self.arg_list]
     self.function_type = FunctionType(name, arg_list_precision, output_format, attributes)
     self.code_object = code_object
+    self.scheme = None
     self.function_object   = None
     self.function_operator = None
     self.language = language
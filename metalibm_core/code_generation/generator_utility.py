@@ -917,14 +917,43 @@ class RoundOperator(FunctionOperator):
         else:
            return FunctionOperator.assemble_code(self, code_generator, code_object, optree, var_arg_list, generate_pre_process = generate_pre_process, force_variable_storing = force_variable_storing, **kwords) 
         
+def dispatch_static(predicate):
+  """ declare predicate (function or class of callable objects) as
+      dispatch-static: its result only depends on the formats it is given,
+      it reads neither the node (optree) nor any global, processor or class
+      state. Instruction selection evaluates dispatch-static conditions and
+      interface conditions once per (operation class, interface formats,
+      codegen key) and memoizes the selection they lead to """
+  predicate.dispatch_static = True
+  return predicate
+
+def constant_true_function(*args, **kwords):
+  return True
+
+def is_constant_true_function(predicate):
+  """ predicate indicating if predicate is a python function whose body is
+      exactly "return True" (e.g. the lambda optree: True conditions of
+      selection tables), such a function is dispatch-static """
+  code = getattr(predicate, "__code__", None)
+  reference = constant_true_function.__code__
+  return not code is None and code.co_code == reference.co_code and code.co_consts == reference.co_consts
+
+def is_dispatch_static(predicate):
+  """ predicate indicating if predicate has been declared dispatch-static
+      (see dispatch_static) or always returns True """
+  return getattr(predicate, "dispatch_static", False) is True or is_constant_true_function(predicate)
+
+@dispatch_static
 def type_all_match(*args, **kwords):
   """ match any type parameters """
   return True
 
+@dispatch_static
 def type_std_integer_match(*arg, **kwords):
   """ check that argument are all integers """
   return all(map(is_std_integer_format, arg))
 
+@dispatch_static
 def type_table_index_match(*arg, **kwords):
   """ check that argument are all integers """
   return all(map(is_table_index_format, arg))
@@ -985,6 +1014,7 @@ def is_impl_list(obj):
     """ predicate testing if obj is an object of class ImplemList """
     return isinstance(obj, ImplemList)
 
+@dispatch_static
 class type_strict_match(object):
     """ Build a type matching predicate from a list of type,
         a node is matched by the predicate if it has as many operands
@@ -999,6 +1029,7 @@ class type_strict_match(object):
         # TODO/FIXME: strict match between type object (no inheritance allowed)
         return self.type_tuple == arg_tuple
 
+@dispatch_static
 class type_strict_match_list(object):
     """ Build a type matching predicate from list of formats,
         result and operands must match one of the item of the list formats
@@ -1016,6 +1047,7 @@ class type_strict_match_list(object):
 def type_strict_match_or_list(type_tuple_list):
     """ Return a function which match strictly any of the tuple within
         type_tuple_list """
+    @dispatch_static
     def match_function(*arg_tuple, **kw):
         for constraint_tuple in type_tuple_list:
             if constraint_tuple == arg_tuple:
@@ -1023,6 +1055,7 @@ def type_strict_match_or_list(type_tuple_list):
         return False
     return match_function
 
+@dispatch_static
 class type_fixed_match(object):
     """ type_strict_match + match any instance of ML_Fixed_Format to 
         ML_Fixed_Format descriptor """
@@ -1032,9 +1065,11 @@ class type_fixed_match(object):
     def __call__(self, *arg_tuple, **kwords):
         return reduce(lambda acc, v: acc and (v[0] == v[1] or (v[0] == ML_Fixed_Format)) and isinstance(v[1], ML_Fixed_Format), zip(self.type_tuple, arg_tuple))
 
+@dispatch_static
 class type_custom_match(BackendImplMatchPredicated):
     """ Callable class that checks whether all arguments match with their
-        respective custom matching function. """
+        respective custom matching function (which must only depend
+        on the format they are given) """
     def __init__(self, *type_tuple, weak=False):
         BackendImplMatchPredicated.__init__(self, weak=weak)
         self.type_tuple = type_tuple
@@ -1050,6 +1085,7 @@ class type_custom_match(BackendImplMatchPredicated):
         return acc
         #return reduce((lambda acc, v: acc and (v[0](v[1]))), zip(self.type_tuple, arg_tuple))
 
+@dispatch_static
 class type_relax_match(object):
     """ implement a relaxed type comparison including ML_Exact as possible true answer """
     def __init__(self, *type_tuple):
@@ -1062,6 +1098,7 @@ class type_relax_match(object):
         return acc
         # return reduce(lambda acc, v: acc and (v[0] == v[1] or v[1] == ML_Exact), zip(self.type_tuple, arg_tuple))
 
+@dispatch_static
 class type_result_match(object):
     def __init__(self, result_type):
         self.result_type = result_type
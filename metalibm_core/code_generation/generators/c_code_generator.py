@@ -395,6 +395,8 @@ class CCodeGenerator(CodeGenerator):
             if symbol_object.is_empty():
               initial_symbol = (symbol_object.get_definition(symbol, final = "", language = self.language)) if initial else ""
               return "{};\n".format(initial_symbol)
+            elif initial and symbol_object.use_binary_emission(language=self.language):
+              return self.generate_binary_table_declaration(symbol, symbol_object)
             else:
               initial_symbol = (symbol_object.get_definition(symbol, final = "", language = self.language) + " ") if initial else ""
               table_content_init = symbol_object.get_content_init(language = self.language)
@@ -408,6 +410,24 @@ class CCodeGenerator(CodeGenerator):
         else:
             Log.report(Log.Error, "{} decl generation not-implemented".format(symbol_object), error=NotImplementedError)
 
+    def generate_binary_table_declaration(self, symbol, table_object):
+        """ generate the declaration of table_object whose content is
+            stored in a binary side file included at assembly time
+            (through .incbin) rather than in a C initializer.
+            Only valid for tables declared at global scope """
+        binary_path = table_object.export_binary_content()
+        section = ".rodata" if table_object.const else ".data"
+        precision_name = table_object.get_storage_precision().get_name(language=self.language)
+        dims = "][".join(str(dim) for dim in table_object.dimensions)
+        return "__asm__(\".pushsection {section}\\n.balign 64\\n{symbol}:\\n.incbin \\\"{path}\\\"\\n.popsection\\n\");\n" \
+               "extern {const}{format_name} {symbol}[{dims}] __attribute__((visibility(\"hidden\")));\n".format(
+            section=section,
+            symbol=symbol,
+            path=binary_path,
+            const="const " if table_object.const else "",
+            format_name=precision_name,
+            dims=dims)
+
     def generate_initialization(self, symbol, symbol_object, initial = True, final = True):
       if isinstance(symbol_object, Constant) or isinstance(symbol_object, Variable):
         final_symbol = ";\n" if final else ""
@@ -723,9 +723,9 @@ c_code_generation_table = {
         None: {
             lambda optree: True: {
                 # implicit conversion from and to any integer,Binary64,Binary32 type
-                (lambda dst_type, src_type, **kwords: (is_std_integer_format(dst_type) and is_std_integer_format(src_type)))
+                dispatch_static(lambda dst_type, src_type, **kwords: (is_std_integer_format(dst_type) and is_std_integer_format(src_type)))
                 : DynamicOperator(dynamic_function = dynamic_integer_conversion),
-                (lambda dst_type,src_type,**kwords:
+                dispatch_static(lambda dst_type,src_type,**kwords:
                     ((is_std_integer_format(dst_type) or is_std_integer_format(src_type)) and (dst_type == ML_Binary64 or dst_type == ML_Binary32 or src_type == ML_Binary64 or src_type == ML_Binary32)) or (dst_type in [ML_Binary32, ML_Binary64] and src_type in [ML_Binary64, ML_Binary32])
                 ) :  IdentityOperator(),
             },
@@ -40,6 +40,7 @@ S2 = sollya.SollyaObject(2)
 
 
 from metalibm_core.core.ml_table import ML_NewTable
+from metalibm_core.core.stratified_sampling import set_sampling_boundaries
 from metalibm_core.utility.num_utils import fp_next
 from metalibm_core.core.polynomials import (
     Polynomial, PolynomialSchemeEvaluator, SollyaError)
@@ -58,6 +59,10 @@ from metalibm_core.utility.log_report import Log
 from metalibm_core.utility.axf_utils import (
     AXF_SimplePolyApprox, AXF_UniformPiecewiseApprox,
     AXF_GenericPolynomialSplit)
+from metalibm_core.utility.approx_cache import cached_guessdegree
+import metalibm_core.utility.parallel_utils as parallel_utils
+from metalibm_core.utility.parallel_utils import (
+    fork_map_chunks, encode_numeric_value, decode_numeric_value)
 
 from metalibm_core.utility.ml_template import precision_parser
 
@@ -100,10 +105,71 @@ def generic_poly_split_param_from_axf(axf_approx, indexing):
     return offset_table, max_degree, poly_table, max_error
 
 
-def generic_poly_split_paramgen(offset_fct, indexing, target_eps, coeff_precision, axf_export=False):
+def get_approx_jobs(jobs=None):
+    """ return the number of worker processes to be used for approximation
+        (default to parallel_utils.DEFAULT_APPROX_JOBS if jobs is None) """
+    return parallel_utils.DEFAULT_APPROX_JOBS if jobs is None else jobs
+
+
+def map_sub_intervals(sub_fct, num_intervals, jobs=None):
+    """ evaluate sub_fct(i) for every i in range(num_intervals), possibly
+        using several worker processes. The result list is ordered by
+        sub-interval index whatever the number of jobs.
+
+        sub_fct must return picklable values """
+    jobs = get_approx_jobs(jobs)
+    if jobs <= 1:
+        return [sub_fct(i) for i in range(num_intervals)]
+    def chunk_task(lo, hi):
+        return [sub_fct(i) for i in range(lo, hi)]
+    chunk_results = fork_map_chunks(chunk_task, num_intervals, jobs, chunk_size=1)
+    return [result for chunk in chunk_results for result in chunk]
+
+
+def map_sub_approximations(sub_approx_fct, num_intervals, jobs=None):
+    """ evaluate sub_approx_fct(i) -> (poly_object, approx_error, extra)
+        for every i in range(num_intervals), possibly using several worker
+        processes (polynomial coefficients and errors are transmitted
+        exactly between processes) """
+    if get_approx_jobs(jobs) <= 1:
+        return [sub_approx_fct(i) for i in range(num_intervals)]
+    def encoded_sub_approx(i):
+        poly_object, approx_error, extra = sub_approx_fct(i)
+        encoded_coeff_map = dict((index, encode_numeric_value(coeff)) for index, coeff in poly_object.coeff_map.items())
+        return encoded_coeff_map, encode_numeric_value(approx_error), extra
+    result_list = []
+    for encoded_coeff_map, encoded_error, extra in map_sub_intervals(encoded_sub_approx, num_intervals, jobs):
+        poly_object = Polynomial(dict((index, decode_numeric_value(coeff)) for index, coeff in encoded_coeff_map.items()))
+        result_list.append((poly_object, decode_numeric_value(encoded_error), extra))
+    return result_list
+
+
+def generic_poly_split_sub_approximation(offset_fct, indexing, sub_index, poly_degree, coeff_precision):
+    """ compute the polynomial approximation of offset_fct on the
+        sub_index-th sub-interval of indexing
+
+        :return: tuple (poly_object, approx_error, absolute) """
+    offset, approx_interval = indexing.get_offseted_sub_interval(sub_index)
+    if poly_degree == 0:
+        # managing constant approximation separately since it seems
+        # to break sollya
+        local_approx = coeff_precision.round_sollya_object(offset_fct(offset)(inf(approx_interval)))
+        approx_error = sollya.infnorm(offset_fct(offset) - local_approx, approx_interval)
+        return Polynomial({0: local_approx}), approx_error, True
+    else:
+        poly_object, approx_error = Polynomial.build_from_approximation_with_error(
+            offset_fct(offset), poly_degree, [coeff_precision]*(poly_degree+1),
+            approx_interval, sollya.relative)
+        return poly_object, approx_error, False
+
+
+def generic_poly_split_paramgen(offset_fct, indexing, target_eps, coeff_precision, axf_export=False, jobs=None):
     # computing degree for a different polynomial approximation on each
     # sub-interval
-    poly_degree_list = [int(sup(guessdegree(offset_fct(offset), sub_interval, target_eps))) for offset, sub_interval in indexing.get_offseted_sub_list()]
+    offseted_sub_list = indexing.get_offseted_sub_list()
+    poly_degree_list = map_sub_intervals(
+        lambda i: cached_guessdegree(offset_fct(offseted_sub_list[i][0]), offseted_sub_list[i][1], target_eps),
+        len(offseted_sub_list), jobs)
     max_degree = max(poly_degree_list)
 
     # tabulating polynomial coefficients on split_num sub-interval of interval
@@ -120,44 +186,31 @@ def generic_poly_split_paramgen(offset_fct, indexing, target_eps, coeff_precisio
     else:
         axf_approx = None
 
-    for sub_index in range(indexing.split_num):
+    # sub-interval approximations are independent and can be computed
+    # concurrently, results are assembled in sub-interval order
+    sub_approx_list = map_sub_approximations(
+        lambda sub_index: generic_poly_split_sub_approximation(
+            offset_fct, indexing, sub_index, poly_degree_list[sub_index], coeff_precision),
+        indexing.split_num, jobs)
+
+    for sub_index, (poly_object, approx_error, absolute) in enumerate(sub_approx_list):
         poly_degree = poly_degree_list[sub_index]
         offset, approx_interval = indexing.get_offseted_sub_interval(sub_index)
         offset_table[sub_index] = offset
-        if poly_degree == 0:
-            # managing constant approximation separately since it seems
-            # to break sollya
-            local_approx = coeff_precision.round_sollya_object(offset_fct(offset)(inf(approx_interval)))
-            poly_table[sub_index][0] = local_approx
-            for monomial_index in range(1, max_degree+1):
-                poly_table[sub_index][monomial_index] = 0
-            approx_error = sollya.infnorm(offset_fct(offset) - local_approx, approx_interval) 
 
-            if axf_export:
-                axf_approx.approx_list.append(
-                    AXF_SimplePolyApprox(Polynomial({0: local_approx}),
-                                         offset_fct(offset), [0], [coeff_precision],
-                                         approx_interval, absolute=True,
-                                         approx_error=approx_error)) 
-
-        else:
-            poly_object, approx_error = Polynomial.build_from_approximation_with_error(
-                offset_fct(offset), poly_degree, [coeff_precision]*(poly_degree+1),
-                approx_interval, sollya.relative)
-
-            for monomial_index in range(max_degree+1):
-                if monomial_index <= poly_degree:
-                    poly_table[sub_index][monomial_index] = poly_object.coeff_map[monomial_index] 
-                else:
-                    poly_table[sub_index][monomial_index] = 0
+        for monomial_index in range(max_degree+1):
+            if monomial_index <= poly_degree and monomial_index in poly_object.coeff_map:
+                poly_table[sub_index][monomial_index] = poly_object.coeff_map[monomial_index]
+            else:
+                poly_table[sub_index][monomial_index] = 0
 
-            if axf_export:
-                axf_approx.approx_list.append(
-                    AXF_SimplePolyApprox(poly_object,
-                                         offset_fct(offset), list(range(poly_degree+1)),
-                                         [coeff_precision]*(poly_degree+1),
-                                         approx_interval, absolute=False,
-                                         approx_error=approx_error)) 
+        if axf_export:
+            axf_approx.approx_list.append(
+                AXF_SimplePolyApprox(poly_object,
+                                     offset_fct(offset), list(range(poly_degree+1)),
+                                     [coeff_precision]*(poly_degree+1),
+                                     approx_interval, absolute=absolute,
+                                     approx_error=approx_error))
         max_error = max(approx_error, max_error)
 
     return offset_table, max_degree, poly_table, max_error, axf_approx
@@ -167,6 +220,13 @@ def generic_poly_split_from_params(offset_table, max_degree, poly_table, indexin
     # indexing function: derive index from input @p vx value
     poly_index = indexing.get_index_node(vx)
     poly_index.set_attributes(tag="poly_index", debug=debug_multi)
+    # sub-interval bounds (as approximated by
+    # generic_poly_split_sub_approximation) are test sampling boundaries
+    boundary_list = []
+    for sub_index in range(indexing.split_num):
+        offset, approx_interval = indexing.get_offseted_sub_interval(sub_index)
+        boundary_list += [offset, offset + sup(approx_interval)]
+    set_sampling_boundaries(poly_index, vx, boundary_list)
 
     ext_precision = get_extended_fp_precision(coeff_precision)
 
@@ -185,7 +245,7 @@ def generic_poly_split_from_params(offset_table, max_degree, poly_table, indexin
     #return poly.hi
     return poly
 
-def generic_poly_split(offset_fct, indexing, target_eps, coeff_precision, vx, axf_export=False):
+def generic_poly_split(offset_fct, indexing, target_eps, coeff_precision, vx, axf_export=False, jobs=None):
     """ generate the meta approximation for @p offset_fct over several
         intervals defined by @p indexing object
         For each sub-interval, a polynomial approximation with
@@ -195,7 +255,7 @@ def generic_poly_split(offset_fct, indexing, target_eps, coeff_precision, vx, ax
 
     offset_table, max_degree, poly_table, max_error, axf_approx = generic_poly_split_paramgen(offset_fct, indexing,
                                                                     target_eps, coeff_precision,
-                                                                    axf_export=axf_export)
+                                                                    axf_export=axf_export, jobs=jobs)
     Log.report(Log.Debug, "max approx error is {}", max_error)
 
     poly = generic_poly_split_from_params(offset_table, max_degree, poly_table, indexing, coeff_precision, vx)
@@ -252,18 +312,84 @@ def piecewise_approximation_degree_generator(
         bound_high=1.0,
         num_intervals=16,
         max_degree=2,
-        error_threshold=S2**-24):
-    """ """
+        error_threshold=S2**-24,
+        jobs=None):
+    """ generate the degree required to approximate function on each
+        sub-interval (with an error below error_threshold) """
     interval_size = (bound_high - bound_low) / num_intervals
-    for i in range(num_intervals):
+    def sub_interval_degree(i):
         subint_low = bound_low + i * interval_size
-        subint_high = bound_low + (i+1) * interval_size
 
         local_function = function(sollya.x + subint_low)
         local_interval = Interval(-interval_size, interval_size)
 
-        local_degree = sollya.guessdegree(local_function, local_interval, error_threshold) 
-        yield int(sollya.sup(local_degree))
+        return cached_guessdegree(local_function, local_interval, error_threshold)
+    if get_approx_jobs(jobs) <= 1:
+        for i in range(num_intervals):
+            yield sub_interval_degree(i)
+    else:
+        for degree in map_sub_intervals(sub_interval_degree, num_intervals, jobs):
+            yield degree
+
+
+def piecewise_sub_approximation(
+        function, coeff_precision, i, bound_low, interval_size, degree,
+        error_threshold, odd=False, even=False):
+    """ compute the polynomial approximation of function on the i-th
+        sub-interval of a piecewise approximation
+
+        :return: tuple (poly_object, approx_error, zero_lower_bound) where
+                 zero_lower_bound indicates that the lower bound of the
+                 sub-interval is a zero of function (and the approximation
+                 was constrained accordingly) """
+    error_function = lambda p, f, ai, mod, t: sollya.dirtyinfnorm(p - f, ai)
+    subint_low = bound_low + i * interval_size
+    subint_high = bound_low + (i+1) * interval_size
+
+    local_function = function(sollya.x + subint_low)
+    local_interval = Interval(-interval_size, interval_size)
+
+    if function(subint_low) == 0.0:
+        # if the lower bound is a zero to the function, we
+        # need to force value=0 for the constant coefficient
+        # and extend the approximation interval
+        local_poly_degree_list = list(range(1 if even else 0, degree+1, 2 if odd or even else 1))
+        format_list = [coeff_precision] * len(local_poly_degree_list)
+        poly_object, approx_error = Polynomial.build_from_approximation_with_error(
+            function(sollya.x) / sollya.x,
+            local_poly_degree_list,
+            format_list,
+            Interval(-subint_high * 0.95,subint_high),
+            sollya.absolute,
+            error_function=error_function
+        )
+        # multiply by sollya.x
+        poly_object = poly_object.sub_poly(offset=-1)
+        return poly_object, approx_error, True
+    else:
+        try:
+            poly_object, approx_error = Polynomial.build_from_approximation_with_error(
+                local_function,
+                degree,
+                [coeff_precision] * (degree + 1),
+                local_interval,
+                sollya.absolute,
+                error_function=error_function
+            )
+        except SollyaError as err:
+            # try to see if function is constant on the interval (possible
+            # failure cause for fpminmax)
+            cst_value = coeff_precision.round_sollya_object(function(subint_low), sollya.RN)
+            accuracy = error_threshold
+            diff_with_cst_range = sollya.supnorm(cst_value, local_function, local_interval, sollya.absolute, accuracy)
+            diff_with_cst = sup(abs(diff_with_cst_range))
+            if diff_with_cst < error_threshold:
+                Log.report(Log.Info, "constant polynomial detected")
+                poly_object = Polynomial([function(subint_low)] + [0] * degree)
+                approx_error = diff_with_cst
+            else:
+                Log.report(Log.error, "degree: {} for index {}, diff_with_cst={} (vs error_threshold={}) ", degree, i, diff_with_cst, error_threshold, error=err)
+        return poly_object, approx_error, False
 
 
 
@@ -278,7 +404,8 @@ def piecewise_approximation_paramgen(
         error_threshold=S2**-24,
         odd=False,
         even=False,
-        axf_export=False):
+        axf_export=False,
+        jobs=None):
     """ Generate the parameters of a piecewise approximation
 
         :param function: function to be approximated
@@ -292,6 +419,8 @@ def piecewise_approximation_paramgen(
         :param num_intervals: number of sub-interval / sub-division of the main interval
         :param max_degree: maximum degree for an approximation on any sub-interval
         :param error_threshold: error bound for an approximation on any sub-interval
+        :param jobs: number of worker processes used to compute sub-interval
+                     approximations (default to parallel_utils.DEFAULT_APPROX_JOBS)
 
         :return: pair (scheme, error) where scheme is a graph node for an
             approximation scheme of function evaluated at variable, and error
@@ -301,6 +430,7 @@ def piecewise_approximation_paramgen(
         function, bound_low, bound_high,
         num_intervals=num_intervals,
         error_threshold=error_threshold,
+        jobs=jobs,
     )
     degree_list = list(degree_generator)
 
@@ -321,70 +451,37 @@ def piecewise_approximation_paramgen(
         const=True # by default all approximation coeff table are const
     )
 
-    error_function = lambda p, f, ai, mod, t: sollya.dirtyinfnorm(p - f, ai)
     max_approx_error = 0.0
     interval_size = (bound_high - bound_low) / num_intervals
 
-    for i in range(num_intervals):
-        subint_low = bound_low + i * interval_size
-        subint_high = bound_low + (i+1) * interval_size
-
-        local_function = function(sollya.x + subint_low)
-        local_interval = Interval(-interval_size, interval_size)
-
-        local_degree = degree_list[i]
+    for local_degree in degree_list:
         if local_degree > max_degree:
             Log.report(Log.Warning, "local_degree {} exceeds max_degree bound ({}) in piecewise_approximation", local_degree, max_degree)
-        # as max_degree defines the size of the table we can use
-        # it as the degree for each sub-interval polynomial
-        # as there is nothing to gain (yet) by using a smaller polynomial
-        degree = max_degree # min(max_degree, local_degree)
-
-        if function(subint_low) == 0.0:
-            # if the lower bound is a zero to the function, we
-            # need to force value=0 for the constant coefficient
-            # and extend the approximation interval
-            local_poly_degree_list = list(range(1 if even else 0, degree+1, 2 if odd or even else 1))
-            format_list = [coeff_precision] * len(local_poly_degree_list)
-            poly_object, approx_error = Polynomial.build_from_approximation_with_error(
-                function(sollya.x) / sollya.x,
-                local_poly_degree_list,
-                format_list,
-                Interval(-subint_high * 0.95,subint_high),
-                sollya.absolute,
-                error_function=error_function
-            )
-            # multiply by sollya.x
-            poly_object = poly_object.sub_poly(offset=-1)
-            if axf_export:
+    # as max_degree defines the size of the table we can use
+    # it as the degree for each sub-interval polynomial
+    # as there is nothing to gain (yet) by using a smaller polynomial
+    degree = max_degree # min(max_degree, local_degree)
+
+    # sub-interval approximations are independent and can be computed
+    # concurrently, results are assembled in sub-interval order
+    sub_approx_list = map_sub_approximations(
+        lambda i: piecewise_sub_approximation(
+            function, coeff_precision, i, bound_low, interval_size, degree,
+            error_threshold, odd=odd, even=even),
+        num_intervals, jobs)
+
+    for i, (poly_object, approx_error, zero_lower_bound) in enumerate(sub_approx_list):
+        subint_low = bound_low + i * interval_size
+        subint_high = bound_low + (i+1) * interval_size
+        if axf_export:
+            if zero_lower_bound:
+                local_poly_degree_list = list(range(1 if even else 0, degree+1, 2 if odd or even else 1))
                 axf_approx.approx_list.append(
-                    AXF_SimplePolyApprox(poly_object, function(sollya.x), [d+1 for d in local_poly_degree_list], format_list, Interval(subint_low, subint_high), absolute=True, approx_error=approx_error)) 
-        else:
-            try:
-                poly_object, approx_error = Polynomial.build_from_approximation_with_error(
-                    local_function,
-                    degree,
-                    [coeff_precision] * (degree + 1),
-                    local_interval,
-                    sollya.absolute,
-                    error_function=error_function
-                )
-            except SollyaError as err:
-                # try to see if function is constant on the interval (possible
-                # failure cause for fpminmax)
-                cst_value = coeff_precision.round_sollya_object(function(subint_low), sollya.RN)
-                accuracy = error_threshold
-                diff_with_cst_range = sollya.supnorm(cst_value, local_function, local_interval, sollya.absolute, accuracy)
-                diff_with_cst = sup(abs(diff_with_cst_range))
-                if diff_with_cst < error_threshold:
-                    Log.report(Log.Info, "constant polynomial detected")
-                    poly_object = Polynomial([function(subint_low)] + [0] * degree)
-                    approx_error = diff_with_cst
-                else:
-                    Log.report(Log.error, "degree: {} for index {}, diff_with_cst={} (vs error_threshold={}) ", degree, i, diff_with_cst, error_threshold, error=err)
-            if axf_export:
+                    AXF_SimplePolyApprox(poly_object, function(sollya.x), [d+1 for d in local_poly_degree_list], [coeff_precision] * len(local_poly_degree_list), Interval(subint_low, subint_high), absolute=True, approx_error=approx_error))
+            else:
+                local_function = function(sollya.x + subint_low)
                 axf_approx.approx_list.append(
-                    AXF_SimplePolyApprox(poly_object, local_function, range(degree+1), [coeff_precision] * (degree+1), Interval(subint_low, subint_high), absolute=True, approx_error=approx_error)) 
+                    AXF_SimplePolyApprox(poly_object, local_function, range(degree+1), [coeff_precision] * (degree+1), Interval(subint_low, subint_high), absolute=True, approx_error=approx_error))
         for ci in range(max_degree+1):
             if ci in poly_object.coeff_map:
                 coeff_table[i][ci] = poly_object.coeff_map[ci]
@@ -548,6 +645,11 @@ def piecewise_evaluation_from_param(variable, precision, bound_low, bound_high,
         debug=debug_multi,
         precision=int_prec
     )
+    # the selected sub-interval approximation changes half-way between
+    # the lower bounds of two consecutive sub-intervals
+    set_sampling_boundaries(
+        index, variable,
+        [bound_low, bound_high] + [bound_low + (i + 0.5) * interval_size for i in range(num_intervals - 1)])
     poly_var = Subtraction(
         diff,
         Multiplication(
@@ -62,6 +62,7 @@ from metalibm_core.core.ml_formats import (
 )
 
 from metalibm_core.utility.ml_template import ML_NewArgTemplate
+from metalibm_core.utility.log_report import Log
 
 def generate_1d_table(dim, storage_precision, tag, value_gen=lambda index: None, empty=False, const=True):
     """ generate a 1D ML_NewTable by using the given value generator @p value_gen """
@@ -408,7 +409,9 @@ class ML_ArrayFunction(ML_FunctionBasis):
     #    @param test_num     number of test to perform
     #    @param test_range numeric range for test's inputs
     #    @param debug enable debug mode
-    def generate_bench_wrapper(self, test_num=1, loop_num=100000, test_ranges=[Interval(-1.0, 1.0)], debug=False):
+    def generate_bench_wrapper(self, test_num=1, loop_num=100000, test_ranges=[Interval(-1.0, 1.0)], debug=False, repeat=0, warmup=0, latency=False):
+        if repeat or warmup or latency:
+            Log.report(Log.Error, "bench repetitions, warm-up and latency modes are not supported for array functions")
         # interval where the array lenght is chosen from (randomly)
         index_range = self.test_index_range
 
@@ -61,6 +61,7 @@ def attr_init(attrs, attr_name, default_value = None, required = False):
 
 ## Object to keep track of ML's node accross the several optimizations passes
 class Handle(object):
+    __slots__ = ("node",)
     def __init__(self, node = None):
         self.node = node
 
@@ -71,11 +72,15 @@ class Handle(object):
         return self.node
 
 class AttributeCtor:
-  def __init__(self, name, build_function = (lambda x: x), default_value = None, required = False):
+  """ constructor of a dynamic attribute, if snapshot is set the default
+      value may change over time and the value of unset attributes is
+      captured when the node is created (else it is resolved lazily) """
+  def __init__(self, name, build_function = (lambda x: x), default_value = None, required = False, snapshot = False):
     self.name = name
     self.build_function = build_function
     self.default_value = default_value
     self.required = required
+    self.snapshot = snapshot
 
   def get_name(self):
     return self.name
@@ -91,35 +96,81 @@ class Attributes(object):
     default_silent        = [None]
     str_del               = "| "
     dynamic_attribute_map = {}
+    # list of the dynamic attribute ctors whose default value is captured
+    # when a node is created
+    snapshot_attribute_list = []
+
+    # static attributes are stored in slots, dynamic attributes are stored
+    # in the instance __dict__ which is only allocated when one of them is
+    # set (unset dynamic attributes are resolved through __getattr__,
+    # except snapshot ones)
+    __slots__ = (
+        "precision", "interval", "debug", "exact", "tag", "max_abs_error",
+        "rel_error", "silent", "_handle", "owner", "clearprevious",
+        "rounding_mode", "rounding_mode_dependant", "prevent_optimization",
+        "unbreakable", "__dict__",
+    )
+    # list of (slot name, default value) for attributes whose
+    # default does not depend on the default_* stacks
+    constant_default_list = [
+        ("interval", None), ("debug", None), ("exact", None), ("tag", None),
+        ("max_abs_error", None), ("rel_error", None), ("clearprevious", None),
+        ("prevent_optimization", None), ("unbreakable", False),
+    ]
 
     ## allow to add a new dynamic attribute
     @staticmethod
     def add_dyn_attribute(attr_ctor):
       Attributes.dynamic_attribute_map[attr_ctor.get_name()] = attr_ctor
+      Attributes.snapshot_attribute_list = [
+        ctor for ctor in Attributes.dynamic_attribute_map.values() if ctor.snapshot]
 
     def get_dyn_attribute(self, attr_name):
       return getattr(self, attr_name)
 
+    def __getattr__(self, attr_name):
+        """ resolve unset dynamic attributes to their default value """
+        if attr_name in Attributes.dynamic_attribute_map:
+            return Attributes.dynamic_attribute_map[attr_name].attr_init({})
+        raise AttributeError(attr_name)
+
     def __init__(self, **init_map):
-        self.precision  = attr_init(init_map, "precision", Attributes.default_precision[0])
-        self.interval   = attr_init(init_map, "interval")
-        self.debug      = attr_init(init_map, "debug")
-        self.exact      = attr_init(init_map, "exact")
-        self.tag        = attr_init(init_map, "tag")
-        self.max_abs_error = attr_init(init_map, "max_abs_error")
-        # relative error
-        self.rel_error  = attr_init(init_map, "rel_error")
-        self.silent     = attr_init(init_map, "silent", Attributes.default_silent[0])
-        self.handle     = attr_init(init_map, "handle", Handle())
-        self.clearprevious = attr_init(init_map, "clearprevious")
-        # rounding mode (if applicable) of the operation
-        self.rounding_mode = attr_init(init_map, "rounding_mode", Attributes.default_rounding_mode[0])
+        if not init_map:
+            # fast path: every attribute is set to its default value
+            for attr_name, default_value in Attributes.constant_default_list:
+                setattr(self, attr_name, default_value)
+            self.precision = Attributes.default_precision[0]
+            self.silent = Attributes.default_silent[0]
+            self.rounding_mode = Attributes.default_rounding_mode[0]
+        else:
+            for attr_name, default_value in Attributes.constant_default_list:
+                setattr(self, attr_name, init_map.get(attr_name, default_value))
+            self.precision  = attr_init(init_map, "precision", Attributes.default_precision[0])
+            self.silent     = attr_init(init_map, "silent", Attributes.default_silent[0])
+            # rounding mode (if applicable) of the operation
+            self.rounding_mode = attr_init(init_map, "rounding_mode", Attributes.default_rounding_mode[0])
+            for dyn_attr in Attributes.dynamic_attribute_map:
+                attr_ctor = Attributes.dynamic_attribute_map[dyn_attr]
+                if dyn_attr in init_map or attr_ctor.required:
+                    setattr(self, dyn_attr, attr_ctor.attr_init(init_map))
+        # snapshot defaults may change after the node creation (e.g.
+        # init_stage follows the current stage of a CodeEntity)
+        for attr_ctor in Attributes.snapshot_attribute_list:
+            if not attr_ctor.name in init_map:
+                setattr(self, attr_ctor.name, attr_ctor.attr_init(init_map))
+        # handle is only allocated when accessed for the first time
+        # (or when shared with a copy), see get_handle
+        self._handle = init_map.get("handle", None)
+        # node owning this attributes object (target of its default handle)
+        self.owner = None
         self.rounding_mode_dependant = None
-        self.prevent_optimization = attr_init(init_map, "prevent_optimization")
-        self.unbreakable  = attr_init(init_map, "unbreakable", False)
-        for dyn_attr in Attributes.dynamic_attribute_map:
-          self.__setattr__(dyn_attr, Attributes.dynamic_attribute_map[dyn_attr].attr_init(init_map))
 
+    def bind_node(self, node):
+        """ declare node as the owner of self: the node handle
+            (possibly allocated later) references node """
+        self.owner = node
+        if not self._handle is None:
+            self._handle.set_node(node)
 
     def get_str(self, tab_level = 0):
         """ string conversion for operation graph 
@@ -132,26 +183,32 @@ class Attributes(object):
 
 
     def get_copy(self):
-        copied_attibute =  Attributes(precision = self.precision, 
-          interval = self.interval, 
-          debug = self.debug, 
-          exact = self.exact, 
-          tag = self.tag, 
-          max_abs_error = self.max_abs_error, 
-          rel_error = self.rel_error,
-          silent = self.silent, 
-          handle = self.handle, 
-          clearprevious = self.clearprevious, 
-          rounding_mode = self.rounding_mode, 
-          prevent_optimization = self.prevent_optimization
-        )
+        copied_attibute = Attributes.__new__(Attributes)
+        for attr_name in ("precision", "interval", "debug", "exact", "tag",
+                          "max_abs_error", "rel_error", "silent",
+                          "clearprevious", "rounding_mode",
+                          "prevent_optimization"):
+            setattr(copied_attibute, attr_name, getattr(self, attr_name))
+        # the copy shares the handle of the original attributes
+        copied_attibute._handle = self.get_handle()
+        copied_attibute.owner = None
+        copied_attibute.rounding_mode_dependant = None
+        copied_attibute.unbreakable = False
         # copying dynamic attributes
-        for dyn_attr in Attributes.dynamic_attribute_map:
-          copied_attibute.__setattr__(dyn_attr, getattr(self, dyn_attr))
+        if self.__dict__:
+            copied_attibute.__dict__.update(self.__dict__)
         return copied_attibute
 
     def get_light_copy(self):
-        return Attributes(precision = self.precision, debug = self.debug, tag = self.tag, silent = self.silent, handle = self.handle, clearprevious = self.clearprevious, rounding_mode = self.rounding_mode, prevent_optimization = self.prevent_optimization)
+        return Attributes(precision = self.precision, debug = self.debug, tag = self.tag, silent = self.silent, handle = self.get_handle(), clearprevious = self.clearprevious, rounding_mode = self.rounding_mode, prevent_optimization = self.prevent_optimization)
+
+    def get_attribute_map(self):
+        """ return a dict of every attribute (static and dynamic) value,
+            which can be used as an Attributes initialization map """
+        attribute_map = dict((attr_name, getattr(self, attr_name)) for attr_name in self.__slots__ if not attr_name in ("_handle", "owner", "__dict__"))
+        attribute_map["handle"] = self.get_handle()
+        attribute_map.update(self.__dict__)
+        return attribute_map
 
     def set_attr(self, **init_map):
         """ generic attribute setter """
@@ -216,10 +273,13 @@ class Attributes(object):
 
     def set_handle(self, new_handle):
         """ handle setter """
-        self.handle = new_handle
+        self._handle = new_handle
     def get_handle(self):
         """ handle getter """
-        return self.handle
+        if self._handle is None:
+            self._handle = Handle(self.owner)
+        return self._handle
+    handle = property(get_handle, set_handle)
 
     def get_clearprevious(self):
         return self.clearprevious
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: interval arithmetic on binary64 bounds with outward rounding,
+#              used as a fast alternative to sollya.Interval during range
+#              evaluation
+###############################################################################
+
+import sys
+import math
+import struct
+
+import sollya
+from sollya import Interval, SollyaObject
+
+
+class RangeEvalEngine:
+    """ interval engines available for range evaluation """
+    # every range is evaluated with sollya.Interval (default)
+    Sollya = "sollya"
+    # ranges are evaluated on binary64 bounds when possible,
+    # sollya.Interval is used as a fallback
+    Float = "float"
+
+## global range evaluation engine
+RANGE_EVAL_ENGINE = RangeEvalEngine.Sollya
+
+def set_range_eval_engine(engine):
+    """ set the global range evaluation engine """
+    global RANGE_EVAL_ENGINE
+    RANGE_EVAL_ENGINE = engine
+
+def is_float_range_eval_enabled():
+    """ predicate testing if range evaluation uses FloatInterval """
+    return RANGE_EVAL_ENGINE == RangeEvalEngine.Float
+
+
+# largest finite binary64 value
+BINARY64_MAX = sys.float_info.max
+# Veltkamp splitting constant (2**27 + 1) for binary64
+SPLIT_FACTOR = 134217729.0
+# bounds on operand and product magnitudes for which two_product is
+# error-free (no overflow in splitting, no underflow in error terms)
+TWO_PRODUCT_MAX = 2.0**995
+TWO_PRODUCT_MIN = 2.0**-969
+
+
+def next_up(value):
+    """ smallest binary64 value greater than value (math.nextafter
+        requires python 3.9) """
+    if math.isnan(value) or value == float("inf"):
+        return value
+    elif value == 0.0:
+        # smallest positive subnormal (from +0 or -0)
+        return 5e-324
+    bits = struct.unpack("<q", struct.pack("<d", value))[0]
+    bits = bits + 1 if value > 0 else bits - 1
+    return struct.unpack("<d", struct.pack("<q", bits))[0]
+
+def next_down(value):
+    """ largest binary64 value less than value """
+    return -next_up(-value)
+
+def two_sum(a, b):
+    """ return (s, e) such that s = RN(a + b) and a + b = s + e exactly
+        (a, b and s must be finite) """
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+def split(a):
+    """ Veltkamp splitting of a into two non-overlapping halves """
+    c = SPLIT_FACTOR * a
+    hi = c - (c - a)
+    return hi, a - hi
+
+def two_product(a, b):
+    """ return (p, e) such that p = RN(a * b) and a * b = p + e exactly
+        (under TWO_PRODUCT_MAX/TWO_PRODUCT_MIN magnitude constraints) """
+    p = a * b
+    a_hi, a_lo = split(a)
+    b_hi, b_lo = split(b)
+    return p, ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+def rounded_bounds(value, error):
+    """ return (down, up, exact) the tightest binary64 enclosure of
+        value + error, value being RN(value + error) """
+    if error == 0:
+        return value, value, True
+    elif error < 0:
+        return next_down(value), value, False
+    return value, next_up(value), False
+
+def overflow_bounds(value):
+    """ enclosure of a finite result whose rounding overflowed to value
+        (+/- infinity) """
+    if value > 0:
+        return BINARY64_MAX, value, False
+    return value, -BINARY64_MAX, False
+
+def add_bounds(a, b):
+    """ enclosure (down, up, exact) of a + b, None if undefined """
+    s = a + b
+    if math.isnan(s):
+        return None
+    elif math.isinf(s):
+        if math.isinf(a) or math.isinf(b):
+            return s, s, True
+        return overflow_bounds(s)
+    return rounded_bounds(*two_sum(a, b))
+
+def mul_bounds(a, b):
+    """ enclosure (down, up, exact) of a * b, None if undefined """
+    p = a * b
+    if math.isnan(p):
+        return None
+    elif math.isinf(p):
+        if math.isinf(a) or math.isinf(b):
+            return p, p, True
+        return overflow_bounds(p)
+    elif a == 0 or b == 0:
+        return p, p, True
+    elif abs(a) < TWO_PRODUCT_MAX and abs(b) < TWO_PRODUCT_MAX and TWO_PRODUCT_MIN < abs(p) < TWO_PRODUCT_MAX:
+        return rounded_bounds(*two_product(a, b))
+    # underflow or splitting overflow: conservative enclosure
+    return next_down(p), next_up(p), False
+
+def div_bounds(a, b):
+    """ enclosure (down, up, exact) of a / b (b finite and non-zero),
+        None if undefined """
+    if math.isinf(a) or math.isinf(b) or b == 0:
+        return None
+    q = a / b
+    if math.isinf(q):
+        return overflow_bounds(q)
+    elif a == 0:
+        return q, q, True
+    elif abs(q) < TWO_PRODUCT_MAX and abs(b) < TWO_PRODUCT_MAX and TWO_PRODUCT_MIN < abs(a) < TWO_PRODUCT_MAX:
+        p, e = two_product(q, b)
+        if p == a and e == 0:
+            return q, q, True
+    return next_down(q), next_up(q), False
+
+
+class FloatInterval:
+    """ closed interval [lo, hi] with binary64 bounds.
+        Arithmetic operations round bounds outward so results always
+        enclose the exact range, the exact flag records if the
+        bounds are the exact bounds of the range (no rounding occured).
+        inf, sup, interval and is_empty provide MetaInterval compatibility """
+    __slots__ = ("lo", "hi", "exact", "_sollya_interval")
+
+    def __init__(self, lo, hi, exact=True):
+        self.lo = lo
+        self.hi = hi
+        self.exact = exact
+        self._sollya_interval = None
+
+    @property
+    def inf(self):
+        return self.lo
+    @property
+    def sup(self):
+        return self.hi
+    @property
+    def is_empty(self):
+        return False
+
+    @property
+    def interval(self):
+        """ sollya.Interval equivalent to self """
+        if self._sollya_interval is None:
+            self._sollya_interval = Interval(self.lo, self.hi)
+        return self._sollya_interval
+
+    def __repr__(self):
+        return "[{};{}]".format(self.lo, self.hi)
+
+    def __contains__(self, value):
+        if isinstance(value, FloatInterval):
+            return self.lo <= value.lo and value.hi <= self.hi
+        return self.lo <= value <= self.hi
+
+    def __neg__(self):
+        return FloatInterval(-self.hi, -self.lo, self.exact)
+
+    def __abs__(self):
+        if self.lo >= 0:
+            return self
+        elif self.hi <= 0:
+            return -self
+        return FloatInterval(0.0, max(-self.lo, self.hi), self.exact)
+
+    def __or__(self, other):
+        """ convex hull of self and other """
+        return FloatInterval(min(self.lo, other.lo), max(self.hi, other.hi), self.exact and other.exact)
+
+    def __add__(self, other):
+        lo_bounds = add_bounds(self.lo, other.lo)
+        hi_bounds = add_bounds(self.hi, other.hi)
+        if lo_bounds is None or hi_bounds is None:
+            return None
+        return FloatInterval(lo_bounds[0], hi_bounds[1],
+                             self.exact and other.exact and lo_bounds[2] and hi_bounds[2])
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def bound_combination(self, other, bound_function):
+        """ enclosure of {bound_function(x, y), x in self, y in other} for
+            a function whose extrema are reached on the bounds """
+        lo = math.inf
+        hi = -math.inf
+        exact = self.exact and other.exact
+        for x in (self.lo, self.hi):
+            for y in (other.lo, other.hi):
+                bounds = bound_function(x, y)
+                if bounds is None:
+                    return None
+                down, up, bound_exact = bounds
+                exact = exact and bound_exact
+                lo = min(lo, down)
+                hi = max(hi, up)
+        return FloatInterval(lo, hi, exact)
+
+    def __mul__(self, other):
+        return self.bound_combination(other, mul_bounds)
+
+    def __truediv__(self, other):
+        if other.lo <= 0 <= other.hi:
+            # divisor interval contains zero
+            return None
+        return self.bound_combination(other, div_bounds)
+
+
+def float_interval_min(lhs, rhs):
+    """ range of min(x, y) for x in lhs and y in rhs """
+    return FloatInterval(min(lhs.lo, rhs.lo), min(lhs.hi, rhs.hi), lhs.exact and rhs.exact)
+
+def float_interval_max(lhs, rhs):
+    """ range of max(x, y) for x in lhs and y in rhs """
+    return FloatInterval(max(lhs.lo, rhs.lo), max(lhs.hi, rhs.hi), lhs.exact and rhs.exact)
+
+
+def float_interval_from_value(value):
+    """ convert a Python int or float value to a (point) FloatInterval,
+        None if value is not exactly representable in binary64 """
+    try:
+        float_value = float(value)
+    except OverflowError:
+        return None
+    if math.isnan(float_value) or float_value != value:
+        return None
+    return FloatInterval(float_value, float_value)
+
+def float_interval_from_sollya(interval):
+    """ convert a sollya.Interval to a FloatInterval, None if one of its
+        bounds is not exactly representable in binary64 """
+    if isinstance(interval, FloatInterval):
+        return interval
+    elif not isinstance(interval, SollyaObject) or not interval.is_range():
+        return None
+    bounds = []
+    for bound in (sollya.inf(interval), sollya.sup(interval)):
+        float_bound = float(bound)
+        if math.isnan(float_bound) or not bound == float_bound:
+            return None
+        bounds.append(float_bound)
+    result = FloatInterval(bounds[0], bounds[1])
+    result._sollya_interval = interval
+    return result
+
+def to_sollya_interval(interval):
+    """ convert a FloatInterval to a sollya.Interval (other objects are
+        returned unchanged) """
+    if isinstance(interval, FloatInterval):
+        return interval.interval
+    return interval
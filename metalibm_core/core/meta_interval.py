@@ -2,10 +2,14 @@ from sollya import Interval, SollyaObject
 import sollya
 import itertools
 
+from metalibm_core.core.float_interval import FloatInterval
+
 def convert_to_MetaInterval(obj):
     """ convert basic numeric objects to MetaInterval if possible """
     if isinstance(obj, MetaInterval):
         return obj
+    elif isinstance(obj, FloatInterval):
+        return MetaInterval(obj.interval)
     elif isinstance(obj, SollyaObject) and obj.is_range():
         return MetaInterval(obj)
     elif isinstance(obj, (float, int, SollyaObject)):
@@ -214,7 +218,7 @@ def inf(obj):
     """ generic getter for interval inferior bound """
     if isinstance(obj, SollyaObject) and obj.is_range():
         return sollya.inf(obj)
-    elif isinstance(obj, (MetaInterval, MetaIntervalList)):
+    elif isinstance(obj, (MetaInterval, MetaIntervalList, FloatInterval)):
         return obj.inf
     else:
         raise NotImplementedError
@@ -224,7 +228,7 @@ def sup(obj):
     """ generic getter for interval superior bound """
     if isinstance(obj, SollyaObject) and obj.is_range():
         return sollya.sup(obj)
-    elif isinstance(obj, (MetaInterval, MetaIntervalList)):
+    elif isinstance(obj, (MetaInterval, MetaIntervalList, FloatInterval)):
         return obj.sup
     else:
         raise NotImplementedError
@@ -85,12 +85,15 @@ from metalibm_core.code_generation.gappa_code_generator import (
 )
 
 from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.test_vector_file import get_test_file_identity
+from metalibm_core.utility.cache_utils import atomic_write
 from metalibm_core.utility.ml_template import (
     ArgDefault, DefaultEntityArgTemplate
 )
 
 from metalibm_core.opt.p_pipelining import generate_pipeline_stage
 
+import os
 import random
 import subprocess
 
@@ -299,6 +302,8 @@ class GHDLSimulation(HDLSimulation):
 ## Base class for all metalibm function (metafunction)
 class ML_EntityBasis(object):
   name = "entity_basis"
+  # number of test cases generated (emulated) at once in a test file
+  TEST_FILE_BATCH_SIZE = 65536
 
   ## constructor
   #  @param base_name string function name (without precision considerations)
@@ -366,6 +371,14 @@ class ML_EntityBasis(object):
     self.auto_test_std     = auto_test_std
     # embedded test in behavior or externalize inputs/expected in data file
     self.externalized_test_data = arg_template.externalized_test_data
+    # test data file streamed by the testbench (generated in batches
+    # if it does not exist)
+    self.test_file = arg_template.test_file
+    self.generate_test_file_only = arg_template.generate_test_file_only
+    if self.test_file:
+      self.auto_test_enable = True
+    # number of test cases of the testbench (set by generate_auto_test)
+    self.test_case_num = None
 
     # enable/disable automatic exit once functional test is finished
     self.exit_after_test   = arg_template.exit_after_test
@@ -622,6 +635,14 @@ class ML_EntityBasis(object):
     # generate scheme
     code_entity_list = self.generate_entity_list()
 
+    if self.generate_test_file_only:
+      if not self.test_file:
+        Log.report(Log.Error, "test file generation requires a test file path (--test-file)")
+      self.generate_test_file(
+        self.test_file, self.auto_test_number if self.auto_test_number else 0,
+        test_range=self.auto_test_range)
+      return
+
     Log.report(Log.Info, "Applying passes at start of generation")
     code_entity_list = self.pass_scheduler.get_full_execute_from_slot(
       code_entity_list,
@@ -699,7 +720,7 @@ class ML_EntityBasis(object):
         Log.report(Log.Error, "unknown RTL elab and simulation tool: {}", self.simulator)
 
     if self.execute_trigger:
-      test_delay = time_step * (self.stage_num + 2) * (self.auto_test_number + (len(self.standard_test_cases) if self.auto_test_std else 0) + 100) 
+      test_delay = time_step * (self.stage_num + 2) * ((self.test_case_num or 0) + 100)
       sim_result = simulation.elab_and_run(test_delay, debug=self.debug_flag, exit_after_test=self.exit_after_test)
       # rtl elaboration
       if sim_result:
@@ -848,6 +869,93 @@ class ML_EntityBasis(object):
     return output_signals
 
 
+  def get_test_data_legend(self, input_signals, output_signals):
+    """ legend line of a test data file: identity of the entity (class,
+        numeric emulation and signal formats) followed by column tags """
+    identity = get_test_file_identity(
+      "{}.{}".format(self.__class__.__module__, self.__class__.__qualname__),
+      self.__class__.numeric_emulate,
+      [(tag, signal.precision) for tag, signal in input_signals.items()],
+      [(tag, signal.precision) for tag, signal in output_signals.items()],
+    )
+    return "# identity={} ".format(identity) + " ".join(list(input_signals.keys()) + list(output_signals.keys()))
+
+  def write_test_data_header(self, data_file, input_signals, output_signals):
+    """ dump legend line of a test data file """
+    data_file.write(self.get_test_data_legend(input_signals, output_signals) + "\n")
+
+  def is_test_file_reusable(self, test_fname, input_signals, output_signals):
+    """ predicate indicating if the existing test data file test_fname
+        has been generated for self (same identity and signals) """
+    if not os.path.isfile(test_fname):
+      return False
+    with open(test_fname) as data_file:
+      legend = data_file.readline().rstrip("\n")
+    if legend != self.get_test_data_legend(input_signals, output_signals):
+      Log.report(Log.Warning, "test file {} was generated for another entity (or signal formats), it is regenerated", test_fname)
+      return False
+    Log.report(Log.Info, "reusing test file {}", test_fname)
+    return True
+
+  def write_test_data(self, data_file, tc_list, input_signals, output_signals):
+    """ dump the test cases of tc_list (list of (input_values, output_values))
+        as lines of hexadecimal values in data_file """
+    def get_raw_cst_column(cst_format, cst_value_list):
+        """ encode a whole column of test values at once """
+        size = int((cst_format.get_bit_size() + 3) / 4)
+        return [hex_str.zfill(size) for hex_str in cst_format.get_base_format().encode_many_hex(cst_value_list)]
+
+    column_list = [
+        get_raw_cst_column(
+            input_signals[input_name].get_precision(),
+            [input_values[input_name] for input_values, _ in tc_list])
+        for input_name in input_signals
+    ] + [
+        get_raw_cst_column(
+            output_signals[output_name].get_precision(),
+            [output_values[output_name] for _, output_values in tc_list])
+        for output_name in output_signals
+    ]
+    for cst_list in zip(*column_list):
+        # dumping line into file
+        data_file.write(" ".join(cst_list) + "\n")
+
+  def generate_test_file(self, test_fname, test_num, test_range=None):
+    """ Generate the test data file test_fname (standard test cases if
+        enabled and test_num random test cases with their expected outputs).
+        Test cases are generated and emulated by batches so the number
+        of test cases is not bounded by memory
+
+        :return: number of test cases written """
+    io_map = {}
+    input_signals = self.generate_input_signal_map(io_map)
+    output_signals = self.generate_output_signal_map(io_map)
+    self.init_test_generator(io_map, test_range)
+
+    std_tc_list = self.standard_test_cases if self.auto_test_std else []
+    test_total = len(std_tc_list) + test_num
+    Log.report(Log.Info, "generating {} test cases in {}", test_total, test_fname)
+
+    def compute_results(tc):
+        """ update test case with output values if required """
+        input_values, output_values = tc
+        if output_values is None:
+            return input_values, self.numeric_emulate(input_values)
+        else:
+            return tc
+
+    with atomic_write(test_fname) as data_file:
+        self.write_test_data_header(data_file, input_signals, output_signals)
+        self.write_test_data(data_file, [compute_results(tc) for tc in std_tc_list], input_signals, output_signals)
+        for batch_start in range(0, test_num, self.TEST_FILE_BATCH_SIZE):
+            tc_list = [
+                compute_results((self.generate_test_case(input_signals, io_map, i), None))
+                for i in range(batch_start, min(test_num, batch_start + self.TEST_FILE_BATCH_SIZE))
+            ]
+            self.write_test_data(data_file, tc_list, input_signals, output_signals)
+            Log.report(Log.Info, "{} / {} test cases generated", len(std_tc_list) + batch_start + len(tc_list), test_total)
+    return test_total
+
   def generate_datafile_testbench(self, tc_list, io_map, input_signals, output_signals, time_step, test_fname="test.input"):
     """ Generate testbench with input and output data externalized in
         a data file """
@@ -916,28 +1024,11 @@ class ML_EntityBasis(object):
 
     DATA_FILE_NAME = test_fname
 
-    with open(DATA_FILE_NAME, "w") as data_file:
-        # dumping column tags
-        data_file.write("# " + " ".join(input_signal_list + output_signal_list) + "\n")
-
-        def get_raw_cst_string(cst_format, cst_value):
-            size = int((cst_format.get_bit_size() + 3) / 4)
-            return ("{:x}").format(cst_format.get_base_format().get_integer_coding(cst_value)).zfill(size)
-
-        for input_values, output_values in tc_list:
-            # TODO; generate test data file
-            cst_list = []
-            for input_name in input_signal_list:
-                input_value = input_values[input_name]
-                input_format = input_signals[input_name].get_precision()
-                cst_list.append(get_raw_cst_string(input_format, input_value))
-
-            for output_name in output_signal_list:
-                output_value = output_values[output_name]
-                output_format = output_signals[output_name].get_precision()
-                cst_list.append(get_raw_cst_string(output_format, output_value))
-            # dumping line into file
-            data_file.write(" ".join(cst_list) + "\n")
+    # tc_list is None when the data file has already been generated
+    if not tc_list is None:
+        with open(DATA_FILE_NAME, "w") as data_file:
+            self.write_test_data_header(data_file, input_signals, output_signals)
+            self.write_test_data(data_file, tc_list, input_signals, output_signals)
 
     input_stream = Variable("data_file", precision=HDL_FILE, var_type=Variable.Local)
     file_status = Variable("file_status", precision=HDL_OPEN_FILE_STATUS, var_type=Variable.Local)
@@ -1034,6 +1125,18 @@ class ML_EntityBasis(object):
     # map of output_tag -> output_signal
     output_signals = self.generate_output_signal_map(io_map)
 
+    if self.test_file:
+        # test cases are streamed by the testbench from a data file
+        # which is only generated if it does not exist (or was generated
+        # for another entity)
+        if self.is_test_file_reusable(self.test_file, input_signals, output_signals):
+            with open(self.test_file) as data_file:
+                # legend line is excluded
+                self.test_case_num = sum(1 for _ in data_file) - 1
+        else:
+            self.test_case_num = self.generate_test_file(self.test_file, test_num, test_range)
+        return self.generate_datafile_testbench(None, io_map, input_signals, output_signals, time_step, test_fname=os.path.abspath(self.test_file))
+
     # building list of test cases
     tc_list = []
 
@@ -1059,6 +1162,7 @@ class ML_EntityBasis(object):
 
     # filling output values
     tc_list = [compute_results(tc) for tc in tc_list]
+    self.test_case_num = len(tc_list)
     if self.externalized_test_data:
         return self.generate_datafile_testbench(tc_list, io_map, input_signals, output_signals, time_step, test_fname=self.externalized_test_data)
     else:
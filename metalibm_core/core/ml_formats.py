@@ -37,9 +37,15 @@
 ###############################################################################
 
 import operator
+import math
 import re
 
 import sollya
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
 from metalibm_core.utility.log_report import Log
 from metalibm_core.code_generation.code_constant import *
 from metalibm_core.core.special_values import (
@@ -143,6 +149,22 @@ class ML_Format(object):
     def get_integer_coding(self, value):
         raise NotImplementedError
 
+    def encode_many(self, values):
+        """ return the integer encodings of the list of values
+            (generic version which encodes one value at a time) """
+        return [self.get_integer_coding(value) for value in values]
+
+    def encode_many_hex(self, values):
+        """ return the list of hexadecimal strings (without prefix and
+            zero-padded to the format size) of the encodings of values """
+        size = int((self.get_bit_size() + 3) / 4)
+        return [("{:x}").format(int(coding)).zfill(size) for coding in self.encode_many(values)]
+
+    def get_cst_many(self, values, language=C_Code):
+        """ return the list of the source code constants of values
+            (generic version which converts one value at a time) """
+        return [self.get_cst(value, language=language) for value in values]
+
     def saturate(self, value):
         """ Return value if it fits in self format range, else
             the closest format bound """
@@ -293,6 +315,40 @@ class ML_FP_Format(ML_Format):
             is a floating-point format """
         return isinstance(precision, ML_FP_Format)
 
+def get_hex_float_str(value):
+    """ return the shortest C99 hexadecimal literal of the python float
+        value (trailing zero digits of float.hex are removed) """
+    mantissa, exponent = value.hex().split("p")
+    return "{}p{}".format(mantissa.rstrip("0").rstrip("."), exponent)
+
+def get_exact_double(value):
+    """ return value as a python float if it is a finite number exactly
+        representable in binary64, else None """
+    if FP_SpecialValue.is_special_value(value):
+        return None
+    elif isinstance(value, float):
+        return value if math.isfinite(value) else None
+    try:
+        double_value = float(value)
+    except (OverflowError, ValueError, TypeError):
+        return None
+    if not math.isfinite(double_value):
+        return None
+    if isinstance(value, int):
+        return double_value if double_value == value else None
+    elif isinstance(value, sollya.SollyaObject):
+        return double_value if sollya.SollyaObject(double_value) == value else None
+    return None
+
+
+## numpy types of the IEEE formats supported by the batch encoding
+#  fast path, indexed by (exponent size, field size)
+NUMPY_FP_TYPE_NAMES = {
+    (5, 10): ("float16", "uint16"),
+    (8, 23): ("float32", "uint32"),
+    (11, 52): ("float64", "uint64"),
+}
+
 ## Ancestor class for standard (as defined in IEEE-754) floating-point formats
 class ML_Std_FP_Format(ML_FP_Format):
     """ standard floating-point format base class """
@@ -385,6 +441,99 @@ class ML_Std_FP_Format(ML_FP_Format):
                     mant = int((value / S2**exp - 1.0) * (S2**self.get_field_size()))
             return mant | (exp_biased << self.get_field_size()) | (sign << (self.get_field_size() + self.get_exponent_size()))
 
+    def get_numpy_types(self):
+        """ return the pair of numpy (float, unsigned integer) types
+            matching @p self, or None if numpy is not available or @p self
+            does not match a numpy floating-point type """
+        if not numpy_available:
+            return None
+        key = (self.get_exponent_size(), self.get_field_size())
+        if not key in NUMPY_FP_TYPE_NAMES or self.get_bit_size() != 1 + sum(key):
+            return None
+        float_name, uint_name = NUMPY_FP_TYPE_NAMES[key]
+        return getattr(numpy, float_name), getattr(numpy, uint_name)
+
+    def encode_many(self, values):
+        """ return the encodings of the list of values as a numpy array of
+            unsigned integers (uint16/uint32/uint64).
+            Values exactly representable in binary64 are rounded (to
+            nearest) and encoded through numpy, other values (special
+            values, values requiring extra precision) are encoded by
+            get_integer_coding. If numpy is not available (or @p self has no
+            numpy equivalent), a list of integers is returned """
+        numpy_types = self.get_numpy_types()
+        if numpy_types is None:
+            return ML_Format.encode_many(self, values)
+        float_type, uint_type = numpy_types
+        values = list(values)
+        double_values = numpy.zeros(len(values), dtype=numpy.float64)
+        slow_index_list = []
+        for index, value in enumerate(values):
+            double_value = get_exact_double(value)
+            if double_value is None:
+                slow_index_list.append(index)
+            else:
+                double_values[index] = double_value
+        # a single (correctly rounded) conversion from the exact binary64
+        # value, overflows are expected to produce infinities
+        with numpy.errstate(over="ignore"):
+            encodings = double_values.astype(float_type).view(uint_type)
+        for index in slow_index_list:
+            encodings[index] = self.get_integer_coding(values[index])
+        return encodings
+
+    def get_cst_many(self, values, language=C_Code):
+        """ return the list of the source code constants of values.
+            C constants of finite non-zero values are built (as C99
+            hexadecimal literals) from the encodings of encode_many,
+            other values are converted by get_cst """
+        values = list(values)
+        numpy_types = self.get_numpy_types()
+        if not language is C_Code or numpy_types is None:
+            return ML_Format.get_cst_many(self, values, language=language)
+        float_type, _ = numpy_types
+        double_values = self.encode_many(values).view(float_type).astype(numpy.float64)
+        return [
+            get_hex_float_str(float(double_value)) + self.c_suffix if numpy.isfinite(double_value) and double_value != 0
+            else self.get_cst(value, language=language)
+            for value, double_value in zip(values, double_values)
+        ]
+
+    def get_cst_many_from_encodings(self, encodings, language=C_Code):
+        """ return the list of the source code constants of the values
+            encoded by the sequence of unsigned encodings, C constants of
+            finite non-zero values are built without decoding them to
+            numerical values """
+        numpy_types = self.get_numpy_types()
+        if not language is C_Code or numpy_types is None:
+            return self.get_cst_many(self.decode_many(encodings), language=language)
+        float_type, uint_type = numpy_types
+        encodings = numpy.asarray(encodings).astype(uint_type)
+        double_values = encodings.view(float_type).astype(numpy.float64)
+        return [
+            get_hex_float_str(float(double_value)) + self.c_suffix if numpy.isfinite(double_value) and double_value != 0
+            else self.get_cst(self.get_value_from_integer_coding(str(int(coding))), language=language)
+            for double_value, coding in zip(double_values, encodings)
+        ]
+
+    def decode_many(self, encodings):
+        """ return the list of values (numerical or special) of the
+            sequence of unsigned encodings (counterpart of encode_many).
+            Finite non-zero values are decoded through numpy (if @p self
+            has a numpy equivalent), other values by
+            get_value_from_integer_coding """
+        numpy_types = self.get_numpy_types()
+        if numpy_types is None:
+            return [self.get_value_from_integer_coding(str(int(coding))) for coding in encodings]
+        float_type, uint_type = numpy_types
+        encodings = numpy.asarray(encodings).astype(uint_type)
+        double_values = encodings.view(float_type).astype(numpy.float64)
+        regular = numpy.isfinite(double_values) & (double_values != 0)
+        return [
+            NumericValue(float(value)) if is_regular else self.get_value_from_integer_coding(str(int(coding)))
+            for value, is_regular, coding in zip(double_values, regular, encodings)
+        ]
+
     def get_value_from_integer_coding(self, value, base=10):
         """ Convert a value binary encoded following IEEE-754 standard
             to its floating-point numerical (or special) counterpart """
@@ -34,7 +34,10 @@
 ###############################################################################
 
 import os
+import math
+import itertools
 import random
+import statistics
 import subprocess
 import re
 
@@ -49,8 +52,8 @@ from sollya import inf, sup, Interval
 from metalibm_core.core.ml_formats import *
 from metalibm_core.core.ml_optimization_engine import OptimizationEngine
 from metalibm_core.core.ml_operations import *
-from metalibm_core.core.ml_table import ML_NewTable
-from metalibm_core.core.ml_complex_formats import ML_Mpfr_t
+from metalibm_core.core.ml_table import ML_NewTable, get_binary_encoding_size
+from metalibm_core.core.ml_complex_formats import ML_Mpfr_t, ML_Pointer_Format
 from metalibm_core.core.ml_call_externalizer import (
     CallExternalizer, generate_function_from_optree
 )
@@ -60,6 +63,10 @@ from metalibm_core.core.ml_vectorizer import (
 )
 from metalibm_core.core.precisions import *
 from metalibm_core.core.random_gen import get_precision_rng
+from metalibm_core.core.numpy_random_gen import get_numpy_precision_rng
+from metalibm_core.core.stratified_sampling import (
+    StratifiedSampler, extract_condition_boundaries, is_stratified_sampling_supported
+)
 
 from metalibm_core.code_generation.code_object import (
     NestedCode, MultiSymbolTable
@@ -81,6 +88,15 @@ from metalibm_core.utility.debug_utils import *
 from metalibm_core.utility.ml_template import DefaultArgTemplate
 import metalibm_core.utility.build_utils as build_utils
 from metalibm_core.utility.num_utils import ulp
+from metalibm_core.utility.test_vector_file import (
+    TestVectorFileWriter, is_test_file_format, get_record_size,
+    get_test_file_identity, check_test_file
+)
+from metalibm_core.utility.cache_utils import get_tmp_path
+from metalibm_core.utility.pass_profiler import profile_section, count_fct_group_nodes
+from metalibm_core.utility.parallel_utils import (
+    fork_map_chunks, encode_numeric_value, decode_numeric_value
+)
 
 
 from metalibm_core.code_generation.code_object import CodeObjectRegistry
@@ -114,6 +130,26 @@ class ValidError(Exception):
     pass
 
 
+## tag prefixing the stdout line printed for each timed bench repetition
+BENCH_REPETITION_TAG = "ml_bench_rep"
+
+def get_bench_statistics(cpe_list):
+    """ compute statistics (min, median, 90th percentile, standard
+        deviation) over a list of per-repetition CPE measures """
+    if not cpe_list:
+        return {"repetitions": [], "min": None, "median": None, "p90": None, "stddev": None}
+    sorted_list = sorted(cpe_list)
+    # nearest-rank 90th percentile
+    p90_index = max(0, int(math.ceil(0.9 * len(sorted_list))) - 1)
+    return {
+        "repetitions": list(cpe_list),
+        "min": sorted_list[0],
+        "median": statistics.median(sorted_list),
+        "p90": sorted_list[p90_index],
+        "stddev": statistics.pstdev(sorted_list),
+    }
+
+
 def convert_error_to_ulp(error_value, error_format):
     """ convert error_value whose assuming format error_format
         to a ulp(s) metric """
@@ -372,6 +408,10 @@ def generate_opencl_vector_wrapper(main_precision, vector_size, vec_arg_list,
 class ML_FunctionBasis(object):
   name = "function_basis"
   arity = 1
+  # number of test file blocks generated (emulated) at once
+  TEST_FILE_BATCH_BLOCK_NUM = 16
+  # number of random test inputs generated at once by numpy generators
+  RANDOM_INPUT_CHUNK_SIZE = 65536
 
   ## constructor
   #   @param all arguments are transmittaed throughs @p arguments object which
@@ -401,9 +441,28 @@ class ML_FunctionBasis(object):
     self.auto_test_range = args.auto_test_range
     self.auto_test_std   = args.auto_test_std 
     self.value_test = args.value_test
+    # number of worker processes used to emulate test outputs
+    self.test_gen_jobs = args.test_gen_jobs
+    # test vectors streamed at runtime from a binary file (None to embed
+    # them in the generated source)
+    self.test_file = args.test_file
+    self.test_file_block_size = args.test_file_block_size
+    # only generate the test file (without generating the implementation)
+    self.generate_test_file_only = args.generate_test_file_only
+    # random input generation seed and engine
+    self.seed = args.seed
+    self.test_rng = args.test_rng
+    # random test input sampling (random or stratified)
+    self.test_sampling = args.test_sampling
 
     # enable the computation of maximal error during functional testing
     self.compute_max_error = args.compute_max_error
+    if self.test_file:
+      # streamed test vectors are always checked by the auto-test wrapper
+      self.auto_test_enable = True
+      if self.compute_max_error:
+        Log.report(Log.Warning, "max error evaluation is not supported with a test file, it is disabled")
+        self.compute_max_error = False
     self.break_error = args.break_error
 
     # enable and configure the generation of a performance bench
@@ -412,6 +471,12 @@ class ML_FunctionBasis(object):
     self.bench_test_range = args.bench_test_range
     # number of benchmark loop to run
     self.bench_loop_num = args.bench_loop_num
+    # number of timed bench repetitions (0 for a single global measure)
+    self.bench_repeat = args.bench_repeat
+    # number of untimed warm-up bench loops
+    self.bench_warmup = args.bench_warmup
+    # enable latency-bound bench (each call's output feeds the next input)
+    self.bench_latency = args.bench_latency
 
     self.display_stdout = args.display_stdout
 
@@ -424,6 +489,14 @@ class ML_FunctionBasis(object):
     # binary execution
     self.execute_trigger = args.execute_trigger
 
+    # exhaustive test (native harness sweeping input encodings)
+    self.exhaustive_test = not args.exhaustive_test is False
+    self.exhaustive_range = None if args.exhaustive_test in (None, True, False) else args.exhaustive_test
+    self.exhaustive_threads = args.exhaustive_threads
+    self.exhaustive_reference = args.exhaustive_reference
+    self.exhaustive_max_ulp = args.exhaustive_max_ulp
+    self.base_name = args.base_name
+
     # Naming logic, using provided information if available, otherwise deriving from base_name
     # base_name is e.g. exp
     # function_name is e.g. expf or expd or whatever 
@@ -463,6 +536,9 @@ class ML_FunctionBasis(object):
     self.plot_steps = args.plot_steps
     # internal flag which indicate that at least one plot must be generated
     self.plot_enabled = self.plot_function or self.plot_error
+    # generate an array wrapper of the implementation (required to plot
+    # through LoadedBinary.call_array)
+    self.array_wrapper = args.array_wrapper or self.plot_enabled
 
     # instance of CodeFunction containing the function implementation
     self.implementation = CodeFunction(self.function_name, output_format=self.get_output_precision())
@@ -489,7 +565,8 @@ class ML_FunctionBasis(object):
             PassScheduler.Typing,
             PassScheduler.Optimization,
             PassScheduler.JustBeforeCodeGen
-        ]
+        ],
+        node_counter=count_fct_group_nodes
     )
 
     self.processor.instanciate_pass_pipeline(self.pass_scheduler,
@@ -724,18 +801,24 @@ class ML_FunctionBasis(object):
 
         """
     # generate scheme
-    function_group = self.generate_function_list()
+    with profile_section("phase", "scheme_generation", function_name=self.function_name):
+        function_group = self.generate_function_list()
 
-    function_group = self.transform_function_group(function_group)
+    with profile_section("phase", "passes", function_name=self.function_name,
+                         node_counter=lambda: count_fct_group_nodes(function_group)):
+        function_group = self.transform_function_group(function_group)
 
-    main_pre_statement, main_statement, function_group = self.instrument_function_group(function_group, enable_subexpr_sharing=enable_subexpr_sharing)
+    with profile_section("phase", "instrumentation", function_name=self.function_name):
+        main_pre_statement, main_statement, function_group = self.instrument_function_group(function_group, enable_subexpr_sharing=enable_subexpr_sharing)
 
     embedding_binary = self.embedded_binary and self.processor.support_embedded_bin
 
     # required for basic metalibm's integer types
     self.get_main_code_object().add_header("stdint.h")
 
-    source_code = self.generate_output(embedding_binary, main_pre_statement, main_statement, function_group)
+    with profile_section("phase", "codegen", function_name=self.function_name,
+                         node_counter=lambda: count_fct_group_nodes(function_group)):
+        source_code = self.generate_output(embedding_binary, main_pre_statement, main_statement, function_group)
     return function_group, source_code
 
   def generate_full_source_code(self, enable_subexpr_sharing=True):
@@ -763,9 +846,25 @@ class ML_FunctionBasis(object):
             enable_subexpr_sharing (bool): I.R enable sub-expression sharing
     """
 
+    if self.generate_test_file_only:
+      if not self.test_file:
+        Log.report(Log.Error, "test file generation requires a test file path (--test-file)")
+      if self.test_sampling == "stratified" and self.get_vector_size() == 1:
+        # stratified sampling boundaries are extracted from the
+        # implementation scheme
+        self.generate_function_list()
+      self.generate_test_file(self.test_file, self.get_auto_test_number(), self.auto_test_range)
+      return {}
+
     function_group, source_code = self.fill_code_object(enable_subexpr_sharing=enable_subexpr_sharing)
+    # local import to avoid circular dependency (through axf_utils)
+    from metalibm_core.utility.approx_cache import get_approx_cache
+    approx_cache = get_approx_cache()
+    if not approx_cache is None:
+      Log.report(Log.Info, "approximation cache: {hit} hit(s), {miss} miss(es)", **approx_cache.get_stats())
     embedding_binary = self.embedded_binary and self.processor.support_embedded_bin
-    return self.build_and_execute_source_code(function_group, source_code, embedding_binary=embedding_binary)
+    with profile_section("phase", "build_execute", function_name=self.function_name):
+        return self.build_and_execute_source_code(function_group, source_code, embedding_binary=embedding_binary)
 
   def transform_function_group(self, function_group):
     """ Apply registered passes to a function_group """
@@ -863,10 +962,21 @@ class ML_FunctionBasis(object):
                 )
         return mapped_function
 
+    # generate auto-test wrapper streaming test vectors from a file
+    if self.auto_test_enable and self.test_file:
+        if not self.is_test_file_reusable(self.test_file):
+            self.generate_test_file(self.test_file, self.get_auto_test_number(), self.auto_test_range)
+        input_tables, output_table = self.generate_test_file_tables()
+        auto_test_function_group = self.generate_test_wrapper(
+            None, input_tables, output_table
+        )
+        auto_test_function_group.apply_to_all_functions(add_fct_call_check_in_main())
+        function_group.merge_with_group(auto_test_function_group)
+
     # generate auto-test wrapper
-    if self.auto_test_enable or self.compute_max_error:
+    elif self.auto_test_enable or self.compute_max_error:
         # common test tables for auto_test and max_error
-        test_num = self.auto_test_number if self.auto_test_number else 0
+        test_num = self.get_auto_test_number()
         DEFAULT_MAX_ERROR_TEST_NUMBER = 10000
 
         if not self.auto_test_enable and self.compute_max_error:
@@ -899,19 +1009,31 @@ class ML_FunctionBasis(object):
             max_error_fct_group.apply_to_all_functions(add_fct_call_check_in_main(check=None))
             function_group.merge_with_group(max_error_fct_group)
 
+    if self.array_wrapper:
+        array_wrapper_group = self.generate_array_wrapper()
+        if not array_wrapper_group is None:
+            # array wrapper is not called from main
+            array_wrapper_group.apply_to_all_functions(fct_group_apply_std_fct_flow)
+            function_group.merge_with_group(array_wrapper_group)
+
     if self.bench_enabled:
         # TODO/FIXME: the number of bench inputs default to 1000 (not documented)
         # when bench is enabled but bench_test_number is not set
         bench_function_group = self.generate_bench_wrapper(
             test_num=self.bench_test_number if self.bench_test_number else 1000,
             loop_num=self.bench_loop_num,
-            test_ranges=self.bench_test_range
+            test_ranges=self.bench_test_range,
+            repeat=self.bench_repeat,
+            warmup=self.bench_warmup,
+            latency=self.bench_latency,
         )
 
         def bench_check(bench_call):
             return Comparison(bench_call, Constant(0.0, precision=ML_Binary64), specifier=Comparison.Less, precision=ML_Bool)
 
-        bench_function_group.apply_to_all_functions(add_fct_call_check_in_main(bench_check))
+        bench_function_group.apply_to_core_functions(add_fct_call_check_in_main(bench_check))
+        # sub-functions (e.g. bench result accessors) are not called from main
+        bench_function_group.apply_to_sub_functions(fct_group_apply_std_fct_flow)
         # appending bench wrapper to general code_function_list
         function_group.merge_with_group(bench_function_group)
     return main_pre_statement, main_statement, function_group
@@ -959,7 +1081,7 @@ class ML_FunctionBasis(object):
   def build_trigger(self):
     """ shared accessor to determine if build is required """
     # plotting function requires it to be build and imported
-    build_trigger = self.build_enable or self.execute_trigger or self.plot_enabled
+    build_trigger = self.build_enable or self.execute_trigger or self.plot_enabled or self.exhaustive_test
     return build_trigger
 
 
@@ -1001,19 +1123,29 @@ class ML_FunctionBasis(object):
             loaded_module = bin_file.loaded_binary
             plot_range_size = sup(self.plot_range) - inf(self.plot_range)
             x_list = [float(inf(self.plot_range) + i / self.plot_steps * plot_range_size) for i in range(self.plot_steps)] 
-            # extracting main function from compiled binary
-            binary_function = loaded_module.get_function_handle(self.function_name)
+            # evaluating main function from compiled binary on every point
+            if self.array_wrapper_supported:
+                y_list = [float(v) for v in loaded_module.call_array(self.function_name, x_list)]
+            else:
+                binary_function = loaded_module.get_function_handle(self.function_name)
+                y_list = [binary_function(v) for v in x_list]
             if self.plot_function:
-                matplotlib.plot(x_list, [binary_function(v) for v in x_list])
+                matplotlib.plot(x_list, y_list)
                 matplotlib.ylabel('{}(x) function plot'.format(self.function_name))
             if self.plot_error:
-                error_list = [(abs(sollya.round((binary_function(v) - self.numeric_emulate(v)) / self.numeric_emulate(v), sollya.binary64, sollya.RN))) for v in x_list]
+                error_list = [(abs(sollya.round((y - self.numeric_emulate(v)) / self.numeric_emulate(v), sollya.binary64, sollya.RN))) for v, y in zip(x_list, y_list)]
                 error_list = [float(v) for v in error_list]
                 matplotlib.plot(x_list, error_list, 'bo')
                 matplotlib.yscale('log', basey=2) 
                 matplotlib.ylabel('{}(x) error plot'.format(self.function_name))
             matplotlib.show()
 
+        # exhaustive test is executed through its own native harness
+        if self.exhaustive_test:
+            exec_result["exhaustive"] = self.run_exhaustive_test(source_file)
+            if not self.execute_trigger:
+                return exec_result
+
         # only executing if build was successful
         if self.execute_trigger:
             if embedding_binary and not(bin_file is None):
@@ -1022,6 +1154,10 @@ class ML_FunctionBasis(object):
                 if self.bench_enabled:
                     cpe_measure = loaded_module.get_function_handle("bench_wrapper")()
                     exec_result["cpe_measure"] = cpe_measure
+                    if self.bench_statistics_enabled:
+                        repetition_cpe = loaded_module.get_function_handle("bench_repetition_cpe")
+                        exec_result["bench"] = self.get_bench_result(
+                            [repetition_cpe(index) for index in range(self.get_bench_repeat_num())])
 
                 # max-error must be evaluated before auto-test
                 # in case auto-test fails and raises a ValidError exception
@@ -1063,7 +1199,18 @@ class ML_FunctionBasis(object):
                     print(str(ret_stdout.replace("\\n", "\n")))
                 #Log.report(Log.Info, "log: {}", ret_stdout)
                 # extracting benchmark result
-                if self.bench_enabled:
+                if self.bench_enabled and self.bench_statistics_enabled:
+                    cpe_list = []
+                    for line in ret_stdout.replace("\\n", "\n").split("\n"):
+                        tokens = line.split()
+                        if BENCH_REPETITION_TAG in tokens:
+                            # <tag> <function> <repetition> <cycles> <cpe>
+                            cpe_list.append(float(tokens[tokens.index(BENCH_REPETITION_TAG) + 4]))
+                    if len(cpe_list) != self.get_bench_repeat_num():
+                        Log.report(Log.Error, "expected {} bench repetitions in log, found {}: {}", self.get_bench_repeat_num(), len(cpe_list), ret_stdout)
+                    exec_result["bench"] = self.get_bench_result(cpe_list)
+                    exec_result["cpe_measure"] = exec_result["bench"]["min"]
+                elif self.bench_enabled:
                     cpe_match = re.search("(?P<cpe_measure>\d+\.\d+) CPE", ret_stdout)
                     if cpe_match is None:
                         Log.report(Log.Error, "not able to extract CPE measure from log: {}", ret_stdout)
@@ -1093,6 +1240,105 @@ class ML_FunctionBasis(object):
 
 
 
+  def get_exhaustive_error_bound(self):
+    """ return (ulp_bound, absolute_bound, relative_bound) derived from
+        self.accuracy: an exhaustive test output succeeds if its error
+        against the correctly rounded reference is at most ulp_bound ulps
+        or at most absolute_bound + relative_bound * abs(reference)
+        (degraded accuracies) """
+    if not self.exhaustive_max_ulp is None:
+      return self.exhaustive_max_ulp, 0.0, 0.0
+    elif isinstance(self.accuracy, ML_CorrectlyRounded):
+      return 0.5, 0.0, 0.0
+    elif isinstance(self.accuracy, ML_DegradedAccuracyAbsolute):
+      return 0.5, float(abs(self.accuracy.goal)), 0.0
+    elif isinstance(self.accuracy, ML_DegradedAccuracyRelative):
+      return 0.5, 0.0, float(abs(self.accuracy.goal))
+    # faithful (and other accuracies)
+    return 1.0, 0.0, 0.0
+
+  def generate_exhaustive_reference_file(self, path, encoding_range):
+    """ write in file @p path the correctly rounded output encoding of
+        every input encoding of the inclusive @p encoding_range, computed
+        by numeric_emulate (distributed over self.test_gen_jobs processes).
+        Only practical for 16-bit formats or small binary32 ranges """
+    from metalibm_core.utility.exhaustive_test import write_reference_file
+    input_format = self.get_input_precision().get_base_format()
+    output_format = self.get_output_precision().get_base_format()
+    lo, hi = encoding_range
+    def emulate_chunk(chunk_lo, chunk_hi):
+      value_list = []
+      for encoding in range(lo + chunk_lo, lo + chunk_hi):
+        exact_value = self.numeric_emulate(input_format.get_value_from_integer_coding(str(encoding), 10))
+        if not FP_SpecialValue.is_special_value(exact_value):
+          exact_value = output_format.round_sollya_object(exact_value, sollya.RN)
+        value_list.append(exact_value)
+      # the whole chunk is encoded at once
+      return [int(coding) for coding in output_format.encode_many(value_list)]
+    Log.report(Log.Info, "emulating {} exhaustive reference values in {}", hi - lo + 1, path)
+    tmp_path = get_tmp_path(path)
+    open(tmp_path, "wb").close()
+    for encoding_list in fork_map_chunks(emulate_chunk, hi - lo + 1, self.test_gen_jobs):
+      write_reference_file(tmp_path, encoding_list, output_format)
+    os.replace(tmp_path, path)
+
+  def run_exhaustive_test(self, source_file):
+    """ build and execute the native exhaustive test harness of @p self
+        function (implemented in @p source_file)
+
+        :return: dict of exhaustive test results (tested, failures,
+                 max_error in ulps, max_error_input encoding) """
+    from metalibm_core.utility.exhaustive_test import (
+      EXHAUSTIVE_INPUT_FORMATS, EXHAUSTIVE_OUTPUT_FORMATS, ExhaustiveReference,
+      is_exhaustive_format, parse_encoding_range, generate_exhaustive_harness,
+      build_exhaustive_harness, parse_exhaustive_result
+    )
+    input_precision = self.get_input_precision()
+    output_precision = self.get_output_precision()
+    if self.arity != 1 or self.get_vector_size() != 1 or \
+       not is_exhaustive_format(input_precision, EXHAUSTIVE_INPUT_FORMATS) or \
+       not is_exhaustive_format(output_precision, EXHAUSTIVE_OUTPUT_FORMATS):
+      Log.report(Log.Error, "exhaustive test requires a scalar one-input function with binary32, binary16 or bfloat16 input")
+    encoding_range = parse_encoding_range(self.exhaustive_range, input_precision.get_base_format().get_bit_size())
+    reference = ExhaustiveReference.parse(
+      self.exhaustive_reference or "{}:{}".format(ExhaustiveReference.Libm, self.base_name))
+    if reference.kind == ExhaustiveReference.File and not os.path.isfile(reference.value):
+      self.generate_exhaustive_reference_file(reference.value, encoding_range)
+
+    harness_path = build_utils.generate_tmp_filename("exhaustive_{}.c".format(self.function_name))
+    ulp_bound, absolute_bound, relative_bound = self.get_exhaustive_error_bound()
+    with open(harness_path, "w") as harness_stream:
+      harness_stream.write(generate_exhaustive_harness(
+        self.function_name, input_precision, output_precision, reference,
+        ulp_bound, encoding_range, thread_num=self.exhaustive_threads,
+        absolute_bound=absolute_bound, relative_bound=relative_bound))
+    # the main function generated with --no-embedded-bin is renamed
+    # to avoid a conflict with the harness main
+    object_file = source_file.build(
+      self.processor, build_utils.generate_tmp_filename("exhaustive_{}.o".format(self.function_name)),
+      shared_object=False, link=False,
+      extra_build_opts=self.get_extra_build_opts() + ["-Dmain=metalibm_generated_main"])
+    bin_name = build_utils.generate_tmp_filename("exhaustive_{}".format(self.function_name))
+    if object_file is None or not build_exhaustive_harness(
+        self.processor, harness_path, object_file.path, bin_name,
+        extra_build_opts=self.get_extra_build_opts(), library_list=source_file.library_list):
+      Log.report(Log.Error, "exhaustive harness build failed", error=BuildError())
+
+    Log.report(Log.Info, "running exhaustive test of {} on encodings [{:#x}, {:#x}] against {}",
+               self.function_name, encoding_range[0], encoding_range[1], reference)
+    _, ret_stdout = build_utils.get_cmd_stdout(bin_name)
+    ret_stdout = ret_stdout.decode()
+    Log.report(Log.Info, "{}", ret_stdout)
+    exhaustive_result = parse_exhaustive_result(ret_stdout)
+    if exhaustive_result is None:
+      Log.report(Log.Error, "not able to extract exhaustive test result from log: {}", ret_stdout)
+    Log.report(Log.Info, "exhaustive test: {tested} input(s), {failures} failure(s), max error {max_error} ulp(s) (input {max_error_input:#x})", **exhaustive_result)
+    if exhaustive_result["failures"]:
+      Log.report(Log.Error, "EXHAUSTIVE VALIDATION FAILURE", error=ValidError())
+    else:
+      Log.report(Log.Info, "EXHAUSTIVE VALIDATION SUCCESS")
+    return exhaustive_result
+
   ## externalized an optree: generate a CodeFunction which compute the 
   #  given optree inside a sub-function and returns it as a result
   # @param optree ML_Operation object to be externalized
@@ -1196,10 +1442,63 @@ class ML_FunctionBasis(object):
   def numeric_emulate(self, input_value):
     raise NotImplementedError
 
+  def get_input_seed(self, in_id):
+    """ seed of the random generator of the in_id-th input (None if
+        generation is not seeded) """
+    return None if self.seed is None else (self.seed << 8) + in_id
+
+  def generate_rand_input_encodings(self, test_num, test_ranges):
+    """ generate random test inputs as arrays of encodings (one numpy
+        array of unsigned integers per input) with numpy generators
+
+        :return: iterator on lists of encoding arrays (one list per chunk
+                 of at most RANDOM_INPUT_CHUNK_SIZE test cases), or None if
+                 an input format is not supported by numpy generators """
+    rng_map = [
+      get_numpy_precision_rng(precision, test_range, seed=self.get_input_seed(in_id))
+      for in_id, (precision, test_range) in enumerate(zip(self.input_precisions, test_ranges))]
+    if None in rng_map:
+      return None
+    def encoding_iterator():
+      for chunk_start in range(0, test_num, self.RANDOM_INPUT_CHUNK_SIZE):
+        chunk_size = min(self.RANDOM_INPUT_CHUNK_SIZE, test_num - chunk_start)
+        yield [rng.get_new_encodings(chunk_size) for rng in rng_map]
+    return encoding_iterator()
+
+  def generate_rand_input_columns(self, test_num, test_ranges):
+    """ generate test_num random test inputs with numpy generators (if
+        selected by self.test_rng)
+
+        :return: list of encoding arrays (one per input), or None if
+                 numpy generation is not selected or not supported """
+    import numpy
+    if self.test_rng != "numpy" or test_num == 0:
+      return None
+    encoding_iterator = self.generate_rand_input_encodings(test_num, test_ranges)
+    if encoding_iterator is None:
+      return None
+    chunk_list = list(encoding_iterator)
+    return [numpy.concatenate([encoding_list[in_id] for encoding_list in chunk_list]) for in_id in range(self.arity)]
+
   def generate_rand_input_iterator(self, test_num, test_ranges):
     """ generate a random list of test inputs """
+    if self.test_rng == "numpy":
+      encoding_iterator = self.generate_rand_input_encodings(test_num, test_ranges)
+      if encoding_iterator is None:
+        Log.report(Log.Warning, "numpy random generation only supports binary16/32/64 inputs, falling back to python generation")
+      else:
+        for encoding_list in encoding_iterator:
+          value_list = [
+            precision.get_base_format().decode_many(encodings)
+            for precision, encodings in zip(self.input_precisions, encoding_list)]
+          for input_tuple in zip(*value_list):
+            yield input_tuple
+        return
+
     # TODO/FIXME: implement proper input range depending on input index
-    rng_map = [get_precision_rng(precision, test_range) for precision, test_range in zip(self.input_precisions, test_ranges)]
+    rng_map = [
+      get_precision_rng(precision, test_range, seed=self.get_input_seed(in_id))
+      for in_id, (precision, test_range) in enumerate(zip(self.input_precisions, test_ranges))]
 
     # random test cases
     for i in range(test_num):
@@ -1216,10 +1515,13 @@ class ML_FunctionBasis(object):
       yield tuple(input_list)
 
 
-  def generate_test_tables(self, test_num, test_ranges=[Interval(-1.0, 1.0)]):
-    """ Generate inputs and output table to be shared between auto test
-        and max_error tests """
-    test_total   = test_num 
+  def get_auto_test_number(self):
+    """ number of random auto-test cases """
+    return self.auto_test_number if self.auto_test_number else 0
+
+  def get_non_random_test_case_list(self):
+    """ return the list of standard (if enabled) and value specific test
+        cases, with inputs rounded to the input formats """
     non_random_test_cases = []
     # add them to the total if standard test enabled
     if self.auto_test_std:
@@ -1228,20 +1530,100 @@ class ML_FunctionBasis(object):
         if not num_std_case:
             Log.report(Log.Warning, "{} standard test case found!", num_std_case)
         non_random_test_cases += self.standard_test_cases
-        test_total += num_std_case
 
     # add value specific tests
     if self.value_test != []:
-        test_total += len(self.value_test)
         non_random_test_cases += self.value_test
 
-    # round up the number of tests to the implementation vector-size
+    test_case_list = []
+    # standard test cases
+    for i, test_case in enumerate(non_random_test_cases):
+      input_list = []
+      # rounding numerical value to input format
+      for in_id in range(self.arity):
+        input_value = test_case[in_id]
+        if not FP_SpecialValue.is_special_value(input_value):
+          input_value = self.get_input_precision(in_id).round_sollya_object(input_value, sollya.RN)
+        input_list.append(input_value)
+      # concatenating expected outputs (if any) and adding test-case
+      # to the list
+      test_case_list.append(tuple(input_list) + tuple(test_case[self.arity:]))
+    return test_case_list
+
+  def get_random_test_num(self, test_num, non_random_test_num):
+    """ round up the number of random tests so that the total number of
+        tests is a multiple of the implementation vector-size """
+    test_total = test_num + non_random_test_num
     diff = (self.get_vector_size() - (test_total % self.get_vector_size())) % self.get_vector_size()
     assert diff >= 0
-    test_total += diff
-    test_num   += diff
+    Log.report(Log.Info, "test test_total, test_num, diff: {} {} {}".format(test_total + diff, test_num + diff, diff))
+    return test_num + diff
+
+  def emulate_output_value_list(self, test_case_list):
+    """ return the list of expected output value tuples of test_case_list,
+        through the reference store if enabled """
+    from metalibm_core.utility.reference_store import get_reference_store
+    reference_store = get_reference_store()
+    if not reference_store is None and self.is_reference_store_supported():
+      return self.emulate_test_case_list_stored(test_case_list, reference_store)
+    else:
+      return self.emulate_test_case_list(test_case_list)
+
+  def get_test_input_boundaries(self, in_id):
+    """ list of the values of the in_id-th input around which the
+        implementation behaviour changes (used by stratified sampling).
+        By default boundaries are extracted from the comparisons of the
+        implementation scheme conditions and from the sub-intervals of
+        its piecewise approximations (scalar implementation only).
+        Only conditions comparing the input itself (or its absolute value
+        or negation) to a constant and approximations indexed by the input
+        itself are detected, thresholds applied to derived values (e.g.
+        reduced argument, exponent field, converted input) are not: this
+        method can be overloaded by meta-functions which know their range
+        reduction boundaries """
+    if self.get_vector_size() != 1:
+      Log.report(Log.Warning, "stratified sampling boundaries are not extracted from vector implementations, only zero is used for input {}", in_id)
+      return []
+    if self.implementation.get_scheme() is None or in_id >= len(self.implementation.arg_list):
+      Log.report(Log.Warning, "no implementation scheme to extract stratified sampling boundaries from, only zero is used for input {}", in_id)
+      return []
+    return extract_condition_boundaries(
+      self.implementation.get_scheme(), self.implementation.arg_list[in_id])
+
+  def generate_stratified_input_iterator(self, test_num, test_ranges):
+    """ generate test_num stratified test inputs (see StratifiedSampler),
+        inputs are sampled independently and paired randomly.
+
+        :return: iterator on input tuples, or None if an input format
+                 is not supported """
+    if not all(is_stratified_sampling_supported(precision) for precision in self.input_precisions):
+      return None
+    value_list = []
+    for in_id, (precision, test_range) in enumerate(zip(self.input_precisions, test_ranges)):
+      boundary_list = self.get_test_input_boundaries(in_id)
+      Log.report(Log.Verbose, "stratified sampling boundaries of input {}: {}", in_id, boundary_list)
+      sampler = StratifiedSampler(
+        precision, test_range, boundary_list, seed=self.get_input_seed(in_id))
+      value_list.append(sampler.generate_values(test_num))
+    return zip(*value_list)
+
+  def generate_test_input_iterator(self, test_num, test_ranges):
+    """ generate test_num test inputs with the sampling selected
+        by self.test_sampling """
+    if self.test_sampling == "stratified":
+      input_iterator = self.generate_stratified_input_iterator(test_num, test_ranges)
+      if not input_iterator is None:
+        return input_iterator
+      Log.report(Log.Warning, "stratified sampling only supports floating-point inputs, falling back to random generation")
+    return self.generate_rand_input_iterator(test_num, test_ranges)
+
+  def generate_test_tables(self, test_num, test_ranges=[Interval(-1.0, 1.0)]):
+    """ Generate inputs and output table to be shared between auto test
+        and max_error tests """
+    test_case_list = self.get_non_random_test_case_list()
+    test_num = self.get_random_test_num(test_num, len(test_case_list))
+    test_total = test_num + len(test_case_list)
 
-    Log.report(Log.Info, "test test_total, test_num, diff: {} {} {}".format(test_total, test_num, diff))
     input_tables = [
       ML_NewTable(
         dimensions = [test_total],
@@ -1257,44 +1639,284 @@ class ML_FunctionBasis(object):
                                const=False,
                                tag=self.uniquify_name("output_table"))
 
-    test_case_list = []
-
-    if len(non_random_test_cases):
-      # standard test cases
-      for i, test_case in enumerate(non_random_test_cases):
-        input_list = []
-        # rounding numerical value to input format
-        for in_id in range(self.arity):
-          input_value = test_case[in_id]
-          if not FP_SpecialValue.is_special_value(input_value):
-            input_value = self.get_input_precision(in_id).round_sollya_object(input_value, sollya.RN)
-          input_list.append(input_value)
-        # concatenating expected outputs (if any) and adding test-case
-        # to the list
-        test_case_list.append(tuple(input_list) + tuple(test_case[self.arity:]))
-
-    # adding randomly generated inputs
-    test_case_list += list(self.generate_rand_input_iterator(test_num, test_ranges))
+    # random inputs generated by numpy are stored as encodings in the
+    # input tables and only decoded for numeric emulation
+    input_columns = None if self.test_sampling == "stratified" else \
+      self.generate_rand_input_columns(test_num, test_ranges)
+    if input_columns is None:
+      # adding randomly generated inputs
+      test_case_list += list(self.generate_test_input_iterator(test_num, test_ranges))
+    else:
+      import numpy
+      non_random_test_case_list = test_case_list
+      test_case_list = test_case_list + list(zip(*(
+        precision.get_base_format().decode_many(encodings)
+        for precision, encodings in zip(self.input_precisions, input_columns))))
+      for in_id, (precision, encodings) in enumerate(zip(self.input_precisions, input_columns)):
+        non_random_encodings = numpy.asarray(
+          precision.get_base_format().encode_many(input_tuple[in_id] for input_tuple in non_random_test_case_list),
+          dtype=encodings.dtype)
+        input_tables[in_id].set_encodings(numpy.concatenate([non_random_encodings, encodings]))
 
     # generating output from the concatenated list of all inputs
-    for table_index, input_tuple in enumerate(test_case_list):
+    output_value_list = self.emulate_output_value_list(test_case_list)
+
+    for table_index, (input_tuple, output_values) in enumerate(zip(test_case_list, output_value_list)):
       # storing inputs
-      for in_id in range(self.arity):
-        input_tables[in_id][table_index] = input_tuple[in_id]
-      # NOTE/DOC: if input_tuple has an extra valid (not None) value
-      #           it is forced as the expected output
-      if len(input_tuple) > self.arity and not input_tuple[self.arity] is None:
-        expected_output = input_tuple[self.arity]
-      else:
-        expected_output = self.numeric_emulate(*input_tuple[:self.arity])
-      # computing and storing output values
-      output_values = self.accuracy.get_output_check_value(expected_output)
+      if input_columns is None:
+        for in_id in range(self.arity):
+          input_tables[in_id][table_index] = input_tuple[in_id]
+      # storing output values
       for o in range(num_output_value):
         output_table[table_index][o] = output_values[o]
 
     return test_total, input_tables, output_table
+
+  def get_test_file_block_size(self):
+    """ maximal number of records per test file block, rounded up to a
+        multiple of the implementation vector-size """
+    vector_size = self.get_vector_size()
+    return (self.test_file_block_size + vector_size - 1) // vector_size * vector_size
+
+  def is_test_file_supported(self):
+    """ predicate indicating if test vectors of @p self can be stored
+        in a (binary) test file """
+    return all(
+      is_test_file_format(precision)
+      for precision in self.get_input_precisions() + [self.get_output_precision()])
+
+  def get_test_file_identity(self):
+    """ identity of @p self recorded in the header of its test files """
+    return get_test_file_identity(*self.get_emulation_identity())
+
+  def is_test_file_reusable(self, path):
+    """ predicate indicating if the existing test file @p path has been
+        generated for @p self (same function identity and formats) and
+        can be streamed by the test wrapper """
+    if not os.path.isfile(path):
+      return False
+    mismatch = check_test_file(
+      path, self.get_test_file_identity(), self.get_input_precisions(),
+      self.get_output_precision(), self.accuracy.get_num_output_value(),
+      self.get_test_file_block_size())
+    if not mismatch is None:
+      Log.report(Log.Warning, "test file {} can not be reused ({}), it is regenerated", path, mismatch)
+      return False
+    Log.report(Log.Info, "reusing test file {}", path)
+    return True
+
+  def generate_test_file(self, path, test_num, test_ranges=[Interval(-1.0, 1.0)]):
+    """ Generate the binary test-vector file @p path (standard, value
+        specific and test_num random test cases with their expected outputs)
+        streamed at runtime by the test wrapper. Test cases are generated
+        and emulated by batches, so the number of test cases is not bounded
+        by memory """
+    if not self.is_test_file_supported():
+      Log.report(Log.Error, "test file requires binary16/32/64 or standard integer input and output formats")
+    num_output_value = self.accuracy.get_num_output_value()
+    block_size = self.get_test_file_block_size()
+    non_random_test_cases = self.get_non_random_test_case_list()
+    test_num = self.get_random_test_num(test_num, len(non_random_test_cases))
+    test_total = test_num + len(non_random_test_cases)
+    Log.report(Log.Info, "generating {} test vectors in {}", test_total, path)
+
+    writer = TestVectorFileWriter(
+      path, self.get_test_file_identity(), self.get_input_precisions(), self.get_output_precision(),
+      num_output_value, test_total, block_size=block_size)
+    test_case_iterator = itertools.chain(
+      non_random_test_cases, self.generate_test_input_iterator(test_num, test_ranges))
+    batch_size = block_size * self.TEST_FILE_BATCH_BLOCK_NUM
+    while True:
+      test_case_list = list(itertools.islice(test_case_iterator, batch_size))
+      if not test_case_list:
+        break
+      output_value_list = self.emulate_output_value_list(test_case_list)
+      writer.write(
+        [[input_tuple[in_id] for input_tuple in test_case_list] for in_id in range(self.arity)],
+        [tuple(output_values[:num_output_value]) for output_values in output_value_list])
+      Log.report(Log.Info, "{} / {} test vectors generated", writer.written_num, test_total)
+    writer.close()
+
+  def generate_test_file_tables(self):
+    """ Generate (empty) input and output tables holding one block of
+        test vectors streamed from the test file """
+    block_size = self.get_test_file_block_size()
+    input_tables = [
+      ML_NewTable(
+        dimensions=[block_size],
+        storage_precision=self.get_input_precision(i),
+        tag=self.uniquify_name("input_block_arg%d" % i),
+        empty=True, const=False
+      ) for i in range(self.arity)
+    ]
+    output_table = ML_NewTable(
+      dimensions=[block_size, self.accuracy.get_num_output_value()],
+      storage_precision=self.get_output_precision(),
+      tag=self.uniquify_name("output_block"),
+      empty=True, const=False)
+    return input_tables, output_table
+
+  def emulate_test_case(self, input_tuple):
+    """ return the tuple of values required to check the result
+        of the test case described by @p input_tuple """
+    # NOTE/DOC: if input_tuple has an extra valid (not None) value
+    #           it is forced as the expected output
+    if len(input_tuple) > self.arity and not input_tuple[self.arity] is None:
+      expected_output = input_tuple[self.arity]
+    else:
+      expected_output = self.numeric_emulate(*input_tuple[:self.arity])
+    return self.accuracy.get_output_check_value(expected_output)
+
+  def emulate_test_case_list(self, test_case_list):
+    """ return the list of the results of emulate_test_case for each
+        element of @p test_case_list """
+    if self.test_gen_jobs > 1:
+      return self.emulate_test_case_list_parallel(test_case_list)
+    return [self.emulate_test_case(input_tuple) for input_tuple in test_case_list]
+
+  def get_emulation_key_parameters(self):
+    """ return the list of the meta-function parameters (other than its
+        formats and accuracy) numeric_emulate depends on, they are part
+        of the key of reference values in the reference store """
+    return []
+
+  def is_reference_store_supported(self):
+    """ predicate testing if test case reference values can be stored in
+        the reference store (input and output formats must be IEEE formats
+        with a numpy equivalent) """
+    return all(
+      isinstance(precision, ML_Std_FP_Format) and not precision.get_numpy_types() is None
+      for precision in self.input_precisions + [self.get_output_precision()])
+
+  def get_emulation_identity(self):
+    """ list of elements identifying the expected values of @p self
+        test cases (meta-function class, numeric emulation and its
+        parameters, formats and accuracy) """
+    return [
+      "{}.{}".format(self.__class__.__module__, self.__class__.__qualname__),
+      self.__class__.numeric_emulate,
+      self.get_emulation_key_parameters(),
+      self.input_precisions,
+      self.get_output_precision(),
+      self.accuracy.__class__.__name__,
+      sorted(vars(self.accuracy).items()),
+    ]
+
+  def get_reference_store_key(self, reference_store):
+    """ key of the reference values of @p self test cases """
+    return reference_store.get_key(*self.get_emulation_identity())
+
+  def emulate_test_case_list_stored(self, test_case_list, reference_store):
+    """ version of emulate_test_case over @p test_case_list which reuses
+        the output values stored in @p reference_store: only test cases
+        whose inputs are not stored yet are emulated (and then stored), the
+        result list is ordered as test_case_list """
+    import numpy
+    output_precision = self.get_output_precision()
+    store_key = self.get_reference_store_key(reference_store)
+    # test cases with a forced expected output are not looked up
+    index_list = [
+      index for index, input_tuple in enumerate(test_case_list)
+      if len(input_tuple) <= self.arity or input_tuple[self.arity] is None
+    ]
+    output_value_list = [None] * len(test_case_list)
+    if index_list:
+      input_encodings = numpy.stack([
+        numpy.asarray(self.get_input_precision(in_id).encode_many(
+          [test_case_list[index][in_id] for index in index_list]), dtype=numpy.uint64)
+        for in_id in range(self.arity)], axis=1)
+      found, output_encodings = reference_store.lookup(store_key, input_encodings)
+      for position in numpy.nonzero(found)[0]:
+        output_value_list[index_list[position]] = tuple(
+          output_precision.get_value_from_integer_coding(str(int(encoding)), 10)
+          for encoding in output_encodings[position])
+      missing_positions = numpy.nonzero(~found)[0]
+      missing_output_list = self.emulate_test_case_list(
+        [test_case_list[index_list[position]] for position in missing_positions])
+      for position, output_values in zip(missing_positions, missing_output_list):
+        output_value_list[index_list[position]] = output_values
+      if len(missing_positions):
+        num_output_value = self.accuracy.get_num_output_value()
+        missing_encodings = numpy.asarray(output_precision.encode_many(
+          [value for output_values in missing_output_list for value in output_values]),
+          dtype=numpy.uint64).reshape(len(missing_positions), num_output_value)
+        reference_store.insert(store_key, input_encodings[missing_positions], missing_encodings)
+      Log.report(Log.Info, "reference store: {} test case(s) found, {} emulated", len(index_list) - len(missing_positions), len(missing_positions))
+    for index, input_tuple in enumerate(test_case_list):
+      if output_value_list[index] is None:
+        output_value_list[index] = self.emulate_test_case(input_tuple)
+    return output_value_list
+
+  def emulate_test_case_list_parallel(self, test_case_list):
+    """ parallel version of emulate_test_case over @p test_case_list,
+        numerical emulation is distributed over self.test_gen_jobs worker
+        processes, the result list is ordered as test_case_list """
+    def emulate_chunk(lo, hi):
+      chunk_result = []
+      for input_tuple in test_case_list[lo:hi]:
+        encoded_values = tuple(encode_numeric_value(v) for v in self.emulate_test_case(input_tuple))
+        # test cases whose outputs can not be transmitted (e.g. special
+        # values) are re-evaluated by the parent process
+        chunk_result.append(None if None in encoded_values else encoded_values)
+      return chunk_result
+
+    Log.report(Log.Info, "emulating {} test cases with {} jobs", len(test_case_list), self.test_gen_jobs)
+    chunk_results = fork_map_chunks(emulate_chunk, len(test_case_list), self.test_gen_jobs)
+    output_value_list = []
+    for encoded_values in (v for chunk in chunk_results for v in chunk):
+      if encoded_values is None:
+        output_value_list.append(None)
+      else:
+        output_value_list.append(tuple(decode_numeric_value(v) for v in encoded_values))
+    for index, output_values in enumerate(output_value_list):
+      if output_values is None:
+        output_value_list[index] = self.emulate_test_case(test_case_list[index])
+    return output_value_list
   
 
+  @property
+  def array_wrapper_supported(self):
+    """ predicate testing if an array wrapper can be generated for the
+        implementation (scalar implementation with ctypes-compatible
+        formats) """
+    return self.get_vector_size() == 1 and all(
+      build_utils.is_ctype_supported(precision)
+      for precision in self.get_input_precisions() + [self.get_output_precision()])
+
+  def generate_array_wrapper(self):
+    """ Generate <function_name>_array(n, x0, ..., r) which evaluates the
+        implementation on the n elements of the input arrays x0, ... and
+        stores the results in array r (e.g. for LoadedBinary.call_array)
+
+        :return: FunctionGroup with the array wrapper as core function, or
+                 None if the implementation is not supported """
+    if not self.array_wrapper_supported:
+      Log.report(Log.Warning, "array wrapper is only generated for scalar implementations with standard formats")
+      return None
+    tested_function = self.implementation.get_function_object()
+    array_function = CodeFunction(build_utils.get_array_wrapper_name(self.function_name), output_format=ML_Int32)
+    size_arg = array_function.add_input_variable("n", ML_Int64)
+    input_ptrs = [
+      array_function.add_input_variable("x{}".format(in_id), ML_Pointer_Format(self.get_input_precision(in_id)))
+      for in_id in range(self.arity)
+    ]
+    output_ptr = array_function.add_input_variable("r", ML_Pointer_Format(self.get_output_precision()))
+
+    vi = Variable("i", precision=ML_Int64, var_type=Variable.Local)
+    local_inputs = tuple(
+      TableLoad(input_ptrs[in_id], vi, precision=self.get_input_precision(in_id))
+      for in_id in range(self.arity))
+    array_loop = Loop(
+      ReferenceAssign(vi, Constant(0, precision=ML_Int64)),
+      vi < size_arg,
+      Statement(
+        TableStore(tested_function(*local_inputs), output_ptr, vi, precision=ML_Void),
+        ReferenceAssign(vi, vi + 1)
+      ),
+    )
+    array_function.set_scheme(Statement(array_loop, Return(Constant(0, precision=ML_Int32))))
+    return FunctionGroup([array_function])
+
   ## Generate a test wrapper for the @p self function 
   #  @param test_num   number of test to perform
   #  @param test_range numeric range for test's inputs
@@ -1313,10 +1935,15 @@ class ML_FunctionBasis(object):
 
     if self.implementation.get_output_format().is_vector_format():
       # vector implementation test
-      test_loop = self.get_vector_test_wrapper(test_total, tested_function, input_tables, output_table)
+      get_test_loop = self.get_vector_test_wrapper
     else:
       # scalar implemetation test
-      test_loop = self.get_scalar_test_wrapper(test_total, tested_function, input_tables, output_table)
+      get_test_loop = self.get_scalar_test_wrapper
+
+    if self.test_file:
+      test_loop = self.get_test_file_loop(get_test_loop, tested_function, input_tables, output_table)
+    else:
+      test_loop = get_test_loop(test_total, tested_function, input_tables, output_table)
 
     # common test scheme between scalar and vector functions
     test_scheme = Statement(
@@ -1328,6 +1955,74 @@ class ML_FunctionBasis(object):
 
     return FunctionGroup([auto_test])
 
+  def get_test_file_loop(self, get_test_loop, tested_function, input_tables, output_table):
+    """ build a loop streaming the blocks of the test file in input_tables
+        and output_table and testing each block with the test loop built
+        by get_test_loop """
+    block_size = self.get_test_file_block_size()
+    num_output_value = self.accuracy.get_num_output_value()
+    output_precision = self.get_output_precision()
+    record_size = get_record_size(self.get_input_precisions(), output_precision, num_output_value)
+    CstError = Constant(1, precision=ML_Int32)
+
+    test_file_open = FunctionObject(
+      "ml_test_file_open", [ML_Int32] * 4, ML_Int32,
+      FunctionOperator(
+        "ml_test_file_open",
+        arg_map={
+          0: "\"{}\"".format(os.path.abspath(self.test_file)), 1: "\"{}\"".format(self.get_test_file_identity()),
+          2: FO_Arg(0), 3: FO_Arg(1), 4: FO_Arg(2), 5: FO_Arg(3)},
+        require_header=["ml_test_file.h"]))
+    test_file_next_block = FunctionObject(
+      "ml_test_file_next_block", [], ML_Int32,
+      FunctionOperator("ml_test_file_next_block", arity=0, require_header=["ml_test_file.h"]))
+    test_file_close = FunctionObject(
+      "ml_test_file_close", [], ML_Void,
+      FunctionOperator("ml_test_file_close", arity=0, void_function=True, require_header=["ml_test_file.h"]))
+    def read_column(table, elt_num):
+      """ read elt_num elements of the current block in table """
+      read_op = FunctionOperator(
+        "ml_test_file_read",
+        arg_map={0: FO_Arg(0), 1: "{}".format(get_binary_encoding_size(table.get_storage_precision()) // 8), 2: FO_Arg(1)},
+        require_header=["ml_test_file.h"])
+      read_function = FunctionObject("ml_test_file_read", [table.get_precision_as_pointer_format(), ML_Int32], ML_Int32, read_op)
+      return ConditionBlock(
+        Comparison(read_function(table, elt_num), Constant(0, precision=ML_Int32), specifier=Comparison.NotEqual, precision=ML_Bool, likely=False),
+        Return(CstError)
+      )
+
+    block_num = Variable("block_num", precision=ML_Int32, var_type=Variable.Local)
+    test_offset = Variable("test_offset", precision=ML_Int32, var_type=Variable.Local)
+    block_test_loop = get_test_loop(block_num, tested_function, input_tables, output_table, test_offset=test_offset)
+
+    return Statement(
+      ConditionBlock(
+        Comparison(
+          test_file_open(
+            Constant(self.arity, precision=ML_Int32), Constant(num_output_value, precision=ML_Int32),
+            Constant(record_size, precision=ML_Int32), Constant(block_size, precision=ML_Int32)),
+          Constant(0, precision=ML_Int32), specifier=Comparison.NotEqual, precision=ML_Bool, likely=False),
+        Return(CstError)
+      ),
+      ReferenceAssign(test_offset, Constant(0, precision=ML_Int32)),
+      Loop(
+        ReferenceAssign(block_num, test_file_next_block()),
+        block_num > Constant(0, precision=ML_Int32),
+        Statement(
+          *tuple(read_column(input_table, block_num) for input_table in input_tables),
+          read_column(output_table, block_num * num_output_value),
+          block_test_loop,
+          ReferenceAssign(test_offset, test_offset + block_num),
+          ReferenceAssign(block_num, test_file_next_block()),
+        )
+      ),
+      test_file_close(),
+      ConditionBlock(
+        Comparison(block_num, Constant(0, precision=ML_Int32), specifier=Comparison.Less, precision=ML_Bool, likely=False),
+        Return(CstError)
+      ),
+    )
+
   ## return a FunctionObject display
   #  an error index, a list of argument values
   #  and a result value
@@ -1361,16 +2056,130 @@ class ML_FunctionBasis(object):
     printf_input_function = FunctionObject("printf", [ML_Int32] + self.get_input_precisions() + [output_format], ML_Void, printf_op)
     return printf_input_function
 
+  def generate_bench_repetition_wrapper(self, bench_function, build_test_loop,
+                                        test_num, loop_num, repeat, warmup,
+                                        global_acc, global_acc_init_value,
+                                        printf_acc_function):
+    """ build the scheme of bench_function for the repetition bench mode:
+        warmup untimed loops followed by repeat timed repetitions of
+        the loop_num x test_num nest. The CPE of each repetition is printed
+        (tagged with BENCH_REPETITION_TAG) and stored in a table which can
+        be read through the bench_repetition_cpe function, bench_function
+        returns the minimal CPE """
+    function_name = self.implementation.get_name()
+    result_precision = global_acc.get_precision()
+
+    # table of per-repetition CPE measures
+    cpe_table = ML_NewTable(
+        dimensions=[repeat], storage_precision=ML_Binary64,
+        tag=self.uniquify_name("bench_cpe_table"), empty=True, const=False)
+
+    timer = Variable("timer", precision=ML_Int64, var_type=Variable.Local)
+    cpe = Variable("rep_cpe", precision=ML_Binary64, var_type=Variable.Local)
+    min_cpe = Variable("min_cpe", precision=ML_Binary64, var_type=Variable.Local)
+    vw = Variable("w", precision=ML_Int32, var_type=Variable.Local)
+    vr = Variable("r", precision=ML_Int32, var_type=Variable.Local)
+    vj = Variable("j", precision=ML_Int32, var_type=Variable.Local)
+
+    printf_rep_op = FunctionOperator(
+        "printf",
+        arg_map={
+            0: "\"%s %s %%d %%\"PRIi64\" %%.6f\\n\"" % (BENCH_REPETITION_TAG, function_name),
+            1: FO_Arg(0), 2: FO_Arg(1), 3: FO_Arg(2)
+        }, void_function=True,
+        require_header=["stdio.h", "inttypes.h"]
+    )
+    printf_rep_function = FunctionObject("printf", [ML_Int32, ML_Int64, ML_Binary64], ML_Void, printf_rep_op)
+
+    def accumulate(test_loop, test_acc):
+        return Statement(
+            test_acc,
+            test_loop,
+            ReferenceAssign(global_acc, Addition(global_acc, test_acc, precision=result_precision)),
+        )
+
+    warmup_loop, warmup_acc = build_test_loop()
+    timed_loop, timed_acc = build_test_loop()
+
+    test_scheme = Statement(
+      self.processor.get_init_timestamp(),
+      ReferenceAssign(global_acc, Constant(global_acc_init_value, precision=result_precision)),
+      # untimed warm-up loops
+      Loop(
+          ReferenceAssign(vw, Constant(0, precision=ML_Int32)),
+          vw < Constant(warmup, precision=ML_Int32),
+          Statement(
+              accumulate(warmup_loop, warmup_acc),
+              ReferenceAssign(vw, vw + 1)
+          )
+      ),
+      # timed repetitions
+      Loop(
+          ReferenceAssign(vr, Constant(0, precision=ML_Int32)),
+          vr < Constant(repeat, precision=ML_Int32),
+          Statement(
+              ReferenceAssign(timer, self.processor.get_current_timestamp()),
+              Loop(
+                  ReferenceAssign(vj, Constant(0, precision=ML_Int32)),
+                  vj < Constant(loop_num, precision=ML_Int32, tag="loop_num"),
+                  Statement(
+                      accumulate(timed_loop, timed_acc),
+                      ReferenceAssign(vj, vj + 1)
+                  )
+              ),
+              ReferenceAssign(timer,
+                Subtraction(
+                  self.processor.get_current_timestamp(),
+                  timer,
+                  precision=ML_Int64
+                )
+              ),
+              ReferenceAssign(cpe,
+                Division(
+                  Conversion(timer, precision=ML_Binary64),
+                  Constant(test_num * loop_num, precision=ML_Binary64),
+                  precision=ML_Binary64
+                )
+              ),
+              TableStore(cpe, cpe_table, vr, precision=ML_Void),
+              printf_rep_function(vr, timer, cpe),
+              ConditionBlock(
+                LogicalOr(
+                  Comparison(vr, Constant(0, precision=ML_Int32), specifier=Comparison.Equal, precision=ML_Bool),
+                  Comparison(cpe, min_cpe, specifier=Comparison.Less, precision=ML_Bool),
+                  precision=ML_Bool
+                ),
+                ReferenceAssign(min_cpe, cpe)
+              ),
+              ReferenceAssign(vr, vr + 1)
+          )
+      ),
+      printf_acc_function(global_acc),
+      Return(min_cpe),
+    )
+    bench_function.set_scheme(test_scheme)
+
+    # accessor to the per-repetition measures (used with embedded binary)
+    repetition_accessor = CodeFunction("bench_repetition_cpe", output_format=ML_Binary64)
+    rep_index = repetition_accessor.add_input_variable("rep_index", ML_Int32)
+    repetition_accessor.set_scheme(
+        Return(TableLoad(cpe_table, rep_index, precision=ML_Binary64))
+    )
+    return FunctionGroup([bench_function], [repetition_accessor])
+
   ## generate a test loop for vector tests
   #  @param test_num number of elementary tests to be executed
   #  @param tested_function FunctionObject to be tested
   #  @param input_tables list of ML_NewTable object containing test inputs
   #  @param output_table ML_NewTable object containing test outputs
-  def get_vector_test_wrapper(self, test_num, tested_function, input_tables, output_table):
+  #  @param test_offset optional node added to the test index in error
+  #         messages (e.g. index of the first test of a test file block)
+  def get_vector_test_wrapper(self, test_num, tested_function, input_tables, output_table, test_offset=None):
     vector_format = self.implementation.get_output_format()
     assignation_statement = Statement()
     vi = Variable("i", precision = ML_Int32, var_type = Variable.Local)
-    test_num_cst = Constant(test_num, precision = ML_Int32, tag = "test_num")
+    test_num_cst = test_num if isinstance(test_num, ML_Operation) else Constant(test_num, precision = ML_Int32, tag = "test_num")
+    test_index = vi if test_offset is None else test_offset + vi
 
     # building inputs
     local_inputs = [
@@ -1407,7 +2216,7 @@ class ML_FunctionBasis(object):
         ConditionBlock(
           failure_test,
           Statement(
-            printf_input_function(*tuple([vi + k] + elt_inputs + [elt_result])), 
+            printf_input_function(*tuple([test_index + k] + elt_inputs + [elt_result])), 
             self.accuracy.get_output_print_call(self.function_name, output_values),
             Return(Constant(1, precision = ML_Int32))
           )
@@ -1437,11 +2246,14 @@ class ML_FunctionBasis(object):
   #  @param input_table ML_NewTable object containing test inputs
   #  @param output_table ML_NewTable object containing test outputs
   #  @param printf_function FunctionObject to print error case
-  def get_scalar_test_wrapper(self, test_num, tested_function, input_tables, output_table):
+  #  @param test_offset optional node added to the test index in error
+  #         messages (e.g. index of the first test of a test file block)
+  def get_scalar_test_wrapper(self, test_num, tested_function, input_tables, output_table, test_offset=None):
     assignation_statement = Statement()
     # loop iterator
     vi = Variable("i", precision = ML_Int32, var_type = Variable.Local)
-    test_num_cst = Constant(test_num, precision = ML_Int32, tag = "test_num")
+    test_num_cst = test_num if isinstance(test_num, ML_Operation) else Constant(test_num, precision = ML_Int32, tag = "test_num")
+    test_index = vi if test_offset is None else test_offset + vi
 
 
     local_inputs  = tuple(TableLoad(input_tables[in_id], vi, precision=input_tables[in_id].get_storage_precision()) for in_id in range(self.arity))
@@ -1466,12 +2278,12 @@ class ML_FunctionBasis(object):
     
     if self.break_error:
         return_statement_break = Statement(
-            printf_input_function(*((vi,) + local_inputs + (local_result,))), 
+            printf_input_function(*((test_index,) + local_inputs + (local_result,))), 
             self.accuracy.get_output_print_call(self.function_name, output_values)
         )
     else:
         return_statement_break = Statement(
-            printf_input_function(*((vi,) + local_inputs + (local_result,))),
+            printf_input_function(*((test_index,) + local_inputs + (local_result,))),
             self.accuracy.get_output_print_call(self.function_name, output_values),
             Return(Constant(1, precision = ML_Int32))
         )
@@ -1675,11 +2487,44 @@ class ML_FunctionBasis(object):
       )
       return main_statement
 
+  @property
+  def bench_statistics_enabled(self):
+    """ predicate indicating that the bench is run with several timed
+        repetitions (rather than a single global measure) """
+    return bool(self.bench_repeat or self.bench_warmup or self.bench_latency)
+
+  def get_bench_repeat_num(self):
+    """ number of timed repetitions in the repetition bench mode """
+    return max(1, self.bench_repeat)
+
+  def get_bench_result(self, cpe_list):
+    """ build the structured bench result from the list of CPE measured
+        for each timed repetition """
+    bench_result = get_bench_statistics(cpe_list)
+    bench_result.update({
+        "mode": "latency" if self.bench_latency else "throughput",
+        "warmup": self.bench_warmup,
+        "loop_num": self.bench_loop_num,
+    })
+    return bench_result
+
   ## Generate a test wrapper for the @p self function
   #  @param test_num   number of test to perform
   #  @param test_range numeric range for test's inputs
   #  @param debug enable debug mode
-  def generate_bench_wrapper(self, test_num = 10, loop_num=100000, test_ranges = [Interval(-1.0, 1.0)], debug = False):
+  def generate_bench_wrapper(self, test_num = 10, loop_num=100000, test_ranges = [Interval(-1.0, 1.0)], debug = False, repeat=0, warmup=0, latency=False):
+    """ generate the performance bench function
+
+        :param repeat: number of timed repetitions of the loop_num x test_num
+                       nest. If repeat, warmup and latency are all unset a
+                       single global measure is performed
+        :param warmup: number of untimed (warm-up) test_num loops executed
+                       before the timed repetitions
+        :param latency: enable latency-bound bench (each call output feeds
+                        the next call input)
+        :return: FunctionGroup with bench_wrapper as core function (and
+                 bench_repetition_cpe accessor as sub-function in
+                 repetition mode) """
     auto_test = CodeFunction("bench_wrapper", output_format=ML_Binary64)
 
     tested_function    = self.implementation.get_function_object()
@@ -1718,17 +2563,36 @@ class ML_FunctionBasis(object):
 
 
     # TODO: factorize with auto-test wrapper generation function
-    # random test cases
-    for index, input_tuple in enumerate(self.generate_rand_input_iterator(test_total, test_ranges)):
-      for in_id in range(self.arity):
-        input_tables[in_id][index] = input_tuple[in_id]
-
-    if self.implementation.get_output_format().is_vector_format():
-      # vector implementation bench
-      test_loop, test_acc = self.get_vector_bench_wrapper(test_num, tested_function, input_tables, output_table)
+    # random test cases (numpy generated encodings are never decoded)
+    input_columns = self.generate_rand_input_columns(test_total, test_ranges)
+    if input_columns is None:
+      for index, input_tuple in enumerate(self.generate_rand_input_iterator(test_total, test_ranges)):
+        for in_id in range(self.arity):
+          input_tables[in_id][index] = input_tuple[in_id]
     else:
-      # scalar implementation bench
-      test_loop, test_acc = self.get_scalar_bench_wrapper(test_num, tested_function, input_tables, output_table)
+      for input_table, encodings in zip(input_tables, input_columns):
+        input_table.set_encodings(encodings)
+
+    if latency and self.implementation.get_output_format().is_vector_format():
+      Log.report(Log.Warning, "latency bench is not supported for vector implementation, measuring throughput")
+      latency = False
+    elif latency and not self.is_latency_bench_supported():
+      Log.report(Log.Warning, "latency bench is not supported for output format {}, measuring throughput", self.implementation.get_output_format())
+      latency = False
+
+    def build_test_loop():
+      """ build a new (test_loop, test_acc) bench loop """
+      if self.implementation.get_output_format().is_vector_format():
+        # vector implementation bench
+        return self.get_vector_bench_wrapper(test_num, tested_function, input_tables, output_table)
+      elif latency:
+        # scalar latency-bound bench
+        return self.get_scalar_latency_bench_wrapper(test_num, tested_function, input_tables, output_table)
+      else:
+        # scalar implementation bench
+        return self.get_scalar_bench_wrapper(test_num, tested_function, input_tables, output_table)
+
+    test_loop, test_acc = build_test_loop()
 
     timer = Variable("timer", precision = ML_Int64, var_type = Variable.Local)
     printf_timing_op = FunctionOperator(
@@ -1765,6 +2629,11 @@ class ML_FunctionBasis(object):
 
     GLOBAL_ACC_INIT_VALUE = 0 if not result_precision.is_vector_format() else [0]*self.get_vector_size()
 
+    if repeat or warmup or latency:
+      return self.generate_bench_repetition_wrapper(
+        auto_test, build_test_loop, test_num, loop_num, max(1, repeat), warmup,
+        global_acc, GLOBAL_ACC_INIT_VALUE, printf_acc_function)
+
     # common test scheme between scalar and vector functions
     test_scheme = Statement(
       self.processor.get_init_timestamp(),
@@ -1889,6 +2758,59 @@ class ML_FunctionBasis(object):
     )
     return test_loop, acc
 
+  def is_latency_bench_supported(self):
+    """ predicate indicating if the output format of @p self allows
+        latency-bound bench (standard floating-point or integer format) """
+    result_precision = self.implementation.get_output_format()
+    return result_precision in [ML_Binary16, ML_Binary32, ML_Binary64] or is_std_integer_format(result_precision)
+
+  def get_latency_result_bits(self, result):
+    """ return an integer node whose value is the encoding of @p result
+        (result itself for integer output format) """
+    result_precision = self.implementation.get_output_format()
+    if is_std_integer_format(result_precision):
+      return result
+    return TypeCast(result, precision=result_precision.get_integer_format())
+
+  ## generate a latency-bound bench loop for scalar tests
+  #  the index of each call inputs depends on the previous call result:
+  #  index = i & ~(bits(previous_result) & 1), which remains in the test range,
+  #  does not propagate special values and only adds integer operations
+  #  to the measured latency
+  #  @param test_num number of elementary tests to be executed
+  #  @param tested_function FunctionObject to be tested
+  #  @param input_tables list of ML_NewTable object containing test inputs
+  #  @param output_table ML_NewTable object containing test outputs
+  def get_scalar_latency_bench_wrapper(self, test_num, tested_function, input_tables, output_table):
+    vi = Variable("i", precision = ML_Int32, var_type = Variable.Local)
+    test_num_cst = Constant(test_num, precision = ML_Int32, tag = "test_num")
+
+    result_precision = self.implementation.get_output_format()
+    # result of the previous call
+    prev_result = Variable("prev_result", precision=result_precision, var_type=Variable.Local)
+
+    result_bits = self.get_latency_result_bits(prev_result)
+    bits_precision = result_bits.get_precision()
+    dependency = BitLogicAnd(result_bits, Constant(1, precision=bits_precision), precision=bits_precision)
+    if bits_precision != ML_Int32:
+      dependency = Conversion(dependency, precision=ML_Int32)
+    chained_index = BitLogicAnd(vi, BitLogicNegate(dependency, precision=ML_Int32), precision=ML_Int32)
+    local_inputs = tuple(TableLoad(input_tables[in_id], chained_index) for in_id in range(self.arity))
+    local_result = tested_function(*local_inputs)
+
+    test_loop = Loop(
+      Statement(
+          ReferenceAssign(vi, Constant(0, precision = ML_Int32)),
+          ReferenceAssign(prev_result, Constant(0, precision=result_precision)),
+      ),
+      vi < test_num_cst,
+      Statement(
+        ReferenceAssign(prev_result, local_result),
+        ReferenceAssign(vi, vi + 1)
+      ),
+    )
+    return test_loop, prev_result
+
   #@staticmethod
   def get_name(self):
     return self.function_name
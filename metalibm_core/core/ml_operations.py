@@ -64,6 +64,7 @@ from .ml_formats import (
 )
 
 from metalibm_core.utility.decorator import safe
+from metalibm_core.opt.graph_traversal import map_postorder
 
 ## \defgroup ml_operations ml_operations
 #  @{
@@ -140,7 +141,8 @@ class AbstractOperation(ML_Operation):
     def __init__(self, **init_map):
         self.attributes = Attributes(**init_map)
         self.index = AbstractOperation.global_index; AbstractOperation.global_index += 1
-        self.get_handle().set_node(self)
+        # the node handle is only allocated when it is first accessed
+        self.attributes.bind_node(self)
 
     ## extract the High part of the Node
     @property
@@ -797,6 +799,12 @@ class GeneralOperation(AbstractOperation):
         self.inputs = tuple(implicit_op(op) for op in ops)
     def get_codegen_key(self):
         return None
+    def build_copy(self, input_copies):
+        """ build a new node of the same class as self with input_copies as
+            inputs (attributes and class specific fields are copied by
+            copy and finish_copy) """
+        return self.__class__(*input_copies, __copy = True)
+
     def copy(self, copy_map=None):
         """ base function to copy an abstract operation object,
             copy_map is a memoization hashtable which can be use to factorize
@@ -805,12 +813,24 @@ class GeneralOperation(AbstractOperation):
         # test for previous definition in memoization map
         if self in copy_map:
             return copy_map[self]
-        # else define a new and free copy
-        new_copy = self.__class__(*tuple(copy_map[op] if op in copy_map else op.copy(copy_map) for op in self.inputs), __copy = True)
-        new_copy.attributes = self.attributes.get_copy()
-        copy_map[self] = new_copy
-        self.finish_copy(new_copy, copy_map)
-        return new_copy
+        # the sub-graph of nodes relying on this generic copy is copied
+        # without recursion (inputs first), other nodes (leaves,
+        # tables, ...) are copied by their own copy method
+        def is_generic_copy(node):
+            return node.__class__.copy is GeneralOperation.copy
+        def get_copy_inputs(node):
+            return node.inputs if is_generic_copy(node) else ()
+        def copy_node(node, input_copies):
+            if not is_generic_copy(node):
+                return node.copy(copy_map)
+            # else define a new and free copy
+            new_copy = node.build_copy(input_copies)
+            new_copy.attributes = node.attributes.get_copy()
+            copy_map[node] = new_copy
+            node.finish_copy(new_copy, copy_map)
+            return new_copy
+        return map_postorder(self, copy_node, memoization_map=copy_map,
+                             get_inputs=get_copy_inputs)
 
     def range_function(self, ops, ops_interval_getter=lambda op: op.get_interval()):
         """ Generic wrapper for node range evaluation """
@@ -2003,15 +2023,8 @@ class FunctionCall(GeneralOperation):
             if isinstance(inp, Constant) and isinstance(inp.get_precision(), ML_AbstractFormat):
                 inp.set_precision(new_optree_format)
 
-    def copy(self, copy_map = {}):
-        # test for previous definition in memoization map
-        if self in copy_map: return copy_map[self]
-        # else define a new and free copy
-        new_copy = self.__class__(self.function_object, *tuple(op.copy(copy_map) for op in self.inputs), __copy = True)
-        new_copy.attributes = self.attributes.get_copy()
-        copy_map[self] = new_copy
-        self.finish_copy(new_copy, copy_map)
-        return new_copy
+    def build_copy(self, input_copies):
+        return self.__class__(self.function_object, *input_copies, __copy = True)
 
 
 class SwitchBlock(ControlFlowOperation):
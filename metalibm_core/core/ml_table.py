@@ -33,6 +33,9 @@
 ## @package ml_table
 #  Metalibm Table (numerical array)
 import itertools
+import hashlib
+import struct
+import os
 
 from sollya import Interval
 
@@ -41,7 +44,8 @@ from .ml_operations import (
 )
 from .attributes import Attributes, attr_init
 from .ml_formats import (
-    ML_Int32, ML_Int64, ML_UInt32, ML_UInt64, ML_Format, ML_FP_Format)
+    ML_Int32, ML_Int64, ML_UInt32, ML_UInt64, ML_Format, ML_FP_Format,
+    ML_Std_FP_Format, ML_Standard_FixedPoint_Format)
 from .ml_complex_formats import (
     ML_Pointer_Format, ML_TableFormat,
 )
@@ -49,6 +53,8 @@ from ..code_generation.code_constant import *
 from ..code_generation.code_configuration import CodeConfiguration
 from .special_values import is_numeric_value
 
+from ..utility.build_utils import generate_tmp_filename
+
 from ..utility.source_info import SourceInfo
 
 ## \defgroup ml_table ml_table
@@ -74,15 +80,29 @@ def create_multi_dim_array(dimensions, init_data = None):
             return [create_multi_dim_array(dimensions[1:]) for i in range(dim)]
 
 
+def flatten_table(table, dimensions):
+    """ return the list of the elements of the array @p table (whose
+        dimension tuple is @p dimensions) in row-major order """
+    if len(dimensions) == 1:
+        return list(table)
+    return [value for line in table for value in flatten_table(line, dimensions[1:])]
+
 ## return the C encoding of the array @table whose dimension tuple is @p dimensions
 #  and data's format is @p storage_precision
 def get_table_content(table, dimensions, storage_precision, language=C_Code, max_len=80):
+    # constants of the whole table are converted at once (batch encoding)
+    cst_list = storage_precision.get_cst_many(flatten_table(table, dimensions), language=language)
+    return get_table_cst_content(table, dimensions, iter(cst_list), max_len=max_len)
+
+## return the C initializer of the array @p table whose dimension tuple is @p dimensions,
+#  the constant strings of its elements are read (in row-major order) from @p cst_iterator
+def get_table_cst_content(table, dimensions, cst_iterator, max_len=80):
     row_suffix = "\n" + CodeConfiguration.tab
     if len(dimensions) == 1:
         code = ""
         new_line = "{"
-        for value in table:
-            value_str = storage_precision.get_cst(value, language=language)
+        for _ in table:
+            value_str = next(cst_iterator)
             if len(new_line) + len(value_str) > max_len:
                 if new_line[0] == "{":
                     # if we are at the first line and an actual line break
@@ -103,12 +123,65 @@ def get_table_content(table, dimensions, storage_precision, language=C_Code, max
         return code
     else:
         code = "{" + row_suffix
-        code += ("," + row_suffix).join(get_table_content(line, dimensions[1:], storage_precision, language = language) for line in table)
+        code += ("," + row_suffix).join(get_table_cst_content(line, dimensions[1:], cst_iterator, max_len=max_len) for line in table)
         code += "\n}"
         return code
 
 
 
+class TableEmissionMode:
+    """ emission modes for table content """
+    # table content is emitted as a C initializer (default)
+    Initializer = "initializer"
+    # raw table encodings are written to a binary side file which is
+    # included in the generated object through an .incbin directive
+    Binary = "binary"
+
+## current table emission mode
+TABLE_EMISSION_MODE = TableEmissionMode.Initializer
+## minimal number of elements for a table to be emitted as a binary blob
+BINARY_TABLE_MIN_SIZE = 1024
+
+def set_table_emission_mode(mode, min_size=None):
+    """ set the global table emission mode (and optionnaly the minimal
+        number of elements for a table to be emitted as binary blob) """
+    global TABLE_EMISSION_MODE, BINARY_TABLE_MIN_SIZE
+    TABLE_EMISSION_MODE = mode
+    if not min_size is None:
+        BINARY_TABLE_MIN_SIZE = min_size
+
+
+## struct codes (little-endian, unsigned) indexed by encoding bit-size
+BINARY_STRUCT_CODE = {8: "B", 16: "H", 32: "I", 64: "Q"}
+
+def get_binary_encoding_size(storage_precision):
+    """ return the bit-size of the raw encoding of a table element in
+        storage_precision, or None if the format does not support
+        binary table emission """
+    if isinstance(storage_precision, ML_Std_FP_Format):
+        bit_size = storage_precision.get_bit_size()
+    elif isinstance(storage_precision, ML_Standard_FixedPoint_Format) and storage_precision.get_frac_size() == 0:
+        bit_size = storage_precision.get_c_bit_size()
+    else:
+        return None
+    return bit_size if bit_size in BINARY_STRUCT_CODE else None
+
+def get_table_binary_content(table, dimensions, storage_precision):
+    """ return the raw encodings of the elements of the array @p table
+        (whose dimension tuple is @p dimensions) as a little-endian bytes
+        object (row-major order) """
+    bit_size = get_binary_encoding_size(storage_precision)
+    value_list = flatten_table(table, dimensions)
+    if isinstance(storage_precision, ML_Std_FP_Format):
+        encoding_list = storage_precision.encode_many(value_list)
+        if hasattr(encoding_list, "tobytes"):
+            # numpy array (fast path)
+            return encoding_list.astype("<u{}".format(bit_size // 8)).tobytes()
+    else:
+        encoding_list = [int(value) & (2**bit_size - 1) for value in value_list]
+    return struct.pack("<{}{}".format(len(encoding_list), BINARY_STRUCT_CODE[bit_size]), *[int(coding) for coding in encoding_list])
+
+
 class ML_Table(ML_LeafNode):
     """ Metalibm Table object """
     ## string used in get_str
@@ -121,6 +194,8 @@ class ML_Table(ML_LeafNode):
         #storage_precision = attr_init(kwords, "storage_precision", None)
         init_data = attr_init(kwords, "init_data", None)
 
+        # raw encodings of the table elements (see set_encodings)
+        self.encodings = None
         self.table = create_multi_dim_array(dimensions, init_data = init_data)
         self.dimensions = dimensions
         self.storage_precision = storage_precision
@@ -133,8 +208,30 @@ class ML_Table(ML_LeafNode):
         # is table const ? (unmutable)
         self.const = const
 
+    @property
+    def table(self):
+        """ table content (multi-dimensional list of values), decoded on
+            first access if the table was filled by set_encodings """
+        if self._table is None:
+            self._table = self.get_storage_precision().decode_many(self.encodings)
+        return self._table
+
+    @table.setter
+    def table(self, table):
+        self._table = table
+        self.encodings = None
+
+    def set_encodings(self, encodings):
+        """ set the content of @p self (one-dimensional table) from the
+            numpy array of the raw encodings of its elements, which are
+            only decoded if the table values are required """
+        assert len(self.dimensions) == 1 and len(encodings) == self.dimensions[0]
+        self._table = None
+        self.encodings = encodings
+
     def __setitem__(self, key, value):
         self.table[key] = value
+        self.encodings = None
 
     def __getitem__(self, key):
         return self.table[key]
@@ -209,8 +306,43 @@ class ML_Table(ML_LeafNode):
             dims=("][".join([str(dim) for dim in self.dimensions])))
 
     def get_content_init(self, language = C_Code):
+        if not self.encodings is None:
+            cst_list = self.get_storage_precision().get_cst_many_from_encodings(self.encodings, language=language)
+            return get_table_cst_content(self.encodings, self.dimensions, iter(cst_list))
         return get_table_content(self.table, self.dimensions, self.get_storage_precision(), language = language)
 
+    def get_element_num(self):
+        """ return the total number of elements in @p self """
+        element_num = 1
+        for dim in self.dimensions:
+            element_num *= dim
+        return element_num
+
+    def use_binary_emission(self, language=C_Code):
+        """ predicate indicating if @p self content must be emitted as
+            a binary blob rather than a C initializer """
+        return TABLE_EMISSION_MODE == TableEmissionMode.Binary and \
+            language is C_Code and \
+            not self.is_empty() and \
+            self.get_element_num() >= BINARY_TABLE_MIN_SIZE and \
+            not get_binary_encoding_size(self.get_storage_precision()) is None
+
+    def export_binary_content(self):
+        """ write @p self raw content to a binary file (in metalibm's
+            temporary directory) and return the file's absolute path """
+        if self.encodings is None:
+            binary_content = get_table_binary_content(self.table, self.dimensions, self.get_storage_precision())
+        else:
+            bit_size = get_binary_encoding_size(self.get_storage_precision())
+            binary_content = self.encodings.astype("<u{}".format(bit_size // 8)).tobytes()
+        # file is named after its content, so identical tables share
+        # the same file
+        filename = generate_tmp_filename("table_{}.bin".format(hashlib.sha256(binary_content).hexdigest()))
+        if not os.path.isfile(filename):
+            with open(filename, "wb") as binary_stream:
+                binary_stream.write(binary_content)
+        return os.path.abspath(filename)
+
     def get_str(
             self, depth = None, display_precision = False,
             tab_level = 0, memoization_map = {}, display_attribute = False,
@@ -233,7 +365,7 @@ class ML_Table(ML_LeafNode):
         if self in copy_map:
             return copy_map[self]
         else:
-            kwords = self.attributes.__dict__.copy()
+            kwords = self.attributes.get_attribute_map()
             kwords.update({
                 'dimensions' : self.dimensions,
                 'storage_precision' : self.storage_precision,
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+""" metalibm_core.core.numpy_random_gen Vectorized random encoding generation """
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: numpy generators of arrays of random floating-point encodings,
+#              vectorized counterparts of random_gen.FPRandomGen
+###############################################################################
+
+import math
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+import sollya
+
+from metalibm_core.core.special_values import (
+    FP_PlusInfty, FP_MinusInfty, FP_PlusZero, FP_MinusZero,
+    FP_PlusOmega, FP_MinusOmega, FP_QNaN, FP_SNaN
+)
+from metalibm_core.core.ml_formats import ML_Std_FP_Format
+from metalibm_core.core.random_gen import UniformInterval
+
+from metalibm_core.utility.log_report import Log
+
+
+def get_ceil_log2(value):
+    """ return ceil(log2(|value|)) for a finite non-zero float value """
+    mantissa, exponent = math.frexp(abs(value))
+    return exponent - 1 if mantissa == 0.5 else exponent
+
+
+class NumpyFPRandomGen:
+    """ Random generator of arrays of encodings (numpy array of unsigned
+        integers of the format bit-size) of floating-point numbers. Every
+        generation method draws from the same numpy Generator, whose state
+        is initialized by seed (None for a non-reproducible generation) """
+    class Category:
+        """ value categories of mix generation (default weights match
+            random_gen.FPRandomGen's default weights) """
+        SpecialValues = "special"
+        Subnormal = "subnormal"
+        Normal = "normal"
+
+    DEFAULT_WEIGHT_MAP = {
+        Category.SpecialValues: 0.1,
+        Category.Subnormal: 0.2,
+        Category.Normal: 0.7,
+    }
+
+    special_value_ctor = [
+        FP_PlusInfty, FP_MinusInfty,
+        FP_PlusZero, FP_MinusZero,
+        FP_PlusOmega, FP_MinusOmega,
+        FP_QNaN, FP_SNaN
+    ]
+
+    def __init__(self, precision, seed=None, include_snan=False):
+        if not numpy_available:
+            Log.report(Log.Error, "numpy is required by NumpyFPRandomGen")
+        self.precision = precision.get_base_format()
+        numpy_types = self.precision.get_numpy_types()
+        if numpy_types is None:
+            Log.report(Log.Error, "unsupported format {} in NumpyFPRandomGen", precision)
+        self.float_type, self.uint_type = numpy_types
+        self.field_size = self.precision.get_field_size()
+        self.exponent_size = self.precision.get_exponent_size()
+        self.bit_size = self.precision.get_bit_size()
+        self.random = numpy.random.default_rng(seed)
+        self.sp_encodings = numpy.array([
+            self.precision.get_integer_coding(sp_class(self.precision)) for sp_class in
+            self.special_value_ctor if (not sp_class is FP_SNaN or include_snan)
+        ], dtype=numpy.uint64)
+        # default generation used by get_new_encodings
+        self.default_generation = self.mix
+
+    @staticmethod
+    def from_interval(precision, low_bound, high_bound, uniform=False, seed=None):
+        """ build a generator whose default generation draws values in
+            [low_bound, high_bound], uniformly in value if uniform is set
+            else uniformly in binade (as FPRandomGen.Category.FPLogInterval) """
+        generator = NumpyFPRandomGen(precision, seed=seed)
+        if uniform:
+            generator.default_generation = lambda size: generator.uniform_value(size, low_bound, high_bound)
+        else:
+            generator.default_generation = lambda size: generator.log_interval(size, low_bound, high_bound)
+        return generator
+
+    def get_new_encodings(self, size):
+        """ Generate an array of size random encodings with the default
+            generation of @p self """
+        return self.default_generation(size)
+
+    def to_encodings(self, encodings):
+        """ convert an array of (uint64) encodings to the format unsigned type """
+        return encodings.astype(self.uint_type)
+
+    def generate_sign(self, size):
+        """ array of random sign bits (in encoding position) """
+        return self.random.integers(0, 2, size=size, dtype=numpy.uint64) << numpy.uint64(self.field_size + self.exponent_size)
+
+    def generate_field(self, size):
+        """ array of random mantissa fields """
+        return self.random.integers(0, 2**self.field_size, size=size, dtype=numpy.uint64)
+
+    def uniform_encoding(self, size, low_encoding=0, high_encoding=None):
+        """ array of encodings drawn uniformly in [low_encoding, high_encoding]
+            (by default every encoding, including special values) """
+        high_encoding = (2**self.bit_size - 1) if high_encoding is None else high_encoding
+        return self.to_encodings(
+            self.random.integers(low_encoding, high_encoding, size=size, dtype=numpy.uint64, endpoint=True))
+
+    def binade(self, size, min_exp=None, max_exp=None, signed=True):
+        """ array of normal number encodings whose exponent is drawn
+            uniformly in [min_exp, max_exp] (default: whole normal range)
+            and whose mantissa is drawn uniformly (uniform per binade) """
+        min_exp = self.precision.get_emin_normal() if min_exp is None else min_exp
+        max_exp = self.precision.get_emax() if max_exp is None else max_exp
+        biased_exp = self.random.integers(
+            min_exp - self.precision.get_bias(), max_exp - self.precision.get_bias(),
+            size=size, dtype=numpy.uint64, endpoint=True)
+        encodings = (biased_exp << numpy.uint64(self.field_size)) | self.generate_field(size)
+        if signed:
+            encodings |= self.generate_sign(size)
+        return self.to_encodings(encodings)
+
+    def normal(self, size):
+        """ array of normal number encodings (uniform per binade) """
+        return self.binade(size)
+
+    def subnormal(self, size):
+        """ array of subnormal number encodings """
+        return self.to_encodings(self.generate_sign(size) | self.generate_field(size))
+
+    def special(self, size):
+        """ array of special value encodings (infinities, zeros, omegas
+            and NaNs) """
+        return self.to_encodings(self.random.choice(self.sp_encodings, size=size))
+
+    def mix(self, size, weight_map=None):
+        """ array of encodings whose category (special, subnormal or normal)
+            is drawn according to weight_map """
+        weight_map = self.DEFAULT_WEIGHT_MAP if weight_map is None else weight_map
+        generator_map = {
+            NumpyFPRandomGen.Category.SpecialValues: self.special,
+            NumpyFPRandomGen.Category.Subnormal: self.subnormal,
+            NumpyFPRandomGen.Category.Normal: self.normal,
+        }
+        category_list = list(weight_map.keys())
+        weights = numpy.array([weight_map[category] for category in category_list], dtype=numpy.float64)
+        category_index = self.random.choice(len(category_list), size=size, p=weights / weights.sum())
+        encodings = numpy.zeros(size, dtype=self.uint_type)
+        for index, category in enumerate(category_list):
+            mask = category_index == index
+            encodings[mask] = generator_map[category](int(numpy.count_nonzero(mask)))
+        return encodings
+
+    def get_bound(self, bound, round_up):
+        """ return the (binary64 approximation of) bound rounded inward
+            (up if round_up else down) to the format """
+        bound = float(bound)
+        with numpy.errstate(over="ignore"):
+            float_bound = self.float_type(bound)
+        if round_up and float(float_bound) < bound:
+            float_bound = numpy.nextafter(float_bound, self.float_type(numpy.inf))
+        elif not round_up and float(float_bound) > bound:
+            float_bound = numpy.nextafter(float_bound, self.float_type(-numpy.inf))
+        return float_bound
+
+    def clip(self, values, low_bound, high_bound):
+        """ round the float64 array values to the format and clip them
+            in [low_bound, high_bound] """
+        with numpy.errstate(over="ignore"):
+            values = values.astype(self.float_type)
+        return numpy.clip(values, self.get_bound(low_bound, True), self.get_bound(high_bound, False)).view(self.uint_type)
+
+    def uniform_value(self, size, low_bound, high_bound):
+        """ array of encodings of values drawn uniformly in
+            [low_bound, high_bound] (as binary64 then rounded to nearest) """
+        return self.clip(self.random.uniform(float(low_bound), float(high_bound), size=size), low_bound, high_bound)
+
+    def log_interval(self, size, low_bound, high_bound):
+        """ array of encodings of values in [low_bound, high_bound] whose
+            exponent is drawn uniformly between the exponents of the bounds
+            (vectorized FPRandomGen.Category.FPLogInterval, values are
+            clipped to the interval). The sign is random only if the
+            interval contains both positive and negative values """
+        bound_list = [float(low_bound), float(high_bound)]
+        exp_list = [get_ceil_log2(bound) for bound in bound_list if bound != 0 and math.isfinite(bound)]
+        emin, emax = self.precision.get_emin_normal(), self.precision.get_emax()
+        if bound_list[0] <= 0 <= bound_list[1] or not exp_list:
+            min_exp = emin
+        else:
+            min_exp = min(emax, max(emin, min(exp_list)))
+        if not all(math.isfinite(bound) for bound in bound_list) or not exp_list:
+            max_exp = emax
+        else:
+            max_exp = max(min_exp, min(emax, max(exp_list)))
+        signed = bound_list[0] < 0 < bound_list[1]
+        values = self.binade(size, min_exp, max_exp, signed=signed).view(self.float_type).astype(numpy.float64)
+        if bound_list[1] <= 0:
+            values = -values
+        return self.clip(values, low_bound, high_bound)
+
+
+def is_numpy_rng_supported(precision):
+    """ predicate indicating if random encodings of precision can be
+        generated by NumpyFPRandomGen """
+    base_format = precision.get_base_format()
+    return numpy_available and isinstance(base_format, ML_Std_FP_Format) and \
+        not base_format.get_numpy_types() is None
+
+def get_numpy_precision_rng(precision, value_range=None, seed=None):
+    """ build a NumpyFPRandomGen for format @p precision with the same
+        value distribution as random_gen.get_precision_rng:
+        value_range None selects the default category mix, an
+        UniformInterval uniform value generation and other intervals
+        per binade generation, or return None if precision is not
+        supported """
+    if not is_numpy_rng_supported(precision):
+        return None
+    if value_range is None:
+        return NumpyFPRandomGen(precision, seed=seed)
+    elif isinstance(value_range, UniformInterval):
+        return NumpyFPRandomGen.from_interval(
+            precision, sollya.inf(value_range.interval), sollya.sup(value_range.interval),
+            uniform=True, seed=seed)
+    else:
+        return NumpyFPRandomGen.from_interval(
+            precision, sollya.inf(value_range), sollya.sup(value_range), seed=seed)
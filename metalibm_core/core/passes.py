@@ -26,7 +26,12 @@
 ###############################################################################
 
 import sys
+import importlib
+
 from metalibm_core.utility.log_report import Log
+from metalibm_core.core.target import import_package_modules
+from metalibm_core.utility.pass_profiler import profile_section, count_graph_nodes
+from metalibm_core.opt.graph_traversal import iter_postorder
 
 """ custom warning log level for pass management """
 LOG_PASS_INFO = Log.LogLevel("Info", "passes")
@@ -128,8 +133,11 @@ class PassScheduler:
         Log.report(Log.Error, "{} is not a valid pass slot tag (possible are: {}", tag, TAG_CLASS_MAP.keys())
     return TAG_CLASS_MAP[tag]
 
-  def __init__(self, pass_tag_list=None):
+  def __init__(self, pass_tag_list=None, node_counter=None):
+    """ :param node_counter: function returning the number of nodes of
+                             a pass input (only used by pass profiling) """
     pass_tag_list = pass_tag_list or self.STANDARD_SLOT_LIST
+    self.node_counter = node_counter
     self.pass_map = {
       None: [], # should remain empty
     }
@@ -178,7 +186,9 @@ class PassScheduler:
     inter_values = inputs
     for pass_object in pass_list:
       Log.report(LOG_PASS_INFO, "executing pass: {}", pass_object.pass_tag)
-      inter_values = execution_function(self, pass_object, inputs)
+      node_counter = None if self.node_counter is None else (lambda: self.node_counter(inputs))
+      with profile_section("pass", pass_object.pass_tag, node_counter=node_counter):
+        inter_values = execution_function(self, pass_object, inputs)
     return inter_values
 
   def flush_rdy_pass_list(self):
@@ -232,11 +242,58 @@ def METALIBM_PASS_REGISTER(pass_class):
     return pass_class
 
 
+## lightweight descriptors of metalibm's passes: pass tag -> name of the
+#  module which registers the pass when imported.
+#  Pass modules are only imported when the pass is selected
+PASS_MODULE_MAP = {
+    "generic_lowering": "metalibm_core.opt.generic_lowering",
+    "critical_path_eval": "metalibm_core.opt.p_auto_pipeline",
+    "basic_legalization": "metalibm_core.opt.p_basic_legalization",
+    "check_generic": "metalibm_core.opt.p_check_precision",
+    "check_precision": "metalibm_core.opt.p_check_precision",
+    "check_target_support": "metalibm_core.opt.p_check_support",
+    "evaluate_range": "metalibm_core.opt.p_evaluate_range",
+    "expand_multi_precision": "metalibm_core.opt.p_expand_multi_precision",
+    "silence_fp_ops": "metalibm_core.opt.p_function_std",
+    "fuse_fma": "metalibm_core.opt.p_function_std",
+    "sub_expr_sharing": "metalibm_core.opt.p_function_std",
+    "check_processor_support": "metalibm_core.opt.p_function_std",
+    "instantiate_abstract_prec": "metalibm_core.opt.p_function_typing",
+    "instantiate_prec": "metalibm_core.opt.p_function_typing",
+    "gen_basic_block": "metalibm_core.opt.p_gen_bb",
+    "ssa_translation": "metalibm_core.opt.p_gen_bb",
+    "basic_block_simplification": "metalibm_core.opt.p_gen_bb",
+    "gvn": "metalibm_core.opt.p_gvn",
+    "legalizertl2swformat": "metalibm_core.opt.p_legalize_rtl_to_sw_format",
+    "logical_simplification": "metalibm_core.opt.p_logical_simplification",
+    "linearize_op_graph": "metalibm_core.opt.p_machine_code_gen",
+    "register_allocation": "metalibm_core.opt.p_machine_code_gen",
+    "simplify_bb_fallback": "metalibm_core.opt.p_machine_code_gen",
+    "collapse_reg_copy": "metalibm_core.opt.p_machine_code_gen",
+    "numerical_simplification": "metalibm_core.opt.p_numerical_simplification",
+    "soft_legalize": "metalibm_core.opt.p_rtl_legalize",
+    "rtl_legalize": "metalibm_core.opt.p_rtl_legalize",
+    "unify_pipeline_stages": "metalibm_core.opt.p_rtl_pipeline",
+    "simplify_rtl": "metalibm_core.opt.p_simplify_rtl",
+    "size_datapath": "metalibm_core.opt.p_size_datapath",
+    "tag_node": "metalibm_core.opt.p_tag_node",
+    "debug_tag_node": "metalibm_core.opt.p_tag_node",
+    "virtual_vector_bool_legalization": "metalibm_core.opt.p_vbool_legalization",
+    "vector_mask_test_legalization": "metalibm_core.opt.p_vector_mask_test_legalization",
+    "vector_promotion": "metalibm_core.opt.p_vector_promotion",
+    "dummy_asm_lowering": "metalibm_core.targets.common.dummy_asm_target",
+    "m128_promotion": "metalibm_core.targets.intel.m128_promotion",
+    "m256_promotion": "metalibm_core.targets.intel.m256_promotion",
+}
+
 ## System to manage dynamically defined optimization pass
 class Pass:
   pass_tag = None
   ## map of all registered pass
   pass_map = {}
+  ## map of passes which have been declared but not imported yet
+  #  pass tag -> module name
+  lazy_pass_map = dict(PASS_MODULE_MAP)
   pass_id_iterator = -1
 
   @staticmethod
@@ -269,14 +326,28 @@ class Pass:
   #  @return[Pass] pass object 
   @staticmethod
   def get_pass_by_tag(tag):
+    if not tag in Pass.pass_map and tag in Pass.lazy_pass_map:
+        # importing the pass module registers the pass
+        importlib.import_module(Pass.lazy_pass_map[tag])
+    if not tag in Pass.pass_map:
+        # pass missing from PASS_MODULE_MAP: importing every pass module
+        # (opt/p_*.py and target modules) before failing
+        import_package_modules("metalibm_core.opt", prefix="p_")
+        import_package_modules("metalibm_core.targets")
     if not tag in Pass.pass_map:
-        Log.report(Log.Error, "unknown pass tag: {}\nknown tags:{}", tag, "\n".join(Pass.pass_map.keys()))
+        Log.report(Log.Error, "unknown pass tag: {}\nknown tags:{}", tag, "\n".join(Pass.get_pass_tag_list()))
     return Pass.pass_map[tag]
 
-  ## return the list of tags of registered passes
+  ## declare the pass @p tag whose module @p module_name is only
+  #  imported when the pass is first requested
+  @staticmethod
+  def register_lazy_pass(tag, module_name):
+    Pass.lazy_pass_map[tag] = module_name
+
+  ## return the list of tags of registered (or declared) passes
   @staticmethod
   def get_pass_tag_list():
-    return [tag for tag in Pass.pass_map]
+    return [tag for tag in Pass.pass_map] + [tag for tag in Pass.lazy_pass_map if not tag in Pass.pass_map]
 
 
 ## Abstract parent to optimization pass
@@ -330,30 +401,17 @@ class LinearizedGraphOptimization(OptreeOptimization):
         raise NotImplementedError
 
     def execute(self, input_node):
-        worklist = [input_node]
-
-        while worklist:
-            node = worklist.pop(0)
-            if not self.is_leaf_node(node):
-                op_ready = True
-                for op in node.inputs:
-                    if not op in self.memoization_map:
-                        op_ready = False
-                        if not op in worklist:
-                            worklist.append(op)
-                if not op_ready and not node in worklist:
-                    worklist.append(node)
-                elif op_ready:
-                    self.apply_on_node(node)
-            else:
-                self.apply_on_node(node)
+        for node in iter_postorder(input_node,
+                                   is_leaf_node=self.is_leaf_node,
+                                   skip_node=lambda op: op in self.memoization_map):
+            self.apply_on_node(node)
         return self.extract_result(input_node)
 
     def extract_result(self, top_input_node):
         """ generate the top-level result when execute is called with
-            <input_node> as input """
-        result_node = self.memoization_map[input_node]
-        return input_node if result_node is None else result_node
+            <top_input_node> as input """
+        result_node = self.memoization_map[top_input_node]
+        return top_input_node if result_node is None else result_node
 
 class FunctionPass(OptreeOptimization):
     """ pass which execute on functions node:
@@ -367,11 +425,13 @@ class FunctionPass(OptreeOptimization):
     def execute_on_function(self, fct, fct_group):
         Log.report(Log.Info, "executing pass {} on fct {}".format(
             self.pass_tag, fct.get_name()))
-        optree = fct.get_scheme()
-        memoization_map = {}
-        new_scheme = self.execute_on_optree(optree, fct, fct_group, memoization_map)
-        if not new_scheme is None:
-            fct.set_scheme(new_scheme)
+        with profile_section("function", self.pass_tag, function_name=fct.get_name(),
+                             node_counter=lambda: count_graph_nodes(fct.get_scheme())):
+            optree = fct.get_scheme()
+            memoization_map = {}
+            new_scheme = self.execute_on_optree(optree, fct, fct_group, memoization_map)
+            if not new_scheme is None:
+                fct.set_scheme(new_scheme)
 
     def execute_on_fct_group(self, fct_group):
         Log.report(Log.Info, "executing pass {} on fct group {}".format(self.pass_tag, fct_group))
@@ -186,6 +186,16 @@ class Polynomial(object):
           else:
             precision_list.append(c)
 
+        # local import to avoid circular dependency (through axf_utils)
+        from metalibm_core.utility.approx_cache import get_approx_cache
+        approx_cache = get_approx_cache()
+        if not approx_cache is None:
+            cache_key = approx_cache.get_key("fpminimax", function, poly_degree, precision_list, approx_interval, modifiers)
+            cached_approx = approx_cache.load_poly_approx(cache_key)
+            if not cached_approx is None:
+                poly_object, _ = cached_approx
+                return poly_object
+
         sollya_poly = sollya.fpminimax(function, poly_degree, precision_list,
                                        approx_interval, *modifiers)
         while sollya_poly.is_error() and sollya.settings.points < 10000:
@@ -213,7 +223,12 @@ class Polynomial(object):
             #   * slightly relax approx_interval bounds
             raise SollyaError
 
-        return Polynomial(sollya_poly)
+        poly_object = Polynomial(sollya_poly)
+        if not approx_cache is None:
+            approx_cache.store_poly_approx(
+                cache_key, poly_object, function, poly_object.coeff_map.keys(),
+                coeff_formats, approx_interval, absolute=(sollya.absolute in modifiers))
+        return poly_object
 
 
     ## Approximation computation with built-in approximation error computation
@@ -246,6 +261,18 @@ class Polynomial(object):
                 precision_list.append(c.get_sollya_object())
             else:
                 precision_list.append(c)
+
+        # local import to avoid circular dependency (through axf_utils)
+        from metalibm_core.utility.approx_cache import get_approx_cache
+        approx_cache = get_approx_cache()
+        if not approx_cache is None:
+            cache_key = approx_cache.get_key(
+                "fpminimax_with_error", function, poly_degree, precision_list,
+                approx_interval, modifiers, tightness, error_function)
+            cached_approx = approx_cache.load_poly_approx(cache_key)
+            if not cached_approx is None:
+                return cached_approx
+
         sollya_poly = sollya.fpminimax(function, poly_degree, precision_list, approx_interval, *modifiers)
         if sollya_poly.is_error():
             print("function: {}, poly_degree: {}, precision_list: {}, approx_interval: {}, modifiers: {}".format(function, poly_degree, precision_list, approx_interval, modifiers))
@@ -254,7 +281,14 @@ class Polynomial(object):
         fpnorm_modifiers = sollya.absolute if sollya.absolute in modifiers else sollya.relative
         #approx_error = sollya.supnorm(sollya_poly, function, approx_interval, fpnorm_modifiers, tightness)
         approx_error = error_function(sollya_poly, function, approx_interval, fpnorm_modifiers, tightness)
-        return Polynomial(sollya_poly), approx_error
+        poly_object = Polynomial(sollya_poly)
+        if not approx_cache is None:
+            approx_cache.store_poly_approx(
+                cache_key, poly_object, function, poly_object.coeff_map.keys(),
+                coeff_formats, approx_interval,
+                absolute=(fpnorm_modifiers == sollya.absolute),
+                approx_error=approx_error)
+        return poly_object, approx_error
 
 def generate_power(variable, power, power_map = {}, precision = None):
     """ generate variable^power, using power_map for memoization
@@ -287,11 +287,12 @@ class FixedPointRandomGen(IntRandomGen):
             )
         )
     @staticmethod
-    def from_interval(precision, low_bound, high_bound):
+    def from_interval(precision, low_bound, high_bound, seed=None):
         return FixedPointRandomGen(
             precision.integer_size,
             precision.frac_size,
             precision.signed,
+            seed=seed,
             min_value=low_bound, max_value=high_bound
         )
 
@@ -306,7 +307,7 @@ class FPRandomGen(RandomGenWeightCat):
             @staticmethod
             def generate_value(generator):
                 """ Generate a single special value """
-                return random.choice(generator.sp_list)
+                return generator.random.choice(generator.sp_list)
 
         class Subnormal:
             """ Subnormal numbers """
@@ -378,7 +379,7 @@ class FPRandomGen(RandomGenWeightCat):
                 # for larger format
                 # Nonetheless this number must be rounded(-down) to the generator
                 # precision to avoid double-rounding issue down the line
-                return NumericValue(generator.precision.round_sollya_object(random.uniform(self.inf_bound, self.sup_bound)))
+                return NumericValue(generator.precision.round_sollya_object(generator.random.uniform(self.inf_bound, self.sup_bound)))
 
 
                 # value = generator.precision.round_sollya_object(random.uniform(self.inf_bound, self.sup_bound))
@@ -417,11 +418,11 @@ class FPRandomGen(RandomGenWeightCat):
         self.sp_list = self.get_special_value_list(include_snan=False)
 
     @staticmethod
-    def from_interval(precision, low_bound, high_bound, uniform=False):
+    def from_interval(precision, low_bound, high_bound, uniform=False, seed=None):
         weight_map = {
             (FPRandomGen.Category.FPLogInterval if not uniform else FPRandomGen.Category.FPUniformInterval)(low_bound, high_bound): 1.0,
         }
-        return FPRandomGen(precision, weight_map)
+        return FPRandomGen(precision, weight_map, seed=seed)
 
     def get_special_value_list(self, include_snan=True):
         """ Returns a list a special values in the generator precision """
@@ -443,7 +444,7 @@ def get_value_exp(value):
 
 class MPFPRandomGen:
     """ random generator for multi-precision floating-point numbers """
-    def __init__(self, mp_format, weight_map=None):
+    def __init__(self, mp_format, weight_map=None, seed=None):
         weight_map = normalize_map({
             FPRandomGen.Category.SpecialValues: 0.0,
             FPRandomGen.Category.Subnormal: 0.0,
@@ -457,20 +458,22 @@ class MPFPRandomGen:
             FPRandomGen.Category.ZeroExp: 1.0,
         })
 
+        # each limb generator gets its own seed derived from seed
         self.rng_gen_list = [
-            FPRandomGen(mp_format.field_format_list[0], weight_map=weight_map)
+            FPRandomGen(mp_format.field_format_list[0], weight_map=weight_map, seed=seed)
         ] + [
             FPRandomGen(
-                limb_format, weight_map=lower_weight_map
-            ) for limb_format in mp_format.field_format_list[1:]
+                limb_format, weight_map=lower_weight_map,
+                seed=(None if seed is None else "{}:{}".format(seed, index))
+            ) for index, limb_format in enumerate(mp_format.field_format_list[1:], 1)
         ]
 
     @staticmethod
-    def from_interval(precision, low_bound, high_bound, uniform=False):
+    def from_interval(precision, low_bound, high_bound, uniform=False, seed=None):
         weight_map = {
             (FPRandomGen.Category.FPLogInterval if not uniform else FPRandomGen.Category.UniformInterval)(low_bound, high_bound): 1.0,
         }
-        return MPFPRandomGen(precision, weight_map)
+        return MPFPRandomGen(precision, weight_map, seed=seed)
 
     def get_new_value(self):
         acc = self.rng_gen_list[0].get_new_value()
@@ -482,16 +485,19 @@ class MPFPRandomGen:
             acc += new_limb
         return acc
 
-def get_precision_rng(precision, value_range=None, uniform=False):
+def get_precision_rng(precision, value_range=None, uniform=False, seed=None):
+    """ build a random number generator for format @p precision, seed
+        (None for a non-reproducible generation) initializes the
+        generator state """
     if value_range is None:
         # default full-range value generation
         base_format = precision.get_base_format()
         if isinstance(base_format, ML_FP_MultiElementFormat):
-            return MPFPRandomGen(precision)
+            return MPFPRandomGen(precision, seed=seed)
         elif isinstance(base_format, ML_FP_Format):
-            return FPRandomGen(precision, include_snan=False)
+            return FPRandomGen(precision, include_snan=False, seed=seed)
         elif isinstance(base_format, ML_Fixed_Format):
-            return FixedPointRandomGen(precision.integer_size, precision.frac_size, precision.signed)
+            return FixedPointRandomGen(precision.integer_size, precision.frac_size, precision.signed, seed=seed)
         else:
             Log.report(Log.Error, "unsupported format {}/{} in get_precision_rng", precision, base_format)
     else:
@@ -503,18 +509,18 @@ def get_precision_rng(precision, value_range=None, uniform=False):
             low_bound = sollya.inf(value_range)
             high_bound = sollya.sup(value_range)
             uniform = uniform
-        return get_precision_rng_with_defined_range(precision, low_bound, high_bound, uniform)
+        return get_precision_rng_with_defined_range(precision, low_bound, high_bound, uniform, seed=seed)
 
-def get_precision_rng_with_defined_range(precision, inf_bound, sup_bound, uniform=False):
+def get_precision_rng_with_defined_range(precision, inf_bound, sup_bound, uniform=False, seed=None):
     """ build a random number generator for format @p precision
         which generates values within the range [inf_bound, sup_bound] """
     base_format = precision.get_base_format()
     if isinstance(base_format, ML_FP_MultiElementFormat):
-        return MPFPRandomGen.from_interval(precision, inf_bound, sup_bound)
+        return MPFPRandomGen.from_interval(precision, inf_bound, sup_bound, seed=seed)
     elif isinstance(base_format, ML_FP_Format):
-        return FPRandomGen.from_interval(precision, inf_bound, sup_bound, uniform)
+        return FPRandomGen.from_interval(precision, inf_bound, sup_bound, uniform, seed=seed)
     elif isinstance(base_format, ML_Fixed_Format):
-        return FixedPointRandomGen.from_interval(precision, inf_bound, sup_bound)
+        return FixedPointRandomGen.from_interval(precision, inf_bound, sup_bound, seed=seed)
     else:
         Log.report(Log.Error, "unsupported format {}/{} in get_precision_rng", precision, base_format)
 
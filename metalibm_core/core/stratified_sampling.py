@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+""" metalibm_core.core.stratified_sampling Stratified test input sampling """
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: stratified generation of floating-point test inputs: the test
+#              budget is split between the neighbourhoods of boundary values
+#              (e.g. comparison constants of the implementation scheme) and
+#              strata (sub-interval between boundaries x sign x binade)
+###############################################################################
+
+import random
+
+import sollya
+
+from metalibm_core.core.special_values import (
+    FP_SpecialValue,
+    FP_PlusInfty, FP_MinusInfty, FP_PlusZero, FP_MinusZero, FP_QNaN
+)
+from metalibm_core.core.ml_formats import ML_Std_FP_Format
+from metalibm_core.core.ml_operations import (
+    ML_LeafNode, Constant, ConditionBlock, Select, Comparison,
+    LogicalAnd, LogicalOr, LogicalNot, Abs, Negation
+)
+from metalibm_core.core.random_gen import UniformInterval
+from metalibm_core.core.attributes import Attributes, AttributeCtor
+
+from metalibm_core.utility.log_report import Log
+
+
+# (variable, value list) recorded on nodes whose value changes when
+# variable crosses one of the values (see set_sampling_boundaries)
+Attributes.add_dyn_attribute(AttributeCtor("sampling_boundaries", default_value=None))
+
+def set_sampling_boundaries(node, variable, boundary_list):
+    """ record on node (e.g. the table index of a piecewise approximation)
+        the values of variable at which the value of node changes, they
+        are extracted as sampling boundaries when variable is a function
+        input """
+    node.set_attributes(sampling_boundaries=(variable, list(boundary_list)))
+
+
+def is_boundary_constant(node):
+    """ predicate indicating if node is a scalar numerical Constant
+        (whose value can be used as a sampling boundary) """
+    if not isinstance(node, Constant):
+        return False
+    value = node.get_value()
+    if isinstance(value, bool) or FP_SpecialValue.is_special_value(value):
+        return False
+    return isinstance(value, (int, float, sollya.SollyaObject))
+
+
+def get_comparison_boundaries(comparison, input_variable):
+    """ return the list of input values at which the result of comparison
+        may change, if comparison compares input_variable (or its absolute
+        value or its negation) to a constant """
+    boundary_list = []
+    lhs, rhs = comparison.get_inputs()
+    for var_side, cst_side in ((lhs, rhs), (rhs, lhs)):
+        if not is_boundary_constant(cst_side):
+            continue
+        value = cst_side.get_value()
+        if var_side is input_variable:
+            boundary_list.append(value)
+        elif isinstance(var_side, Abs) and var_side.get_input(0) is input_variable:
+            boundary_list += [value, -value]
+        elif isinstance(var_side, Negation) and var_side.get_input(0) is input_variable:
+            boundary_list.append(-value)
+    return boundary_list
+
+
+def extract_condition_boundaries(scheme, input_variable):
+    """ list the boundary values of input_variable derived from the
+        comparisons of the conditions of scheme's ConditionBlock
+        (and Select) nodes and from the boundaries recorded by
+        set_sampling_boundaries (e.g. sub-interval bounds of piecewise
+        approximations of input_variable). Only comparisons between a
+        constant and input_variable itself, Abs(input_variable) or
+        Negation(input_variable) are detected: comparisons on values
+        derived from the input (reduced argument, exponent field,
+        conversion, ...) do not provide boundaries """
+    boundary_list = []
+
+    def visit_condition(condition):
+        if isinstance(condition, (LogicalAnd, LogicalOr, LogicalNot)):
+            for op in condition.get_inputs():
+                visit_condition(op)
+        elif isinstance(condition, Comparison):
+            boundary_list.extend(get_comparison_boundaries(condition, input_variable))
+
+    # iterative traversal to support deep schemes
+    processed = set()
+    node_stack = [scheme]
+    while node_stack:
+        node = node_stack.pop()
+        if node in processed or isinstance(node, ML_LeafNode):
+            continue
+        processed.add(node)
+        if isinstance(node, (ConditionBlock, Select)):
+            visit_condition(node.get_input(0))
+        recorded_boundaries = node.attributes.sampling_boundaries
+        if not recorded_boundaries is None and recorded_boundaries[0] is input_variable:
+            boundary_list.extend(recorded_boundaries[1])
+        node_stack.extend(node.get_inputs())
+        node_stack.extend(node.get_extra_inputs())
+    return boundary_list
+
+
+class StratifiedSampler:
+    """ Stratified generator of floating-point test inputs in a given range.
+
+        Finite values of the format are mapped to ordinals (signed integers
+        whose ordering matches the value ordering, consecutive numbers have
+        consecutive ordinals and ordinal 0 is zero). A fraction of the test
+        budget is spent on ordinals around each boundary (a few consecutive
+        neighbours then exponentially increasing offsets), the remaining
+        budget is split equally between strata: each sub-interval between
+        boundaries is split by sign and binade (the subnormal range being
+        one binade). When the range is not defined, the generation covers
+        every finite number and starts with special values """
+    # fraction of the test budget spent around boundaries
+    BOUNDARY_FRACTION = 0.25
+    # number of consecutive neighbours tested on each side of a boundary
+    NEIGHBOUR_NUM = 4
+
+    special_value_ctor = [
+        FP_PlusInfty, FP_MinusInfty, FP_PlusZero, FP_MinusZero, FP_QNaN
+    ]
+
+    def __init__(self, precision, value_range=None, boundary_list=None, seed=None):
+        self.precision = precision.get_base_format()
+        if not isinstance(self.precision, ML_Std_FP_Format):
+            Log.report(Log.Error, "unsupported format {} in StratifiedSampler", precision)
+        self.random = random.Random(seed)
+        self.field_size = self.precision.get_field_size()
+        self.exponent_size = self.precision.get_exponent_size()
+        self.sign_mask = 2**(self.field_size + self.exponent_size)
+        # ordinal of omega (largest finite number)
+        self.max_ordinal = ((2**self.exponent_size - 1) << self.field_size) - 1
+        if value_range is None:
+            self.low_ordinal, self.high_ordinal = -self.max_ordinal, self.max_ordinal
+            self.special_encodings = [
+                self.precision.get_integer_coding(sp_class(self.precision))
+                for sp_class in self.special_value_ctor]
+        else:
+            if isinstance(value_range, UniformInterval):
+                value_range = value_range.interval
+            # bounds are rounded inward
+            self.low_ordinal = self.get_ordinal(sollya.inf(value_range), sollya.RU)
+            self.high_ordinal = self.get_ordinal(sollya.sup(value_range), sollya.RD)
+            self.special_encodings = []
+        if self.low_ordinal > self.high_ordinal:
+            Log.report(Log.Error, "range {} does not contain any {} number", value_range, self.precision)
+        boundary_ordinals = set(
+            self.get_ordinal(boundary, sollya.RN) for boundary in (boundary_list or []))
+        # zero (sign change and subnormal range) is always a boundary
+        boundary_ordinals.add(0)
+        self.boundary_ordinals = sorted(
+            ordinal for ordinal in boundary_ordinals
+            if self.low_ordinal <= ordinal <= self.high_ordinal)
+
+    def get_ordinal(self, value, round_mode):
+        """ ordinal of value rounded to the format with round_mode
+            (saturated to the finite range) """
+        omega = self.precision.get_omega()
+        if value > omega:
+            return self.max_ordinal
+        elif value < -omega:
+            return -self.max_ordinal
+        value = self.precision.round_sollya_object(value, round_mode)
+        if value == 0:
+            return 0
+        encoding = self.precision.get_integer_coding(value)
+        magnitude = min(encoding % self.sign_mask, self.max_ordinal)
+        return -magnitude if encoding >= self.sign_mask else magnitude
+
+    def get_encoding(self, ordinal):
+        """ encoding of the number whose ordinal is ordinal """
+        return ordinal if ordinal >= 0 else (-ordinal) | self.sign_mask
+
+    def get_binade_strata(self, low, high):
+        """ split the ordinal range [low, high] (which must not
+            contain both positive and negative ordinals) by binade """
+        if high < 0:
+            return [(-stratum_high, -stratum_low) for stratum_low, stratum_high in self.get_binade_strata(-high, -low)]
+        strata = []
+        for biased_exp in range(low >> self.field_size, (high >> self.field_size) + 1):
+            strata.append((
+                max(low, biased_exp << self.field_size),
+                min(high, ((biased_exp + 1) << self.field_size) - 1)))
+        return strata
+
+    def get_strata(self):
+        """ list of strata (ordinal ranges): the test range is split at
+            each boundary, then by sign and by binade (strata reduced to
+            a boundary are discarded) """
+        cut_list = [self.low_ordinal - 1] + [
+            ordinal for ordinal in self.boundary_ordinals
+            if self.low_ordinal <= ordinal < self.high_ordinal] + [self.high_ordinal]
+        strata = []
+        for cut_low, cut_high in zip(cut_list[:-1], cut_list[1:]):
+            low, high = cut_low + 1, cut_high
+            if low > high:
+                continue
+            if low < 0 <= high:
+                strata += self.get_binade_strata(low, -1)
+                strata += self.get_binade_strata(0, high)
+            else:
+                strata += self.get_binade_strata(low, high)
+        # boundaries are already covered by boundary sampling
+        boundary_set = set(self.boundary_ordinals)
+        return [
+            (low, high) for low, high in strata
+            if low != high or not low in boundary_set]
+
+    def get_boundary_ordinals(self, boundary, ordinal_num):
+        """ list of ordinal_num ordinals of the test range around boundary:
+            the boundary itself, its NEIGHBOUR_NUM closest neighbours on
+            each side, then ordinals at +/-2**k of the boundary and finally
+            random ordinals at most 2**field_size away from the boundary """
+        offset_list = [0]
+        for offset in range(1, self.NEIGHBOUR_NUM + 1):
+            offset_list += [-offset, offset]
+        for k in range(3, self.field_size + 1):
+            if 2**k > self.NEIGHBOUR_NUM:
+                offset_list += [-2**k, 2**k]
+        ordinal_list = [
+            boundary + offset for offset in offset_list
+            if self.low_ordinal <= boundary + offset <= self.high_ordinal][:ordinal_num]
+        low = max(self.low_ordinal, boundary - 2**self.field_size)
+        high = min(self.high_ordinal, boundary + 2**self.field_size)
+        ordinal_list += [self.random.randint(low, high) for _ in range(ordinal_num - len(ordinal_list))]
+        return ordinal_list
+
+    def generate_boundary_ordinals(self, test_num):
+        """ list of test_num ordinals around the boundaries """
+        ordinal_list = []
+        boundary_num = len(self.boundary_ordinals)
+        for index, boundary in enumerate(self.boundary_ordinals):
+            ordinal_num = test_num // boundary_num + (1 if index < test_num % boundary_num else 0)
+            ordinal_list += self.get_boundary_ordinals(boundary, ordinal_num)
+        return ordinal_list
+
+    def generate_strata_ordinals(self, test_num):
+        """ list of test_num ordinals drawn uniformly in each stratum, with
+            the same number of ordinals (up to one) per stratum """
+        strata = self.get_strata() or [(self.low_ordinal, self.high_ordinal)]
+        if test_num < len(strata):
+            count_list = [0] * len(strata)
+            for index in self.random.sample(range(len(strata)), test_num):
+                count_list[index] = 1
+        else:
+            count_list = [test_num // len(strata)] * len(strata)
+            for index in self.random.sample(range(len(strata)), test_num % len(strata)):
+                count_list[index] += 1
+        ordinal_list = []
+        for (low, high), count in zip(strata, count_list):
+            ordinal_list += [self.random.randint(low, high) for _ in range(count)]
+        return ordinal_list
+
+    def generate_encodings(self, test_num):
+        """ list of test_num encodings (in random order) """
+        encoding_list = self.special_encodings[:test_num]
+        test_num -= len(encoding_list)
+        boundary_num = int(test_num * self.BOUNDARY_FRACTION) if self.boundary_ordinals else 0
+        ordinal_list = self.generate_boundary_ordinals(boundary_num) + \
+            self.generate_strata_ordinals(test_num - boundary_num)
+        encoding_list += [self.get_encoding(ordinal) for ordinal in ordinal_list]
+        self.random.shuffle(encoding_list)
+        return encoding_list
+
+    def generate_values(self, test_num):
+        """ list of test_num values (numerical or special) """
+        return self.precision.decode_many(self.generate_encodings(test_num))
+
+
+def is_stratified_sampling_supported(precision):
+    """ predicate indicating if inputs of format precision can be
+        generated by StratifiedSampler """
+    return isinstance(precision.get_base_format(), ML_Std_FP_Format)
@@ -31,6 +31,52 @@
 # author(s): Nicolas Brunie (nicolas.brunie@kalray.eu)
 ###############################################################################
 
+import pkgutil
+import importlib
+
+
+## lightweight descriptors of metalibm's targets: target name -> name of
+#  the module which registers the target when imported.
+#  Target modules (and their instruction tables) are only imported when
+#  the target is selected
+TARGET_MODULE_MAP = {
+    "generic": "metalibm_core.code_generation.generic_processor",
+    "mpfr_backend": "metalibm_core.code_generation.mpfr_backend",
+    "formal_backend": "metalibm_core.code_generation.vhdl_backend",
+    "vhdl_backend": "metalibm_core.code_generation.vhdl_backend",
+    "llvm": "metalibm_core.targets.common.llvm_ir",
+    "fixed_point": "metalibm_core.targets.common.fixed_point_backend",
+    "vector": "metalibm_core.targets.common.vector_backend",
+    "dummy_asm_backend": "metalibm_core.targets.common.dummy_asm_target",
+    "x86": "metalibm_core.targets.intel.x86_processor",
+    "x86_sse": "metalibm_core.targets.intel.x86_processor",
+    "x86_sse2": "metalibm_core.targets.intel.x86_processor",
+    "x86_sse3": "metalibm_core.targets.intel.x86_processor",
+    "x86_ssse3": "metalibm_core.targets.intel.x86_processor",
+    "x86_sse41": "metalibm_core.targets.intel.x86_processor",
+    "x86_sse42": "metalibm_core.targets.intel.x86_processor",
+    "x86_avx": "metalibm_core.targets.intel.x86_processor",
+    "x86_avx2": "metalibm_core.targets.intel.x86_processor",
+}
+
+
+def import_package_modules(package_name, prefix=""):
+    """ import every module of package package_name (and of its
+        sub-packages) whose name starts with prefix, registering the targets
+        and passes they declare. Used as a fallback when a target or a pass
+        is not listed in the lightweight descriptor maps """
+    package = importlib.import_module(package_name)
+    for _, module_name, is_pkg in pkgutil.walk_packages(package.__path__, package_name + "."):
+        if is_pkg or not module_name.split(".")[-1].startswith(prefix):
+            continue
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            # a module with missing (optional) dependencies can not
+            # register anything, discovery goes on
+            continue
+
+
 def UniqueTargetDecorator(cls):
     """ decorator to build a unique target object """
 
@@ -42,20 +88,43 @@ def UniqueTargetDecorator(cls):
 class TargetRegister(object):
     """ target register """
     target_map = {}
+    # map of targets which have been declared but not imported yet
+    # target name -> module name
+    lazy_target_map = dict(TARGET_MODULE_MAP)
 
     @staticmethod
     def get_target_name_list():
-        for target_name in TargetRegister.target_map:
+        for target_name in TargetRegister.get_target_names():
             print(target_name)
 
+    @staticmethod
+    def get_target_names():
+        """ return the list of names of registered (or declared) targets """
+        return list(TargetRegister.target_map) + [
+            target_name for target_name in TargetRegister.lazy_target_map
+            if not target_name in TargetRegister.target_map]
+
     @staticmethod
     def get_target_by_name(target_name):
+        if not target_name in TargetRegister.target_map and target_name in TargetRegister.lazy_target_map:
+            # importing the target module registers the target
+            importlib.import_module(TargetRegister.lazy_target_map[target_name])
+        if not target_name in TargetRegister.target_map:
+            # target missing from TARGET_MODULE_MAP: importing every target
+            # module before failing
+            import_package_modules("metalibm_core.targets")
         return TargetRegister.target_map[target_name]
 
     @staticmethod
     def register_new_target(target_name, target_build_function):
         TargetRegister.target_map[target_name] = target_build_function
 
+    @staticmethod
+    def register_lazy_target(target_name, module_name):
+        """ declare target_name, whose module module_name is only imported
+            when the target is first requested """
+        TargetRegister.lazy_target_map[target_name] = module_name
+
     @staticmethod
     def METALIBM_TARGET_REGISTER(target_class):
         """ decorator to automate target class registerting """
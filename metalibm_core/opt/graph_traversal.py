@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: non-recursive traversals of operation graphs (post-order
+#              iteration, memoized map and fold, in-place rewrite).
+#              This module only relies on the node get_inputs/set_input
+#              methods so it can be used by metalibm_core.core modules.
+###############################################################################
+
+
+def default_input_getter(node):
+    """ default input getter: node.get_inputs() """
+    return node.get_inputs()
+
+
+def build_input_getter(is_leaf_node=None, get_inputs=None):
+    """ build a function returning the inputs to be traversed for a node:
+        none for nodes selected by is_leaf_node, get_inputs(node) (default
+        to node.get_inputs()) for the others """
+    if get_inputs is None:
+        get_inputs = default_input_getter
+    if is_leaf_node is None:
+        return get_inputs
+    def leaf_aware_input_getter(node):
+        return () if is_leaf_node(node) else get_inputs(node)
+    return leaf_aware_input_getter
+
+
+def iter_postorder(root, is_leaf_node=None, skip_node=None, get_inputs=None):
+    """ iterate over the nodes of the graph rooted at <root> in post-order:
+        each node is yielded once, after all its inputs.
+
+        The traversal uses an explicit stack (and not recursion) so it
+        scales linearly to very large and very deep graphs.
+
+        :param is_leaf_node: predicate selecting nodes whose inputs must not
+                             be traversed (default: nodes without inputs)
+        :param skip_node: predicate selecting input nodes which must be
+                          neither traversed nor yielded (e.g. nodes already
+                          processed by a previous traversal)
+        :param get_inputs: function returning the list of inputs to be
+                           traversed for a (non-leaf) node, default to
+                           node.get_inputs(). It is called exactly once per
+                           traversed node, when the node is entered (before
+                           any of its inputs), thus it can also be used
+                           as a pre-order hook.
+    """
+    get_inputs = build_input_getter(is_leaf_node, get_inputs)
+    visited = set([root])
+    # stack of (node, iterator over the node's inputs not yet processed)
+    stack = [(root, iter(get_inputs(root)))]
+    while stack:
+        node, input_iterator = stack[-1]
+        for op in input_iterator:
+            if op in visited or (not skip_node is None and skip_node(op)):
+                continue
+            visited.add(op)
+            stack.append((op, iter(get_inputs(op))))
+            break
+        else:
+            # every input of node has been yielded
+            stack.pop()
+            yield node
+
+
+def map_postorder(root, node_function, memoization_map=None, is_leaf_node=None, get_inputs=None):
+    """ memoized map over the graph rooted at <root>: evaluate
+        node_function(node, input_values), where input_values is the tuple
+        of the values of get_inputs(node) (empty for nodes selected by
+        is_leaf_node), for every node not already in memoization_map,
+        inputs first. get_inputs is called exactly once per evaluated node.
+
+        :param memoization_map: node -> value dict, completed with the value
+                                of every traversed node
+        :return: the value of root
+    """
+    memoization_map = {} if memoization_map is None else memoization_map
+    if root in memoization_map:
+        return memoization_map[root]
+    get_inputs = build_input_getter(is_leaf_node, get_inputs)
+    # inputs of the nodes entered but not yet evaluated, so that
+    # get_inputs is called only once per node
+    pending_inputs = {}
+    def recording_input_getter(node):
+        node_inputs = pending_inputs[node] = tuple(get_inputs(node))
+        return node_inputs
+    for node in iter_postorder(root, get_inputs=recording_input_getter, skip_node=memoization_map.__contains__):
+        memoization_map[node] = node_function(
+            node, tuple(memoization_map[op] for op in pending_inputs.pop(node)))
+    return memoization_map[root]
+
+
+def fold_postorder(root, fold_function, init_value, is_leaf_node=None, get_inputs=None):
+    """ fold the nodes of the graph rooted at <root> (each node being
+        visited once, inputs first): value = fold_function(value, node)
+
+        :return: the last folded value
+    """
+    value = init_value
+    for node in iter_postorder(root, is_leaf_node=is_leaf_node, get_inputs=get_inputs):
+        value = fold_function(value, node)
+    return value
+
+
+def rewrite_postorder(root, rewrite_function, is_leaf_node=None, memoization_map=None):
+    """ in-place rewrite of the graph rooted at <root>: each node inputs are
+        first replaced by their rewrite, then rewrite_function(node) is
+        evaluated and must return the node replacing node (possibly node
+        itself) or None if node is unchanged.
+
+        :param memoization_map: node -> rewritten node dict, nodes already
+                                in memoization_map are not traversed
+        :return: the node replacing root
+    """
+    memoization_map = {} if memoization_map is None else memoization_map
+    if root in memoization_map:
+        return memoization_map[root]
+    for node in iter_postorder(root, is_leaf_node=is_leaf_node, skip_node=memoization_map.__contains__):
+        if is_leaf_node is None or not is_leaf_node(node):
+            for index, op in enumerate(node.get_inputs()):
+                new_op = memoization_map[op]
+                if not new_op is op:
+                    node.set_input(index, new_op)
+        new_node = rewrite_function(node)
+        memoization_map[node] = node if new_node is None else new_node
+    return memoization_map[root]
@@ -35,6 +35,8 @@
 from metalibm_core.core.passes import FunctionPass, Pass, LOG_PASS_INFO
 from metalibm_core.core.ml_operations import is_leaf_node
 
+from metalibm_core.opt.graph_traversal import iter_postorder
+
 from metalibm_core.utility.log_report import Log
 
 
@@ -87,27 +89,40 @@ class Pass_NodeTransformation(FunctionPass):
 
 
     def transform_graph(self, node, *args):
+        """ transform the graph rooted at node and return the node resulting
+            from node's transformation (None if node was not transformed).
+
+            The graph is traversed with an explicit stack: a non-transformable
+            node is associated with None when it is entered (before its
+            inputs) and its transformed inputs are replaced (in-place) by
+            their reconstruction once they all have been processed,
+            a transformable node is transformed after its inputs """
         if self.has_memoization(node):
             return self.get_memoization_value(node)
-        elif not self.can_be_transformed(node):
+        transformable_nodes = set()
+        def enter_node(current_node):
+            """ pre-order processing of current_node, returns the list
+                of inputs to be processed """
+            if self.can_be_transformed(current_node):
+                transformable_nodes.add(current_node)
+                return current_node.get_inputs()
             # associate None to node in memoization_map
-            Log.report(LOG_LEVEL_NODE_TRANSFORM_VERBOSE, "associating None to {}", node)
-            self.set_memoization_value(node, None)
-            # recursively process node's inputs
-            if not is_leaf_node(node):
-                for index, op_input in enumerate(node.get_inputs()):
-                    new_input = self.transform_graph(op_input)
+            Log.report(LOG_LEVEL_NODE_TRANSFORM_VERBOSE, "associating None to {}", current_node)
+            self.set_memoization_value(current_node, None)
+            return () if is_leaf_node(current_node) else current_node.get_inputs()
+        for current_node in iter_postorder(node, get_inputs=enter_node, skip_node=self.has_memoization):
+            if current_node in transformable_nodes:
+                transformed_inputs = [self.get_memoization_value(op_input) for op_input in current_node.get_inputs()]
+                new_node = self.transform_node(current_node, transformed_inputs)
+                self.set_memoization_value(current_node, new_node)
+            elif not is_leaf_node(current_node):
+                for index, op_input in enumerate(current_node.get_inputs()):
+                    new_input = self.get_memoization_value(op_input)
                     if not new_input is None:
                         reconstructed_input = self.reconstruct_from_transformed(op_input, new_input)
-                        Log.report(LOG_LEVEL_NODE_TRANSFORM_VERBOSE, "new input id={} of {} is {}", index, node, reconstructed_input)
-                        node.set_input(index, reconstructed_input)
-                return None
-            return None
-        else:
-            transformed_inputs = [self.transform_graph(op_input) for op_input in node.get_inputs()]
-            new_node = self.transform_node(node, transformed_inputs)
-            self.set_memoization_value(node, new_node)
-            return new_node
+                        Log.report(LOG_LEVEL_NODE_TRANSFORM_VERBOSE, "new input id={} of {} is {}", index, current_node, reconstructed_input)
+                        current_node.set_input(index, reconstructed_input)
+        return self.get_memoization_value(node)
 
     def execute_on_optree(self, optree, fct, fct_group, memoization_map):
         return self.transform_graph(optree)
@@ -0,0 +1,619 @@
+# -*- coding: utf-8 -*-
+
+## @package opt.numpy_eval
+#  Metalibm bit-accurate operation graph interpreter over numpy arrays
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: vectorized evaluation of typed operation graphs (binary16/32/64
+#              and standard integer formats) on numpy arrays of inputs, with
+#              the IEEE semantics (round-to-nearest) of the generated C code.
+#              Control-flow (ConditionBlock, Return, ReferenceAssign) is
+#              evaluated on every input at once under lane masks.
+###############################################################################
+
+import collections
+from fractions import Fraction
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+from metalibm_core.core.ml_operations import (
+    AbstractVariable, Constant,
+    Addition, Subtraction, Multiplication, Division, Modulo,
+    Negation, Abs, Min, Max, FusedMultiplyAdd,
+    BitLogicAnd, BitLogicOr, BitLogicXor, BitLogicNegate,
+    BitLogicLeftShift, BitLogicRightShift, BitArithmeticRightShift,
+    Conversion, TypeCast, Select, TableLoad,
+    NearestInteger, Ceil, Floor, Trunc,
+    ExponentExtraction, ExponentInsertion, MantissaExtraction,
+    CountLeadingZeros,
+    LogicalAnd, LogicalOr, LogicalNot, Comparison, Test,
+    SpecificOperation, ExceptionOperation, NoResultOperation,
+    Statement, ConditionBlock, ReferenceAssign, Return,
+    ControlFlowOperation,
+)
+from metalibm_core.core.advanced_operations import PlaceHolder
+from metalibm_core.core.ml_table import ML_Table
+from metalibm_core.core.ml_formats import (
+    ML_Std_FP_Format, ML_Bool_Format, ML_Void,
+    is_std_integer_format, is_std_signed_integer_format,
+)
+from metalibm_core.core.float_interval import (
+    two_sum, two_product, TWO_PRODUCT_MAX, TWO_PRODUCT_MIN,
+)
+
+from metalibm_core.opt.graph_traversal import map_postorder
+
+from metalibm_core.utility.log_report import Log
+
+LOG_NUMPY_EVAL = Log.LogLevel("Info", "numpy_eval")
+
+# below this magnitude, the emulated binary64 FMA result may be subnormal
+# and is computed exactly (lane by lane)
+FMA_EMULATION_MIN = 2.0**-900
+
+
+def check_numpy_available():
+    """ report an error if numpy is not available """
+    if not numpy_available:
+        Log.report(Log.Error, "numpy is required by the numpy graph evaluator")
+
+
+def get_numpy_dtype(precision):
+    """ return the numpy dtype used to store values of format precision
+        (binary16/32/64, standard integer and boolean formats), None if
+        precision has no numpy equivalent """
+    if isinstance(precision, ML_Bool_Format):
+        return numpy.dtype(numpy.bool_)
+    elif isinstance(precision, ML_Std_FP_Format):
+        numpy_types = precision.get_numpy_types()
+        return None if numpy_types is None else numpy.dtype(numpy_types[0])
+    elif is_std_integer_format(precision):
+        bit_size = precision.get_base_format().get_bit_size()
+        if not bit_size in (8, 16, 32, 64):
+            return None
+        return numpy.dtype("{}int{}".format("" if is_std_signed_integer_format(precision) else "u", bit_size))
+    return None
+
+def get_uint_dtype(dtype):
+    """ unsigned integer dtype with the same size as dtype """
+    return numpy.dtype("uint{}".format(dtype.itemsize * 8))
+
+def get_int_dtype(dtype):
+    """ signed integer dtype with the same size as dtype """
+    return numpy.dtype("int{}".format(dtype.itemsize * 8))
+
+def to_bool(value):
+    """ convert a boolean or integer (C-like) condition to a numpy bool array """
+    value = numpy.asarray(value)
+    return value if value.dtype == numpy.bool_ else value != 0
+
+
+def round_to_odd_sum(x, y):
+    """ return RO(x + y), the sum of x and y rounded to odd (x, y and x + y
+        must be finite for the result to be relevant) """
+    s, e = two_sum(x, y)
+    uint_dtype = get_uint_dtype(s.dtype)
+    # inexact sums whose encoding is even are moved one ulp towards
+    # the exact value
+    inexact_even = numpy.isfinite(e) & (e != 0) & ((s.view(uint_dtype) & 1) == 0)
+    return numpy.where(inexact_even, numpy.nextafter(s, numpy.where(e > 0, numpy.inf, -numpy.inf)), s)
+
+def exact_fma_lane(a, b, c):
+    """ correctly rounded binary64 fma(a, b, c) for finite a, b, c
+        evaluated with rational arithmetic """
+    exact_value = Fraction(a) * Fraction(b) + Fraction(c)
+    if exact_value == 0:
+        # sign of zero follows IEEE rules of a * b + c
+        return a * b + c
+    try:
+        return float(exact_value)
+    except OverflowError:
+        return float("inf") if exact_value > 0 else float("-inf")
+
+def numpy_fma(a, b, c, dtype):
+    """ correctly rounded a * b + c in dtype (float16, float32 or float64) """
+    a, b, c = numpy.broadcast_arrays(*(numpy.asarray(op, dtype=dtype) for op in (a, b, c)))
+    shape = a.shape
+    a, b, c = a.ravel(), b.ravel(), c.ravel()
+    if dtype != numpy.float64:
+        # the product of two binary32 (or binary16) values is exact in
+        # binary64, a binary64 sum rounded to odd is then rounded correctly
+        # to the (at least 2 bits) narrower format
+        product = a.astype(numpy.float64) * b.astype(numpy.float64)
+        return round_to_odd_sum(product, c.astype(numpy.float64)).astype(dtype).reshape(shape)
+    # binary64: Boldo-Melquiond emulation
+    #   (uh, ul) = TwoProduct(a, b), (th, tl) = TwoSum(c, uh),
+    #   fma = RN(th + RO(tl + ul))
+    uh, ul = two_product(a, b)
+    th, tl = two_sum(c, uh)
+    result = th + round_to_odd_sum(tl, ul)
+    naive = a * b + c
+    # lanes for which the error-free transforms are not exact
+    # (overflow, underflow, including non-zero products which underflow
+    # to zero) or the result may be subnormal
+    exact_lanes = numpy.isfinite(a) & numpy.isfinite(b) & numpy.isfinite(c) & (
+        (abs(a) >= TWO_PRODUCT_MAX) | (abs(b) >= TWO_PRODUCT_MAX) | (abs(c) >= TWO_PRODUCT_MAX) |
+        (abs(uh) >= TWO_PRODUCT_MAX) | (abs(uh) <= TWO_PRODUCT_MIN) |
+        (abs(th) < FMA_EMULATION_MIN))
+    # lanes with special inputs (or exact zero product) follow naive
+    # evaluation: a * b is then exactly a (signed) zero
+    naive_lanes = ~(numpy.isfinite(a) & numpy.isfinite(b) & numpy.isfinite(c)) | (a == 0) | (b == 0)
+    result = numpy.where(naive_lanes, naive, result)
+    for index in zip(*numpy.nonzero(exact_lanes & ~naive_lanes)):
+        result[index] = exact_fma_lane(float(a[index]), float(b[index]), float(c[index]))
+    return result.reshape(shape)
+
+
+def count_leading_zeros(value, dtype):
+    """ number of leading zeros of the integer value (bit_size if value is 0) """
+    bit_size = dtype.itemsize * 8
+    x = numpy.asarray(value).astype(dtype).view(get_uint_dtype(dtype)).astype(numpy.uint64)
+    count = numpy.full(x.shape, bit_size, dtype=numpy.int64)
+    shift = bit_size // 2
+    while shift > 0:
+        high = x >> numpy.uint64(shift)
+        nonzero = high != 0
+        count = numpy.where(nonzero, count - shift, count)
+        x = numpy.where(nonzero, high, x)
+        shift //= 2
+    return count - x.astype(numpy.int64)
+
+
+class NumpyGraphEvaluator:
+    """ bit-accurate evaluation of an operation graph (or of a function
+        scheme) for a set of inputs stored in numpy arrays.
+        Expression nodes are evaluated once per scope (like the C code
+        generator memoization), variables are always read from their
+        current value. Control-flow is evaluated under lane masks: every
+        branch is evaluated on every lane but only updates (variables,
+        returned value) the lanes for which it is taken """
+    def __init__(self, input_mapping, output_precision=None):
+        """ :param input_mapping: dict input node -> numpy array (or scalar)
+            :param output_precision: format of the function returned value """
+        check_numpy_available()
+        self.input_mapping = dict((node, numpy.asarray(value)) for node, value in input_mapping.items())
+        self.shape = numpy.broadcast(*self.input_mapping.values()).shape if self.input_mapping else ()
+        # node -> value, a new map is pushed for each conditional branch
+        self.memoization_map = collections.ChainMap({})
+        # variable -> current value
+        self.variable_map = {}
+        # table -> numpy array of the table content
+        self.table_map = {}
+        # lanes which are active during the current evaluation
+        self.active_mask = numpy.ones(self.shape, dtype=numpy.bool_)
+        self.output_precision = output_precision
+        self.result = None
+        if not output_precision is None and output_precision != ML_Void:
+            self.result = numpy.zeros(self.shape, dtype=self.get_dtype(output_precision))
+        # lanes for which a value has already been returned
+        self.returned_mask = numpy.zeros(self.shape, dtype=numpy.bool_)
+
+    def get_dtype(self, precision, node=None):
+        dtype = get_numpy_dtype(precision)
+        if dtype is None:
+            Log.report(Log.Error, "format {} is not supported by the numpy evaluator (node {})", precision, node)
+        return dtype
+
+    def get_node_dtype(self, node):
+        return self.get_dtype(node.get_precision(), node)
+
+    def get_constant_value(self, node):
+        """ numpy (0-d) array of the value of the Constant node """
+        precision = node.get_precision()
+        dtype = self.get_node_dtype(node)
+        value = node.get_value()
+        if isinstance(precision, ML_Std_FP_Format):
+            return precision.encode_many([value]).view(dtype).reshape(())
+        elif dtype == numpy.bool_:
+            return numpy.asarray(bool(value))
+        uint_dtype = get_uint_dtype(dtype)
+        return numpy.asarray(int(value) & (2**(dtype.itemsize * 8) - 1), dtype=uint_dtype).view(dtype)
+
+    def get_table_array(self, table):
+        """ numpy array (with the table dimensions) of the table content """
+        if not table in self.table_map:
+            precision = table.get_storage_precision()
+            dtype = self.get_dtype(precision, table)
+            def flatten(sub_table, sub_dimensions):
+                if len(sub_dimensions) == 1:
+                    return list(sub_table)
+                return [value for line in sub_table for value in flatten(line, sub_dimensions[1:])]
+            value_list = flatten(table.get_data(), table.dimensions)
+            if isinstance(precision, ML_Std_FP_Format):
+                array = numpy.asarray(precision.encode_many(value_list)).view(dtype)
+            else:
+                mask = 2**(dtype.itemsize * 8) - 1
+                array = numpy.array([int(value) & mask for value in value_list], dtype=get_uint_dtype(dtype)).view(dtype)
+            self.table_map[table] = array.reshape(table.dimensions)
+        return self.table_map[table]
+
+    def get_variable_value(self, node):
+        if node in self.input_mapping:
+            return self.input_mapping[node]
+        elif node in self.variable_map:
+            return self.variable_map[node]
+        Log.report(Log.Error, "variable {} is read before being assigned in numpy evaluation", node)
+
+    def get_value_inputs(self, node):
+        """ list of the nodes whose value is required to evaluate node """
+        if isinstance(node, (AbstractVariable, Constant, ML_Table)):
+            return ()
+        elif isinstance(node, TableLoad):
+            return tuple(node.get_inputs()[1:])
+        elif isinstance(node, ExceptionOperation):
+            return ()
+        return node.get_inputs()
+
+    def evaluate_node(self, node, input_values):
+        """ evaluate the value of node from the values of its inputs """
+        if isinstance(node, AbstractVariable):
+            return self.get_variable_value(node)
+        elif isinstance(node, Constant):
+            return self.get_constant_value(node)
+        elif isinstance(node, PlaceHolder):
+            return input_values[0]
+        elif isinstance(node, TableLoad):
+            return self.evaluate_table_load(node, input_values)
+        elif isinstance(node, Test):
+            return self.evaluate_test(node, input_values[0])
+        elif isinstance(node, Comparison):
+            return self.evaluate_comparison(node, *input_values)
+        elif isinstance(node, LogicalAnd):
+            return to_bool(input_values[0]) & to_bool(input_values[1])
+        elif isinstance(node, LogicalOr):
+            return to_bool(input_values[0]) | to_bool(input_values[1])
+        elif isinstance(node, LogicalNot):
+            return ~to_bool(input_values[0])
+
+        dtype = self.get_node_dtype(node)
+        if isinstance(node, TypeCast):
+            value = numpy.asarray(input_values[0])
+            if value.dtype.itemsize != dtype.itemsize:
+                Log.report(Log.Error, "numpy evaluation of TypeCast between formats of different sizes: {}", node)
+            return value.view(dtype)
+        elif isinstance(node, Conversion):
+            if dtype == numpy.bool_:
+                return to_bool(input_values[0])
+            return numpy.asarray(input_values[0]).astype(dtype)
+        elif isinstance(node, Select):
+            return numpy.where(to_bool(input_values[0]), input_values[1], input_values[2]).astype(dtype)
+        elif isinstance(node, FusedMultiplyAdd):
+            return self.evaluate_fma(node, dtype, *input_values)
+        elif isinstance(node, ExponentExtraction):
+            return self.evaluate_exponent_extraction(node, dtype, input_values[0])
+        elif isinstance(node, ExponentInsertion):
+            return self.evaluate_exponent_insertion(node, dtype, input_values[0])
+        elif isinstance(node, MantissaExtraction):
+            return self.evaluate_mantissa_extraction(node, dtype, input_values[0])
+        elif isinstance(node, CountLeadingZeros):
+            return count_leading_zeros(input_values[0], numpy.asarray(input_values[0]).dtype).astype(dtype)
+        elif isinstance(node, (NearestInteger, Ceil, Floor, Trunc)):
+            value = numpy.asarray(input_values[0])
+            rounding_function = {
+                NearestInteger: numpy.rint, Ceil: numpy.ceil,
+                Floor: numpy.floor, Trunc: numpy.trunc
+            }[node.__class__]
+            if value.dtype.kind == "f":
+                value = rounding_function(value)
+            return value.astype(dtype)
+        elif isinstance(node, SpecificOperation) and node.get_specifier() is SpecificOperation.CopySign:
+            return numpy.copysign(*(numpy.asarray(op).astype(dtype) for op in input_values))
+        elif isinstance(node, BitLogicRightShift):
+            uint_dtype = get_uint_dtype(dtype)
+            value = numpy.asarray(input_values[0]).astype(dtype).view(uint_dtype)
+            return (value >> numpy.asarray(input_values[1]).astype(uint_dtype)).view(dtype)
+        elif isinstance(node, BitArithmeticRightShift):
+            int_dtype = get_int_dtype(dtype)
+            value = numpy.asarray(input_values[0]).astype(dtype).view(int_dtype)
+            return (value >> numpy.asarray(input_values[1]).astype(int_dtype)).view(dtype)
+
+        # operations evaluated in the node format
+        ops = [numpy.asarray(op).astype(dtype) for op in input_values]
+        if isinstance(node, Addition):
+            return ops[0] + ops[1]
+        elif isinstance(node, Subtraction):
+            return ops[0] - ops[1]
+        elif isinstance(node, Multiplication):
+            return ops[0] * ops[1]
+        elif isinstance(node, Division):
+            if dtype.kind == "f":
+                return ops[0] / ops[1]
+            # C integer division rounds towards zero
+            return (ops[0] - numpy.fmod(ops[0], ops[1])) // ops[1]
+        elif isinstance(node, Modulo):
+            return numpy.fmod(ops[0], ops[1])
+        elif isinstance(node, Negation):
+            return -ops[0]
+        elif isinstance(node, Abs):
+            return numpy.abs(ops[0])
+        elif isinstance(node, Min):
+            # same semantic as the Select legalization of Min
+            return numpy.where(ops[0] < ops[1], ops[0], ops[1])
+        elif isinstance(node, Max):
+            return numpy.where(ops[0] > ops[1], ops[0], ops[1])
+        elif isinstance(node, BitLogicAnd):
+            return ops[0] & ops[1]
+        elif isinstance(node, BitLogicOr):
+            return ops[0] | ops[1]
+        elif isinstance(node, BitLogicXor):
+            return ops[0] ^ ops[1]
+        elif isinstance(node, BitLogicNegate):
+            return ~ops[0]
+        elif isinstance(node, BitLogicLeftShift):
+            return ops[0] << ops[1]
+        Log.report(Log.Error, "node {} is not supported by the numpy evaluator", node)
+
+    def evaluate_table_load(self, node, index_values):
+        table_array = self.get_table_array(node.get_input(0))
+        index_list = []
+        for dim_size, index in zip(table_array.shape, index_values):
+            index = numpy.asarray(index).astype(numpy.int64)
+            # inactive lanes may contain any index
+            index = numpy.where(self.active_mask, index, 0)
+            if numpy.any((index < 0) | (index >= dim_size)):
+                Log.report(Log.Error, "out-of-bound table access in numpy evaluation of {}", node)
+            index_list.append(index)
+        return table_array[tuple(index_list)]
+
+    def evaluate_comparison(self, node, lhs, rhs):
+        lhs = numpy.asarray(lhs)
+        rhs = numpy.asarray(rhs)
+        specifier = node.specifier
+        if specifier in (Comparison.LessSigned, Comparison.LessOrEqualSigned,
+                         Comparison.GreaterSigned, Comparison.GreaterOrEqualSigned):
+            if lhs.dtype.kind in "ui":
+                lhs = lhs.view(get_int_dtype(lhs.dtype))
+            if rhs.dtype.kind in "ui":
+                rhs = rhs.view(get_int_dtype(rhs.dtype))
+        comparison_function = {
+            Comparison.Equal: numpy.equal,
+            Comparison.NotEqual: numpy.not_equal,
+            Comparison.Less: numpy.less,
+            Comparison.LessOrEqual: numpy.less_equal,
+            Comparison.Greater: numpy.greater,
+            Comparison.GreaterOrEqual: numpy.greater_equal,
+            Comparison.LessSigned: numpy.less,
+            Comparison.LessOrEqualSigned: numpy.less_equal,
+            Comparison.GreaterSigned: numpy.greater,
+            Comparison.GreaterOrEqualSigned: numpy.greater_equal,
+        }[specifier]
+        return comparison_function(lhs, rhs)
+
+    def evaluate_test(self, node, value):
+        value = numpy.asarray(value)
+        specifier = node.specifier
+        if specifier is Test.IsNaN:
+            return numpy.isnan(value)
+        elif specifier in (Test.IsQuietNaN, Test.IsSignalingNaN):
+            precision = node.get_input(0).get_precision()
+            encoding = value.view(get_uint_dtype(value.dtype))
+            quiet_bit = (encoding >> (precision.get_field_size() - 1)) & 1
+            is_quiet = quiet_bit == 1
+            return numpy.isnan(value) & (is_quiet if specifier is Test.IsQuietNaN else ~is_quiet)
+        elif specifier is Test.IsInfty:
+            return numpy.isinf(value)
+        elif specifier is Test.IsPositiveInfty:
+            return value == numpy.inf
+        elif specifier is Test.IsNegativeInfty:
+            return value == -numpy.inf
+        elif specifier is Test.IsInfOrNaN:
+            return ~numpy.isfinite(value)
+        elif specifier is Test.IsZero:
+            return value == 0
+        elif specifier is Test.IsPositiveZero:
+            return (value == 0) & ~numpy.signbit(value)
+        elif specifier is Test.IsNegativeZero:
+            return (value == 0) & numpy.signbit(value)
+        elif specifier is Test.IsSubnormal:
+            return (value != 0) & (abs(value) < numpy.finfo(value.dtype).tiny)
+        elif specifier is Test.IsIEEENormalPositive:
+            return (value >= numpy.finfo(value.dtype).tiny) & (value < numpy.inf)
+        Log.report(Log.Error, "test {} is not supported by the numpy evaluator", node)
+
+    def evaluate_fma(self, node, dtype, op0, op1, op2):
+        specifier = node.specifier
+        op0 = numpy.asarray(op0).astype(dtype)
+        op2 = numpy.asarray(op2).astype(dtype)
+        # negations are exact, every specifier is expressed with a
+        # standard fma
+        if specifier is FusedMultiplyAdd.Standard:
+            return numpy_fma(op0, op1, op2, dtype)
+        elif specifier is FusedMultiplyAdd.Subtract:
+            return numpy_fma(op0, op1, -op2, dtype)
+        elif specifier is FusedMultiplyAdd.Negate:
+            return numpy_fma(-op0, op1, -op2, dtype)
+        elif specifier is FusedMultiplyAdd.SubtractNegate:
+            return numpy_fma(-op0, op1, op2, dtype)
+        Log.report(Log.Error, "fma specifier of {} is not supported by the numpy evaluator", node)
+
+    def evaluate_exponent_extraction(self, node, dtype, value):
+        """ unbiased exponent field of value (without special
+            value or subnormal handling, like ml_exp_extraction_dirty_fp*) """
+        precision = node.get_input(0).get_precision()
+        value = numpy.asarray(value)
+        encoding = value.view(get_uint_dtype(value.dtype)).astype(numpy.int64)
+        exponent_field = (encoding >> precision.get_field_size()) & (2**precision.get_exponent_size() - 1)
+        return (exponent_field + int(precision.get_bias())).astype(dtype)
+
+    def evaluate_exponent_insertion(self, node, dtype, value):
+        """ 2**value built by inserting value in the exponent field,
+            like ml_exp_insertion_fp* (or ml_exp_insertion_no_offset_fp*) """
+        precision = node.get_precision()
+        field_size = precision.get_field_size()
+        value = numpy.asarray(value).astype(numpy.int64)
+        if node.specifier is ExponentInsertion.NoOffset:
+            encoding = value.astype(numpy.uint64) << numpy.uint64(field_size)
+        else:
+            exponent_mask = (2**precision.get_exponent_size() - 1) << field_size
+            encoding = ((value - int(precision.get_bias())).astype(numpy.uint64) << numpy.uint64(field_size)) & numpy.uint64(exponent_mask)
+        uint_dtype = get_uint_dtype(dtype)
+        return encoding.astype(uint_dtype).view(dtype)
+
+    def evaluate_mantissa_extraction(self, node, dtype, value):
+        """ value with its exponent field replaced by 0 (unbiased),
+            like ml_mantissa_extraction_fp* """
+        precision = node.get_precision()
+        if dtype.kind != "f":
+            Log.report(Log.Error, "numpy evaluation of MantissaExtraction is only supported for floating-point results: {}", node)
+        field_size = precision.get_field_size()
+        uint_dtype = get_uint_dtype(dtype)
+        sign_field_mask = (1 << (precision.get_bit_size() - 1)) | ((1 << field_size) - 1)
+        one_encoding = int(-precision.get_bias()) << field_size
+        encoding = numpy.asarray(value).astype(dtype).view(uint_dtype)
+        return ((encoding & uint_dtype.type(sign_field_mask)) | uint_dtype.type(one_encoding)).view(dtype)
+
+    def evaluate(self, node):
+        """ evaluate the value of the expression rooted at node """
+        local_map = self.memoization_map.new_child()
+        value = map_postorder(node, lambda op, input_values: numpy.asarray(self.evaluate_node(op, input_values)),
+                              memoization_map=local_map,
+                              get_inputs=self.get_value_inputs)
+        # variable values may change, they are not memoized
+        for op, op_value in local_map.maps[0].items():
+            if not isinstance(op, AbstractVariable):
+                self.memoization_map[op] = op_value
+        return value
+
+    def execute_branch(self, node, mask):
+        """ execute node for the lanes of mask in a new memoization scope """
+        if not numpy.any(mask & ~self.returned_mask):
+            return
+        self.memoization_map = self.memoization_map.new_child()
+        try:
+            self.execute(node, mask)
+        finally:
+            self.memoization_map = self.memoization_map.parents
+
+    def execute(self, node, mask=None):
+        """ execute the statement node for the lanes of mask (default all) """
+        mask = numpy.ones(self.shape, dtype=numpy.bool_) if mask is None else mask
+        active_mask = mask & ~self.returned_mask
+        self.active_mask = active_mask
+        if isinstance(node, Statement):
+            for op in node.get_inputs():
+                if not op in self.memoization_map:
+                    self.execute(op, mask)
+        elif isinstance(node, ConditionBlock):
+            self.execute(node.get_pre_statement(), mask)
+            self.active_mask = active_mask
+            condition = to_bool(self.evaluate(node.get_input(0)))
+            self.execute_branch(node.get_input(1), mask & condition)
+            if len(node.get_inputs()) > 2:
+                self.execute_branch(node.get_input(2), mask & ~condition)
+        elif isinstance(node, ReferenceAssign):
+            variable = node.get_input(0)
+            value = self.evaluate(node.get_input(1))
+            if variable in self.variable_map:
+                value = numpy.where(active_mask, value, self.variable_map[variable])
+            self.variable_map[variable] = numpy.broadcast_to(value, self.shape).astype(self.get_dtype(variable.get_precision(), variable))
+        elif isinstance(node, Return) or (isinstance(node, ExceptionOperation) and node.get_specifier() is ExceptionOperation.RaiseReturn):
+            if isinstance(node, Return):
+                return_value = node.get_input(0) if node.get_inputs() else None
+            else:
+                return_value = node.get_return_value()
+            if not return_value is None:
+                value = numpy.broadcast_to(self.evaluate(return_value), self.shape)
+                self.result = numpy.where(active_mask, value, self.result).astype(self.result.dtype)
+            self.returned_mask = self.returned_mask | active_mask
+        elif isinstance(node, (ExceptionOperation, NoResultOperation)):
+            # floating-point environment (flags, rounding mode) is not modeled
+            pass
+        elif isinstance(node, ControlFlowOperation):
+            Log.report(Log.Error, "control-flow node {} is not supported by the numpy evaluator", node)
+        else:
+            self.evaluate(node)
+
+
+def evaluate_graph_numpy(optree, input_mapping):
+    """ evaluate the expression optree (without control-flow) for every
+        input of input_mapping (dict input node -> numpy array), return
+        the numpy array of optree values """
+    evaluator = NumpyGraphEvaluator(input_mapping)
+    with numpy.errstate(all="ignore"):
+        return numpy.broadcast_to(evaluator.evaluate(optree), evaluator.shape)
+
+def evaluate_function_scheme(scheme, input_mapping, output_precision):
+    """ execute the function scheme (statement) for every input of
+        input_mapping (dict input node -> numpy array), return the numpy
+        array of the values returned by scheme """
+    evaluator = NumpyGraphEvaluator(input_mapping, output_precision)
+    with numpy.errstate(all="ignore"):
+        evaluator.execute(scheme)
+    if not numpy.all(evaluator.returned_mask) and not evaluator.result is None:
+        Log.report(LOG_NUMPY_EVAL, "{} lane(s) did not return any value", numpy.count_nonzero(~evaluator.returned_mask))
+    return evaluator.result
+
+def evaluate_code_function(code_function, *input_arrays):
+    """ execute the scheme of code_function, input_arrays being the numpy
+        arrays of the values of its arguments (in order) """
+    arg_list = code_function.arg_list
+    if len(arg_list) != len(input_arrays):
+        Log.report(Log.Error, "{} expects {} argument(s), {} array(s) provided", code_function.get_name(), len(arg_list), len(input_arrays))
+    input_mapping = dict(
+        (arg, numpy.asarray(array).astype(get_numpy_dtype(arg.get_precision())))
+        for arg, array in zip(arg_list, input_arrays))
+    return evaluate_function_scheme(code_function.get_scheme(), input_mapping, code_function.get_output_format())
+
+
+def get_ulp_error(values, reference, precision):
+    """ return the array of errors (in ulps of precision) between values
+        and reference (numpy array of exact or more accurate values, e.g.
+        numpy.longdouble). Lanes where values and reference are both NaN or
+        equal have a zero error, other lanes involving a special value have
+        an infinite error """
+    check_numpy_available()
+    values = numpy.asarray(values)
+    reference = numpy.asarray(reference)
+    work_dtype = numpy.result_type(reference.dtype, numpy.float64)
+    values = values.astype(work_dtype)
+    reference = reference.astype(work_dtype)
+    with numpy.errstate(all="ignore"):
+        _, exponent = numpy.frexp(reference)
+        # frexp mantissa is in [0.5, 1)
+        exponent = numpy.clip(exponent - 1, int(precision.get_emin_normal()), int(precision.get_emax()))
+        ulp = numpy.ldexp(numpy.ones_like(reference), exponent - precision.get_field_size())
+        error = abs(values - reference) / ulp
+    equal = (values == reference) | (numpy.isnan(values) & numpy.isnan(reference))
+    special = ~(numpy.isfinite(values) & numpy.isfinite(reference))
+    return numpy.where(equal, 0, numpy.where(special, numpy.inf, error))
+
+def get_max_ulp_error(values, reference, precision):
+    """ return (max error in ulps, index of the first lane reaching it) """
+    error = get_ulp_error(values, reference, precision)
+    if error.size == 0:
+        return 0, None
+    index = numpy.unravel_index(numpy.argmax(error), error.shape)
+    return error[index], index
@@ -32,16 +32,26 @@
 
 from functools import reduce
 
-from metalibm_core.core.ml_formats import ML_Bool
+from metalibm_core.core.ml_formats import ML_Bool, is_floating_format
 from metalibm_core.core.ml_operations import (
     ML_LeafNode, Comparison, BooleanOperation,
     is_leaf_node,
     LogicalAnd, LogicalOr, Constant,
     BitLogicLeftShift, BitLogicRightShift,
     BitArithmeticRightShift,
+    Addition, Subtraction, Multiplication, Division,
+    Negation, Abs, Min, Max, Select, Return,
 )
 from metalibm_core.core.advanced_operations import PlaceHolder
 from metalibm_core.core.ml_table import ML_NewTable
+from metalibm_core.core.float_interval import (
+    FloatInterval, is_float_range_eval_enabled,
+    float_interval_min, float_interval_max,
+    float_interval_from_value, float_interval_from_sollya,
+    to_sollya_interval,
+)
+
+from metalibm_core.opt.graph_traversal import map_postorder
 
 from metalibm_core.utility.log_report import Log
 
@@ -57,7 +67,56 @@ def is_comparison(node):
 
 LOG_VERBOSE_EVALUATE_RANGE = Log.LogLevel("EvaluateRangeVerbose")
 
-## Assuming @p optree has no pre-defined range, recursively compute a range
+# map of operation class -> function(node, input FloatInterval tuple)
+# evaluating the node range with FloatInterval (None if it can not)
+FLOAT_RANGE_FUNCTION_MAP = {
+    Addition: lambda node, ops: ops[0] + ops[1],
+    Subtraction: lambda node, ops: ops[0] - ops[1],
+    Multiplication: lambda node, ops: ops[0] * ops[1],
+    Division: lambda node, ops: ops[0] / ops[1],
+    Negation: lambda node, ops: -ops[0],
+    Abs: lambda node, ops: abs(ops[0]),
+    Min: lambda node, ops: float_interval_min(ops[0], ops[1]),
+    Max: lambda node, ops: float_interval_max(ops[0], ops[1]),
+    Select: lambda node, ops: None if ops[1] is None or ops[2] is None else ops[1] | ops[2],
+    Return: lambda node, ops: ops[0],
+}
+
+def accepts_rounded_range(node):
+    """ predicate testing if an outward-rounded (non-exact) range is
+        acceptable for node: floating-point node ranges are
+        over-approximations anyway whereas the ranges of integer and
+        fixed-point nodes are used to size datapaths and must be exact """
+    precision = node.get_precision()
+    if not precision is None and precision.is_vector_format():
+        precision = precision.get_scalar_format()
+    return is_floating_format(precision)
+
+def get_leaf_float_interval(node, interval):
+    """ convert the pre-defined interval of node to a FloatInterval if it
+        is exactly representable (else return interval unchanged) """
+    if isinstance(node, Constant) and isinstance(node.get_value(), (int, float)):
+        float_interval = float_interval_from_value(node.get_value())
+    else:
+        float_interval = float_interval_from_sollya(interval)
+    return interval if float_interval is None else float_interval
+
+def evaluate_float_range(node, args_interval):
+    """ try to evaluate node range with FloatInterval from its inputs'
+        ranges, return None if it can not (unsupported operation,
+        non-FloatInterval inputs or rounded result which must be exact) """
+    float_range_function = FLOAT_RANGE_FUNCTION_MAP.get(node.__class__)
+    if float_range_function is None:
+        return None
+    for index, op_interval in enumerate(args_interval):
+        if not isinstance(op_interval, FloatInterval) and not (isinstance(node, Select) and index == 0):
+            return None
+    op_range = float_range_function(node, args_interval)
+    if op_range is None or not (op_range.exact or accepts_rounded_range(node)):
+        return None
+    return op_range
+
+## Assuming @p optree has no pre-defined range, compute a range
 #  from the node inputs
 def evaluate_range(optree, update_interval=False, memoization_map=None):
     """ evaluate the range of an Operation node
@@ -68,44 +127,58 @@ def evaluate_range(optree, update_interval=False, memoization_map=None):
         Return:
             sollya Interval: evaluated range of optree or None if no range
                              could be determined
+
+        When the float range evaluation engine is enabled, ranges are
+        evaluated on binary64 bounds (FloatInterval) when possible and
+        memoization_map values may be FloatInterval objects.
     """
     if memoization_map is None:
         memoization_map = {}
     init_interval = optree.get_interval()
     if not init_interval is None:
         return init_interval
-    else:
-        if optree in memoization_map:
-            return memoization_map[optree]
-        elif isinstance(optree, ML_LeafNode):
-            op_range = optree.get_interval()
-        elif is_comparison(optree):
-            op_range = evaluate_comparison_range(optree)
-            if update_interval:
-                optree.set_interval(op_range)
-        elif isinstance(optree, PlaceHolder):
-            op_range = evaluate_range(optree.get_input(0),
-                                      update_interval=update_interval,
-                                      memoization_map=memoization_map)
-            if update_interval:
-                optree.set_interval(op_range)
+    float_range_eval = is_float_range_eval_enabled()
+    def get_range_inputs(node):
+        """ list of the nodes whose range is required to evaluate
+            node's range """
+        if not node.get_interval() is None or isinstance(node, ML_LeafNode) or is_comparison(node):
+            return ()
+        elif isinstance(node, PlaceHolder):
+            return (node.get_input(0),)
+        return node.get_inputs()
+    def evaluate_node_range(node, args_interval):
+        init_interval = node.get_interval()
+        if not init_interval is None:
+            if float_range_eval:
+                return get_leaf_float_interval(node, init_interval)
+            return init_interval
+        elif isinstance(node, ML_LeafNode):
+            op_range = node.get_interval()
+        elif is_comparison(node):
+            op_range = evaluate_comparison_range(node)
+        elif isinstance(node, PlaceHolder):
+            op_range = args_interval[0]
         else:
-            args_interval = tuple(
-                evaluate_range(op, update_interval=update_interval,
-                               memoization_map=memoization_map
-                ) for op in optree.get_inputs())
-            args_interval_map = {op: op_interval for op, op_interval in zip(optree.inputs, args_interval)}
-            # evaluate_range cannot rely on bare_range_function only as some
-            # operations (e.g. CountLeadingZeros) do not base interval computation
-            # on their inputs' intervals but on other parameters
-            ops_interval_get = lambda op: args_interval_map[op]
-            op_range = optree.range_function(optree.inputs,
-                                             ops_interval_getter=ops_interval_get)
-            if update_interval:
-                optree.set_interval(op_range)
-        Log.report(LOG_VERBOSE_EVALUATE_RANGE, "range of {} is {}", optree, op_range)
-        memoization_map[optree] = op_range
+            op_range = evaluate_float_range(node, args_interval) if float_range_eval else None
+            if op_range is None:
+                # sollya evaluation (or fallback)
+                args_interval = tuple(to_sollya_interval(op_interval) for op_interval in args_interval)
+                args_interval_map = {op: op_interval for op, op_interval in zip(node.inputs, args_interval)}
+                # evaluate_range cannot rely on bare_range_function only as some
+                # operations (e.g. CountLeadingZeros) do not base interval computation
+                # on their inputs' intervals but on other parameters
+                ops_interval_get = lambda op: args_interval_map[op]
+                op_range = node.range_function(node.inputs,
+                                               ops_interval_getter=ops_interval_get)
+        if update_interval and not isinstance(node, ML_LeafNode):
+            node.set_interval(to_sollya_interval(op_range))
+        Log.report(LOG_VERBOSE_EVALUATE_RANGE, "range of {} is {}", node, op_range)
         return op_range
+    # the graph is traversed with an explicit stack (no recursion) so
+    # evaluate_range scales to very deep graphs
+    return to_sollya_interval(map_postorder(optree, evaluate_node_range,
+                                            memoization_map=memoization_map,
+                                            get_inputs=get_range_inputs))
 
 
 def forward_attributes(src, dst):
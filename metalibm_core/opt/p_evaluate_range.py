@@ -31,6 +31,7 @@ from metalibm_core.core.ml_operations import is_leaf_node
 from metalibm_core.utility.log_report import Log
 from metalibm_core.core.passes import FunctionPass, LOG_PASS_INFO, Pass
 from metalibm_core.opt.opt_utils import evaluate_range
+from metalibm_core.opt.graph_traversal import iter_postorder
 
 LOG_VERBOSE_EVALUATE_RANGE = Log.LogLevel("EvaluateRangeVerbose")
 
@@ -47,20 +48,20 @@ class Pass_EvaluateRange(FunctionPass):
         memoization_map = {} if memoization_map is None else memoization_map
         if  optree in memoization_map:
             return optree
-        else:
-            if not is_leaf_node(optree):
-                for op in optree.inputs:
-                    _ = self.evaluate_set_range(op, memoization_map=memoization_map)
-
-            if optree.get_interval() is None:
-                op_range = evaluate_range(optree, update_interval=True)
+        # ranges evaluated by evaluate_range, shared between calls so each
+        # node range is evaluated once (and kept in the range evaluation
+        # engine representation)
+        range_map = {}
+        for node in iter_postorder(optree, is_leaf_node=is_leaf_node, skip_node=memoization_map.__contains__):
+            if node.get_interval() is None:
+                op_range = evaluate_range(node, update_interval=True, memoization_map=range_map)
             else:
-                op_range = optree.get_interval()
+                op_range = node.get_interval()
             if not op_range is None:
-                Log.report(LOG_VERBOSE_EVALUATE_RANGE, "range for {} has been evaluated to {}", optree, op_range)
+                Log.report(LOG_VERBOSE_EVALUATE_RANGE, "range for {} has been evaluated to {}", node, op_range)
             # memoization
-            memoization_map[optree] = op_range
-            return optree
+            memoization_map[node] = op_range
+        return optree
 
     def execute_on_optree(self, optree, fct=None, fct_group=None, memoization_map=None):
         return self.evaluate_set_range(optree, memoization_map)
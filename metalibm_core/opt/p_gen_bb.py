@@ -278,6 +278,9 @@ class BasicBlockGraph:
         self._dominator_map = None
         self._immediate_dominator_map = None
         self._cfg_edges = None
+        self._successor_map = None
+        self._predecessor_map = None
+        self._reverse_post_order = None
         self._dominator_tree = None
 
     @property
@@ -330,6 +333,30 @@ class BasicBlockGraph:
             self._cfg_edges = build_cfg_edges_set(self.bb_list)
         return self._cfg_edges
 
+    @property
+    def successor_map(self):
+        """ dict associating to each basic block the ordered list of its
+            control flow successors """
+        if self._successor_map is None:
+            self._successor_map = build_successor_map(self.bb_list)
+        return self._successor_map
+
+    @property
+    def predecessor_map(self):
+        """ dict associating to each basic block the ordered list of its
+            control flow predecessors """
+        if self._predecessor_map is None:
+            self._predecessor_map = build_predecessor_map(self.bb_list, self.successor_map)
+        return self._predecessor_map
+
+    @property
+    def reverse_post_order(self):
+        """ list of the basic blocks reachable from root in reverse
+            post-order """
+        if self._reverse_post_order is None:
+            self._reverse_post_order = build_reverse_post_order(self.root, self.successor_map)
+        return self._reverse_post_order
+
     @property
     def dominator_map(self):
         """ dict associating to each node the least of nodes which dominate it """
@@ -348,33 +375,54 @@ class BasicBlockGraph:
         """ dict associating to each node its unique immediate dominator """
         if self._immediate_dominator_map is None:
             self._immediate_dominator_map = build_immediate_dominator_map(
-                self.dominator_map, self.bb_list)
+                self.root, self.reverse_post_order, self.predecessor_map)
+            for bb in self.bb_list.inputs:
+                if not bb is self.root and not bb in self._immediate_dominator_map:
+                    Log.report(LOG_LEVEL_GEN_BB_INFO,
+                               "could not find immediate dominator for: \n{}", bb)
         return self._immediate_dominator_map
 
     def op_dominates(self, op0, op1):
         """ test if op0 dominates op1 """
-        return self.bb_map[op0] in self.dominator_map[self.bb_map[op1]]
+        return self.dominator_tree.dominates(self.bb_map[op0], self.bb_map[op1])
 
 BB_EMPTY_ERROR_MSG = """\
 basic block {} is empty and does not have a last op (hint: could disappear after running basic_block_simplification pass.
 """
 
+def get_bb_successors(bb):
+    """ return the list of destinations of the branch ending
+        basic block @p bb """
+    if bb.empty:
+        Log.report(Log.Error, BB_EMPTY_ERROR_MSG, bb)
+    last_op = bb.get_inputs()[-1]
+    if isinstance(last_op, UnconditionalBranch):
+        return [last_op.get_input(0)]
+    elif isinstance(last_op, ConditionalBranch):
+        return [last_op.get_input(1), last_op.get_input(2)]
+    return []
+
 def build_cfg_edges_set(bb_list):
     cfg_edges = set()
     for bb in bb_list.inputs:
-        if bb.empty:
-            Log.report(Log.Error, BB_EMPTY_ERROR_MSG, bb)
-        last_op = bb.get_inputs()[-1]
-        if isinstance(last_op, UnconditionalBranch):
-            dst = last_op.get_input(0)
+        for dst in get_bb_successors(bb):
             cfg_edges.add(CFGEdge(bb, dst))
-        elif isinstance(last_op, ConditionalBranch):
-            true_dst = last_op.get_input(1)
-            false_dst = last_op.get_input(2)
-            cfg_edges.add(CFGEdge(bb, true_dst))
-            cfg_edges.add(CFGEdge(bb, false_dst))
     return cfg_edges
 
+def build_successor_map(bb_list):
+    """ build a dictionnary associating to each basic block the ordered
+        list of its successors """
+    return dict((bb, get_bb_successors(bb)) for bb in bb_list.inputs)
+
+def build_predecessor_map(bb_list, successor_map):
+    """ build a dictionnary associating to each basic block the ordered
+        list of its predecessors """
+    predecessor_map = dict((bb, []) for bb in bb_list.inputs)
+    for bb in bb_list.inputs:
+        for dst in successor_map[bb]:
+            predecessor_map.setdefault(dst, []).append(bb)
+    return predecessor_map
+
 def build_predominance_map_list(cfg_edges):
     """ build a dictionnary associating to each node the list of its
         predecessors """
@@ -391,87 +439,98 @@ def build_predominance_map_list(cfg_edges):
                 [predom.get_tag() for predom in predominance_map_list[bb]]))
     return predominance_map_list
 
+def build_reverse_post_order(root, successor_map):
+    """ return the list of basic blocks reachable from @p root in reverse
+        post-order (depth first search, without recursion) """
+    post_order = []
+    visited = set([root])
+    stack = [(root, iter(successor_map.get(root, [])))]
+    while stack:
+        bb, successor_iterator = stack[-1]
+        for successor in successor_iterator:
+            if not successor in visited:
+                visited.add(successor)
+                stack.append((successor, iter(successor_map.get(successor, []))))
+                break
+        else:
+            stack.pop()
+            post_order.append(bb)
+    post_order.reverse()
+    return post_order
+
+def build_immediate_dominator_map(root, reverse_post_order, predecessor_map):
+    """ Build a dictionnary associating the immediate dominator of each
+        basic-block reachable from @p root (except root) to this BB.
+
+        Iterative algorithm from K. D. Cooper, T. J. Harvey and K. Kennedy,
+        "A Simple, Fast Dominance Algorithm": basic blocks are processed in
+        reverse post-order and the immediate dominator of each block is the
+        nearest common ancestor (in the current dominator tree) of its
+        already processed predecessors """
+    rpo_index = dict((bb, index) for index, bb in enumerate(reverse_post_order))
+    idom = {root: root}
+    def intersect(bb0, bb1):
+        """ return the nearest common dominator of bb0 and bb1 """
+        while not bb0 is bb1:
+            while rpo_index[bb0] > rpo_index[bb1]:
+                bb0 = idom[bb0]
+            while rpo_index[bb1] > rpo_index[bb0]:
+                bb1 = idom[bb1]
+        return bb0
+    change = True
+    while change:
+        change = False
+        for bb in reverse_post_order[1:]:
+            new_idom = None
+            for pred in predecessor_map[bb]:
+                # unprocessed and unreachable predecessors are ignored
+                if not pred in idom:
+                    continue
+                new_idom = pred if new_idom is None else intersect(pred, new_idom)
+            if not idom.get(bb) is new_idom:
+                idom[bb] = new_idom
+                change = True
+    # root has no immediate dominator
+    idom.pop(root)
+    return idom
+
 def build_dominator_map(bbg):
     """ Build a dict which associates to each node N
         a list of nodes which dominate N.
         (by definition this list contains at least N, since each node
-        dominates itself) """
-    predominance_map_list = build_predominance_map_list(bbg.cfg_edges)
-    # building dominator map for each node
+        dominates itself).
+        Basic blocks not reachable from the root are dominated by every
+        basic block. """
     dominator_map = {}
     for bb in bbg.bb_list.inputs:
         dominator_map[bb] = set(bbg.bb_list.get_inputs())
     dominator_map[bbg.root] = set([bbg.root])
-    while True:
-        change = False
-        # dom(n) = fix point of intersect(dom(x), x in predecessor(n)) U {n}
-        for bb in predominance_map_list:
-            dom = set.union(
-                set([bb]),
-                set.intersection(
-                    *tuple(dominator_map[pred] for pred in predominance_map_list[bb])
-                )
-            )
-            if not bb in dominator_map:
-                Log.report(Log.Error, "following bb was not in dominator_map: {}", bb)
-            if dom != dominator_map[bb]:
-                change = True
-            dominator_map[bb] = dom
-            Log.report(LOG_LEVEL_GEN_BB_VERBOSE, "bb {}'s dominator list is {}",
-                       bb.get_tag(), [dom.get_tag() for dom in dominator_map[bb]])
-        if not change:
-            break
+    for bb in bbg.reverse_post_order[1:]:
+        # immediate dominator precedes bb in reverse post-order
+        dominator_map[bb] = dominator_map[bbg.immediate_dominator_map[bb]] | set([bb])
     return dominator_map
 
-def build_immediate_dominator_map(dominator_map, bb_list):
-    """ Build a dictionnary associating the immediate dominator of each
-        basic-block to this BB """
-    # looking for immediate dominator
-    immediate_dominator_map = {}
-    for bb in bb_list.inputs:
-        for dom in dominator_map[bb]:
-            # skip self node
-            if dom is bb: continue
-            is_imm = True
-            for other_dom in dominator_map[bb]:
-                if other_dom is dom or other_dom is bb: continue
-                if dom in dominator_map[other_dom]:
-                    is_imm = False
-                    break
-            if is_imm:
-                immediate_dominator_map[bb] = dom
-                break
-        if not bb in immediate_dominator_map:
-            Log.report(LOG_LEVEL_GEN_BB_INFO,
-                       "could not find immediate dominator for: \n{}", bb)
-    return immediate_dominator_map
-
-
-def does_not_strictly_dominate(dominator_map, x, y):
-    """ predicate testing if @p x does not strictly dominate @p y using
-        @p dominator_map """
-    if x == y:
-        return True
-    elif x in dominator_map[y]:
-        # y is dominated by x, and x != y so x strictly dominates y
-        return False
-    return True
-
 
 def get_dominance_frontiers(bbg):
     """ compute the dominance frontier for each node in the basic-block group
-        @p bbg """
-    # build BB's conftrol flow graph
+        @p bbg: for each control flow edge (p -> b), p and its dominators
+        up to (excluding) b's immediate dominator have b in their
+        dominance frontier """
+    idom = bbg.immediate_dominator_map
     dominance_frontier = {}
-    for edge in bbg.cfg_edges:
-        x = edge.src
-        while does_not_strictly_dominate(bbg.dominator_map, x, edge.dst):
-            if not x in dominance_frontier:
-                dominance_frontier[x] = set()
-            dominance_frontier[x].add(edge.dst)
-            if not x in bbg.immediate_dominator_map:
-                Log.report(Log.Error, "could not find {} in bbg.immediate_dominator_map", x)
-            x = bbg.immediate_dominator_map[x]
+    for bb in bbg.reverse_post_order:
+        for pred in bbg.predecessor_map[bb]:
+            if not pred in idom and not pred is bbg.root:
+                # unreachable predecessor
+                continue
+            runner = pred
+            while not runner is idom.get(bb):
+                if not runner in dominance_frontier:
+                    dominance_frontier[runner] = set()
+                dominance_frontier[runner].add(bb)
+                if runner is bbg.root:
+                    break
+                runner = idom[runner]
     for x in dominance_frontier:
         Log.report(
             LOG_LEVEL_GEN_BB_VERBOSE,
@@ -550,10 +609,48 @@ def phi_node_insertion(bbg):
 
 
 class DominatorTree(dict):
-    """ DominatorTree object (dict + root) """
+    """ DominatorTree object (dict + root): associates to each node
+        the list of nodes it immediately dominates """
     def __init__(self, root=None):
         dict.__init__(self)
         self.root = root
+        # node -> (pre-order index, largest pre-order index of its sub-tree)
+        self._preorder_interval = None
+
+    def iter_preorder(self):
+        """ iterate over the tree nodes in depth-first pre-order
+            (without recursion) """
+        node_stack = [self.root]
+        while node_stack:
+            node = node_stack.pop()
+            yield node
+            # children are pushed in reverse order to be processed in order
+            node_stack.extend(reversed(self.get(node, [])))
+
+    @property
+    def preorder_interval(self):
+        if self._preorder_interval is None:
+            preorder_list = list(self.iter_preorder())
+            preorder_index = dict((node, index) for index, node in enumerate(preorder_list))
+            interval = {}
+            # children appear after their parent in pre-order, so each
+            # sub-tree end is known before the parent's one is needed
+            for node in reversed(preorder_list):
+                index = preorder_index[node]
+                interval[node] = (index, max([index] + [interval[child][1] for child in self.get(node, [])]))
+            self._preorder_interval = interval
+        return self._preorder_interval
+
+    def dominates(self, x, y):
+        """ test if node x dominates node y (every node dominates itself and
+            nodes which are not in the tree) """
+        interval = self.preorder_interval
+        if not y in interval:
+            # y is not reachable
+            return True
+        elif not x in interval:
+            return False
+        return interval[x][0] <= interval[y][0] <= interval[x][1]
 
 
 def build_dominator_tree(immediate_dominator_map, root):
@@ -724,9 +821,8 @@ def variable_renaming(bbg):
 
     memoization_map = {}
 
-    def rec_bb_processing(bb):
-        """ perform variable renaming in the basic block @p bb
-            and recursivly in bb's children in the dominator tree """
+    def bb_processing(bb):
+        """ perform variable renaming in the basic block @p bb """
         Log.report(LOG_LEVEL_GEN_BB_VERBOSE, "processing bb {}", bb)
         # because a node can be duplicated between
         # its declaration and its use in a subsequent operation in the same
@@ -774,13 +870,10 @@ def variable_renaming(bbg):
                 # updating_reaching_def(bbg, reaching_def, var, phi)
                 update_indexed_used_var_in_phi(phi, index, var, reaching_def[var], bb)
                 break
-        # finally traverse sub-tree
-        if bb in bbg.dominator_tree:
-            for child in bbg.dominator_tree[bb]:
-                rec_bb_processing(child)
 
     # processing dominator tree in depth-first search pre-order
-    rec_bb_processing(bbg.dominator_tree.root)
+    for bb in bbg.dominator_tree.iter_preorder():
+        bb_processing(bb)
 
 def add_to_bb(bb, node):
     """ add operation node @p node to the end of the basic-block @p bb """
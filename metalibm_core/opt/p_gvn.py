@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: global value numbering (structural hash-consing) pass
+###############################################################################
+
+import sollya
+
+from metalibm_core.core.passes import FunctionPass, METALIBM_PASS_REGISTER
+from metalibm_core.core.ml_operations import (
+    ML_Operation, is_leaf_node,
+    Constant, AbstractVariable, ML_ArithmeticOperation,
+    ControlFlowOperation, ConditionBlock, SwitchBlock, Statement,
+    TableStore, Dereference, CopySign,
+)
+from metalibm_core.core.ml_hdl_operations import Concatenation, Replication
+from metalibm_core.core.ml_table import ML_Table
+from metalibm_core.core.bb_operations import PhiNode
+from metalibm_core.core.machine_operations import RegisterCopy
+
+from metalibm_core.opt.graph_traversal import iter_postorder
+
+from metalibm_core.utility.log_report import Log
+
+
+LOG_GVN_INFO = Log.LogLevel("Info", "gvn")
+
+# operation classes whose nodes may be merged (side-effect free
+# and only depending on their inputs and attributes)
+GVN_OPERATION_CLASSES = (ML_ArithmeticOperation, Concatenation, Replication, CopySign)
+# exceptions to GVN_OPERATION_CLASSES
+GVN_EXCLUDED_CLASSES = (TableStore, Dereference, PhiNode, RegisterCopy)
+# static attributes which are part of the value number key: nodes which
+# differ by one of them are not merged (merging would lose information
+# such as the interval or error bounds of one of the nodes)
+GVN_ATTRIBUTE_NAMES = (
+    "precision", "rounding_mode", "silent", "exact", "unbreakable",
+    "interval", "max_abs_error", "rel_error", "clearprevious",
+)
+
+
+class NotMergeable(Exception):
+    """ raised when a node value can not be used in a value number key """
+    pass
+
+def get_value_key(value):
+    """ return an hashable key which identifies value exactly """
+    if value is None or isinstance(value, (bool, int, float, str, type)):
+        return (type(value), value)
+    elif isinstance(value, sollya.SollyaObject):
+        # sollya display is set to hexadecimal during the pass execution
+        return (sollya.SollyaObject, str(value))
+    elif isinstance(value, (list, tuple)):
+        return (type(value), tuple(get_value_key(v) for v in value))
+    elif isinstance(value, ML_Operation):
+        # node references (other than inputs) are not considered
+        raise NotMergeable
+    try:
+        hash(value)
+    except TypeError:
+        raise NotMergeable
+    return (type(value), value)
+
+
+class ValueNumbering:
+    """ scoped value numbering of an operation graph: structurally
+        equivalent nodes are merged with the first equivalent node found in
+        the current control-flow scope or in its enclosing scopes """
+    def __init__(self):
+        # node -> value number
+        self.value_number_map = {}
+        # node -> node which replaces it
+        self.replacement_map = {}
+        # set of nodes whose value depends on a mutable state
+        # (non-input variable, non-constant table, memory)
+        self.state_dependent = set()
+        # stack of maps: value number key -> representative node
+        self.scope_stack = [{}]
+        self.eliminated_node_count = 0
+        self.value_number_counter = 0
+
+    def new_value_number(self):
+        self.value_number_counter += 1
+        return self.value_number_counter
+
+    def is_state_dependent(self, node):
+        if isinstance(node, AbstractVariable):
+            return node.get_var_type() != AbstractVariable.Input
+        elif isinstance(node, ML_Table):
+            return not node.const
+        elif isinstance(node, Dereference):
+            return True
+        elif is_leaf_node(node):
+            return False
+        return any(op in self.state_dependent for op in node.get_inputs())
+
+    def is_mergeable(self, node):
+        if node in self.state_dependent:
+            return False
+        elif node.get_debug() or node.get_prevent_optimization():
+            return False
+        elif isinstance(node, Constant):
+            return True
+        return isinstance(node, GVN_OPERATION_CLASSES) and not isinstance(node, GVN_EXCLUDED_CLASSES)
+
+    def get_node_key(self, node):
+        """ build the value number key of node, which identifies its
+            class, codegen key, semantic attributes (format, interval, ...),
+            dynamic attributes, input value numbers and class specific
+            fields """
+        attributes = node.attributes
+        return (
+            node.__class__,
+            node.get_codegen_key(),
+            tuple(get_value_key(getattr(attributes, name)) for name in GVN_ATTRIBUTE_NAMES),
+            tuple((name, get_value_key(value)) for name, value in sorted(attributes.__dict__.items())),
+            None if is_leaf_node(node) else tuple(self.value_number_map[op] for op in node.get_inputs()),
+            tuple((name, get_value_key(value)) for name, value in sorted(node.__dict__.items())),
+        )
+
+    def lookup(self, key):
+        for scope in reversed(self.scope_stack):
+            if key in scope:
+                return scope[key]
+        return None
+
+    def number_node(self, node, is_root=False):
+        """ assign a value number to node (whose inputs have already been
+            numbered) and merge it with an equivalent node if one exists """
+        if not is_leaf_node(node):
+            for index, op in enumerate(node.get_inputs()):
+                if op in self.replacement_map:
+                    node.set_input(index, self.replacement_map[op])
+        if self.is_state_dependent(node):
+            self.state_dependent.add(node)
+        if self.is_mergeable(node):
+            try:
+                key = self.get_node_key(node)
+                representative = self.lookup(key)
+            except (NotMergeable, TypeError):
+                # TypeError: unhashable format
+                pass
+            else:
+                if representative is None:
+                    self.scope_stack[-1][key] = node
+                elif not is_root:
+                    # region roots have no parent to update
+                    self.replacement_map[node] = representative
+                    self.value_number_map[node] = self.value_number_map[representative]
+                    self.eliminated_node_count += 1
+                    return
+        self.value_number_map[node] = self.new_value_number()
+
+    def number_region(self, root, new_scope=False):
+        """ number every node of the region (control-flow block) rooted at
+            root, optionally in a new scope nested in the current one """
+        if root in self.value_number_map:
+            return
+        if new_scope:
+            self.scope_stack.append({})
+        def is_region_leaf(node):
+            return is_leaf_node(node) or isinstance(node, ControlFlowOperation) and not isinstance(node, Statement) or node.get_prevent_optimization()
+        for node in iter_postorder(root, is_leaf_node=is_region_leaf,
+                                   skip_node=lambda op: op in self.value_number_map):
+            if isinstance(node, ControlFlowOperation) and not isinstance(node, Statement):
+                self.number_control_flow(node)
+            elif node.get_prevent_optimization() and not is_leaf_node(node):
+                # sub-graph is left untouched
+                self.value_number_map[node] = self.new_value_number()
+                self.state_dependent.add(node)
+            else:
+                self.number_node(node, is_root=(node is root))
+        if new_scope:
+            self.scope_stack.pop()
+
+    def number_control_flow(self, node):
+        """ number the regions of a control-flow node: sub-blocks are
+            numbered in their own scope so nodes of a block are never
+            replaced by nodes of a sibling block """
+        if isinstance(node, (ConditionBlock, SwitchBlock)):
+            # pre-statement (factorized sub-expressions) is generated
+            # before the block itself
+            self.number_region(node.pre_statement)
+        if isinstance(node, ConditionBlock):
+            self.number_region(node.get_input(0))
+            for branch in node.inputs[1:]:
+                self.number_region(branch, new_scope=True)
+        elif isinstance(node, SwitchBlock):
+            self.number_region(node.get_input(0))
+            case_map = node.get_case_map()
+            for case in case_map:
+                self.number_region(case_map[case], new_scope=True)
+        else:
+            # loops and other control-flow: a single nested scope
+            self.scope_stack.append({})
+            for op in node.inputs:
+                self.number_region(op)
+            self.scope_stack.pop()
+        for index, op in enumerate(node.inputs):
+            if op in self.replacement_map:
+                node.set_input(index, self.replacement_map[op])
+        self.value_number_map[node] = self.new_value_number()
+        # control-flow may modify variables
+        self.state_dependent.add(node)
+
+
+@METALIBM_PASS_REGISTER
+class Pass_GlobalValueNumbering(FunctionPass):
+    """ Merge structurally equivalent side-effect free nodes (same class,
+        codegen key, format, interval and other semantic attributes,
+        equivalent inputs and constant value) """
+    pass_tag = "gvn"
+
+    def __init__(self, target):
+        FunctionPass.__init__(self, "global value numbering", target)
+        self.eliminated_node_count = 0
+
+    def execute(self, optree):
+        """ pass execution, API required to be executed on an ML_Entity """
+        old_display = sollya.settings.display
+        sollya.settings.display = sollya.hexadecimal
+        try:
+            value_numbering = ValueNumbering()
+            value_numbering.number_region(optree)
+        finally:
+            sollya.settings.display = old_display
+        self.eliminated_node_count += value_numbering.eliminated_node_count
+        Log.report(LOG_GVN_INFO, "gvn eliminated {} node(s)", value_numbering.eliminated_node_count)
+        return optree
+
+    def execute_on_optree(self, optree, fct=None, fct_group=None, memoization_map=None):
+        return self.execute(optree)
+
+    def execute_on_fct_group(self, fct_group):
+        result = FunctionPass.execute_on_fct_group(self, fct_group)
+        Log.report(Log.Info, "gvn pass eliminated {} node(s) in total", self.eliminated_node_count)
+        return result
@@ -47,6 +47,8 @@ from metalibm_core.core.ml_formats import ML_Void
 from metalibm_core.code_generation.code_constant import C_Code
 from metalibm_core.code_generation.generator_utility import TemplateOperatorFormat
 
+from metalibm_core.opt.graph_traversal import map_postorder
+
 from metalibm_core.utility.log_report import Log
 
 LOG_RUNTIME_EVAL_ERROR = Log.LogLevel("LogRuntimeEvalError")
@@ -71,28 +73,30 @@ def evaluate_graph_value(optree, input_mapping, memoization_map=None):
     """
     # initializing memoization_map
     memoization_map = {} if memoization_map is None else memoization_map
-    # computing values
-    if optree in memoization_map:
-        return memoization_map[optree]
-    elif optree in input_mapping:
-        value = input_mapping[optree]
-    elif is_constant(optree):
-        value = optree.get_value()
-    elif is_typecast(optree):
-        input_value = evaluate_graph_value(optree.get_input(0), input_mapping, memoization_map)
-        value = evaluate_typecast_value(optree, input_value)
-    elif is_conversion(optree):
-        input_value = evaluate_graph_value(optree.get_input(0), input_mapping, memoization_map)
-        value = evaluate_conversion_value(optree, input_value)
-    else:
-        args_interval = tuple(
-            evaluate_graph_value(op, input_mapping, memoization_map) for op in
-            optree.get_inputs()
-        )
-        value = optree.apply_bare_range_function(args_interval)
-    memoization_map[optree] = value
-    Log.report(LOG_RUNTIME_EVAL_ERROR, "node {} value has been evaluated to: {}", optree.get_tag(), value)
-    return value
+    def get_value_inputs(node):
+        """ list of the nodes whose value is required to evaluate node """
+        if node in input_mapping or is_constant(node):
+            return ()
+        elif is_typecast(node) or is_conversion(node):
+            return (node.get_input(0),)
+        return node.get_inputs()
+    def evaluate_node_value(node, input_values):
+        if node in input_mapping:
+            value = input_mapping[node]
+        elif is_constant(node):
+            value = node.get_value()
+        elif is_typecast(node):
+            value = evaluate_typecast_value(node, input_values[0])
+        elif is_conversion(node):
+            value = evaluate_conversion_value(node, input_values[0])
+        else:
+            value = node.apply_bare_range_function(input_values)
+        Log.report(LOG_RUNTIME_EVAL_ERROR, "node {} value has been evaluated to: {}", node.get_tag(), value)
+        return value
+    # computing values (explicit stack traversal, inputs first)
+    return map_postorder(optree, evaluate_node_value,
+                         memoization_map=memoization_map,
+                         get_inputs=get_value_inputs)
 
 def get_printf_value(optree, error_value, expected_value, language=C_Code):
     """ generate a printf call to display the local error value
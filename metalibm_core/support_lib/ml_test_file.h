@@ -0,0 +1,118 @@
+/*******************************************************************************
+* This file is part of Kalray's Metalibm tool
+* Copyright (2026)
+* All rights reserved
+* created:          Oct 16, 2026
+* last-modified:    Oct 16, 2026
+*
+* Description: streaming reader for metalibm binary test-vector files
+*
+* A test-vector file starts with a header (little-endian):
+*   char     magic[8]      "MLTESTV2"
+*   uint32_t byte_order    0x01020304
+*   uint32_t arity         number of inputs per record
+*   uint32_t output_num    number of expected values per record
+*   uint32_t record_size   size (in bytes) of one record
+*   uint32_t block_size    maximal number of records per block
+*   uint32_t reserved
+*   uint64_t test_num      total number of records
+*   char     identity[64]  digest (hexadecimal) of the function identity
+*   char     formats[64]   input/output formats (zero padded)
+* followed by blocks of at most block_size records:
+*   uint32_t n             number of records in the block
+*   for each input: n encodings
+*   n x output_num expected encodings (record-major)
+*
+*******************************************************************************/
+#ifndef __ML_TEST_FILE_H__
+#define __ML_TEST_FILE_H__
+
+#include <inttypes.h>
+#include <stdio.h>
+#include <string.h>
+
+#define ML_TEST_FILE_MAGIC "MLTESTV2"
+#define ML_TEST_FILE_BYTE_ORDER 0x01020304u
+
+typedef struct {
+    char magic[8];
+    uint32_t byte_order;
+    uint32_t arity;
+    uint32_t output_num;
+    uint32_t record_size;
+    uint32_t block_size;
+    uint32_t reserved;
+    uint64_t test_num;
+    char identity[64];
+    char formats[64];
+} ml_test_file_header_t;
+
+/** test-vector file currently streamed (one at a time) */
+static FILE* ml_test_file_stream = NULL;
+/** maximal number of records per block of the current file */
+static uint32_t ml_test_file_block_size = 0;
+
+/** open the test-vector file path and check that its header matches
+ *  the function identity and the layout expected by the test wrapper,
+ *  return 0 on success */
+static inline int ml_test_file_open(const char* path, const char* identity, uint32_t arity, uint32_t output_num,
+                                    uint32_t record_size, uint32_t max_block_size) {
+    ml_test_file_header_t header;
+    ml_test_file_stream = fopen(path, "rb");
+    if (!ml_test_file_stream) {
+        printf("error: unable to open test file %s\n", path);
+        return 1;
+    }
+    if (fread(&header, sizeof(header), 1, ml_test_file_stream) != 1 ||
+        memcmp(header.magic, ML_TEST_FILE_MAGIC, 8) ||
+        header.byte_order != ML_TEST_FILE_BYTE_ORDER) {
+        printf("error: %s is not a valid test file\n", path);
+        return 1;
+    }
+    if (header.arity != arity || header.output_num != output_num ||
+        header.record_size != record_size || header.block_size > max_block_size) {
+        printf("error: test file %s layout (arity=%"PRIu32", output_num=%"PRIu32", record_size=%"PRIu32", block_size=%"PRIu32") "
+               "does not match test wrapper\n",
+               path, header.arity, header.output_num, header.record_size, header.block_size);
+        return 1;
+    }
+    if (memcmp(header.identity, identity, sizeof(header.identity))) {
+        printf("error: test file %s (formats %.64s) was generated for another function\n",
+               path, header.formats);
+        return 1;
+    }
+    ml_test_file_block_size = header.block_size;
+    printf("streaming %"PRIu64" test(s) from %s\n", header.test_num, path);
+    return 0;
+}
+
+/** start reading the next block, return its number of records,
+ *  0 at the end of the file and -1 on error */
+static inline int32_t ml_test_file_next_block(void) {
+    uint32_t n;
+    if (fread(&n, sizeof(n), 1, ml_test_file_stream) != 1) {
+        return feof(ml_test_file_stream) ? 0 : -1;
+    }
+    if (n > ml_test_file_block_size) {
+        printf("error: invalid test file block size %"PRIu32"\n", n);
+        return -1;
+    }
+    return (int32_t) n;
+}
+
+/** read the n elements of elt_size bytes of the next column of the
+ *  current block into dst, return 0 on success */
+static inline int ml_test_file_read(void* dst, size_t elt_size, int32_t n) {
+    if (fread(dst, elt_size, n, ml_test_file_stream) != (size_t) n) {
+        printf("error: truncated test file\n");
+        return 1;
+    }
+    return 0;
+}
+
+static inline void ml_test_file_close(void) {
+    fclose(ml_test_file_stream);
+    ml_test_file_stream = NULL;
+}
+
+#endif /* __ML_TEST_FILE_H__ */
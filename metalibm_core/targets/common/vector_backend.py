@@ -598,6 +598,7 @@ vector_opencl_code_generation_table = {
   },
 }
 
+@dispatch_static
 def type_uniform_op2_match(result_type, op0_type, op1_type, **kw):
     """ Type match predicates:
             a 2-operand where operands and result format must
@@ -609,6 +610,7 @@ def type_uniform_op2_match_restrain(list_t):
     """ Type matching predicate which check that a 2-operand operation
         has identical type for both operand and results and that this type
         is in <list_t> """
+    @dispatch_static
     def local_match(result_type, op0_t, op1_t, **kw):
         return type_uniform_op2_match(result_type, op0_t, op1_t, **kw) and result_type in list_t
     return local_match
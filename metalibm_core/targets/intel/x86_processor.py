@@ -57,7 +57,7 @@ from metalibm_core.code_generation.abstract_backend import LOG_BACKEND_INIT
 from metalibm_core.code_generation.generic_processor import GenericProcessor
 from metalibm_core.code_generation.complex_generator import DynamicOperator
 
-from .x86_processor_table import x86_sse_approx_table_map
+from .x86_processor_table import get_x86_sse_approx_table_map
 
 
 def get_sse_scalar_cst(format_object, value, language = C_Code):
@@ -1203,7 +1203,7 @@ sse_c_code_generation_table = {
                 type_strict_match(v4int32, ML_SSE_m128_v4int32):
                     SymbolOperator("(ml_int4_t)", arity=1),
                 # identity operators
-                lambda dst_type, src_type, **kwords: dst_type == src_type:
+                dispatch_static(lambda dst_type, src_type, **kwords: dst_type == src_type):
                     IdentityOperator(),
                 # signed/unsigned conversions
                 type_strict_match(ML_SSE_m128_v4int32, ML_SSE_m128_v4uint32):
@@ -2863,8 +2863,10 @@ class X86_SSE_Processor(X86_Processor):
         C_Code: sse_c_code_generation_table,
     }
 
-    # approximation table map
-    approx_table_map = x86_sse_approx_table_map
+    # approximation table map (built on first access)
+    @property
+    def approx_table_map(self):
+        return get_x86_sse_approx_table_map()
 
     TARGET_PREFERRED_VECTOR_SIZE_MAP = {
         ML_Binary32: 4,
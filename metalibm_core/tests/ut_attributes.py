@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for node Attributes
+###############################################################################
+import unittest
+
+from metalibm_core.core.ml_formats import ML_Int32
+from metalibm_core.core.ml_operations import Variable, Addition
+from metalibm_core.code_generation.code_entity import CodeEntity
+
+
+class UT_Attributes(unittest.TestCase):
+    def test_init_stage_snapshot(self):
+        """ the init_stage dynamic attribute of a node is the stage of its
+            entity when the node was created, not the current stage """
+        entity = CodeEntity("ut_attributes_entity")
+        va = Variable("a", precision=ML_Int32)
+        vb = Variable("b", precision=ML_Int32)
+        stage0_node = Addition(va, vb, precision=ML_Int32)
+        for _ in range(3):
+            entity.start_new_stage()
+        stage3_node = Addition(stage0_node, vb, precision=ML_Int32)
+        self.assertEqual(stage0_node.attributes.get_dyn_attribute("init_stage"), 0)
+        self.assertEqual(stage3_node.attributes.get_dyn_attribute("init_stage"), 3)
+        # copies keep the stage of the original node
+        self.assertEqual(stage0_node.attributes.get_copy().get_dyn_attribute("init_stage"), 0)
+
+    def test_lazy_dynamic_attribute(self):
+        """ unset dynamic attributes without snapshot are not stored in
+            the node attributes """
+        entity = CodeEntity("ut_attributes_entity")
+        va = Variable("a", precision=ML_Int32)
+        node = Addition(va, va, precision=ML_Int32)
+        self.assertNotIn("init_op", vars(node.attributes))
+        self.assertIsNone(node.attributes.get_dyn_attribute("init_op"))
+        op_node = Addition(va, va, precision=ML_Int32, init_op=node)
+        self.assertIs(op_node.attributes.get_dyn_attribute("init_op"), node)
+
+    def test_explicit_init_stage(self):
+        """ explicit init_stage is kept whatever the entity stage """
+        entity = CodeEntity("ut_attributes_entity")
+        va = Variable("a", precision=ML_Int32)
+        node = Addition(va, va, precision=ML_Int32, init_stage=5)
+        entity.start_new_stage()
+        self.assertEqual(node.attributes.get_dyn_attribute("init_stage"), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit tests for on-disk cache helpers (atomic writes and
+#                  least recently used eviction)
+###############################################################################
+
+import os
+import stat
+import tempfile
+import unittest
+
+from metalibm_core.utility.cache_utils import (
+    atomic_write, atomic_copy, evict_least_recently_used, get_directory_size
+)
+
+
+class UT_CacheUtils(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = self.tmp_dir.name
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_entry(self, name, size, mtime):
+        path = os.path.join(self.dir, name)
+        with open(path, "wb") as stream:
+            stream.write(b"x" * size)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_atomic_write(self):
+        path = os.path.join(self.dir, "entry.json")
+        with atomic_write(path) as stream:
+            stream.write("partial")
+            # nothing is exposed under path until the block completes
+            self.assertFalse(os.path.exists(path))
+        with open(path) as stream:
+            self.assertEqual(stream.read(), "partial")
+        self.assertEqual(os.listdir(self.dir), ["entry.json"])
+
+    def test_atomic_write_failure(self):
+        path = os.path.join(self.dir, "entry.json")
+        with self.assertRaises(ValueError):
+            with atomic_write(path) as stream:
+                stream.write("partial")
+                raise ValueError
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_atomic_copy(self):
+        src_path = self.write_entry("src", 16, 0)
+        os.chmod(src_path, 0o755)
+        dst_path = os.path.join(self.dir, "dst")
+        atomic_copy(src_path, dst_path)
+        with open(dst_path, "rb") as stream:
+            self.assertEqual(stream.read(), b"x" * 16)
+        self.assertEqual(stat.S_IMODE(os.stat(dst_path).st_mode), 0o755)
+
+    def test_evict_files(self):
+        old = self.write_entry("old.json", 100, 1000)
+        new = self.write_entry("new.json", 100, 2000)
+        other = self.write_entry("other.bin", 1000, 0)
+        evict_least_recently_used(self.dir, 150, suffix=".json")
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(new))
+        # entries without the suffix are neither counted nor removed
+        self.assertTrue(os.path.exists(other))
+        evict_least_recently_used(self.dir, 100, suffix=".json")
+        self.assertTrue(os.path.exists(new))
+
+    def test_evict_directories(self):
+        import shutil
+        for index, name in enumerate(["a", "b"]):
+            os.makedirs(os.path.join(self.dir, name))
+            with open(os.path.join(self.dir, name, "data"), "wb") as stream:
+                stream.write(b"x" * 64)
+            os.utime(os.path.join(self.dir, name), (index, index))
+        self.assertEqual(get_directory_size(os.path.join(self.dir, "a")), 64)
+        evict_least_recently_used(self.dir, 64, get_size=get_directory_size, remove=shutil.rmtree)
+        self.assertEqual(os.listdir(self.dir), ["b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for instruction selection memoization
+###############################################################################
+import unittest
+
+from metalibm_core.core.ml_formats import ML_Binary32, ML_Int32
+from metalibm_core.code_generation.generator_utility import (
+    type_strict_match, type_std_integer_match, type_custom_match, TCM,
+    dispatch_static, is_dispatch_static)
+from metalibm_core.code_generation.abstract_backend import DispatchEntry
+
+# global flag read by a selection predicate
+ENABLE_IMPL = True
+
+def flag_condition(*args, **kwords):
+    """ selection condition reading a global flag """
+    return ENABLE_IMPL
+
+@dispatch_static
+class CountingMatch:
+    """ dispatch-static interface condition counting its evaluations """
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *arg_tuple, **kwords):
+        self.count += 1
+        return True
+
+class DummyProcessor:
+    """ processor whose state is read by a selection predicate """
+    # class attribute read by a predicate
+    enabled_by_class = True
+
+    def __init__(self):
+        self.enabled = True
+
+    def is_enabled(self, *args, **kwords):
+        return self.enabled
+
+
+class UT_DispatchCache(unittest.TestCase):
+    def test_static_predicates(self):
+        """ declared predicates and constant True functions are static """
+        self.assertTrue(is_dispatch_static(type_strict_match(ML_Binary32, ML_Binary32)))
+        self.assertTrue(is_dispatch_static(type_custom_match(TCM(ML_Binary32.__class__))))
+        self.assertTrue(is_dispatch_static(type_std_integer_match))
+        self.assertTrue(is_dispatch_static(lambda *args, **kwords: True))
+        self.assertTrue(is_dispatch_static(lambda optree: True))
+
+    def test_state_predicates(self):
+        """ undeclared predicates are not static, whatever they read """
+        self.assertFalse(is_dispatch_static(flag_condition))
+        self.assertFalse(is_dispatch_static(DummyProcessor().is_enabled))
+        processor = DummyProcessor()
+        self.assertFalse(is_dispatch_static(lambda *args, **kwords: processor.enabled))
+        self.assertFalse(is_dispatch_static(lambda *args, **kwords: DummyProcessor.enabled_by_class))
+        self.assertFalse(is_dispatch_static(lambda *args, **kwords: False))
+        captured_list = [ML_Int32]
+        self.assertFalse(is_dispatch_static(lambda result, *args, **kwords: result in captured_list))
+
+    def test_static_selection_memoized(self):
+        """ static selection is evaluated once and memoized """
+        match = CountingMatch()
+        condition = lambda *args, **kwords: True
+        entry = DispatchEntry({condition: {match: "impl"}}, None, (ML_Int32,))
+        for _ in range(3):
+            result = entry.resolve(None)
+        self.assertEqual(result.implementation, "impl")
+        self.assertTrue(result.static)
+        self.assertEqual(match.count, 1)
+
+    def test_state_selection_reevaluated(self):
+        """ selection depending on a global flag, on processor state or on
+            a mutable class attribute or container follows the state changes """
+        global ENABLE_IMPL
+        entry = DispatchEntry({flag_condition: {type_std_integer_match: "impl"}}, None, (ML_Int32,))
+        try:
+            ENABLE_IMPL = True
+            self.assertEqual(entry.resolve(None).implementation, "impl")
+            ENABLE_IMPL = False
+            self.assertIsNone(entry.resolve(None).implementation)
+        finally:
+            ENABLE_IMPL = True
+
+        processor = DummyProcessor()
+        entry = DispatchEntry({processor.is_enabled: {type_std_integer_match: "impl"}}, None, (ML_Int32,))
+        self.assertEqual(entry.resolve(None).implementation, "impl")
+        processor.enabled = False
+        self.assertIsNone(entry.resolve(None).implementation)
+
+        class_condition = lambda *args, **kwords: DummyProcessor.enabled_by_class
+        entry = DispatchEntry({class_condition: {type_std_integer_match: "impl"}}, None, (ML_Int32,))
+        try:
+            self.assertEqual(entry.resolve(None).implementation, "impl")
+            DummyProcessor.enabled_by_class = False
+            self.assertIsNone(entry.resolve(None).implementation)
+        finally:
+            DummyProcessor.enabled_by_class = True
+
+        format_list = [ML_Int32]
+        list_match = lambda result, *args, **kwords: result in format_list
+        entry = DispatchEntry({lambda optree: True: {list_match: "impl"}}, None, (ML_Int32,))
+        self.assertEqual(entry.resolve(None).implementation, "impl")
+        format_list.clear()
+        self.assertIsNone(entry.resolve(None).implementation)
+
+
+if __name__ == '__main__':
+    unittest.main()
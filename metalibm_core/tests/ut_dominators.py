@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for dominator and dominance frontier
+#                  computation on basic block graphs
+###############################################################################
+import random
+import unittest
+
+from metalibm_core.core.ml_formats import ML_Bool, ML_Int32
+from metalibm_core.core.ml_operations import Variable, Return, Constant
+from metalibm_core.core.bb_operations import (
+    BasicBlockList, BasicBlock, ConditionalBranch, UnconditionalBranch)
+from metalibm_core.opt.p_gen_bb import BasicBlockGraph
+
+# number of random control flow graphs checked
+RANDOM_CFG_NUM = 200
+
+
+def build_random_cfg(rng, bb_num):
+    """ build a random basic block graph of bb_num basic blocks, each block
+        ends with a return, an unconditional branch or a conditional branch
+        (blocks may be unreachable, loops and self loops are allowed) """
+    cond = Variable("cond", precision=ML_Bool, var_type=Variable.Input)
+    bb_list = [BasicBlock(tag="bb{}".format(index)) for index in range(bb_num)]
+    for bb in bb_list:
+        kind = rng.randrange(4)
+        if kind == 0:
+            bb.push(Return(Constant(0, precision=ML_Int32)))
+        elif kind == 1:
+            bb.push(UnconditionalBranch(rng.choice(bb_list)))
+        else:
+            bb.push(ConditionalBranch(cond, rng.choice(bb_list), rng.choice(bb_list)))
+    return BasicBlockGraph(bb_list[0], BasicBlockList(*bb_list))
+
+def naive_dominator_map(root, bb_list, predecessor_map, reachable):
+    """ set-intersection fixpoint: dom(root) = {root},
+        dom(n) = {n} | intersection of dom(p) for p reachable predecessor
+        of n (unreachable blocks are dominated by every block) """
+    dom = dict((bb, set(bb_list)) for bb in bb_list)
+    dom[root] = set([root])
+    change = True
+    while change:
+        change = False
+        for bb in bb_list:
+            if bb is root or not bb in reachable:
+                continue
+            new_dom = set(bb_list)
+            for pred in predecessor_map[bb]:
+                if pred in reachable:
+                    new_dom &= dom[pred]
+            new_dom.add(bb)
+            if new_dom != dom[bb]:
+                dom[bb] = new_dom
+                change = True
+    return dom
+
+def naive_immediate_dominator(bb, dom):
+    """ strict dominator of bb which is dominated by every other strict
+        dominator of bb """
+    strict_dom = dom[bb] - set([bb])
+    return max(strict_dom, key=lambda d: len(dom[d]))
+
+def naive_dominance_frontier(x, bb_list, predecessor_map, reachable, dom):
+    """ y is in DF(x) if x dominates a (reachable) predecessor of y
+        and does not strictly dominate y """
+    return set(
+        y for y in bb_list if y in reachable and
+        any(x in dom[pred] for pred in predecessor_map[y] if pred in reachable) and
+        not (x in dom[y] and not x is y))
+
+
+class UT_Dominators(unittest.TestCase):
+    def test_random_cfgs(self):
+        """ dominators, immediate dominators, dominator tree and dominance
+            frontiers match a naive computation on random CFGs """
+        rng = random.Random(17)
+        for _ in range(RANDOM_CFG_NUM):
+            bbg = build_random_cfg(rng, rng.randrange(1, 24))
+            bb_list = bbg.bb_list.get_inputs()
+            reachable = set(bbg.reverse_post_order)
+            dom = naive_dominator_map(bbg.root, bb_list, bbg.predecessor_map, reachable)
+            self.assertEqual(bbg.dominator_map, dom)
+            for bb in reachable:
+                if bb is bbg.root:
+                    self.assertNotIn(bb, bbg.immediate_dominator_map)
+                else:
+                    self.assertIs(bbg.immediate_dominator_map[bb], naive_immediate_dominator(bb, dom))
+                self.assertEqual(
+                    bbg.dominance_frontier_map.get(bb, set()),
+                    naive_dominance_frontier(bb, bb_list, bbg.predecessor_map, reachable, dom))
+                for other_bb in reachable:
+                    self.assertEqual(bbg.dominator_tree.dominates(bb, other_bb), bb in dom[other_bb])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for outward-rounded binary64 intervals
+###############################################################################
+import math
+import random
+import struct
+import unittest
+from fractions import Fraction
+
+from metalibm_core.core.float_interval import (
+    FloatInterval, next_up, next_down, BINARY64_MAX)
+
+# number of random interval pairs checked per operation
+RANDOM_TEST_NUM = 2000
+
+
+def random_float(rng):
+    """ random binary64 value with a random exponent (normal, subnormal,
+        zero or close to overflow) """
+    kind = rng.randrange(8)
+    if kind == 0:
+        return rng.choice([0.0, -0.0])
+    elif kind == 1:
+        # subnormal
+        return struct.unpack("<d", struct.pack("<Q", rng.getrandbits(52) | (rng.getrandbits(1) << 63)))[0]
+    elif kind == 2:
+        return rng.choice([-1, 1]) * rng.uniform(0.5, 1.0) * BINARY64_MAX
+    return rng.choice([-1, 1]) * rng.uniform(1.0, 2.0) * 2.0**rng.randrange(-1060, 1024)
+
+def random_interval(rng):
+    lo, hi = sorted([random_float(rng), random_float(rng)])
+    return FloatInterval(lo, hi)
+
+def exact_range(lhs, rhs, op):
+    """ exact (Fraction) bounds of {op(x, y), x in lhs, y in rhs} for an
+        operation whose extrema are reached on the bounds """
+    values = [op(Fraction(x), Fraction(y)) for x in (lhs.lo, lhs.hi) for y in (rhs.lo, rhs.hi)]
+    return min(values), max(values)
+
+
+class UT_FloatInterval(unittest.TestCase):
+    def test_next_float(self):
+        """ next_up / next_down step to the adjacent binary64 values """
+        self.assertEqual(next_up(1.0), 1.0 + 2.0**-52)
+        self.assertEqual(next_down(1.0), 1.0 - 2.0**-53)
+        self.assertEqual(next_up(0.0), 5e-324)
+        self.assertEqual(next_up(-0.0), 5e-324)
+        self.assertEqual(next_down(0.0), -5e-324)
+        self.assertEqual(next_up(-5e-324), 0.0)
+        self.assertEqual(next_up(BINARY64_MAX), math.inf)
+        self.assertEqual(next_up(-math.inf), -BINARY64_MAX)
+        self.assertEqual(next_up(math.inf), math.inf)
+        self.assertEqual(next_down(-1.0), -1.0 - 2.0**-52)
+
+    def check_operation(self, op, float_op, divisor=False):
+        rng = random.Random(23)
+        for _ in range(RANDOM_TEST_NUM):
+            lhs = random_interval(rng)
+            rhs = random_interval(rng)
+            if divisor and rhs.lo <= 0 <= rhs.hi:
+                self.assertIsNone(float_op(lhs, rhs))
+                continue
+            result = float_op(lhs, rhs)
+            exact_lo, exact_hi = exact_range(lhs, rhs, op)
+            # outward rounding: the result encloses the exact range
+            self.assertTrue(result.lo <= exact_lo and exact_hi <= result.hi, (lhs, rhs, result))
+            if result.exact:
+                self.assertEqual((Fraction(result.lo), Fraction(result.hi)), (exact_lo, exact_hi))
+            # bounds are at most 1 ulp away (2 ulps for underflowing
+            # products or quotients) from the exact bounds
+            if not math.isinf(result.lo):
+                self.assertTrue(exact_lo < next_up(next_up(result.lo)), (lhs, rhs, result))
+            if not math.isinf(result.hi):
+                self.assertTrue(next_down(next_down(result.hi)) < exact_hi, (lhs, rhs, result))
+
+    def test_add(self):
+        self.check_operation(lambda x, y: x + y, lambda lhs, rhs: lhs + rhs)
+
+    def test_sub(self):
+        self.check_operation(lambda x, y: x - y, lambda lhs, rhs: lhs - rhs)
+
+    def test_mul(self):
+        self.check_operation(lambda x, y: x * y, lambda lhs, rhs: lhs * rhs)
+
+    def test_div(self):
+        self.check_operation(lambda x, y: x / y, lambda lhs, rhs: lhs / rhs, divisor=True)
+
+    def test_point_add_tight(self):
+        """ the sum of two point intervals is the tightest enclosure """
+        result = FloatInterval(1.0, 1.0) + FloatInterval(2.0**-60, 2.0**-60)
+        self.assertEqual((result.lo, result.hi, result.exact), (1.0, next_up(1.0), False))
+        result = FloatInterval(1.0, 1.0) + FloatInterval(0.5, 0.5)
+        self.assertEqual((result.lo, result.hi, result.exact), (1.5, 1.5, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for non-recursive operation graph traversals
+###############################################################################
+import sys
+import unittest
+
+from metalibm_core.core.ml_formats import ML_Binary32
+from metalibm_core.core.ml_operations import (
+    ML_LeafNode, Variable, Addition, Multiplication, Negation, Statement)
+from metalibm_core.opt.graph_traversal import (
+    iter_postorder, map_postorder, fold_postorder, rewrite_postorder)
+
+
+class Node:
+    """ minimal graph node """
+    def __init__(self, name, *inputs):
+        self.name = name
+        self.inputs = list(inputs)
+
+    def get_inputs(self):
+        return self.inputs
+
+    def set_input(self, index, op):
+        self.inputs[index] = op
+
+    def __repr__(self):
+        return self.name
+
+
+class CustomCopyAddition(Addition):
+    """ operation class overriding copy: its inputs must be copied by
+        its own copy method, through the shared copy_map """
+    copy_count = 0
+
+    def copy(self, copy_map=None):
+        copy_map = {} if copy_map is None else copy_map
+        if self in copy_map:
+            return copy_map[self]
+        CustomCopyAddition.copy_count += 1
+        new_copy = CustomCopyAddition(
+            *tuple(op.copy(copy_map) for op in self.inputs),
+            precision=self.get_precision())
+        copy_map[self] = new_copy
+        return new_copy
+
+
+class UT_GraphTraversal(unittest.TestCase):
+    def build_diamond(self):
+        """ root = f(g(shared), h(shared)), shared = s(leaf) """
+        leaf = Node("leaf")
+        shared = Node("shared", leaf)
+        left = Node("left", shared)
+        right = Node("right", shared, leaf)
+        return Node("root", left, right), shared, leaf
+
+    def build_chain(self, length):
+        node = Node("leaf")
+        for index in range(length):
+            node = Node("n{}".format(index), node)
+        return node
+
+    def test_shared_sub_graph(self):
+        """ shared nodes are yielded once, after all their inputs, and
+            get_inputs is called once per node """
+        root, shared, leaf = self.build_diamond()
+        call_list = []
+        def get_inputs(node):
+            call_list.append(node)
+            return node.get_inputs()
+        order = list(iter_postorder(root, get_inputs=get_inputs))
+        self.assertEqual(len(order), 5)
+        self.assertEqual(len(set(order)), 5)
+        self.assertEqual(sorted(call_list, key=order.index), order)
+        for node in order:
+            for op in node.get_inputs():
+                self.assertLess(order.index(op), order.index(node))
+        self.assertIs(order[-1], root)
+
+    def test_map_shared_sub_graph(self):
+        """ map_postorder evaluates (and gets the inputs of) each node once """
+        root, shared, leaf = self.build_diamond()
+        input_calls = []
+        def get_inputs(node):
+            input_calls.append(node)
+            return node.get_inputs()
+        evaluated = []
+        def count_leaves(node, input_values):
+            evaluated.append(node)
+            return sum(input_values) if input_values else 1
+        # leaf is reached through shared (twice) and right
+        self.assertEqual(map_postorder(root, count_leaves, get_inputs=get_inputs), 3)
+        self.assertEqual(len(evaluated), 5)
+        self.assertEqual(sorted(input_calls, key=evaluated.index), evaluated)
+
+    def test_memoization_reuse(self):
+        """ nodes already in the memoization map are neither traversed
+            nor evaluated, their memoized value is used """
+        root, shared, leaf = self.build_diamond()
+        memoization_map = {shared: 10}
+        evaluated = []
+        def count_leaves(node, input_values):
+            evaluated.append(node)
+            return sum(input_values) if input_values else 1
+        # left = shared = 10, right = shared + leaf = 11
+        self.assertEqual(map_postorder(root, count_leaves, memoization_map=memoization_map), 21)
+        self.assertEqual(set(evaluated), set([root, root.inputs[0], root.inputs[1], leaf]))
+        # every evaluated node is recorded, a second map is free
+        evaluated.clear()
+        self.assertEqual(map_postorder(root, count_leaves, memoization_map=memoization_map), 21)
+        self.assertEqual(evaluated, [])
+
+    def test_skip_and_leaf_node(self):
+        """ skipped nodes are not yielded, leaf nodes are yielded without
+            their inputs """
+        root, shared, leaf = self.build_diamond()
+        order = list(iter_postorder(root, skip_node=lambda node: node is shared))
+        self.assertEqual(order, [root.inputs[0], leaf, root.inputs[1], root])
+        order = list(iter_postorder(root, is_leaf_node=lambda node: node is shared))
+        self.assertNotIn(leaf, order[:1])
+        self.assertEqual(order.index(shared), 0)
+        self.assertEqual(fold_postorder(root, lambda count, node: count + 1, 0,
+                                        is_leaf_node=lambda node: node is shared), 5)
+
+    def test_deep_chain(self):
+        """ traversals do not recurse: chains deeper than the recursion
+            limit are supported """
+        length = 3 * sys.getrecursionlimit()
+        root = self.build_chain(length)
+        self.assertEqual(fold_postorder(root, lambda count, node: count + 1, 0), length + 1)
+        self.assertEqual(map_postorder(root, lambda node, values: 1 + sum(values)), length + 1)
+        # rewrite replacing the leaf, every node input must be updated
+        new_leaf = Node("new_leaf")
+        def rewrite(node):
+            return new_leaf if node.name == "leaf" else None
+        self.assertIs(rewrite_postorder(root, rewrite), root)
+        self.assertIs(list(iter_postorder(root))[0], new_leaf)
+
+    def test_deep_copy(self):
+        """ copy of an operation graph deeper than the recursion limit """
+        node = Variable("x", precision=ML_Binary32, var_type=Variable.Input)
+        for _ in range(3 * sys.getrecursionlimit()):
+            node = Negation(node, precision=ML_Binary32)
+        node_copy = node.copy()
+        self.assertIsNot(node_copy, node)
+        self.assertIsInstance(node_copy, Negation)
+        self.assertEqual(fold_postorder(node_copy, lambda count, op: count + 1, 0,
+                                        is_leaf_node=lambda op: isinstance(op, ML_LeafNode)),
+                         3 * sys.getrecursionlimit() + 1)
+
+    def test_copy_shared_sub_graph(self):
+        """ shared nodes are copied once, including through nodes whose
+            class overrides copy """
+        vx = Variable("x", precision=ML_Binary32, var_type=Variable.Local)
+        shared = Multiplication(vx, vx, precision=ML_Binary32)
+        custom = CustomCopyAddition(shared, vx, precision=ML_Binary32)
+        generic = Addition(custom, shared, precision=ML_Binary32)
+        scheme = Statement(generic, custom)
+        CustomCopyAddition.copy_count = 0
+        copy_map = {}
+        scheme_copy = scheme.copy(copy_map)
+        generic_copy, custom_copy = scheme_copy.get_inputs()
+        # custom is reached twice but copied once, by its own copy method
+        self.assertEqual(CustomCopyAddition.copy_count, 1)
+        self.assertIsInstance(custom_copy, CustomCopyAddition)
+        self.assertIs(generic_copy.get_input(0), custom_copy)
+        # shared sub-graph (copied by both copy paths) is copied once
+        self.assertIsNot(copy_map[shared], shared)
+        self.assertIs(generic_copy.get_input(1), copy_map[shared])
+        self.assertIs(custom_copy.get_input(0), copy_map[shared])
+        self.assertIs(custom_copy.get_input(1), copy_map[vx])
+        self.assertIs(copy_map[shared].get_input(0), copy_map[vx])
+        self.assertIsNot(copy_map[vx], vx)
+
+
+if __name__ == '__main__':
+    unittest.main()
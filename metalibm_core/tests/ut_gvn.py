@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for the global value numbering pass
+###############################################################################
+import unittest
+
+import sollya
+
+from metalibm_core.core.ml_formats import ML_Binary32
+from metalibm_core.core.ml_operations import Variable, Addition, Statement
+from metalibm_core.opt.p_gvn import Pass_GlobalValueNumbering
+
+
+class UT_GVN(unittest.TestCase):
+    def build_scheme(self, interval0, interval1):
+        va = Variable("a", precision=ML_Binary32, var_type=Variable.Input)
+        vb = Variable("b", precision=ML_Binary32, var_type=Variable.Input)
+        add0 = Addition(va, vb, precision=ML_Binary32, interval=interval0)
+        add1 = Addition(va, vb, precision=ML_Binary32, interval=interval1)
+        return add0, Statement(add0, add1)
+
+    def test_same_interval_merged(self):
+        """ structurally equivalent nodes with the same interval are merged """
+        add0, scheme = self.build_scheme(sollya.Interval(0, 1), sollya.Interval(0, 1))
+        gvn_pass = Pass_GlobalValueNumbering(None)
+        gvn_pass.execute(scheme)
+        self.assertEqual(gvn_pass.eliminated_node_count, 1)
+        self.assertIs(scheme.get_input(1), add0)
+
+    def test_different_interval_not_merged(self):
+        """ nodes which only differ by their interval must not be merged """
+        add0, scheme = self.build_scheme(sollya.Interval(0, 1), sollya.Interval(0, 2))
+        gvn_pass = Pass_GlobalValueNumbering(None)
+        gvn_pass.execute(scheme)
+        self.assertEqual(gvn_pass.eliminated_node_count, 0)
+        self.assertIsNot(scheme.get_input(1), add0)
+
+    def test_different_error_not_merged(self):
+        """ nodes which only differ by their max_abs_error must not be merged """
+        add0, scheme = self.build_scheme(None, None)
+        scheme.get_input(1).set_max_abs_error(2**-10)
+        gvn_pass = Pass_GlobalValueNumbering(None)
+        gvn_pass.execute(scheme)
+        self.assertEqual(gvn_pass.eliminated_node_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
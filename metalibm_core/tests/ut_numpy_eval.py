@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for the numpy bit-accurate graph evaluator
+#                  (fused multiply-add and rounding)
+###############################################################################
+import math
+import random
+import unittest
+from fractions import Fraction
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+from metalibm_core.core.ml_formats import ML_Binary64, ML_Int32
+from metalibm_core.core.ml_operations import (
+    Variable, NearestInteger, Trunc, Conversion)
+
+if numpy_available:
+    from metalibm_core.opt.numpy_eval import (
+        numpy_fma, round_to_odd_sum, evaluate_graph_numpy)
+
+# number of random operand tuples checked
+RANDOM_TEST_NUM = 5000
+
+
+def random_float(rng):
+    """ random binary64 value with a random exponent (including zeros,
+        subnormals and values close to overflow) """
+    kind = rng.randrange(10)
+    if kind == 0:
+        return rng.choice([0.0, -0.0])
+    elif kind == 1:
+        return rng.choice([-1, 1]) * rng.randrange(1, 2**52) * 2.0**-1074
+    return rng.choice([-1, 1]) * rng.uniform(1.0, 2.0) * 2.0**rng.randrange(-1074, 1024)
+
+def round_fraction(value, dtype):
+    """ round the rational value to nearest (ties to even) in dtype """
+    try:
+        # int / int division is correctly rounded to binary64
+        candidate = float(value)
+    except OverflowError:
+        return dtype.type(math.inf if value > 0 else -math.inf)
+    if dtype == numpy.float64:
+        return numpy.float64(candidate)
+    # narrower format: rounding the binary64 value again may be a double
+    # rounding error, the nearest binary32 neighbour is selected exactly
+    max_value = numpy.finfo(dtype).max
+    half_ulp = (Fraction(float(max_value)) - Fraction(float(numpy.nextafter(max_value, dtype.type(0))))) / 2
+    if abs(value) >= Fraction(float(max_value)) + half_ulp:
+        return dtype.type(math.inf if value > 0 else -math.inf)
+    candidate = dtype.type(max(min(candidate, float(max_value)), -float(max_value)))
+    neighbours = [candidate] + [numpy.nextafter(candidate, dtype.type(direction)) for direction in (-numpy.inf, numpy.inf)]
+    uint_dtype = numpy.dtype("uint{}".format(dtype.itemsize * 8))
+    return min(
+        (x for x in neighbours if numpy.isfinite(x)),
+        key=lambda x: (abs(Fraction(float(x)) - value), int(x.view(uint_dtype)) & 1))
+
+def reference_fma(a, b, c, dtype):
+    """ correctly rounded a * b + c (finite operands) """
+    exact_value = Fraction(float(a)) * Fraction(float(b)) + Fraction(float(c))
+    if exact_value == 0:
+        # sign of an exact zero sum follows IEEE rules (a * b is exact)
+        return dtype.type(float(a) * float(b) + float(c))
+    result = round_fraction(exact_value, dtype)
+    if result == 0:
+        return dtype.type(0.0 if exact_value > 0 else -0.0)
+    return result
+
+def same_encoding(x, y):
+    x = numpy.asarray(x)
+    y = numpy.asarray(y)
+    return x.dtype == y.dtype and x.tobytes() == y.tobytes()
+
+
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class UT_NumpyEval(unittest.TestCase):
+    def test_fma_binary64(self):
+        """ binary64 fma is correctly rounded on random operands """
+        rng = random.Random(7)
+        dtype = numpy.dtype(numpy.float64)
+        a, b, c = (numpy.array([random_float(rng) for _ in range(RANDOM_TEST_NUM)]) for _ in range(3))
+        with numpy.errstate(all="ignore"):
+            result = numpy_fma(a, b, c, dtype)
+        for index in range(RANDOM_TEST_NUM):
+            expected = reference_fma(a[index], b[index], c[index], dtype)
+            self.assertTrue(same_encoding(result[index], expected), (a[index], b[index], c[index], result[index], expected))
+
+    def test_fma_binary32(self):
+        """ binary32 fma (binary64 round-to-odd sum) is correctly rounded """
+        rng = random.Random(11)
+        dtype = numpy.dtype(numpy.float32)
+        operands = []
+        for _ in range(3):
+            values = [numpy.float32(rng.uniform(1.0, 2.0) * 2.0**rng.randrange(-149, 128)) * rng.choice([-1, 1]) for _ in range(RANDOM_TEST_NUM)]
+            operands.append(numpy.array(values, dtype=dtype))
+        with numpy.errstate(all="ignore"):
+            result = numpy_fma(*operands, dtype)
+        for index in range(RANDOM_TEST_NUM):
+            a, b, c = (op[index] for op in operands)
+            if not (numpy.isfinite(a) and numpy.isfinite(b) and numpy.isfinite(c)):
+                continue
+            expected = reference_fma(a, b, c, dtype)
+            self.assertTrue(same_encoding(result[index], expected), (a, b, c, result[index], expected))
+
+    def test_fma_underflowing_product(self):
+        """ non-zero products which underflow to zero keep their sign and
+            their contribution to ties """
+        dtype = numpy.dtype(numpy.float64)
+        a = numpy.array([2.0**-600, -2.0**-600, 2.0**-600, 2.0**-500, 2.0**-500])
+        b = numpy.array([-2.0**-600, 2.0**-600, -2.0**-600, 2.0**-575, -2.0**-575])
+        c = numpy.array([0.0, 0.0, -0.0, 2.0**-1074, 3 * 2.0**-1074])
+        expected = numpy.array([-0.0, -0.0, -0.0, 2.0**-1073, 2.0**-1073])
+        with numpy.errstate(all="ignore"):
+            result = numpy_fma(a, b, c, dtype)
+        self.assertTrue(same_encoding(result, expected), result)
+
+    def test_fma_zero_product(self):
+        """ exact zero products follow IEEE signed zero rules """
+        dtype = numpy.dtype(numpy.float64)
+        a = numpy.array([0.0, -0.0, 0.0, 1.0])
+        b = numpy.array([-1.0, 1.0, 1.0, -0.0])
+        c = numpy.array([0.0, -0.0, -0.0, -0.0])
+        expected = numpy.array([0.0, -0.0, 0.0, -0.0])
+        self.assertTrue(same_encoding(numpy_fma(a, b, c, dtype), expected))
+
+    def test_round_to_odd_sum(self):
+        """ inexact sums are rounded to the odd neighbour of the exact sum """
+        rng = random.Random(13)
+        for _ in range(RANDOM_TEST_NUM):
+            x = rng.uniform(-1.0, 1.0) * 2.0**rng.randrange(-60, 60)
+            y = rng.uniform(-1.0, 1.0) * 2.0**rng.randrange(-60, 60)
+            result = float(round_to_odd_sum(numpy.float64(x), numpy.float64(y)))
+            exact_value = Fraction(x) + Fraction(y)
+            if Fraction(result) != exact_value:
+                self.assertEqual(numpy.float64(result).view(numpy.uint64) & 1, 1)
+                lo, hi = sorted([result, math.nextafter(result, math.inf if Fraction(result) < exact_value else -math.inf)])
+                self.assertTrue(Fraction(lo) < exact_value < Fraction(hi))
+
+    def test_integer_rounding(self):
+        """ NearestInteger rounds ties to even, Trunc and float to integer
+            Conversion round towards zero """
+        vx = Variable("x", precision=ML_Binary64, var_type=Variable.Input)
+        x = numpy.array([0.5, 1.5, 2.5, -0.5, -1.5, 2.75, -2.75])
+        self.assertTrue(same_encoding(
+            evaluate_graph_numpy(NearestInteger(vx, precision=ML_Binary64), {vx: x}),
+            numpy.array([0.0, 2.0, 2.0, -0.0, -2.0, 3.0, -3.0])))
+        self.assertTrue(same_encoding(
+            evaluate_graph_numpy(Trunc(vx, precision=ML_Binary64), {vx: x}),
+            numpy.array([0.0, 1.0, 2.0, -0.0, -1.0, 2.0, -2.0])))
+        self.assertTrue(same_encoding(
+            evaluate_graph_numpy(NearestInteger(vx, precision=ML_Int32), {vx: x}),
+            numpy.array([0, 2, 2, 0, -2, 3, -3], dtype=numpy.int32)))
+        self.assertTrue(same_encoding(
+            evaluate_graph_numpy(Conversion(vx, precision=ML_Int32), {vx: x}),
+            numpy.array([0, 1, 2, 0, -1, 2, -2], dtype=numpy.int32)))
+
+
+if __name__ == '__main__':
+    unittest.main()
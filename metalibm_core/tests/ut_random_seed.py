@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for seeded (reproducible) random test inputs
+###############################################################################
+import unittest
+
+from metalibm_core.core.ml_formats import ML_Binary32
+from metalibm_core.core.ml_function import ML_FunctionBasis
+from metalibm_core.utility.ml_template import (
+    MetaFunctionArgTemplate, DefaultArgTemplate)
+
+
+class SeededFunction(ML_FunctionBasis):
+    """ meta-function only initialized with the state read by random
+        test input generation """
+    arity = 2
+
+    def __init__(self, seed, test_rng):
+        self.precision = ML_Binary32
+        self._input_precisions = None
+        self.seed = seed
+        self.test_rng = test_rng
+
+    def get_input_encodings(self, test_num):
+        return [
+            tuple(int(coding) for coding in ML_Binary32.encode_many(input_tuple))
+            for input_tuple in self.generate_rand_input_iterator(test_num, [None, None])]
+
+
+class UT_RandomSeed(unittest.TestCase):
+    def parse_args(self, arg_list):
+        return MetaFunctionArgTemplate(default_arg=DefaultArgTemplate).get_parser().parse_args(arg_list)
+
+    def test_seed_parsing(self):
+        self.assertEqual(self.parse_args(["--seed", "17"]).seed, 17)
+        self.assertIsNone(self.parse_args([]).seed)
+        with self.assertRaises(SystemExit):
+            self.parse_args(["--seed", "-1"])
+
+    def test_reproducible_inputs(self):
+        """ a given seed reproduces the same inputs with both generators,
+            different seeds (and inputs) get different values """
+        for test_rng in ["python", "numpy"]:
+            input_list = SeededFunction(17, test_rng).get_input_encodings(100)
+            self.assertEqual(len(input_list), 100)
+            self.assertEqual(SeededFunction(17, test_rng).get_input_encodings(100), input_list)
+            self.assertNotEqual(SeededFunction(18, test_rng).get_input_encodings(100), input_list)
+            self.assertNotEqual([lhs for lhs, _ in input_list], [rhs for _, rhs in input_list])
+
+    def test_numpy_input_columns(self):
+        """ encoding columns stored in input tables match the decoded
+            inputs used for numeric emulation """
+        function = SeededFunction(17, "numpy")
+        input_columns = function.generate_rand_input_columns(100, [None, None])
+        self.assertEqual(
+            list(zip(*[[int(coding) for coding in column] for column in input_columns])),
+            function.get_input_encodings(100))
+        self.assertIsNone(SeededFunction(17, "python").generate_rand_input_columns(100, [None, None]))
+
+
+if __name__ == '__main__':
+    unittest.main()
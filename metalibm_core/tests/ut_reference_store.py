@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for reference store keys
+###############################################################################
+import unittest
+
+import sollya
+
+from metalibm_core.utility.reference_store import ReferenceStore
+from metalibm_core.utility.approx_cache import sollya_key_str
+
+from metalibm_functions.ml_sincos import ML_SinCos
+from metalibm_functions.generic_log import ML_GenericLog
+from metalibm_functions.remquo import MetaRemQuo
+
+
+def build_function_with_constant(constant):
+    """ build a function whose code only differs by a constant """
+    return lambda x: x * constant
+
+
+class UT_ReferenceStore(unittest.TestCase):
+    def setUp(self):
+        # the store directory is not accessed when building keys
+        self.store = ReferenceStore(store_dir="ut_reference_store")
+
+    def get_key(self, meta_function):
+        return meta_function.get_reference_store_key(self.store)
+
+    def test_parameter_collision(self):
+        """ instances of the same meta-function whose emulation parameters
+            differ must not share reference values """
+        self.assertNotEqual(
+            self.get_key(ML_SinCos(ML_SinCos.get_default_args(sin_output=True))),
+            self.get_key(ML_SinCos(ML_SinCos.get_default_args(sin_output=False))))
+        self.assertNotEqual(
+            self.get_key(ML_GenericLog(ML_GenericLog.get_default_args(basis=sollya.parse("2")))),
+            self.get_key(ML_GenericLog(ML_GenericLog.get_default_args(basis=sollya.parse("10")))))
+        self.assertNotEqual(
+            self.get_key(MetaRemQuo(MetaRemQuo.get_default_args(mode="quotient"))),
+            self.get_key(MetaRemQuo(MetaRemQuo.get_default_args(mode="remainder"))))
+        self.assertNotEqual(
+            self.get_key(MetaRemQuo(MetaRemQuo.get_default_args(mode="quotient", quotient_size=3))),
+            self.get_key(MetaRemQuo(MetaRemQuo.get_default_args(mode="quotient", quotient_size=7))))
+
+    def test_same_parameters(self):
+        """ identical meta-function parameters build identical keys """
+        self.assertEqual(
+            self.get_key(ML_SinCos(ML_SinCos.get_default_args(sin_output=True))),
+            self.get_key(ML_SinCos(ML_SinCos.get_default_args(sin_output=True))))
+
+    def test_function_key(self):
+        """ function keys depend on code constants and captured values """
+        self.assertNotEqual(
+            sollya_key_str(lambda x: x * 2), sollya_key_str(lambda x: x * 3))
+        self.assertNotEqual(
+            sollya_key_str(build_function_with_constant(2)),
+            sollya_key_str(build_function_with_constant(3)))
+        self.assertEqual(
+            sollya_key_str(build_function_with_constant(sollya.parse("0x1.8p0"))),
+            sollya_key_str(build_function_with_constant(sollya.parse("0x1.8p0"))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for boundary extraction of stratified sampling
+###############################################################################
+import unittest
+
+from metalibm_core.core.ml_formats import ML_Binary32, ML_Bool
+from metalibm_core.core.ml_operations import (
+    Variable, Constant, Comparison, ConditionBlock, Return, Statement,
+    Abs, Negation, Multiplication, LogicalOr,
+)
+from metalibm_core.core.ml_table import ML_NewTable
+from metalibm_core.core.approximation import piecewise_evaluation_from_param
+from metalibm_core.core.stratified_sampling import (
+    extract_condition_boundaries, set_sampling_boundaries)
+
+
+def build_condition(lhs, value, specifier=Comparison.Greater):
+    return Comparison(lhs, Constant(value, precision=ML_Binary32), specifier=specifier, precision=ML_Bool)
+
+
+class UT_StratifiedSampling(unittest.TestCase):
+    def setUp(self):
+        self.vx = Variable("x", precision=ML_Binary32, var_type=Variable.Input)
+
+    def get_boundaries(self, condition):
+        scheme = Statement(
+            ConditionBlock(condition, Return(self.vx), Return(Negation(self.vx, precision=ML_Binary32))))
+        return extract_condition_boundaries(scheme, self.vx)
+
+    def test_direct_comparison(self):
+        self.assertEqual(self.get_boundaries(build_condition(self.vx, 88.0)), [88.0])
+
+    def test_abs_and_negation(self):
+        self.assertEqual(sorted(self.get_boundaries(build_condition(Abs(self.vx, precision=ML_Binary32), 2.0))), [-2.0, 2.0])
+        self.assertEqual(self.get_boundaries(build_condition(Negation(self.vx, precision=ML_Binary32), 3.0)), [-3.0])
+
+    def test_logical_combination(self):
+        condition = LogicalOr(build_condition(self.vx, 1.0), build_condition(self.vx, -1.0, Comparison.Less), precision=ML_Bool)
+        self.assertEqual(sorted(self.get_boundaries(condition)), [-1.0, 1.0])
+
+    def test_derived_value_not_detected(self):
+        """ thresholds applied to values derived from the input are not
+            extracted (documented limitation) """
+        reduced = Multiplication(self.vx, Constant(2.0, precision=ML_Binary32), precision=ML_Binary32)
+        self.assertEqual(self.get_boundaries(build_condition(reduced, 4.0)), [])
+
+    def test_recorded_boundaries(self):
+        """ boundaries recorded on a node are only extracted for their
+            variable """
+        vy = Variable("y", precision=ML_Binary32, var_type=Variable.Local)
+        node_x = Multiplication(self.vx, self.vx, precision=ML_Binary32)
+        node_y = Multiplication(vy, vy, precision=ML_Binary32)
+        set_sampling_boundaries(node_x, self.vx, [0.5, 1.5])
+        set_sampling_boundaries(node_y, vy, [7.0])
+        scheme = Statement(Return(node_x), Return(node_y))
+        self.assertEqual(extract_condition_boundaries(scheme, self.vx), [0.5, 1.5])
+        self.assertEqual(extract_condition_boundaries(scheme, vy), [7.0])
+        # recorded boundaries are kept by copies
+        self.assertEqual(extract_condition_boundaries(scheme.copy({self.vx: self.vx}), self.vx), [0.5, 1.5])
+
+    def test_piecewise_boundaries(self):
+        """ the sub-interval selection points of a piecewise evaluation
+            are extracted """
+        coeff_table = ML_NewTable(dimensions=[4, 2], storage_precision=ML_Binary32)
+        scheme = piecewise_evaluation_from_param(self.vx, ML_Binary32, 0.0, 2.0, 1, 4, 0.5, coeff_table)
+        self.assertEqual(sorted(extract_condition_boundaries(scheme, self.vx)), [0.0, 0.25, 0.75, 1.25, 2.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
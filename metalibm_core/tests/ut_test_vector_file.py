@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:              Oct   16th, 2026
+# last-modified:        Oct   16th, 2026
+#
+# desciprition:    unit-tests for binary test-vector files
+###############################################################################
+import os
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+from metalibm_core.core.ml_formats import ML_Binary32, ML_Binary64
+from metalibm_core.utility.test_vector_file import (
+    TestVectorFileWriter, get_test_file_identity, check_test_file
+)
+
+
+SUPPORT_LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "support_lib")
+
+# C program opening a test file with the identity given on command line
+OPEN_TEST_PROGRAM = """
+#include <ml_test_file.h>
+int main(int argc, char** argv) {
+    int status = ml_test_file_open(argv[1], argv[2], 1, 1, 8, 4);
+    if (!status) ml_test_file_close();
+    return status;
+}
+"""
+
+
+class UT_TestVectorFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "test.tv")
+        self.identity = get_test_file_identity("ml_exp.ML_Exponential", [], ML_Binary32)
+        writer = TestVectorFileWriter(self.path, self.identity, [ML_Binary32], ML_Binary32, 1, 3, block_size=4)
+        writer.write([[1.0, 2.0, 3.0]], [(1.0,), (2.0,), (3.0,)])
+        writer.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_reusable(self):
+        self.assertIsNone(check_test_file(self.path, self.identity, [ML_Binary32], ML_Binary32, 1, 4))
+
+    def test_other_function(self):
+        other_identity = get_test_file_identity("ml_log.ML_Log", [], ML_Binary32)
+        self.assertNotEqual(other_identity, self.identity)
+        self.assertIsNotNone(check_test_file(self.path, other_identity, [ML_Binary32], ML_Binary32, 1, 4))
+
+    def test_other_formats(self):
+        self.assertIsNotNone(check_test_file(self.path, self.identity, [ML_Binary64], ML_Binary64, 1, 4))
+        self.assertIsNotNone(check_test_file(self.path, self.identity, [ML_Binary32, ML_Binary32], ML_Binary32, 1, 4))
+        self.assertIsNotNone(check_test_file(self.path, self.identity, [ML_Binary32], ML_Binary32, 2, 4))
+
+    def test_block_size(self):
+        self.assertIsNotNone(check_test_file(self.path, self.identity, [ML_Binary32], ML_Binary32, 1, 2))
+
+    def test_invalid_file(self):
+        with open(self.path, "r+b") as stream:
+            stream.write(b"MLTESTV1")
+        self.assertIsNotNone(check_test_file(self.path, self.identity, [ML_Binary32], ML_Binary32, 1, 4))
+        self.assertIsNotNone(check_test_file(self.path + ".none", self.identity, [ML_Binary32], ML_Binary32, 1, 4))
+
+    @unittest.skipUnless(shutil.which("cc"), "C compiler required")
+    def test_c_header(self):
+        """ the C reader accepts the file for its identity only """
+        source_path = os.path.join(self.tmp_dir, "open_test.c")
+        bin_path = os.path.join(self.tmp_dir, "open_test")
+        with open(source_path, "w") as source_file:
+            source_file.write(OPEN_TEST_PROGRAM)
+        subprocess.check_call(["cc", "-I", SUPPORT_LIB_DIR, "-o", bin_path, source_path])
+        self.assertEqual(subprocess.call([bin_path, self.path, self.identity], stdout=subprocess.DEVNULL), 0)
+        other_identity = get_test_file_identity("ml_log.ML_Log", [], ML_Binary32)
+        self.assertNotEqual(subprocess.call([bin_path, self.path, other_identity], stdout=subprocess.DEVNULL), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: persistent content-addressed cache for polynomial
+#              approximation results (fpminimax, supnorm, guessdegree)
+###############################################################################
+
+import os
+import json
+import inspect
+import hashlib
+
+import sollya
+
+from metalibm_core.core.polynomials import Polynomial
+from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.axf_utils import AXF_SimplePolyApprox
+from metalibm_core.utility.build_utils import METALIBM_TMP_DIR
+from metalibm_core.utility.cache_utils import atomic_write, evict_least_recently_used
+
+# custom log level for approximation cache
+LOG_APPROX_CACHE = Log.LogLevel("Info", "approx_cache")
+
+# version of the cache entry layout, must be incremented each time
+# the layout changes to invalidate previous entries
+APPROX_CACHE_VERSION = 1
+
+
+def get_code_key(code):
+    """ hash of a python code object: bytecode, names and constants
+        (nested code objects are hashed recursively) """
+    code_hash = hashlib.sha256(code.co_code + repr(code.co_names).encode())
+    for const in code.co_consts:
+        code_hash.update((get_code_key(const) if inspect.iscode(const) else repr(const)).encode())
+    return code_hash.hexdigest()
+
+def sollya_key_str(value):
+    """ convert value (SollyaObject, int, list, ...) to a string which
+        represents it exactly (SollyaObject are displayed in hexadecimal) """
+    if isinstance(value, (list, tuple)):
+        return "[{}]".format(",".join(sollya_key_str(v) for v in value))
+    elif hasattr(value, "__code__"):
+        # python function (e.g. error_function), its bytecode (including
+        # constants) is used as key so any change in its definition
+        # invalidates the entry, values captured by the function are part
+        # of the key
+        closure = [cell.cell_contents for cell in (value.__closure__ or ())]
+        return "fct({},{})".format(
+            get_code_key(value.__code__),
+            sollya_key_str([
+                # captured functions are only keyed by their code (avoiding
+                # recursion through self-referencing closures)
+                "fct({})".format(get_code_key(captured.__code__)) if hasattr(captured, "__code__") else captured
+                for captured in closure]))
+    old_display = sollya.settings.display
+    sollya.settings.display = sollya.hexadecimal
+    result = str(value)
+    sollya.settings.display = old_display
+    return result
+
+
+class ApproxCache:
+    """ on-disk cache of approximation results, each entry is stored
+        in its own JSON file (named after the entry key) and the total
+        cache size is bounded (least recently used entries are evicted) """
+    DEFAULT_MAX_SIZE = 64 * 2**20
+
+    def __init__(self, cache_dir=None, max_size=None):
+        self.cache_dir = os.path.join(METALIBM_TMP_DIR, "approx_cache") if cache_dir is None else cache_dir
+        self.max_size = self.DEFAULT_MAX_SIZE if max_size is None else max_size
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def get_key(self, *key_elements):
+        """ build a content-addressed key from a list of elements
+            (function expression, degree list, formats, interval, ...) """
+        key_str = "|".join(
+            [str(APPROX_CACHE_VERSION), sollya_key_str(sollya.settings.prec)] +
+            [sollya_key_str(elt) for elt in key_elements]
+        )
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+    def get_entry_path(self, key):
+        return os.path.join(self.cache_dir, "{}.json".format(key))
+
+    def load(self, key):
+        """ return the dict stored for key or None if no entry exists """
+        entry_path = self.get_entry_path(key)
+        try:
+            with open(entry_path, "r") as entry_stream:
+                entry = json.load(entry_stream)
+        except (IOError, OSError, ValueError):
+            self.miss_count += 1
+            Log.report(LOG_APPROX_CACHE, "approx cache miss {} (hits={}, misses={})", key, self.hit_count, self.miss_count)
+            return None
+        # updating access time to implement LRU eviction
+        os.utime(entry_path, None)
+        self.hit_count += 1
+        Log.report(LOG_APPROX_CACHE, "approx cache hit {} (hits={}, misses={})", key, self.hit_count, self.miss_count)
+        return entry
+
+    def store(self, key, entry):
+        """ store the dict entry under key and evict older entries if
+            the cache size exceeds its bound """
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        with atomic_write(self.get_entry_path(key)) as entry_stream:
+            json.dump(entry, entry_stream, sort_keys=True)
+        self.evict()
+
+    def evict(self):
+        """ remove least recently used entries until the cache size
+            is below self.max_size """
+        evict_least_recently_used(self.cache_dir, self.max_size, suffix=".json")
+
+    def load_poly_approx(self, key):
+        """ return the pair (Polynomial, approx_error) stored under key or
+            None. approx_error is None if it was not stored """
+        entry = self.load(key)
+        if entry is None:
+            return None
+        axf_approx = AXF_SimplePolyApprox.deserialize_from_dict(entry["approx"])
+        approx_error = sollya.parse(axf_approx.approx_error) if entry["with_error"] else None
+        # JSON keys are strings (sorted as strings by store), coefficients
+        # are rebuilt in increasing degree order so that the polynomial is
+        # identical to the uncached one (including its evaluation order)
+        coeff_map = axf_approx.poly.coeff_map
+        poly = Polynomial(dict(
+            (index, sollya.parse(coeff_map[index])) for index in sorted(coeff_map)))
+        return poly, approx_error
+
+    def store_poly_approx(self, key, poly, function, degree_list, format_list,
+                          interval, absolute=True, approx_error=None):
+        """ store polynomial approximation poly (and optionnaly its
+            approximation error) under key, using AXF serialization """
+        old_display = sollya.settings.display
+        sollya.settings.display = sollya.hexadecimal
+        axf_approx = AXF_SimplePolyApprox(
+            poly, function, degree_list, format_list, interval,
+            absolute=absolute, approx_error=approx_error)
+        sollya.settings.display = old_display
+        self.store(key, {
+            "approx": axf_approx.serialize_to_dict(),
+            "with_error": not approx_error is None,
+        })
+
+    def get_stats(self):
+        """ return a dict of cache statistics """
+        return {"hit": self.hit_count, "miss": self.miss_count}
+
+    def load_degree(self, key):
+        """ return the degree stored under key (or None) """
+        entry = self.load(key)
+        return None if entry is None else entry["degree"]
+
+    def store_degree(self, key, degree):
+        self.store(key, {"degree": int(degree)})
+
+
+# global approximation cache (None when disabled)
+APPROX_CACHE = None
+
+def enable_approx_cache(max_size=None, cache_dir=None):
+    """ enable the global approximation cache """
+    global APPROX_CACHE
+    APPROX_CACHE = ApproxCache(cache_dir=cache_dir, max_size=max_size)
+    return APPROX_CACHE
+
+def get_approx_cache():
+    """ return the global approximation cache or None if disabled """
+    return APPROX_CACHE
+
+
+def cached_guessdegree(function, interval, eps):
+    """ memoized version of sollya.guessdegree, returns the integer upper
+        bound of the guessed degree range """
+    approx_cache = get_approx_cache()
+    if approx_cache is None:
+        return int(sollya.sup(sollya.guessdegree(function, interval, eps)))
+    key = approx_cache.get_key("guessdegree", function, interval, eps)
+    degree = approx_cache.load_degree(key)
+    if degree is None:
+        degree = int(sollya.sup(sollya.guessdegree(function, interval, eps)))
+        approx_cache.store_degree(key, degree)
+    return degree
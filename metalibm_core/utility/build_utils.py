@@ -38,12 +38,20 @@ import hashlib
 import subprocess
 import os
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 
 from metalibm_core.core.ml_formats import (
     ML_Binary32, ML_Binary64,
     ML_Int32, ML_Int64, ML_UInt32, ML_UInt64,
 )
+from metalibm_core.core.ml_complex_formats import ML_Pointer_Format
 from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.cache_utils import atomic_copy, evict_least_recently_used
 
 
 METALIBM_TMP_DIR = os.path.join(".", ".mltmp")
@@ -68,6 +76,8 @@ def get_cmd_stdout(cmd):
 
 def get_ctype_translate(precision):
     """ translate a Metalibm format object to its ctypes equivalent """
+    if isinstance(precision, ML_Pointer_Format):
+        return ctypes.POINTER(get_ctype_translate(precision.get_data_precision()))
     return {
         ML_Binary64: ctypes.c_double,
         ML_Binary32: ctypes.c_float,
@@ -78,6 +88,19 @@ def get_ctype_translate(precision):
     }[precision]
 
 
+def is_ctype_supported(precision):
+    """ predicate testing if get_ctype_translate supports precision """
+    try:
+        get_ctype_translate(precision)
+    except KeyError:
+        return False
+    return True
+
+def get_array_wrapper_name(function_name):
+    """ name of the array wrapper generated for function_name """
+    return "{}_array".format(function_name)
+
+
 def adapt_ctypes_wrapper_to_code_function(wrapper, code_function):
     """ Adapt a ctypes' function wrapper to match code_function prototype """
     wrapper.restype = get_ctype_translate(code_function.get_output_format())
@@ -121,6 +144,33 @@ class LoadedBinary:
         adapt_ctypes_wrapper_to_code_function(fct_handle, code_function)
         return fct_handle 
 
+    def call_array(self, function_name, *input_arrays):
+        """ evaluate function_name on every element of input_arrays (numpy
+            arrays or scalars, broadcast together) through a single call to
+            its array wrapper, return the numpy array of results """
+        if not numpy_available:
+            Log.report(Log.Error, "numpy is required by LoadedBinary.call_array")
+        wrapper_name = get_array_wrapper_name(function_name)
+        code_function = self.binary_file.source_object.function_list.get_code_function_by_name(wrapper_name)
+        if code_function is None:
+            Log.report(Log.Error, "no array wrapper {} in binary (generated with --array-wrapper)", wrapper_name)
+        # wrapper prototype: (size, input pointers..., output pointer)
+        pointer_args = code_function.arg_list[1:]
+        if len(pointer_args) != len(input_arrays) + 1:
+            Log.report(Log.Error, "{} expects {} input array(s), {} provided", function_name, len(pointer_args) - 1, len(input_arrays))
+        dtype_list = [
+            numpy.dtype(get_ctype_translate(arg.get_precision().get_data_precision()))
+            for arg in pointer_args]
+        input_arrays = numpy.broadcast_arrays(*(
+            numpy.asarray(array, dtype=dtype) for array, dtype in zip(input_arrays, dtype_list)))
+        shape = input_arrays[0].shape if input_arrays else ()
+        input_arrays = [numpy.ascontiguousarray(array).ravel() for array in input_arrays]
+        output_array = numpy.empty(int(numpy.prod(shape)), dtype=dtype_list[-1])
+        wrapper = self.get_function_handle(wrapper_name)
+        wrapper(output_array.size, *(
+            array.ctypes.data_as(ctype) for array, ctype in zip(input_arrays + [output_array], wrapper.argtypes[1:])))
+        return output_array.reshape(shape)
+
 def sha256_file(filename):
     """ return the sha256 checksum of @p filename """
     BLOCKSIZE = 65536
@@ -132,6 +182,115 @@ def sha256_file(filename):
             buf = afile.read(BLOCKSIZE)
     return hasher.hexdigest()
 
+# custom log level for build cache
+LOG_BUILD_CACHE = Log.LogLevel("Info", "build_cache")
+
+# version of the build cache key layout, must be incremented each time
+# the key layout changes to invalidate previous entries
+BUILD_CACHE_VERSION = 1
+
+class BuildCache:
+    """ content-addressed cache of build results (object files, shared
+        objects and executables). Entries are keyed on the source file
+        content, the build command (compiler, options, library list),
+        the target and the content of metalibm's support library headers.
+        The total cache size is bounded, least recently used entries are
+        evicted first """
+    DEFAULT_MAX_SIZE = 256 * 2**20
+
+    def __init__(self, cache_dir=None, max_size=None):
+        self.cache_dir = os.path.join(METALIBM_TMP_DIR, "build_cache") if cache_dir is None else cache_dir
+        self.max_size = self.DEFAULT_MAX_SIZE if max_size is None else max_size
+        self.hit_count = 0
+        self.miss_count = 0
+        # memoized support library hash (per ML_SRC_DIR)
+        self._support_lib_hash = {}
+
+    def get_support_lib_hash(self, ML_SRC_DIR):
+        """ hash of every file of metalibm's support library (which can be
+            included by generated sources) """
+        if not ML_SRC_DIR in self._support_lib_hash:
+            hasher = hashlib.sha256()
+            support_lib_dir = os.path.join(ML_SRC_DIR, "metalibm_core", "support_lib")
+            for root, dirs, files in os.walk(support_lib_dir):
+                dirs.sort()
+                for filename in sorted(files):
+                    path = os.path.join(root, filename)
+                    hasher.update(path.encode())
+                    hasher.update(sha256_file(path).encode())
+            self._support_lib_hash[ML_SRC_DIR] = hasher.hexdigest()
+        return self._support_lib_hash[ML_SRC_DIR]
+
+    def get_key(self, path, target, shared_object, link, extra_build_opts, library_list):
+        """ build the cache key of a build request """
+        # source and binary paths are replaced by placeholders so that
+        # the same source built under a different name shares its entry
+        build_command = SourceFile.get_build_command(
+            "<source>", target, "<binary>", shared_object, link,
+            expand_env_var=True, extra_build_opts=extra_build_opts,
+            library_list=library_list)
+        key_str = "|".join([
+            str(BUILD_CACHE_VERSION),
+            sha256_file(path),
+            build_command,
+            target.__class__.__name__,
+            ",".join(library_list),
+            self.get_support_lib_hash(os.environ["ML_SRC_DIR"]),
+        ])
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+    def get_entry_path(self, key):
+        return os.path.join(self.cache_dir, "{}.bin".format(key))
+
+    def load(self, key, bin_name):
+        """ copy the build result stored under key to bin_name, return
+            True on cache hit and False on miss """
+        entry_path = self.get_entry_path(key)
+        if not os.path.isfile(entry_path):
+            self.miss_count += 1
+            Log.report(LOG_BUILD_CACHE, "build cache miss {} (hits={}, misses={})", key, self.hit_count, self.miss_count)
+            return False
+        # copying through a temporary file, as bin_name may already be
+        # loaded (e.g. shared object loaded by a previous execution)
+        atomic_copy(entry_path, bin_name)
+        # updating access time to implement LRU eviction
+        os.utime(entry_path, None)
+        self.hit_count += 1
+        Log.report(LOG_BUILD_CACHE, "build cache hit {} (hits={}, misses={})", key, self.hit_count, self.miss_count)
+        return True
+
+    def store(self, key, bin_name):
+        """ store build result bin_name under key and evict older entries
+            if the cache size exceeds its bound """
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        atomic_copy(bin_name, self.get_entry_path(key))
+        self.evict()
+
+    def evict(self):
+        """ remove least recently used entries until the cache size
+            is below self.max_size """
+        evict_least_recently_used(self.cache_dir, self.max_size, suffix=".bin")
+
+    def get_stats(self):
+        """ return a dict of cache statistics """
+        return {"hit": self.hit_count, "miss": self.miss_count}
+
+
+# global build cache (None when disabled)
+BUILD_CACHE = None
+
+def enable_build_cache(max_size=None, cache_dir=None):
+    """ enable the global build cache """
+    global BUILD_CACHE
+    BUILD_CACHE = BuildCache(cache_dir=cache_dir, max_size=max_size)
+    return BUILD_CACHE
+
+def get_build_cache():
+    """ return the global build cache or None if disabled """
+    return BUILD_CACHE
+
+
 class SourceFile:
     def __init__(self, path, function_list, library_list=None):
         self.function_list = function_list
@@ -179,6 +338,13 @@ class SourceFile:
                 link: enable/disable link
             Return:
                 BinaryFile, str (error, stdout) """
+        bin_name = bin_name or sha256_file(self.path)
+        build_cache = get_build_cache()
+        if not build_cache is None:
+            cache_key = build_cache.get_key(self.path, target, shared_object, link, extra_build_opts, self.library_list)
+            if build_cache.load(cache_key, bin_name):
+                return BinaryFile(bin_name, self, shared_object=shared_object, library_deps=self.library_list)
+
         build_command = SourceFile.get_build_command(self.path, target, bin_name, shared_object, link, expand_env_var=True, extra_build_opts=extra_build_opts, library_list=self.library_list)
 
         Log.report(Log.Info, "Building source with command: {}".format(build_command))
@@ -187,6 +353,8 @@ class SourceFile:
         if build_result:
             return None
         else:
+            if not build_cache is None:
+                build_cache.store(cache_key, bin_name)
             return BinaryFile(bin_name, self, shared_object=shared_object, library_deps=self.library_list)
 
 
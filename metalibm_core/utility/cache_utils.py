@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: helpers shared by on-disk caches (atomic writes and least
+#              recently used eviction)
+###############################################################################
+
+import os
+import stat
+import shutil
+import contextlib
+
+
+def get_tmp_path(path):
+    """ temporary (per-process) path under which path is written before
+        being renamed """
+    return "{}.{}.tmp".format(path, os.getpid())
+
+@contextlib.contextmanager
+def atomic_write(path, mode="w"):
+    """ context manager opening a temporary file which is renamed to path
+        once the block completes, so that concurrent processes never read a
+        partially written path (the temporary file is removed if the block
+        raises) """
+    tmp_path = get_tmp_path(path)
+    try:
+        with open(tmp_path, mode) as stream:
+            yield stream
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def atomic_copy(src_path, dst_path):
+    """ copy src_path (content and permission bits) to dst_path
+        through atomic_write """
+    with open(src_path, "rb") as src_stream, atomic_write(dst_path, "wb") as dst_stream:
+        shutil.copyfileobj(src_stream, dst_stream)
+        os.chmod(dst_stream.fileno(), stat.S_IMODE(os.stat(src_path).st_mode))
+
+def get_directory_size(path):
+    """ total size (in bytes) of the files of directory path """
+    return sum(os.path.getsize(os.path.join(path, filename)) for filename in os.listdir(path))
+
+def evict_least_recently_used(cache_dir, max_size, suffix="", get_size=os.path.getsize, remove=os.remove):
+    """ remove the least recently used (oldest modification time) entries
+        of cache_dir (files or directories whose name ends with suffix)
+        until their total size, measured by get_size, is below max_size.
+        Entries are removed by remove, entries which disappear concurrently
+        are ignored """
+    entry_list = []
+    try:
+        name_list = os.listdir(cache_dir)
+    except OSError:
+        return
+    for name in name_list:
+        if not name.endswith(suffix) or name.endswith(".tmp"):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            entry_list.append((os.stat(path).st_mtime, get_size(path), path))
+        except OSError:
+            continue
+    cache_size = sum(size for _, size, _ in entry_list)
+    for _, size, path in sorted(entry_list):
+        if cache_size <= max_size:
+            break
+        try:
+            remove(path)
+        except OSError:
+            pass
+        cache_size -= size
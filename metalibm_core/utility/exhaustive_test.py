@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: native multi-threaded harness sweeping every encoding of a
+#              one-input (binary32, binary16 or bfloat16) function and
+#              comparing results against a libm or file reference
+###############################################################################
+
+import os
+import re
+import string
+import struct
+
+from metalibm_core.core.ml_formats import (
+    ML_Binary16, ML_Binary32, ML_Binary64, BFloat16, BFloat16_Base,
+)
+from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.build_utils import get_cmd_stdout
+
+
+## input formats supported by the exhaustive harness
+EXHAUSTIVE_INPUT_FORMATS = [ML_Binary32, ML_Binary16, BFloat16, BFloat16_Base]
+## output formats supported by the exhaustive harness
+EXHAUSTIVE_OUTPUT_FORMATS = EXHAUSTIVE_INPUT_FORMATS + [ML_Binary64]
+
+# margin (in ulps) added to the error bound when the reference is a
+# binary64 libm function (which is not exact)
+LIBM_REFERENCE_ULP_SLACK = 2.0**-20
+
+
+def is_exhaustive_format(precision, format_list):
+    return any(precision is fmt for fmt in format_list)
+
+def get_uint_c_type(bit_size):
+    return "uint{}_t".format(bit_size)
+
+
+class ExhaustiveReference:
+    """ reference of an exhaustive test, either a binary64 libm function
+        (libm:<name>) or a file of output encodings (file:<path>) """
+    Libm = "libm"
+    File = "file"
+
+    def __init__(self, kind, value):
+        self.kind = kind
+        self.value = value
+
+    @staticmethod
+    def parse(ref_str):
+        """ parse a "libm:<name>" or "file:<path>" reference string """
+        kind, sep, value = ref_str.partition(":")
+        if not sep or not kind in (ExhaustiveReference.Libm, ExhaustiveReference.File) or not value:
+            Log.report(Log.Error, "invalid exhaustive reference {}, expecting libm:<function> or file:<path>", ref_str)
+        return ExhaustiveReference(kind, value)
+
+    def __str__(self):
+        return "{}:{}".format(self.kind, self.value)
+
+
+def parse_encoding_range(range_str, bit_size):
+    """ parse an inclusive "LO:HI" encoding range (decimal or hexadecimal
+        integers), None selects every encoding of a bit_size-bit format """
+    if range_str is None:
+        return 0, 2**bit_size - 1
+    match = re.match(r"^\s*(\w+)\s*:\s*(\w+)\s*$", range_str)
+    if match is None:
+        Log.report(Log.Error, "invalid exhaustive test range {}, expecting LO:HI", range_str)
+    lo, hi = (int(bound, 0) for bound in match.groups())
+    if not 0 <= lo <= hi < 2**bit_size:
+        Log.report(Log.Error, "invalid exhaustive test range {}: bounds must verify 0 <= LO <= HI < 2**{}", range_str, bit_size)
+    return lo, hi
+
+
+EXHAUSTIVE_HARNESS_TEMPLATE = string.Template("""\
+/* exhaustive test harness for $function_name (generated by metalibm) */
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdint.h>
+#include <string.h>
+#include <math.h>
+#include <pthread.h>
+#include <fcntl.h>
+#include <unistd.h>
+
+$type_decl
+typedef $in_uint_type in_enc_t;
+typedef $out_uint_type out_enc_t;
+
+$out_c_type $function_name($in_c_type);
+$ref_decl
+
+#define IN_EXP_SIZE $in_exp_size
+#define IN_FIELD_SIZE $in_field_size
+#define OUT_EXP_SIZE $out_exp_size
+#define OUT_FIELD_SIZE $out_field_size
+#define USE_FILE_REFERENCE $use_file_reference
+#define ERROR_BOUND $error_bound
+/* value error bounds of degraded accuracies: a result within
+ * ABSOLUTE_BOUND + RELATIVE_BOUND * |reference| of the reference is valid */
+#define ABSOLUTE_BOUND $absolute_bound
+#define RELATIVE_BOUND $relative_bound
+/* number of encodings processed by a thread between two synchronizations */
+#define CHUNK_SIZE 65536
+/* maximal number of failures printed */
+#define MAX_FAILURE_REPORT 16
+
+/* decode a floating-point encoding to binary64 */
+static double decode_fp(uint64_t enc, int exp_size, int field_size) {
+    int sign = (enc >> (exp_size + field_size)) & 1;
+    int exp_field = (enc >> field_size) & ((1 << exp_size) - 1);
+    uint64_t mant = enc & ((UINT64_C(1) << field_size) - 1);
+    int bias = (1 << (exp_size - 1)) - 1;
+    double value;
+    if (exp_field == (1 << exp_size) - 1) value = mant ? NAN : INFINITY;
+    else if (exp_field == 0) value = ldexp((double) mant, 1 - bias - field_size);
+    else value = ldexp((double) (mant | (UINT64_C(1) << field_size)), exp_field - bias - field_size);
+    return sign ? -value : value;
+}
+
+/* error of result against reference, in ulps of the output format.
+ * infinities (and references beyond the output format range) are
+ * counted as 2^(emax+1) */
+static double ulp_error(double result, double reference) {
+    const int emax = (1 << (OUT_EXP_SIZE - 1)) - 1;
+    const int emin = 1 - emax;
+    const double overflow_value = ldexp(1.0, emax + 1);
+    int exp;
+    if (isnan(reference) || isnan(result)) return (isnan(reference) && isnan(result)) ? 0.0 : INFINITY;
+    if (result == reference) return 0.0;
+    if (isinf(result)) result = copysign(overflow_value, result);
+    if (fabs(reference) > overflow_value) reference = copysign(overflow_value, reference);
+    frexp(reference, &exp);
+    exp = (exp - 1 < emin) ? emin : exp - 1;
+    return fabs(result - reference) / ldexp(1.0, exp - OUT_FIELD_SIZE);
+}
+
+typedef struct {
+    uint64_t failures;
+    double max_error;
+    uint64_t max_error_input;
+} thread_result_t;
+
+static uint64_t range_lo, range_hi, next_chunk;
+#if USE_FILE_REFERENCE
+static int reference_fd = -1;
+#endif
+static uint64_t failure_reported = 0;
+static pthread_mutex_t report_mutex = PTHREAD_MUTEX_INITIALIZER;
+
+static void* sweep(void* arg) {
+    thread_result_t* result = (thread_result_t*) arg;
+    out_enc_t ref_buffer[CHUNK_SIZE];
+    (void) ref_buffer;
+    while (1) {
+        uint64_t lo = __sync_fetch_and_add(&next_chunk, CHUNK_SIZE);
+        if (lo > range_hi) break;
+        uint64_t hi = (range_hi - lo < CHUNK_SIZE - 1) ? range_hi : lo + CHUNK_SIZE - 1;
+#if USE_FILE_REFERENCE
+        size_t byte_size = (size_t) (hi - lo + 1) * sizeof(out_enc_t);
+        off_t offset = (off_t) (lo - range_lo) * sizeof(out_enc_t);
+        if (pread(reference_fd, ref_buffer, byte_size, offset) != (ssize_t) byte_size) {
+            fprintf(stderr, "error: unable to read reference values at offset %lld\\n", (long long) offset);
+            exit(2);
+        }
+#endif
+        for (uint64_t enc = lo; enc <= hi; ++enc) {
+            in_enc_t in_enc = (in_enc_t) enc;
+            $in_c_type x;
+            $out_c_type r;
+            out_enc_t r_enc;
+            memcpy(&x, &in_enc, sizeof(x));
+            r = $function_name(x);
+            memcpy(&r_enc, &r, sizeof(r_enc));
+#if USE_FILE_REFERENCE
+            double reference = decode_fp(ref_buffer[enc - lo], OUT_EXP_SIZE, OUT_FIELD_SIZE);
+#else
+            double reference = $ref_function(decode_fp(enc, IN_EXP_SIZE, IN_FIELD_SIZE));
+#endif
+            double r_value = decode_fp(r_enc, OUT_EXP_SIZE, OUT_FIELD_SIZE);
+            double error = ulp_error(r_value, reference);
+            if (error > result->max_error) {
+                result->max_error = error;
+                result->max_error_input = enc;
+            }
+            if (error > ERROR_BOUND && !(fabs(r_value - reference) <= ABSOLUTE_BOUND + RELATIVE_BOUND * fabs(reference))) {
+                result->failures++;
+                /* report slots are claimed atomically, the mutex is only
+                 * taken to print one of the first MAX_FAILURE_REPORT failures */
+                if (__atomic_load_n(&failure_reported, __ATOMIC_RELAXED) < MAX_FAILURE_REPORT &&
+                    __sync_fetch_and_add(&failure_reported, 1) < MAX_FAILURE_REPORT) {
+                    pthread_mutex_lock(&report_mutex);
+                    printf("failure: input=0x%llx result=0x%llx reference=%a error=%g ulp(s)\\n",
+                           (unsigned long long) enc, (unsigned long long) r_enc, reference, error);
+                    pthread_mutex_unlock(&report_mutex);
+                }
+            }
+        }
+    }
+    return NULL;
+}
+
+/* usage: <binary> [lo hi [thread_num [reference_file]]] */
+int main(int argc, char** argv) {
+    int thread_num = $thread_num;
+    const char* reference_path = "$reference_path";
+    range_lo = UINT64_C($range_lo);
+    range_hi = UINT64_C($range_hi);
+    if (argc > 2) {
+        range_lo = strtoull(argv[1], NULL, 0);
+        range_hi = strtoull(argv[2], NULL, 0);
+    }
+    if (argc > 3) thread_num = atoi(argv[3]);
+    if (argc > 4) reference_path = argv[4];
+    if (thread_num <= 0) thread_num = (int) sysconf(_SC_NPROCESSORS_ONLN);
+    if (thread_num <= 0) thread_num = 1;
+    next_chunk = range_lo;
+#if USE_FILE_REFERENCE
+    reference_fd = open(reference_path, O_RDONLY);
+    if (reference_fd < 0) {
+        fprintf(stderr, "error: unable to open reference file %s\\n", reference_path);
+        return 2;
+    }
+#else
+    (void) reference_path;
+#endif
+    pthread_t* threads = malloc(thread_num * sizeof(pthread_t));
+    thread_result_t* results = calloc(thread_num, sizeof(thread_result_t));
+    for (int i = 0; i < thread_num; ++i) {
+        /* any tested input updates the maximal error */
+        results[i].max_error = -1.0;
+        pthread_create(&threads[i], NULL, sweep, &results[i]);
+    }
+    uint64_t failures = 0;
+    double max_error = -1.0;
+    uint64_t max_error_input = range_lo;
+    for (int i = 0; i < thread_num; ++i) {
+        pthread_join(threads[i], NULL);
+        failures += results[i].failures;
+        if (results[i].max_error > max_error || (results[i].max_error == max_error && results[i].max_error_input < max_error_input)) {
+            max_error = results[i].max_error;
+            max_error_input = results[i].max_error_input;
+        }
+    }
+    printf("exhaustive test: tested=%llu failures=%llu max_error=%a max_error_input=0x%llx threads=%d\\n",
+           (unsigned long long) (range_hi - range_lo + 1), (unsigned long long) failures,
+           max_error, (unsigned long long) max_error_input, thread_num);
+    free(threads);
+    free(results);
+    return failures != 0;
+}
+""")
+
+
+def generate_exhaustive_harness(function_name, input_format, output_format,
+                                reference, error_bound, encoding_range,
+                                thread_num=0, absolute_bound=0.0,
+                                relative_bound=0.0):
+    """ return the C source of the exhaustive harness of function_name
+
+        :param reference: ExhaustiveReference object
+        :param error_bound: maximal error (in ulps of output_format) of a
+                            successful test
+        :param encoding_range: inclusive (lo, hi) input encoding range
+        :param thread_num: number of threads (0 for one per online CPU)
+        :param absolute_bound: results whose absolute error is at most
+                               absolute_bound + relative_bound * |reference|
+                               are also successful (degraded accuracies)
+        :param relative_bound: see absolute_bound """
+    in_base = input_format.get_base_format()
+    out_base = output_format.get_base_format()
+    type_decl = ""
+    if any(fmt is ML_Binary16 for fmt in (input_format, output_format)):
+        type_decl = "typedef _Float16 {};".format(ML_Binary16.get_name())
+    use_file_reference = reference.kind == ExhaustiveReference.File
+    if not use_file_reference:
+        error_bound += LIBM_REFERENCE_ULP_SLACK
+    return EXHAUSTIVE_HARNESS_TEMPLATE.substitute(
+        function_name=function_name,
+        type_decl=type_decl,
+        in_uint_type=get_uint_c_type(in_base.get_bit_size()),
+        out_uint_type=get_uint_c_type(out_base.get_bit_size()),
+        in_c_type=input_format.get_name(),
+        out_c_type=output_format.get_name(),
+        ref_decl="" if use_file_reference else "double {}(double);".format(reference.value),
+        ref_function="" if use_file_reference else reference.value,
+        in_exp_size=in_base.get_exponent_size(),
+        in_field_size=in_base.get_field_size(),
+        out_exp_size=out_base.get_exponent_size(),
+        out_field_size=out_base.get_field_size(),
+        use_file_reference=int(use_file_reference),
+        error_bound=repr(float(error_bound)),
+        absolute_bound=repr(float(absolute_bound)),
+        relative_bound=repr(float(relative_bound)),
+        thread_num=thread_num,
+        reference_path=reference.value if use_file_reference else "",
+        range_lo=encoding_range[0],
+        range_hi=encoding_range[1],
+    )
+
+
+def write_reference_file(path, encoding_list, output_format):
+    """ append the list of output encodings to the reference file path
+        (little-endian, one encoding of output_format size per input) """
+    code = {16: "H", 32: "I", 64: "Q"}[output_format.get_base_format().get_bit_size()]
+    with open(path, "ab") as reference_stream:
+        reference_stream.write(struct.pack("<{}{}".format(len(encoding_list), code), *encoding_list))
+
+
+def build_exhaustive_harness(target, harness_path, object_path, bin_name, extra_build_opts=[], library_list=[]):
+    """ compile harness_path and link it with object_path (the function
+        object file) into bin_name, return True on success """
+    ML_SRC_DIR = os.environ["ML_SRC_DIR"]
+    build_command = "{compiler} {options} {harness} {object_file} -o {bin_name} {libs} -lpthread -lm".format(
+        compiler=target.get_compiler(),
+        options=" ".join(["-O2"] + extra_build_opts + target.get_compilation_options(ML_SRC_DIR)),
+        harness=harness_path,
+        object_file=object_path,
+        bin_name=bin_name,
+        libs=" ".join("-l{}".format(lib) for lib in library_list))
+    Log.report(Log.Info, "Building exhaustive harness with command: {}", build_command)
+    build_result, build_stdout = get_cmd_stdout(build_command)
+    Log.report(Log.Verbose, "building stdout {}\n", build_stdout)
+    return not build_result
+
+
+def parse_exhaustive_result(stdout):
+    """ extract the summary of an exhaustive harness execution as a dict
+        (tested, failures, max_error, max_error_input) """
+    match = re.search(
+        r"exhaustive test: tested=(\d+) failures=(\d+) max_error=(\S+) max_error_input=(0x[0-9a-f]+)",
+        stdout)
+    if match is None:
+        return None
+    return {
+        "tested": int(match.group(1)),
+        "failures": int(match.group(2)),
+        "max_error": float.fromhex(match.group(3)),
+        "max_error_input": int(match.group(4), 16),
+    }
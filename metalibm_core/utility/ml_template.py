@@ -48,9 +48,7 @@ from .log_report import Log
 from ..core.ml_formats import *
 from ..core.precisions import *
 
-from ..code_generation.generic_processor import GenericProcessor
 from ..core.target import TargetRegister
-from ..targets import *
 from ..code_generation.code_constant import *
 from ..core.passes import Pass
 
@@ -61,20 +59,12 @@ from ..core.ml_hdl_format import (
     HdlVirtualFormat
 )
 
-from metalibm_core.code_generation.vhdl_backend import VHDLBackend
-
-# import optimization passes
-from metalibm_core.opt import *
-
 import metalibm_core.utility.gappa_utils as gappa_utils
-
-# populating target_map
-target_map = {}
-for target_name in TargetRegister.target_map:
-    target_map[target_name] = TargetRegister.get_target_by_name(
-        target_name
-    )(None)
-
+import metalibm_core.utility.parallel_utils as parallel_utils
+from metalibm_core.utility.build_utils import enable_build_cache
+from metalibm_core.utility.pass_profiler import enable_pass_profiler
+from metalibm_core.core.ml_table import TableEmissionMode, set_table_emission_mode
+from metalibm_core.core.float_interval import RangeEvalEngine, set_range_eval_engine
 
 precision_map = {
     # floating-point formats
@@ -237,15 +227,24 @@ def rng_mode_list_parser(list_str):
 def interval_list_parser(list_str):
     return list(map(interval_parser, list_str.split(":")))
 
+def seed_parser(seed_str):
+    """ string -> non-negative integer conversion (random generation
+        seed) """
+    seed = int(seed_str)
+    if seed < 0:
+        raise argparse.ArgumentTypeError("seed must be a non-negative integer, got {}".format(seed))
+    return seed
+
 ## return the Target Constructor associated with
 #  the string @p target_name
 def target_parser(target_name):
     """ string -> target conversion """
     try:
-        return target_map[target_name]
+        # target module is only imported when the target is selected
+        return TargetRegister.get_target_by_name(target_name)(None)
     except KeyError:
         print("available target(s):\n  -")
-        print("\n  -".join(target_map.keys()))
+        print("\n  -".join(TargetRegister.get_target_names()))
         raise
 # Instanciate a target object from its string description
 
@@ -270,6 +269,32 @@ def target_instanciate(target_name):
     return target_object
 
 
+class LazyTarget:
+    """ class attribute descriptor for default target: the target is only
+        imported and instanciated when the attribute is first read """
+    def __init__(self, target_name):
+        self.target_name = target_name
+
+    def __get__(self, obj, objtype=None):
+        return target_instanciate(self.target_name)
+
+def get_target_default(default_arg, attr_name):
+    """ return the command-line default value for the target attribute
+        attr_name of default_arg: the target name if the attribute is still
+        a LazyTarget (argparse only converts it if the option is not set),
+        else the attribute value """
+    if not isinstance(default_arg, type) and attr_name in vars(default_arg):
+        return getattr(default_arg, attr_name)
+    arg_class = default_arg if isinstance(default_arg, type) else type(default_arg)
+    for parent_class in arg_class.__mro__:
+        if attr_name in vars(parent_class):
+            class_value = vars(parent_class)[attr_name]
+            if isinstance(class_value, LazyTarget):
+                return class_value.target_name
+            break
+    return getattr(default_arg, attr_name)
+
+
 def language_parser(language_str):
     """ string -> Language object conversion """
     if not language_str in language_map:
@@ -306,6 +331,55 @@ class DisablingGappa(argparse.Action):
     def __call__(self, parser, namespace, values, option_string=None):
         gappa_utils.DISABLE_GAPPA = True
 
+class ApproxCacheAction(argparse.Action):
+    """ Custom action for command-line command --approx-cache """
+    def __call__(self, parser, namespace, values, option_string=None):
+        # local import to avoid circular dependency (through axf_utils)
+        from metalibm_core.utility.approx_cache import enable_approx_cache
+        max_size = None if values is None else int(values) * 2**20
+        enable_approx_cache(max_size=max_size)
+        setattr(namespace, self.dest, True)
+
+class ReferenceStoreAction(argparse.Action):
+    """ Custom action for command-line command --reference-store """
+    def __call__(self, parser, namespace, values, option_string=None):
+        # local import as numpy is only required when the store is enabled
+        from metalibm_core.utility.reference_store import enable_reference_store
+        max_size = None if values is None else int(values) * 2**20
+        enable_reference_store(max_size=max_size)
+        setattr(namespace, self.dest, True)
+
+class BuildCacheAction(argparse.Action):
+    """ Custom action for command-line command --build-cache """
+    def __call__(self, parser, namespace, values, option_string=None):
+        max_size = None if values is None else int(values) * 2**20
+        enable_build_cache(max_size=max_size)
+        setattr(namespace, self.dest, True)
+
+class PassProfileAction(argparse.Action):
+    """ Custom action for command-line command --pass-profile """
+    def __call__(self, parser, namespace, values, option_string=None):
+        enable_pass_profiler(values)
+        setattr(namespace, self.dest, values)
+
+class TableEmissionAction(argparse.Action):
+    """ Custom action for command-line command --table-emission """
+    def __call__(self, parser, namespace, values, option_string=None):
+        set_table_emission_mode(values)
+        setattr(namespace, self.dest, values)
+
+class RangeEvalAction(argparse.Action):
+    """ Custom action for command-line command --range-eval """
+    def __call__(self, parser, namespace, values, option_string=None):
+        set_range_eval_engine(values)
+        setattr(namespace, self.dest, values)
+
+class ApproxJobsAction(argparse.Action):
+    """ Custom action for command-line command --approx-jobs """
+    def __call__(self, parser, namespace, values, option_string=None):
+        parallel_utils.DEFAULT_APPROX_JOBS = values
+        setattr(namespace, self.dest, values)
+
 class VerboseAction(argparse.Action):
     def __init__(self, option_strings, dest, nargs=None, **kwargs):
         if nargs is not None:
@@ -325,10 +399,10 @@ class VerboseAction(argparse.Action):
 
 
 def list_targets():
-    for target_name in target_map:
+    for target_name in TargetRegister.get_target_names():
         print("{color_prefix}{name}{color_suffix}:\n  {target_object}".format(
             name=target_name,
-            target_object=target_map[target_name],
+            target_object=target_parser(target_name),
             color_prefix=BColors.OKGREEN,
             color_suffix=BColors.ENDC)
         )
@@ -454,7 +528,7 @@ class DefaultCommonArgTemplate:
     libm_compliant = False
     input_intervals = [Interval(-ml_infty, ml_infty)]
     # Optimization parameters
-    target = GenericProcessor.get_target_instance()
+    target = LazyTarget("generic")
     target_exec_options = None
     fuse_fma = False
     fast_path_extract = True
@@ -470,12 +544,29 @@ class DefaultCommonArgTemplate:
     auto_test_range = [Interval(0, 1)]
     auto_test_std = False
     value_test = []
+    # number of processes used to emulate test outputs
+    test_gen_jobs = 1
+    # test vector file streamed at runtime (None to embed test vectors)
+    test_file = None
+    # maximal number of test vectors per test file block
+    test_file_block_size = 4096
+    # only generate the test file
+    generate_test_file_only = False
+    # seed of random test input generation (None: not reproducible)
+    seed = None
+    # random test input generation engine (python or numpy)
+    test_rng = "python"
+    # random test input sampling (random or stratified)
+    test_sampling = "random"
     # enable max error computation
     compute_max_error = False
     break_error = False
     # bench properties
     bench_test_number = 0
     bench_loop_num = 10000
+    bench_repeat = 0
+    bench_warmup = 0
+    bench_latency = False
     bench_test_range = [Interval(0, 1)]
     bench_function_name = "undefined"
     headers = []
@@ -491,6 +582,19 @@ class DefaultCommonArgTemplate:
     # when execution is required, export binary into python runtime
     # rather than executing it into a sub-process
     embedded_binary = True
+    # generate an array wrapper of the function (for LoadedBinary.call_array)
+    array_wrapper = False
+    # exhaustive test (False: disabled, None: every input encoding,
+    # "LO:HI": inclusive input encoding range)
+    exhaustive_test = False
+    # number of exhaustive test threads (0: one per online CPU)
+    exhaustive_threads = 0
+    # exhaustive test reference (libm:<function> or file:<path>),
+    # None selects the binary64 libm function named after base_name
+    exhaustive_reference = None
+    # maximal error (in ulps) of exhaustive test, None selects the
+    # bound matching accuracy
+    exhaustive_max_ulp = None
     # cross-platform: build is done for and execution will be done on a remote machine (thus
     # using Target object's execute method is required)
     cross_platform = False
@@ -533,7 +637,7 @@ class DefaultEntityArgTemplate(DefaultArgTemplate):
     io_formats = None
     accuracy = ML_Faithful
     # Optimization parameters,
-    backend = VHDLBackend()
+    backend = LazyTarget("vhdl_backend")
     # Debug verbosity,
     debug = False
     language = VHDL_Code
@@ -650,6 +754,19 @@ class ML_CommonArgTemplate(object):
             type=(lambda s: [tuple(parse_with_error(v) for v in t.split(",")) for t in s.split(":")]),
             default=default_arg.value_test,
             help="give input value for tests as ':'-separated list of tuples")
+        self.parser.add_argument(
+            "--test-file", dest="test_file", action="store",
+            default=default_arg.test_file,
+            help="stream test inputs/expected values at runtime from the "
+                 "specified file (generated from auto-test options if it "
+                 "does not exist) rather than embedding them in the "
+                 "generated source")
+        self.parser.add_argument(
+            "--generate-test-file", dest="generate_test_file_only",
+            action="store_const", const=True,
+            default=default_arg.generate_test_file_only,
+            help="only generate the --test-file test vectors (from "
+                 "auto-test options) and exit")
 
         # enable the computation of eval error (if self-testing enabled)
         self.parser.add_argument(
@@ -675,6 +792,21 @@ class ML_CommonArgTemplate(object):
             type=rng_mode_list_parser, default=default_arg.bench_test_range,
             help="define the interval of input values to use during "
                   "performance bench")
+        self.parser.add_argument(
+            "--bench-repeat", dest="bench_repeat", action="store",
+            type=int, default=default_arg.bench_repeat,
+            help="run the bench loop nest N times and report min/median/p90/"
+                 "stddev of the per-repetition CPE (0: single global measure)")
+        self.parser.add_argument(
+            "--bench-warmup", dest="bench_warmup", action="store",
+            type=int, default=default_arg.bench_warmup,
+            help="number of untimed warm-up bench loops executed before "
+                 "timed repetitions")
+        self.parser.add_argument(
+            "--bench-latency", dest="bench_latency", action="store_const",
+            const=True, default=default_arg.bench_latency,
+            help="measure latency rather than throughput: each call input "
+                 "depends on the previous call result")
 
         self.parser.add_argument(
             "--verbose", dest="verbose_enable", action=VerboseAction,
@@ -698,6 +830,58 @@ class ML_CommonArgTemplate(object):
             nargs=0,
             help="disable gappa usage (even if installed)")
 
+        self.parser.add_argument(
+            "--approx-cache", dest="approx_cache",
+            action=ApproxCacheAction, nargs="?", default=False,
+            metavar="MAX_SIZE_MB",
+            help="enable persistent cache (in .mltmp) of polynomial "
+                 "approximation results, optionnal argument sets the "
+                 "cache size bound (in MB)")
+        self.parser.add_argument(
+            "--reference-store", dest="reference_store",
+            action=ReferenceStoreAction, nargs="?", default=False,
+            metavar="MAX_SIZE_MB",
+            help="enable persistent store (in .mltmp) of the emulated "
+                 "reference outputs of test cases (only inputs which were "
+                 "not emulated by a previous run are emulated), optionnal "
+                 "argument sets the store size bound (in MB)")
+        self.parser.add_argument(
+            "--build-cache", dest="build_cache",
+            action=BuildCacheAction, nargs="?", default=False,
+            metavar="MAX_SIZE_MB",
+            help="enable persistent cache (in .mltmp) of build results "
+                 "(binaries are reused when source, compiler, options, "
+                 "target and libraries are unchanged), optionnal argument "
+                 "sets the cache size bound (in MB)")
+        self.parser.add_argument(
+            "--pass-profile", dest="pass_profile",
+            action=PassProfileAction, default=None,
+            metavar="FILE",
+            help="profile (wall time, CPU time, node count and peak "
+                 "allocated memory) every pass execution and generation "
+                 "phase, results are written in JSON to FILE and as a "
+                 "text summary to FILE.txt")
+        self.parser.add_argument(
+            "--table-emission", dest="table_emission",
+            action=TableEmissionAction, default=TableEmissionMode.Initializer,
+            choices=[TableEmissionMode.Initializer, TableEmissionMode.Binary],
+            help="select how the content of large tables is emitted in C "
+                 "code: C initializer (default) or raw encodings in a "
+                 "binary side file included with .incbin")
+        self.parser.add_argument(
+            "--range-eval", dest="range_eval",
+            action=RangeEvalAction, default=RangeEvalEngine.Sollya,
+            choices=[RangeEvalEngine.Sollya, RangeEvalEngine.Float],
+            help="select the interval engine used to evaluate node ranges: "
+                 "sollya (default) or float (outward-rounded binary64 "
+                 "bounds, sollya is used when exact bounds do not fit "
+                 "in binary64)")
+        self.parser.add_argument(
+            "--approx-jobs", dest="approx_jobs",
+            action=ApproxJobsAction, type=int, default=1,
+            help="number of worker processes used to compute piecewise "
+                 "polynomial approximations (one per sub-interval)")
+
         self.parser.add_argument(
             "--exit-on-error", dest="exit_on_error",
             action=ExitOnErrorAction, const=True,
@@ -795,7 +979,7 @@ class ML_EntityArgTemplate(ML_CommonArgTemplate):
         )
         self.parser.add_argument("--backend", dest="backend", action="store",
             type=target_instanciate,
-            default=default_arg.backend, help="select generation backend"
+            default=get_target_default(default_arg, "backend"), help="select generation backend"
         )
         self.parser.add_argument(
             "--debug-file", dest="debug_file",
@@ -885,6 +1069,36 @@ class MetaFunctionArgTemplate(ML_CommonArgTemplate):
             help="define the range of input values to be used during "
                  "functional testing")
 
+        self.parser.add_argument(
+            "--test-gen-jobs", dest="test_gen_jobs", action="store",
+            type=int, default=default_arg.test_gen_jobs,
+            help="number of worker processes used to emulate expected "
+                 "outputs of auto-test (results are identical to the "
+                 "serial generation)")
+        self.parser.add_argument(
+            "--test-file-block", dest="test_file_block_size", action="store",
+            type=int, default=default_arg.test_file_block_size,
+            help="maximal number of test vectors per block of --test-file "
+                 "(size of the test wrapper buffers)")
+        self.parser.add_argument(
+            "--seed", dest="seed", action="store", type=seed_parser,
+            default=default_arg.seed,
+            help="seed (non-negative integer) of random test and bench "
+                 "inputs generation, makes generated inputs reproducible")
+        self.parser.add_argument(
+            "--test-rng", dest="test_rng", action="store",
+            choices=["python", "numpy"], default=default_arg.test_rng,
+            help="random test and bench inputs generator: python (one "
+                 "sollya value at a time) or numpy (arrays of encodings, "
+                 "binary16/32/64 inputs only)")
+        self.parser.add_argument(
+            "--test-sampling", dest="test_sampling", action="store",
+            choices=["random", "stratified"], default=default_arg.test_sampling,
+            help="random test inputs sampling: random (whole test range) "
+                 "or stratified (test budget split between boundaries of "
+                 "the implementation conditions, sub-intervals, signs and "
+                 "binades, floating-point inputs only)")
+
         self.parser.add_argument(
             "--libm", dest="libm_compliant", action="store_const",
             const=True, default=False,
@@ -895,6 +1109,40 @@ class MetaFunctionArgTemplate(ML_CommonArgTemplate):
             const=False, default=default_arg.embedded_binary,
             help="link test program as shared object to be embedded"
         )
+        self.parser.add_argument(
+            "--array-wrapper", dest="array_wrapper", action="store_const",
+            const=True, default=default_arg.array_wrapper,
+            help="generate <function>_array(n, inputs..., output) which "
+                 "evaluates the function on arrays (used by "
+                 "LoadedBinary.call_array)"
+        )
+        self.parser.add_argument(
+            "--exhaustive-test", dest="exhaustive_test", action="store",
+            nargs="?", const=None, default=default_arg.exhaustive_test,
+            metavar="LO:HI",
+            help="test the function on every input encoding (one-input "
+                 "binary32, binary16 or bfloat16 functions) with a native "
+                 "multi-threaded harness, optionnal argument restricts the "
+                 "test to an inclusive encoding range")
+        self.parser.add_argument(
+            "--exhaustive-threads", dest="exhaustive_threads", action="store",
+            type=int, default=default_arg.exhaustive_threads,
+            help="number of exhaustive test threads (default: one per "
+                 "online CPU)")
+        self.parser.add_argument(
+            "--exhaustive-reference", dest="exhaustive_reference", action="store",
+            default=default_arg.exhaustive_reference,
+            help="exhaustive test reference: libm:<function> (binary64 "
+                 "libm function, default libm:<base name>) or file:<path> "
+                 "(output encodings, generated by numerical emulation if "
+                 "the file does not exist)")
+        self.parser.add_argument(
+            "--exhaustive-max-ulp", dest="exhaustive_max_ulp", action="store",
+            type=float, default=default_arg.exhaustive_max_ulp,
+            help="maximal error (in ulps) of exhaustive test (default: "
+                 "derived from the accuracy: 0.5 for correctly rounded "
+                 "functions, 1 for faithful functions, the error goal "
+                 "for degraded accuracies)")
         self.parser.add_argument(
             "--cross-platform", dest="cross_platform", action="store_const",
             const=True, default=default_arg.cross_platform,
@@ -905,7 +1153,7 @@ class MetaFunctionArgTemplate(ML_CommonArgTemplate):
             default=default_arg.function_name, help="set function name"
         )
         self.parser.add_argument("--target", dest="target", action="store",
-            type=target_instanciate, default=default_arg.target,
+            type=target_instanciate, default=get_target_default(default_arg, "target"),
             help="select generation target"
         )
         def target_exec_options_parser(s):
@@ -970,5 +1218,5 @@ class MultiAryArgTemplate(MetaFunctionArgTemplate):
 
 
 if __name__ == "__main__":
-    for target_name in target_map:
-        print(target_name, ": ", target_map[target_name])
+    for target_name in TargetRegister.get_target_names():
+        print(target_name, ": ", target_parser(target_name))
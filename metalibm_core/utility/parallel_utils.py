@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: process-pool helpers to distribute python-side work
+#              (numerical emulation, approximation) over several workers
+###############################################################################
+
+import multiprocessing
+
+import sollya
+
+from metalibm_core.core.special_values import NumericValue
+from metalibm_core.utility.log_report import Log
+
+
+# default number of worker processes used to compute piecewise
+# approximations (can be set through --approx-jobs)
+DEFAULT_APPROX_JOBS = 1
+
+# task executed by forked workers, set by fork_map_chunks just before
+# the pool is created so it is inherited (and not pickled) by each worker
+_FORKED_TASK = None
+
+
+def _execute_forked_chunk(chunk_bounds):
+    """ worker-side entry point: execute the inherited task on one chunk """
+    lo, hi = chunk_bounds
+    return _FORKED_TASK(lo, hi)
+
+
+def split_in_chunks(total, jobs, chunk_size=None):
+    """ split the index range [0, total) in a list of (lo, hi) chunks
+
+        If chunk_size is not specified, the range is split so that each of
+        the @p jobs workers receives a few chunks (to balance load) """
+    if chunk_size is None:
+        chunk_size = max(1, total // (4 * max(1, jobs)))
+    return [(lo, min(total, lo + chunk_size)) for lo in range(0, total, chunk_size)]
+
+
+def fork_map_chunks(chunk_task, total, jobs, chunk_size=None):
+    """ evaluate chunk_task(lo, hi) on every chunk of [0, total) using
+        @p jobs forked worker processes
+
+        chunk_task is inherited through fork (it can be a closure over non
+        picklable objects, e.g. a meta-function instance) but its results
+        must be picklable.
+
+        :param chunk_task: callable(lo, hi) -> picklable chunk result
+        :param total: size of the index range to process
+        :param jobs: number of worker processes
+        :return: list of chunk results, in increasing chunk order """
+    global _FORKED_TASK
+    chunk_list = split_in_chunks(total, jobs, chunk_size)
+    if jobs <= 1 or len(chunk_list) <= 1:
+        return [chunk_task(lo, hi) for lo, hi in chunk_list]
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        Log.report(Log.Warning, "fork start method is not available, falling back to serial execution")
+        return [chunk_task(lo, hi) for lo, hi in chunk_list]
+    _FORKED_TASK = chunk_task
+    try:
+        with context.Pool(processes=jobs) as pool:
+            # Pool.map preserves chunk order which ensures a deterministic
+            # result whatever the scheduling of workers
+            return pool.map(_execute_forked_chunk, chunk_list, chunksize=1)
+    finally:
+        _FORKED_TASK = None
+
+
+def encode_numeric_value(value):
+    """ encode a numerical value so that it can be transmitted between
+        processes without loss of accuracy.
+        Returns None if value can not be encoded (e.g. special values) """
+    if isinstance(value, (int, float)):
+        return ("py", value)
+    elif isinstance(value, sollya.SollyaObject):
+        old_display = sollya.settings.display
+        sollya.settings.display = sollya.hexadecimal
+        encoded = str(value)
+        sollya.settings.display = old_display
+        return ("num" if isinstance(value, NumericValue) else "sollya", encoded)
+    return None
+
+
+def decode_numeric_value(encoded):
+    """ decode a value encoded by encode_numeric_value """
+    kind, payload = encoded
+    if kind == "py":
+        return payload
+    value = sollya.parse(payload)
+    return NumericValue(value) if kind == "num" else value
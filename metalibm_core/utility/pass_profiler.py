@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: profiling of pass executions and generation phases
+#              (wall time, CPU time, node count and peak allocated memory)
+###############################################################################
+
+import json
+import time
+import atexit
+import contextlib
+import tracemalloc
+
+from metalibm_core.utility.log_report import Log
+
+# custom log level for pass profiling summary
+LOG_PASS_PROFILE = Log.LogLevel("Info", "pass_profile")
+
+
+def count_graph_nodes(root):
+    """ return the number of nodes in the operation graph rooted at root """
+    # local import to avoid circular dependency (through core.passes)
+    from metalibm_core.core.ml_operations import is_leaf_node
+    from metalibm_core.opt.graph_traversal import iter_postorder
+    if root is None:
+        return 0
+    return sum(1 for _ in iter_postorder(root, is_leaf_node=is_leaf_node))
+
+def count_fct_group_nodes(fct_group):
+    """ return the total number of nodes in the schemes of every function
+        of fct_group """
+    node_count = [0]
+    def count_fct_nodes(group, fct):
+        node_count[0] += count_graph_nodes(fct.get_scheme())
+    fct_group.apply_to_all_functions(count_fct_nodes)
+    return node_count[0]
+
+
+class PassProfiler:
+    """ records wall time, CPU time, node counts (before and after) and
+        peak allocated memory of profiled sections (pass executions,
+        generation phases). Sections can be nested. """
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self.record_list = []
+        # stack of the peak traced memory (absolute) observed by
+        # the currently opened sections, innermost last
+        self.peak_stack = []
+
+    @contextlib.contextmanager
+    def profile(self, category, name, function_name=None, node_counter=None):
+        """ context manager profiling the execution of its body
+
+            :param category: kind of section (e.g. "pass", "phase")
+            :param name: section name (e.g. pass tag)
+            :param function_name: name of the function being processed (if any)
+            :param node_counter: function returning the number of nodes
+                                 processed by the section (or None) """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        record = {
+            "category": category,
+            "name": name,
+            "function": function_name,
+            "depth": len(self.peak_stack),
+        }
+        # records are listed in section start order
+        self.record_list.append(record)
+        record["nodes_before"] = None if node_counter is None else node_counter()
+        if self.peak_stack:
+            # saving the peak observed so far by the enclosing section
+            # before resetting it for this section
+            self.peak_stack[-1] = max(self.peak_stack[-1], tracemalloc.get_traced_memory()[1])
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        # else (python < 3.9) the peak can not be reset and the section
+        # peak is an over-approximation (peak since tracing start)
+        start_memory = tracemalloc.get_traced_memory()[0]
+        self.peak_stack.append(start_memory)
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_time"] = time.perf_counter() - start_wall
+            record["cpu_time"] = time.process_time() - start_cpu
+            peak = max(self.peak_stack.pop(), tracemalloc.get_traced_memory()[1])
+            record["peak_memory"] = peak - start_memory
+            if self.peak_stack:
+                self.peak_stack[-1] = max(self.peak_stack[-1], peak)
+            record["nodes_after"] = None if node_counter is None else node_counter()
+
+    def get_summary(self):
+        """ aggregate records by (category, name), sorted by decreasing
+            total wall time """
+        summary_map = {}
+        for record in self.record_list:
+            if not "wall_time" in record:
+                # section not terminated (e.g. process exit during the pass)
+                continue
+            key = (record["category"], record["name"])
+            if not key in summary_map:
+                summary_map[key] = {
+                    "category": record["category"], "name": record["name"],
+                    "count": 0, "wall_time": 0.0, "cpu_time": 0.0,
+                    "peak_memory": 0, "node_delta": 0,
+                }
+            entry = summary_map[key]
+            entry["count"] += 1
+            entry["wall_time"] += record["wall_time"]
+            entry["cpu_time"] += record["cpu_time"]
+            entry["peak_memory"] = max(entry["peak_memory"], record["peak_memory"])
+            if not record["nodes_before"] is None:
+                entry["node_delta"] += record["nodes_after"] - record["nodes_before"]
+        return sorted(summary_map.values(), key=lambda entry: entry["wall_time"], reverse=True)
+
+    def get_text_summary(self):
+        """ return the summary as a text table """
+        lines = ["{:<10} {:<32} {:>5} {:>10} {:>10} {:>12} {:>10}".format(
+            "category", "name", "count", "wall (s)", "cpu (s)", "peak (KiB)", "node delta")]
+        for entry in self.get_summary():
+            lines.append("{:<10} {:<32} {:>5} {:>10.3f} {:>10.3f} {:>12.1f} {:>10}".format(
+                entry["category"], entry["name"], entry["count"],
+                entry["wall_time"], entry["cpu_time"],
+                entry["peak_memory"] / 1024.0, entry["node_delta"]))
+        return "\n".join(lines) + "\n"
+
+    def dump(self):
+        """ write records and summary in JSON to self.output_file and the
+            text summary to self.output_file + ".txt" """
+        with open(self.output_file, "w") as output_stream:
+            json.dump({"records": self.record_list, "summary": self.get_summary()},
+                      output_stream, indent=2)
+        text_summary = self.get_text_summary()
+        with open(self.output_file + ".txt", "w") as output_stream:
+            output_stream.write(text_summary)
+        Log.report(LOG_PASS_PROFILE, "pass profile written to {}\n{}", self.output_file, text_summary)
+
+
+# global pass profiler (None when disabled)
+PASS_PROFILER = None
+
+def enable_pass_profiler(output_file):
+    """ enable the global pass profiler, its results are written to
+        output_file when the process exits """
+    global PASS_PROFILER
+    PASS_PROFILER = PassProfiler(output_file)
+    atexit.register(PASS_PROFILER.dump)
+    return PASS_PROFILER
+
+def get_pass_profiler():
+    """ return the global pass profiler or None if disabled """
+    return PASS_PROFILER
+
+@contextlib.contextmanager
+def null_section():
+    """ no-op context manager (contextlib.nullcontext requires python 3.7) """
+    yield None
+
+def profile_section(category, name, function_name=None, node_counter=None):
+    """ return a context manager profiling its body if the global pass
+        profiler is enabled (and doing nothing else) """
+    if PASS_PROFILER is None:
+        return null_section()
+    return PASS_PROFILER.profile(category, name, function_name=function_name, node_counter=node_counter)
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: persistent content-addressed store of reference output
+#              encodings (numerical emulation results) indexed by input
+#              encodings, with bulk numpy lookup and insertion
+###############################################################################
+
+import os
+import time
+import shutil
+import hashlib
+import itertools
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.build_utils import METALIBM_TMP_DIR
+from metalibm_core.utility.cache_utils import (
+    atomic_write, evict_least_recently_used, get_directory_size)
+from metalibm_core.utility.approx_cache import sollya_key_str
+
+# custom log level for reference store
+LOG_REFERENCE_STORE = Log.LogLevel("Info", "reference_store")
+
+# version of the store layout, must be incremented each time
+# the layout changes to invalidate previous entries
+REFERENCE_STORE_VERSION = 1
+
+# per-process counter used to build unique segment names
+SEGMENT_COUNTER = itertools.count()
+
+
+def get_row_keys(encodings):
+    """ convert the 2D array of unsigned encodings (one row per input tuple)
+        to a 1D array of fixed-size byte strings (big-endian encodings of
+        each row) whose ordering is the lexicographic ordering of rows """
+    encodings = numpy.asarray(encodings, dtype=numpy.uint64)
+    row_size = encodings.shape[1]
+    big_endian = numpy.ascontiguousarray(encodings.astype(">u8"))
+    return big_endian.view("S{}".format(8 * row_size)).reshape(encodings.shape[0])
+
+
+class ReferenceStore:
+    """ on-disk store of reference values: each key (e.g. a meta-function
+        with its emulation parameters and formats) owns a directory of
+        segments. A segment is a pair of .npy files: the sorted row keys of
+        the input encodings and the matching output encodings (one row of
+        uint64 per input tuple). Segments are memory-mapped during lookup,
+        each insertion adds a new segment and segments are merged once they
+        become too numerous. The total store size is bounded (least recently
+        used keys are evicted) """
+    DEFAULT_MAX_SIZE = 256 * 2**20
+    # number of segments of a key above which they are merged
+    MAX_SEGMENT_NUM = 16
+
+    def __init__(self, store_dir=None, max_size=None):
+        self.store_dir = os.path.join(METALIBM_TMP_DIR, "reference_store") if store_dir is None else store_dir
+        self.max_size = self.DEFAULT_MAX_SIZE if max_size is None else max_size
+        # number of input tuples found / not found in the store
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def get_key(self, *key_elements):
+        """ build a content-addressed key from a list of elements
+            (meta-function class, emulation parameters, formats, ...) """
+        key_str = "|".join(
+            [str(REFERENCE_STORE_VERSION)] +
+            [sollya_key_str(elt) for elt in key_elements]
+        )
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+    def get_key_dir(self, key):
+        return os.path.join(self.store_dir, key)
+
+    def get_segment_list(self, key):
+        """ return the list of (row key path, output path) of the
+            segments stored under key, oldest first """
+        key_dir = self.get_key_dir(key)
+        try:
+            filename_list = sorted(os.listdir(key_dir))
+        except OSError:
+            return []
+        return [
+            (os.path.join(key_dir, filename), os.path.join(key_dir, filename[:-len(".keys.npy")] + ".out.npy"))
+            for filename in filename_list if filename.endswith(".keys.npy")
+        ]
+
+    def load_segment(self, segment):
+        """ return the memory-mapped (row keys, outputs) arrays of segment
+            or None if it can not be read """
+        keys_path, out_path = segment
+        try:
+            return numpy.load(keys_path, mmap_mode="r"), numpy.load(out_path, mmap_mode="r")
+        except (IOError, OSError, ValueError):
+            return None
+
+    def lookup(self, key, input_encodings):
+        """ look for the rows of input_encodings (2D array of unsigned
+            encodings, one row per input tuple) under key.
+
+            :return: (found, output_encodings) where found is the boolean
+                     array of the rows present in the store and
+                     output_encodings the 2D uint64 array of their
+                     outputs (None if no row was found) """
+        input_keys = get_row_keys(input_encodings)
+        found = numpy.zeros(input_keys.shape, dtype=numpy.bool_)
+        output_encodings = None
+        for segment in self.get_segment_list(key):
+            segment_arrays = self.load_segment(segment)
+            if segment_arrays is None:
+                continue
+            segment_keys, segment_outputs = segment_arrays
+            if len(segment_keys) == 0 or segment_keys.dtype != input_keys.dtype:
+                continue
+            pending = numpy.nonzero(~found)[0]
+            if len(pending) == 0:
+                break
+            position = numpy.searchsorted(segment_keys, input_keys[pending])
+            clipped_position = numpy.minimum(position, len(segment_keys) - 1)
+            match = (position < len(segment_keys)) & (segment_keys[clipped_position] == input_keys[pending])
+            if output_encodings is None:
+                output_encodings = numpy.zeros((len(input_keys), segment_outputs.shape[1]), dtype=numpy.uint64)
+            output_encodings[pending[match]] = segment_outputs[clipped_position[match]]
+            found[pending[match]] = True
+        hit_num = int(numpy.count_nonzero(found))
+        self.hit_count += hit_num
+        self.miss_count += len(found) - hit_num
+        if hit_num:
+            # updating access time to implement LRU eviction
+            os.utime(self.get_key_dir(key), None)
+        Log.report(LOG_REFERENCE_STORE, "reference store lookup {}: {} hit(s), {} miss(es)", key, hit_num, len(found) - hit_num)
+        return found, output_encodings
+
+    def write_segment(self, key, row_keys, output_encodings):
+        """ write a new segment (row_keys must be sorted and unique) """
+        key_dir = self.get_key_dir(key)
+        if not os.path.isdir(key_dir):
+            os.makedirs(key_dir, exist_ok=True)
+        # time.time_ns is not available before python 3.7, the per-process
+        # counter keeps segment names unique within the same microsecond
+        segment_name = "{:020d}-{}-{}".format(int(time.time() * 1e6), os.getpid(), next(SEGMENT_COUNTER))
+        # the output file is written first, the row key file marks the
+        # segment as complete
+        for suffix, array in ((".out.npy", output_encodings), (".keys.npy", row_keys)):
+            with atomic_write(os.path.join(key_dir, segment_name + suffix), "wb") as segment_stream:
+                numpy.save(segment_stream, array)
+
+    def insert(self, key, input_encodings, output_encodings):
+        """ store output_encodings (2D array of unsigned encodings, one row
+            per input tuple) for the rows of input_encodings under key """
+        if len(input_encodings) == 0:
+            return
+        row_keys, unique_index = numpy.unique(get_row_keys(input_encodings), return_index=True)
+        output_encodings = numpy.asarray(output_encodings, dtype=numpy.uint64)[unique_index]
+        self.write_segment(key, row_keys, output_encodings)
+        if len(self.get_segment_list(key)) > self.MAX_SEGMENT_NUM:
+            self.merge_segments(key)
+        self.evict()
+
+    def merge_segments(self, key):
+        """ merge every segment of key into a single one """
+        segment_list = self.get_segment_list(key)
+        loaded_list = [arrays for arrays in map(self.load_segment, segment_list) if not arrays is None]
+        if not loaded_list:
+            return
+        row_keys, unique_index = numpy.unique(
+            numpy.concatenate([segment_keys for segment_keys, _ in loaded_list]),
+            return_index=True)
+        output_encodings = numpy.concatenate([segment_outputs for _, segment_outputs in loaded_list])[unique_index]
+        self.write_segment(key, row_keys, output_encodings)
+        for keys_path, out_path in segment_list:
+            for path in (keys_path, out_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def evict(self):
+        """ remove least recently used keys until the store size
+            is below self.max_size """
+        evict_least_recently_used(
+            self.store_dir, self.max_size, get_size=get_directory_size,
+            remove=lambda key_dir: shutil.rmtree(key_dir, ignore_errors=True))
+
+    def get_stats(self):
+        """ return a dict of store statistics """
+        return {"hit": self.hit_count, "miss": self.miss_count}
+
+
+# global reference store (None when disabled)
+REFERENCE_STORE = None
+
+def enable_reference_store(max_size=None, store_dir=None):
+    """ enable the global reference store """
+    global REFERENCE_STORE
+    if not numpy_available:
+        Log.report(Log.Error, "numpy is required by the reference store")
+    REFERENCE_STORE = ReferenceStore(store_dir=store_dir, max_size=max_size)
+    return REFERENCE_STORE
+
+def get_reference_store():
+    """ return the global reference store or None if disabled """
+    return REFERENCE_STORE
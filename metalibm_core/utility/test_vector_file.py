@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: binary test-vector files streamed at runtime by test wrappers
+###############################################################################
+
+import os
+import struct
+import hashlib
+import collections
+
+from metalibm_core.core.ml_table import (
+    get_binary_encoding_size, get_table_binary_content
+)
+from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.approx_cache import sollya_key_str
+from metalibm_core.utility.cache_utils import get_tmp_path
+
+
+# header layout, must match support_lib/ml_test_file.h
+TEST_FILE_MAGIC = b"MLTESTV2"
+TEST_FILE_BYTE_ORDER = 0x01020304
+## size of the identity and formats fields of the header
+TEST_FILE_NAME_SIZE = 64
+TEST_FILE_HEADER = struct.Struct("<8sIIIIIIQ{0}s{0}s".format(TEST_FILE_NAME_SIZE))
+TestFileHeader = collections.namedtuple(
+    "TestFileHeader",
+    ["magic", "byte_order", "arity", "output_num", "record_size",
+     "block_size", "reserved", "test_num", "identity", "formats"])
+TEST_FILE_BLOCK_HEADER = struct.Struct("<I")
+## default maximal number of records per block
+DEFAULT_TEST_FILE_BLOCK_SIZE = 4096
+
+
+def is_test_file_format(precision):
+    """ predicate indicating if values of precision can be stored in
+        a test-vector file """
+    return not get_binary_encoding_size(precision) is None
+
+def get_record_size(input_formats, output_format, output_num):
+    """ size (in bytes) of a test-vector record """
+    return (sum(get_binary_encoding_size(precision) for precision in input_formats) +
+            get_binary_encoding_size(output_format) * output_num) // 8
+
+
+def get_test_file_identity(*identity_elements):
+    """ digest (64 hexadecimal characters) identifying the function whose
+        expected values are stored in a test file, built from a list of
+        elements (meta-function class, numeric emulation, emulation
+        parameters, formats, accuracy, ...) """
+    identity_str = "|".join(sollya_key_str(elt) for elt in identity_elements)
+    return hashlib.sha256(identity_str.encode()).hexdigest()
+
+def get_test_file_formats(input_formats, output_format, output_num):
+    """ human-readable description of test file formats, e.g.
+        "float,float->floatx1" (truncated to TEST_FILE_NAME_SIZE bytes in
+        the header, formats are also covered by the identity) """
+    return "{}->{}x{}".format(
+        ",".join(str(precision) for precision in input_formats),
+        output_format, output_num)
+
+def read_test_file_header(path):
+    """ return the header (TestFileHeader) of test file path or None
+        if it can not be read """
+    try:
+        with open(path, "rb") as stream:
+            header_content = stream.read(TEST_FILE_HEADER.size)
+    except OSError:
+        return None
+    if len(header_content) != TEST_FILE_HEADER.size:
+        return None
+    return TestFileHeader(*TEST_FILE_HEADER.unpack(header_content))
+
+def check_test_file(path, identity, input_formats, output_format, output_num, max_block_size):
+    """ check that test file path was generated for the function identity
+        and formats and can be streamed by blocks of max_block_size records,
+        return None if it can be reused, else the mismatch reason """
+    header = read_test_file_header(path)
+    if header is None or header.magic != TEST_FILE_MAGIC or header.byte_order != TEST_FILE_BYTE_ORDER:
+        return "invalid header (or older test file version)"
+    formats = get_test_file_formats(input_formats, output_format, output_num)
+    file_formats = header.formats.rstrip(b"\0")
+    if header.arity != len(input_formats) or header.output_num != output_num or \
+       header.record_size != get_record_size(input_formats, output_format, output_num) or \
+       file_formats != formats.encode()[:TEST_FILE_NAME_SIZE]:
+        return "formats {} differ from {}".format(file_formats.decode(errors="replace"), formats)
+    if header.identity.decode(errors="replace") != identity:
+        return "generated for another function (or function parameters)"
+    if header.block_size > max_block_size:
+        return "block size {} exceeds {}".format(header.block_size, max_block_size)
+    return None
+
+
+class TestVectorFileWriter:
+    """ writer of a binary test-vector file: a header followed by blocks
+        of at most block_size records. The header records identity (see
+        get_test_file_identity) and formats of the function, so
+        that a test file generated for another function is not reused.
+        In each block, input values are
+        stored column by column (one column per input) followed by the
+        expected output values (output_num per record), so that each
+        column can be read directly into a test table """
+    def __init__(self, path, identity, input_formats, output_format, output_num, test_num,
+                 block_size=DEFAULT_TEST_FILE_BLOCK_SIZE):
+        self.path = path
+        self.input_formats = input_formats
+        self.output_format = output_format
+        self.output_num = output_num
+        self.test_num = test_num
+        self.block_size = block_size
+        self.written_num = 0
+        # the file is written under a temporary name and renamed
+        # once complete
+        self.tmp_path = get_tmp_path(path)
+        self.stream = open(self.tmp_path, "wb")
+        self.stream.write(TEST_FILE_HEADER.pack(
+            TEST_FILE_MAGIC, TEST_FILE_BYTE_ORDER, len(input_formats), output_num,
+            get_record_size(input_formats, output_format, output_num),
+            block_size, 0, test_num, identity.encode(),
+            get_test_file_formats(input_formats, output_format, output_num).encode()))
+
+    def write(self, input_columns, output_rows):
+        """ append records, input_columns is the list (one per input) of
+            input value lists and output_rows the list (one per record)
+            of expected output value tuples """
+        record_num = len(output_rows)
+        for offset in range(0, record_num, self.block_size):
+            block_num = min(self.block_size, record_num - offset)
+            self.stream.write(TEST_FILE_BLOCK_HEADER.pack(block_num))
+            for precision, column in zip(self.input_formats, input_columns):
+                self.stream.write(get_table_binary_content(column[offset:offset + block_num], [block_num], precision))
+            self.stream.write(get_table_binary_content(
+                output_rows[offset:offset + block_num], [block_num, self.output_num], self.output_format))
+        self.written_num += record_num
+
+    def close(self):
+        self.stream.close()
+        if self.written_num != self.test_num:
+            os.remove(self.tmp_path)
+            Log.report(Log.Error, "test file {} expected {} records, {} were written", self.path, self.test_num, self.written_num)
+        os.replace(self.tmp_path, self.path)
@@ -120,6 +120,9 @@ class ML_ExternalBench(ML_Function("ml_external_bench")):
   def get_extra_build_opts(self):
     return self.extra_src_files
 
+  def get_emulation_key_parameters(self):
+    return [self.emulate]
+
   def numeric_emulate(self, *args):
     return self.emulate(*args)
 
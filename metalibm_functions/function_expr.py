@@ -199,6 +199,9 @@ class FunctionExpression(ML_FunctionBasis):
 
         return scheme
 
+    def get_emulation_key_parameters(self):
+        return [self.function_expr_str]
+
     def numeric_emulate(self, *input_values):
         """ exact numerical emulation of self's function """
         value_mapping = {
@@ -405,6 +405,9 @@ class ML_GenericLog(ScalarUnaryFunction):
         scheme = pre_scheme
         return scheme
 
+    def get_emulation_key_parameters(self):
+        return [self.basis]
+
     def numeric_emulate(self, input_value):
         return sollya.log(input_value)/sollya.log(self.basis)
 
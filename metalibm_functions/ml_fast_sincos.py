@@ -330,6 +330,9 @@ class ML_FastSinCos(ML_FunctionBasis):
 
         return scheme
 
+    def get_emulation_key_parameters(self):
+        return [self.cos_output]
+
     def numeric_emulate(self, input_value):
         if self.cos_output:
             return cos(input_value)
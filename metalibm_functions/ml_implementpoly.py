@@ -99,6 +99,9 @@ class ML_ImplementPoly(ML_Function("ml_implementpoly")):
     #
     return Return(p)
 
+  def get_emulation_key_parameters(self):
+    return [self.function]
+
   def numeric_emulate(self, input_value):
     return self.function(input_value)
 
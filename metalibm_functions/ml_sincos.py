@@ -350,6 +350,9 @@ class ML_SinCos(ScalarUnaryFunction):
         (sollya.parse(v),) for v in ["-0x1.ab3c84717c7c7p+62", "0x1.e540d2p-1", "0x1.4b7b42p-1"]
     ]
 
+    def get_emulation_key_parameters(self):
+        return [self.sin_output]
+
     def numeric_emulate(self, input_value):
         if self.sin_output:
             return sin(input_value)
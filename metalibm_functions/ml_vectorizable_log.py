@@ -630,6 +630,9 @@ class ML_Log(ML_Function("ml_log")):
 
     return scheme
 
+  def get_emulation_key_parameters(self):
+    return [self.log_radix]
+
   def numeric_emulate(self, input_value):
     return self.log_emulation_function(input_value)
 
@@ -408,6 +408,9 @@ class MetaRemQuo(ML_FunctionBasis):
         return mod_scheme
 
 
+    def get_emulation_key_parameters(self):
+        return [self.mode.__name__, self.quotient_size]
+
     def numeric_emulate(self, vx, vy):
         """ Numeric emulation of exponential """
         if self.mode is QUOTIENT_MODE:
@@ -301,6 +301,9 @@ class ML_VectorialFunction(ML_ArrayFunction):
         return FunctionGroup([self.implementation], self.function_list)
 
 
+    def get_emulation_key_parameters(self):
+        return [self.scalar_emulate]
+
     def numeric_emulate(self, input_value):
         """ Numeric emaluation of exponential """
         return self.scalar_emulate(input_value)
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+""" Micro-benchmarks of metalibm core infrastructure (graph traversal,
+    pass engine, ...) on large synthetic operation graphs """
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2026 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 16th, 2026
+# last-modified:    Oct 16th, 2026
+#
+# description: core infrastructure micro-benchmarks
+###############################################################################
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+import tracemalloc
+
+from sollya import Interval
+
+from metalibm_core.core.ml_formats import ML_Binary32
+from metalibm_core.core.ml_operations import (
+    Variable, Addition, Multiplication, is_leaf_node
+)
+from metalibm_core.core.passes import LinearizedGraphOptimization
+from metalibm_core.opt.graph_traversal import iter_postorder, fold_postorder
+from metalibm_core.opt.node_transformation import Pass_NodeTransformation
+from metalibm_core.opt.opt_utils import evaluate_range
+from metalibm_core.core.float_interval import RangeEvalEngine, set_range_eval_engine
+
+
+def generate_synthetic_graph(node_num, fanin_window=16):
+    """ generate a synthetic DAG of (about) node_num nodes: a long chain of
+        binary operations where each node also re-uses an older node (within
+        fanin_window) so the graph is both deep and shared, like unrolled
+        vector schemes or multi-precision expansions """
+    var_list = [Variable("x%d" % i, precision=ML_Binary32, interval=Interval(-1, 1)) for i in range(4)]
+    node_list = list(var_list)
+    while len(node_list) < node_num:
+        index = len(node_list)
+        lhs = node_list[-1]
+        rhs = node_list[max(0, index - 1 - (index * 7) % fanin_window)]
+        op_class = Addition if index % 2 else Multiplication
+        node_list.append(op_class(lhs, rhs, precision=ML_Binary32))
+    return node_list[-1]
+
+
+class IdentityLinearizedPass(LinearizedGraphOptimization):
+    """ linearized pass which does not modify the graph, used to measure
+        the cost of the pass engine itself """
+    def __init__(self):
+        LinearizedGraphOptimization.__init__(self, None, "identity")
+
+    def apply_on_node(self, node):
+        self.memoization_map[node] = None
+
+    def is_leaf_node(self, node):
+        return is_leaf_node(node)
+
+
+class IdentityNodeTransformation(Pass_NodeTransformation):
+    """ node transformation which visits every node but does not
+        modify the graph """
+    def can_be_transformed(self, node, *args):
+        return not is_leaf_node(node)
+
+    def transform_node(self, node, transformed_inputs, *args):
+        return None
+
+    def reconstruct_from_transformed(self, op_input, transformed_node):
+        return transformed_node
+
+
+def bench_postorder(root):
+    """ iterate over the whole graph """
+    return sum(1 for _ in iter_postorder(root, is_leaf_node=is_leaf_node))
+
+def bench_fold(root):
+    """ count the graph nodes with a fold """
+    return fold_postorder(root, lambda count, node: count + 1, 0, is_leaf_node=is_leaf_node)
+
+def bench_copy(root):
+    """ copy the whole graph """
+    copy_map = {}
+    root.copy(copy_map)
+    return len(copy_map)
+
+def bench_evaluate_range(root):
+    """ evaluate the range of every node (without updating intervals) """
+    memoization_map = {}
+    evaluate_range(root, memoization_map=memoization_map)
+    return len(memoization_map)
+
+def bench_evaluate_range_float(root):
+    """ evaluate the range of every node with the FloatInterval engine """
+    set_range_eval_engine(RangeEvalEngine.Float)
+    try:
+        return bench_evaluate_range(root)
+    finally:
+        set_range_eval_engine(RangeEvalEngine.Sollya)
+
+def bench_node_transformation(root):
+    """ execute an (identity) node transformation on the whole graph """
+    opt_pass = IdentityNodeTransformation()
+    opt_pass.transform_graph(root)
+    return len(opt_pass.memoization_map)
+
+def bench_linearized_pass(root):
+    """ execute a LinearizedGraphOptimization on the whole graph """
+    opt_pass = IdentityLinearizedPass()
+    opt_pass.execute(root)
+    return len(opt_pass.memoization_map)
+
+
+def bench_graph_memory(size):
+    """ return the memory (in bytes) allocated by the generation of a
+        synthetic graph of size nodes """
+    tracemalloc.start()
+    root = generate_synthetic_graph(size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+# meta-function generation commands used to measure peak memory
+# (resident set size) of a full generation
+GENERATION_MEMORY_BENCH = {
+    "ml_exp": ["metalibm_functions/ml_exp.py", "--precision", "binary32"],
+    "ml_log": ["metalibm_functions/generic_log.py", "--precision", "binary32"],
+}
+
+def bench_generation_memory(function_name, target="x86_avx2", vector_size=8):
+    """ generate function_name in a fresh process and return its peak
+        resident set size in KiB (or None if generation failed) """
+    output_file = os.path.join(tempfile.mkdtemp(), "{}.c".format(function_name))
+    cmd = [sys.executable] + GENERATION_MEMORY_BENCH[function_name] + [
+        "--target", target, "--vector-size", str(vector_size),
+        "--output", output_file]
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    # wait4 returns the resource usage of this specific child process
+    _, status, rusage = os.wait4(process.pid, 0)
+    process.returncode = status
+    if status != 0:
+        return None
+    return rusage.ru_maxrss
+
+
+# modules whose import time is measured by --import-time
+IMPORT_TIME_BENCH = [
+    "metalibm_core.core.ml_operations",
+    "metalibm_core.utility.ml_template",
+    "metalibm_core.core.ml_function",
+]
+
+def bench_import_time(module_name, repeat):
+    """ return the minimal time (over repeat fresh processes) to import
+        module_name, in seconds (or None if import failed) """
+    cmd = [sys.executable, "-c",
+           "import time; start = time.perf_counter(); import {}; "
+           "print(time.perf_counter() - start)".format(module_name)]
+    timing_list = []
+    for _ in range(repeat):
+        process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        if process.returncode != 0:
+            return None
+        timing_list.append(float(process.stdout.decode().split()[-1]))
+    return min(timing_list)
+
+
+# map of benchmark name -> function(root) -> processed node count
+BENCHMARK_MAP = {
+    "postorder": bench_postorder,
+    "fold": bench_fold,
+    "linearized_pass": bench_linearized_pass,
+    "copy": bench_copy,
+    "evaluate_range": bench_evaluate_range,
+    "evaluate_range_float": bench_evaluate_range_float,
+    "node_transformation": bench_node_transformation,
+}
+
+
+def run_benchmark(bench_name, size_list, repeat):
+    """ run benchmark bench_name on graph of each size in size_list and
+        report the minimal time (over repeat runs) per node """
+    bench_function = BENCHMARK_MAP[bench_name]
+    print("{}:".format(bench_name))
+    for size in size_list:
+        root = generate_synthetic_graph(size)
+        timing_list = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            node_count = bench_function(root)
+            timing_list.append(time.perf_counter() - start)
+        best = min(timing_list)
+        print("  {:>8} nodes: {:8.3f} ms, {:6.3f} us/node, {:8.1f} knodes/s".format(
+            node_count, best * 1e3, best * 1e6 / node_count, node_count / best / 1e3))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(" Metalibm core micro-benchmarks")
+    arg_parser.add_argument(
+        "--bench", dest="bench_list", default=list(BENCHMARK_MAP.keys()),
+        type=lambda s: s.split(","),
+        help="comma separated list of benchmarks among: {}".format(", ".join(BENCHMARK_MAP)))
+    arg_parser.add_argument(
+        "--sizes", dest="size_list", default=[10000, 30000, 100000],
+        type=lambda s: [int(v) for v in s.split(",")],
+        help="comma separated list of synthetic graph sizes (node count)")
+    arg_parser.add_argument(
+        "--repeat", default=3, type=int,
+        help="number of runs per (benchmark, size), the best run is reported")
+    arg_parser.add_argument(
+        "--memory", action="store_const", default=False, const=True,
+        help="measure memory footprint (synthetic graphs and peak RSS of "
+             "meta-function generations) rather than execution time")
+    arg_parser.add_argument(
+        "--memory-functions", dest="memory_function_list",
+        default=list(GENERATION_MEMORY_BENCH.keys()),
+        type=lambda s: s.split(","),
+        help="comma separated list of meta-functions (among {}) whose "
+             "generation peak RSS is measured by --memory".format(", ".join(GENERATION_MEMORY_BENCH)))
+    arg_parser.add_argument(
+        "--import-time", action="store_const", default=False, const=True,
+        help="measure the import time of metalibm's main modules (in fresh "
+             "processes) rather than graph processing time")
+    args = arg_parser.parse_args(sys.argv[1:])
+
+    if args.import_time:
+        print("import time:")
+        for module_name in IMPORT_TIME_BENCH:
+            import_time = bench_import_time(module_name, args.repeat)
+            print("  {:>36}: {}".format(
+                module_name, "import failed" if import_time is None else "{:8.1f} ms".format(import_time * 1e3)))
+        return
+
+    if args.memory:
+        print("synthetic graph memory:")
+        for size in args.size_list:
+            peak = bench_graph_memory(size)
+            print("  {:>8} nodes: {:8.1f} KiB, {:6.1f} B/node".format(size, peak / 1024.0, peak / float(size)))
+        print("generation peak RSS:")
+        for function_name in args.memory_function_list:
+            max_rss = bench_generation_memory(function_name)
+            print("  {:>10}: {}".format(
+                function_name, "generation failed" if max_rss is None else "{} KiB".format(max_rss)))
+        return
+
+    for bench_name in args.bench_list:
+        if not bench_name in BENCHMARK_MAP:
+            print("unknown benchmark {}".format(bench_name))
+            sys.exit(1)
+        run_benchmark(bench_name, args.size_list, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
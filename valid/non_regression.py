@@ -77,6 +77,7 @@ from metalibm_core.targets.intel.m128_promotion import Pass_M128_Promotion
 from metalibm_core.targets.intel.m256_promotion import Pass_M256_Promotion
 from metalibm_core.utility.ml_template import (
     target_instanciate, VerboseAction, ExitOnErrorAction)
+from metalibm_core.utility.build_utils import enable_build_cache
 
 from valid.test_utils import *
 
@@ -447,6 +448,14 @@ arg_parser.add_argument(
     help="convert Fatal error to sys exit rather than exception")
 
 
+arg_parser.add_argument("--build-cache", dest="build_cache", action="store_const",
+                        default=False, const=True,
+                        help="reuse build results (in .mltmp) of unchanged generated sources")
+arg_parser.add_argument("--jobs", dest="jobs", type=int, default=1,
+                        help="number of tests executed concurrently (each in an isolated worker process)")
+arg_parser.add_argument("--timeout", dest="timeout", type=float, default=None,
+                        help="per-test timeout in seconds (tests are executed in isolated worker processes)")
+
 arg_parser.add_argument(
     "--verbose", dest="verbose_enable", action=VerboseAction,
     const=True, default=False,
@@ -454,18 +463,23 @@ arg_parser.add_argument(
 
 
 args = arg_parser.parse_args(sys.argv[1:])
+if args.build_cache:
+  enable_build_cache()
 
 success = True
 # list of TestResult objects generated by execution
 # of new scheme tests
 result_details = []
 
-for test_scheme in args.test_list:
-  if re.search(args.match_regex, test_scheme.get_tag_title()) != None:
-    test_result = test_scheme.perform_all_test(debug = args.debug)
-    result_details.append(test_result)
-    if not test_result.get_result():
-      success = False
+selected_test_list = [test_scheme for test_scheme in args.test_list if re.search(args.match_regex, test_scheme.get_tag_title()) != None]
+# tests of every selected scheme are scheduled together
+result_map = perform_test_list_no_reduce(selected_test_list, debug=args.debug, jobs=args.jobs, timeout=args.timeout)
+
+for test_scheme in selected_test_list:
+  test_result = test_scheme.reduce_test_result(result_map[test_scheme])
+  result_details.append(test_result)
+  if not test_result.get_result():
+    success = False
 
 unexpected_failure_count = 0
 
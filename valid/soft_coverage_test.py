@@ -78,6 +78,7 @@ from metalibm_core.code_generation.code_configuration import CodeConfiguration
 from metalibm_core.targets.intel.m128_promotion import Pass_M128_Promotion
 from metalibm_core.targets.intel.m256_promotion import Pass_M256_Promotion
 from metalibm_core.utility.ml_template import target_instanciate
+from metalibm_core.utility.build_utils import enable_build_cache
 
 from valid.test_utils import *
 from valid.test_summary import TestSummary
@@ -518,12 +519,10 @@ class SubFunctionTest(NewSchemeTest):
 
 def execute_test_list(test_list):
     """ execute all the tests listed in test_list """
-    result_map = {}
     # forcing exception cause to be raised
     Log.exit_on_error = False
-    for test_scheme in test_list:
-        test_results = test_scheme.perform_all_test_no_reduce(debug=args.debug)
-        result_map[test_scheme] = test_results
+    result_map = perform_test_list_no_reduce(
+        test_list, debug=args.debug, jobs=args.jobs, timeout=args.timeout)
 
     test_summary = GlobalTestResult.init_from_test_list(test_list, result_map)
 
@@ -640,11 +639,22 @@ if __name__ == "__main__":
     arg_parser.add_argument("--timestamp", dest="timestamp", action="store_const",
                             default=False, const=True,
                             help="enable filename timestamping")
+    arg_parser.add_argument("--build-cache", dest="build_cache", action="store_const",
+                            default=False, const=True,
+                            help="reuse build results (in .mltmp) of unchanged generated sources")
+    arg_parser.add_argument("--jobs", dest="jobs", action="store",
+                            default=1, type=int,
+                            help="number of tests executed concurrently (each in an isolated worker process)")
+    arg_parser.add_argument("--timeout", dest="timeout", action="store",
+                            default=None, type=float,
+                            help="per-test timeout in seconds (tests are executed in isolated worker processes)")
     arg_parser.add_argument(
         "--verbose", dest="verbose_enable", action=VerboseAction,
         const=True, default=False,
         help="enable Verbose log level")
     args = arg_parser.parse_args(sys.argv[1:])
+    if args.build_cache:
+        enable_build_cache()
 
     # number of self-checking test to be generated
     if args.error_eval:
@@ -34,9 +34,24 @@
 # Last Modified:     March 6th, 2018
 ###############################################################################
 
+import os
+import time
+import signal
+import shutil
+import tempfile
+import traceback
+import collections
+import multiprocessing
+import multiprocessing.connection
+
+import sollya
+
 from metalibm_core.core.ml_function import (
     DefaultArgTemplate, BuildError, ValidError
 )
+from metalibm_core.utility.parallel_utils import (
+    encode_numeric_value, decode_numeric_value
+)
 
 class DisabledTest(Exception):
     """ Exception indicating that a test was disabled when its execution was
@@ -47,6 +62,16 @@ class GenerationError(Exception):
     """ Exception indicating that an error occured during code generation """
     pass
 
+class TestTimeout(Exception):
+    """ Exception indicating that a test did not complete before its
+        timeout when executed in an isolated worker """
+    pass
+
+class TestCrash(Exception):
+    """ Exception indicating that the worker process executing a test
+        terminated without reporting a result """
+    pass
+
 class TestResult:
   ## @param result boolean indicating success (True) or failure (False)
   #  @param details string with test information
@@ -89,9 +114,15 @@ class CommonTestScheme:
   def get_tag_title(self):
     return self.title.replace(" ", "_")
 
-  def perform_all_test_no_reduce(self, debug=False):
+  def perform_all_test_no_reduce(self, debug=False, jobs=1, timeout=None):
     """ perform all test in CommonTestScheme and returns
-        raw TestResult list """
+        raw TestResult list
+
+        if jobs > 1 or timeout is set, each test is executed in an
+        isolated worker process (see execute_isolated_tests) """
+    if jobs > 1 or timeout is not None:
+      task_list = [(self, tc) for tc in self.argument_tc]
+      return execute_isolated_tests(task_list, jobs=jobs, timeout=timeout, debug=debug)
     return [self.single_test(tc, debug=debug) for tc in self.argument_tc]
 
   def get_success_count(self, result_list):
@@ -122,10 +153,10 @@ class CommonTestScheme:
             "\n    ".join(r.get_details() for r in result_list))
       return TestResult(not unexpected_failure, result_msg, unexpected_count=unexpected_failure_count)
 
-  def perform_all_test(self, debug=False):
+  def perform_all_test(self, debug=False, jobs=1, timeout=None):
     """ Perform all test of the scheme ahd then reduce test results
         to a single object """
-    result_list = self.perform_all_test_no_reduce(debug)
+    result_list = self.perform_all_test_no_reduce(debug, jobs=jobs, timeout=timeout)
     return self.reduce_test_result(result_list)
 
 # Test object for new type meta function
@@ -173,3 +204,163 @@ class NewSchemeTest(CommonTestScheme):
 
         return TestResult(True, "{} succeed".format(test_desc), title=title, return_value=return_value)
 
+
+
+def perform_test_list_no_reduce(test_list, debug=False, jobs=1, timeout=None):
+    """ perform all the tests of every CommonTestScheme of test_list
+        and return a dict test_scheme -> raw TestResult list
+
+        if jobs > 1 or timeout is set, the tests of all schemes are
+        scheduled together on the same pool of isolated workers """
+    if jobs <= 1 and timeout is None:
+        return dict((test_scheme, test_scheme.perform_all_test_no_reduce(debug=debug)) for test_scheme in test_list)
+    task_list = [(test_scheme, tc) for test_scheme in test_list for tc in test_scheme.argument_tc]
+    result_list = execute_isolated_tests(task_list, jobs=jobs, timeout=timeout, debug=debug)
+    # every scheme gets an entry, even if it has no test case
+    result_map = dict((test_scheme, []) for test_scheme in test_list)
+    for (test_scheme, _), result in zip(task_list, result_list):
+        result_map[test_scheme].append(result)
+    return result_map
+
+
+def get_transferable_result(result):
+    """ convert a TestResult into a picklable object which can be sent
+        back from a worker process (numerical values in return_value are
+        encoded exactly, errors are reduced to their class) """
+    return_value = result.return_value
+    if isinstance(return_value, dict):
+        return_value = dict(
+            (key, ("encoded", encode_numeric_value(value)) if isinstance(value, sollya.SollyaObject) else ("raw", value))
+            for key, value in return_value.items())
+    return TestResult(
+        result.result, result.details, test_case=result.test_case,
+        error=None if result.error is None else result.error.__class__(*[str(arg) for arg in result.error.args]),
+        title=result.title, expected_to_fail=result.expected_to_fail,
+        unexpected_count=result.unexpected_count, return_value=return_value)
+
+def restore_transferable_result(result, test_scheme):
+    """ reverse get_transferable_result """
+    if isinstance(result.return_value, dict):
+        result.return_value = dict(
+            (key, decode_numeric_value(value) if kind == "encoded" else value)
+            for key, (kind, value) in result.return_value.items())
+    result.test_object = test_scheme
+    return result
+
+
+def set_process_group(pid):
+    """ make process pid the leader of its own process group (called by
+        both the worker and its parent to avoid any race) """
+    try:
+        os.setpgid(pid, pid)
+    except OSError:
+        # the worker may already have changed group or exited
+        pass
+
+def kill_process_group(process):
+    """ kill the worker process and every process of its group """
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except OSError:
+        process.kill()
+
+
+def isolated_test_worker(test_scheme, arg_tc, debug, work_dir, connection):
+    """ worker process entry point: execute a single test in work_dir
+        and send its result through connection """
+    # the worker leads its own process group, so that the processes it
+    # spawns (compiler, test binary) can be killed with it on timeout
+    set_process_group(os.getpid())
+    os.chdir(work_dir)
+    try:
+        result = test_scheme.single_test(arg_tc, debug=debug)
+    except BaseException:
+        traceback.print_exc()
+        result = TestResult(
+            False, "{}/{} raised an exception".format(test_scheme.get_title(), str(arg_tc)),
+            error=TestCrash("exception"), title=test_scheme.sub_case_title(arg_tc),
+            expected_to_fail=arg_tc.get("expected_to_fail", False))
+    connection.send(get_transferable_result(result))
+    connection.close()
+
+
+def execute_isolated_tests(task_list, jobs=1, timeout=None, debug=False, tmp_root=None):
+    """ execute a list of tests, each in its own worker process (and its
+        own temporary working directory), with at most jobs tests
+        running concurrently
+
+        :param task_list: list of (test_scheme, arg_tc) pairs
+        :param timeout: per-test timeout in seconds (None to disable)
+        :param tmp_root: directory where per-test working directories
+                         are created (a new temporary directory by default)
+        :return: list of TestResult, in task_list order. A test which
+                 exceeds its timeout gets a TestTimeout error, a test whose
+                 worker dies without reporting a result gets a TestCrash error.
+                 Working directories of failing tests are kept for
+                 inspection """
+    context = multiprocessing.get_context("fork")
+    remove_tmp_root = tmp_root is None
+    if tmp_root is None:
+        tmp_root = tempfile.mkdtemp(prefix="ml_valid_")
+    jobs = max(1, jobs)
+    result_list = [None] * len(task_list)
+    pending = collections.deque(enumerate(task_list))
+    # connection -> (task index, process, work directory, start time)
+    running = {}
+
+    def failure_result(index, msg, error):
+        test_scheme, arg_tc = task_list[index]
+        return TestResult(
+            False, "{}/{} {}".format(test_scheme.get_title(), str(arg_tc), msg),
+            test_object=test_scheme, error=error,
+            title=test_scheme.sub_case_title(arg_tc),
+            expected_to_fail=arg_tc.get("expected_to_fail", False))
+
+    def complete(connection, result):
+        index, process, work_dir, _ = running.pop(connection)
+        connection.close()
+        process.join()
+        result_list[index] = result
+        if result.get_result():
+            shutil.rmtree(work_dir, ignore_errors=True)
+        else:
+            print("test {} failed, working directory kept in {}".format(result.title, work_dir))
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            index, (test_scheme, arg_tc) = pending.popleft()
+            if arg_tc.get("disabled", False):
+                # disabled tests are cheap to evaluate and do not require
+                # a worker
+                result_list[index] = test_scheme.single_test(arg_tc, debug=debug)
+                continue
+            work_dir = tempfile.mkdtemp(prefix="test_{}_".format(index), dir=tmp_root)
+            parent_connection, child_connection = context.Pipe(duplex=False)
+            process = context.Process(
+                target=isolated_test_worker,
+                args=(test_scheme, arg_tc, debug, work_dir, child_connection))
+            process.start()
+            set_process_group(process.pid)
+            # closing parent copy of child end, so that a crashed worker is
+            # detected as an EOF on parent_connection
+            child_connection.close()
+            running[parent_connection] = (index, process, work_dir, time.time())
+        if not running:
+            continue
+        for connection in multiprocessing.connection.wait(list(running.keys()), timeout=1.0):
+            index = running[connection][0]
+            try:
+                result = restore_transferable_result(connection.recv(), task_list[index][0])
+            except EOFError:
+                exitcode = running[connection][1].exitcode
+                result = failure_result(index, "worker crashed (exit code {})".format(exitcode), TestCrash("crash"))
+            complete(connection, result)
+        if timeout is not None:
+            current_time = time.time()
+            for connection in [c for c in running if current_time - running[c][3] > timeout]:
+                index, process, _, _ = running[connection]
+                kill_process_group(process)
+                complete(connection, failure_result(index, "timeout after {}s".format(timeout), TestTimeout("timeout")))
+    if remove_tmp_root and not os.listdir(tmp_root):
+        os.rmdir(tmp_root)
+    return result_list